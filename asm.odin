@@ -0,0 +1,356 @@
+package occm
+
+// Assembly as data. Both backends append instruction records to an Asm_Builder instead of formatting lines of text,
+// so that peephole.odin can match and rewrite them, and write_asm turns the finished records into AT&T syntax in one
+// go. Records are small and hold no strings: names are atoms, see interning.odin.
+import "core:strings"
+
+Asm_Register :: enum u8 {
+    Rax,
+    Rbx,
+    Rcx,
+    Rdx,
+    Rsi,
+    Rdi,
+    Rbp,
+    Rsp,
+    R8,
+    R9,
+    R10,
+    R11,
+    R12,
+    R13,
+    R14,
+    R15,
+    Rip, // Only as the base of a memory operand
+}
+
+Asm_Registers :: bit_set[Asm_Register]
+
+Asm_Width :: enum u8 {
+    Dword,
+    Qword,
+    Byte,
+}
+
+asm_register_names := [Asm_Width][Asm_Register]string{
+    .Dword = {
+        .Rax = "%eax", .Rbx = "%ebx", .Rcx = "%ecx", .Rdx = "%edx", .Rsi = "%esi", .Rdi = "%edi", .Rbp = "%ebp",
+        .Rsp = "%esp", .R8 = "%r8d", .R9 = "%r9d", .R10 = "%r10d", .R11 = "%r11d", .R12 = "%r12d", .R13 = "%r13d",
+        .R14 = "%r14d", .R15 = "%r15d", .Rip = "%eip",
+    },
+    .Qword = {
+        .Rax = "%rax", .Rbx = "%rbx", .Rcx = "%rcx", .Rdx = "%rdx", .Rsi = "%rsi", .Rdi = "%rdi", .Rbp = "%rbp",
+        .Rsp = "%rsp", .R8 = "%r8", .R9 = "%r9", .R10 = "%r10", .R11 = "%r11", .R12 = "%r12", .R13 = "%r13",
+        .R14 = "%r14", .R15 = "%r15", .Rip = "%rip",
+    },
+    .Byte = {
+        .Rax = "%al", .Rbx = "%bl", .Rcx = "%cl", .Rdx = "%dl", .Rsi = "%sil", .Rdi = "%dil", .Rbp = "%bpl",
+        .Rsp = "%spl", .R8 = "%r8b", .R9 = "%r9b", .R10 = "%r10b", .R11 = "%r11b", .R12 = "%r12b", .R13 = "%r13b",
+        .R14 = "%r14b", .R15 = "%r15b", .Rip = "",
+    },
+}
+
+asm_width_suffixes := [Asm_Width]u8{.Dword = 'l', .Qword = 'q', .Byte = 'b'}
+
+Asm_Reg :: struct {
+    register: Asm_Register,
+    width: Asm_Width,
+}
+
+EAX :: Asm_Reg{.Rax, .Dword}
+RAX :: Asm_Reg{.Rax, .Qword}
+AL :: Asm_Reg{.Rax, .Byte}
+EBX :: Asm_Reg{.Rbx, .Dword}
+RBX :: Asm_Reg{.Rbx, .Qword}
+ECX :: Asm_Reg{.Rcx, .Dword}
+RCX :: Asm_Reg{.Rcx, .Qword}
+CL :: Asm_Reg{.Rcx, .Byte}
+EDX :: Asm_Reg{.Rdx, .Dword}
+RDX :: Asm_Reg{.Rdx, .Qword}
+RSI :: Asm_Reg{.Rsi, .Qword}
+RDI :: Asm_Reg{.Rdi, .Qword}
+RBP :: Asm_Reg{.Rbp, .Qword}
+RSP :: Asm_Reg{.Rsp, .Qword}
+R8 :: Asm_Reg{.R8, .Qword}
+R9 :: Asm_Reg{.R9, .Qword}
+R10D :: Asm_Reg{.R10, .Dword}
+R11D :: Asm_Reg{.R11, .Dword}
+R11B :: Asm_Reg{.R11, .Byte}
+
+Asm_Immediate :: distinct int
+
+// offset(base, index, scale), or label(%rip) or symbol(%rip) when one of those is set. Labels start from 1, so 0
+// means no label, NO_ATOM means no symbol, and a scale of 0 means no index.
+Asm_Memory :: struct {
+    offset: i32,
+    label: i32,
+    symbol: Atom,
+    base: Asm_Register,
+    index: Asm_Register,
+    scale: u8,
+}
+
+Asm_Label :: distinct int // L<n>
+Asm_Symbol :: distinct Atom // A function or static variable
+Asm_Function_End :: distinct Atom // <function>_done, where return jumps to
+Asm_User_Label :: struct { // _<name>@<function>, a label from the source
+    name: Atom,
+    function: Atom,
+}
+
+Asm_Operand :: union {
+    Asm_Reg,
+    Asm_Immediate,
+    Asm_Memory,
+    Asm_Label,
+    Asm_Symbol,
+    Asm_Function_End,
+    Asm_User_Label,
+}
+
+Asm_Op :: enum u8 {
+    Label, // first:
+    Globl, // .globl first
+    Text, // .text
+    Data, // .data
+    P2align, // .p2align first
+    Balign, // .balign first
+    Long, // .long first - second for two labels, or .long first for a constant
+    Mov,
+    Movslq,
+    Movzbl,
+    Push,
+    Pop,
+    Add,
+    Sub,
+    Imul, // With one operand, edx:eax = eax * first
+    Idiv, // eax, edx = edx:eax / first, edx:eax % first
+    Cdq, // Sign extends eax into edx:eax
+    And,
+    Or,
+    Xor,
+    Shl,
+    Sal,
+    Shr,
+    Sar,
+    Neg,
+    Not,
+    Inc,
+    Dec,
+    Cmp,
+    Test,
+    Set, // set<condition> first
+    Jcc, // j<condition> first
+    Jmp,
+    Jmp_Indirect, // jmp *first
+    Lea,
+    Call,
+    Ret,
+}
+
+asm_mnemonics := [Asm_Op]string{
+    .Label = "", .Globl = ".globl", .Text = ".text", .Data = ".data", .P2align = ".p2align", .Balign = ".balign",
+    .Long = ".long", .Mov = "mov", .Movslq = "movslq", .Movzbl = "movzbl", .Push = "push", .Pop = "pop",
+    .Add = "add", .Sub = "sub", .Imul = "imul", .Idiv = "idiv", .Cdq = "cdq", .And = "and", .Or = "or",
+    .Xor = "xor", .Shl = "shl", .Sal = "sal", .Shr = "shr", .Sar = "sar", .Neg = "neg", .Not = "not", .Inc = "inc",
+    .Dec = "dec", .Cmp = "cmp", .Test = "test", .Set = "set", .Jcc = "j", .Jmp = "jmp", .Jmp_Indirect = "jmp",
+    .Lea = "lea", .Call = "call", .Ret = "ret",
+}
+
+// Conditions on the flags set by cmp a, b, comparing b with a
+Asm_Condition :: enum u8 {
+    E,
+    Ne,
+    L,
+    Le,
+    G,
+    Ge,
+    A, // Unsigned
+    Be, // Unsigned
+}
+
+asm_condition_names := [Asm_Condition]string{
+    .E = "e", .Ne = "ne", .L = "l", .Le = "le", .G = "g", .Ge = "ge", .A = "a", .Be = "be",
+}
+
+asm_inverse_conditions := [Asm_Condition]Asm_Condition{
+    .E = .Ne, .Ne = .E, .L = .Ge, .Le = .G, .G = .Le, .Ge = .L, .A = .Be, .Be = .A,
+}
+
+// Operands are in AT&T order, source first. `width` gives the size suffix for instructions that have no register
+// operand to imply one.
+Asm_Instruction :: struct {
+    op: Asm_Op,
+    condition: Asm_Condition,
+    width: Asm_Width,
+    first: Asm_Operand,
+    second: Asm_Operand,
+}
+
+Asm_Builder :: struct {
+    code: [dynamic]Asm_Instruction,
+    stack_bytes: int, // How far the emitted pushes, pops and immediate adjustments of %rsp have moved it down
+}
+
+asm_emit :: proc(builder: ^Asm_Builder, op: Asm_Op, first: Asm_Operand = nil, second: Asm_Operand = nil, width := Asm_Width.Dword) {
+    append(&builder.code, Asm_Instruction{op = op, width = width, first = first, second = second})
+    #partial switch op {
+        case .Push:
+            builder.stack_bytes += 8
+        case .Pop:
+            builder.stack_bytes -= 8
+        case .Sub, .Add:
+            amount, is_immediate := first.(Asm_Immediate)
+            if is_immediate && asm_operands_equal(second, RSP) {
+                builder.stack_bytes += int(amount) if op == .Sub else -int(amount)
+            }
+    }
+}
+
+asm_emit_jump :: proc(builder: ^Asm_Builder, condition: Asm_Condition, label: int) {
+    append(&builder.code, Asm_Instruction{op = .Jcc, condition = condition, first = Asm_Label(label)})
+}
+
+// Sets the byte register to 1 if the condition holds and 0 otherwise
+asm_emit_set :: proc(builder: ^Asm_Builder, condition: Asm_Condition, destination := AL) {
+    append(&builder.code, Asm_Instruction{op = .Set, condition = condition, first = destination})
+}
+
+rbp_offset :: proc(offset: int) -> Asm_Memory {
+    return Asm_Memory{offset = i32(offset), base = .Rbp}
+}
+
+is_asm_register :: proc(operand: Asm_Operand, register: Asm_Register) -> bool {
+    reg, is_reg := operand.(Asm_Reg)
+    return is_reg && reg.register == register
+}
+
+
+asm_operands_equal :: proc(a, b: Asm_Operand) -> bool {
+    switch x in a {
+        case Asm_Reg:
+            y, ok := b.(Asm_Reg)
+            return ok && x == y
+        case Asm_Immediate:
+            y, ok := b.(Asm_Immediate)
+            return ok && x == y
+        case Asm_Memory:
+            y, ok := b.(Asm_Memory)
+            return ok && x == y
+        case Asm_Label:
+            y, ok := b.(Asm_Label)
+            return ok && x == y
+        case Asm_Symbol:
+            y, ok := b.(Asm_Symbol)
+            return ok && x == y
+        case Asm_Function_End:
+            y, ok := b.(Asm_Function_End)
+            return ok && x == y
+        case Asm_User_Label:
+            y, ok := b.(Asm_User_Label)
+            return ok && x == y
+    }
+    return b == nil
+}
+
+// Bytes reserved per record when sizing the output, which covers a typical line so the buffer rarely has to grow
+ASM_BYTES_PER_INSTRUCTION :: 24
+
+write_asm_operand :: proc(builder: ^strings.Builder, operand: Asm_Operand) {
+    switch o in operand {
+        case Asm_Reg:
+            strings.write_string(builder, asm_register_names[o.width][o.register])
+        case Asm_Immediate:
+            strings.write_byte(builder, '$')
+            strings.write_int(builder, int(o))
+        case Asm_Memory:
+            if o.label != 0 {
+                strings.write_byte(builder, 'L')
+                strings.write_int(builder, int(o.label))
+            }
+            else if o.symbol != NO_ATOM do strings.write_string(builder, atom_text(o.symbol))
+            else if o.offset != 0 do strings.write_int(builder, int(o.offset))
+            strings.write_byte(builder, '(')
+            strings.write_string(builder, asm_register_names[.Qword][o.base])
+            if o.scale != 0 {
+                strings.write_byte(builder, ',')
+                strings.write_string(builder, asm_register_names[.Qword][o.index])
+                strings.write_byte(builder, ',')
+                strings.write_int(builder, int(o.scale))
+            }
+            strings.write_byte(builder, ')')
+        case Asm_Label:
+            strings.write_byte(builder, 'L')
+            strings.write_int(builder, int(o))
+        case Asm_Symbol:
+            strings.write_string(builder, atom_text(Atom(o)))
+        case Asm_Function_End:
+            strings.write_string(builder, atom_text(Atom(o)))
+            strings.write_string(builder, "_done")
+        case Asm_User_Label:
+            strings.write_byte(builder, '_')
+            strings.write_string(builder, atom_text(o.name))
+            strings.write_byte(builder, '@')
+            strings.write_string(builder, atom_text(o.function))
+    }
+}
+
+write_asm_instruction :: proc(builder: ^strings.Builder, instruction: Asm_Instruction) {
+    #partial switch instruction.op {
+        case .Label:
+            write_asm_operand(builder, instruction.first)
+            strings.write_string(builder, ":\n")
+            return
+        case .Globl:
+            strings.write_string(builder, ".globl ")
+            write_asm_operand(builder, instruction.first)
+            strings.write_byte(builder, '\n')
+            return
+        case .Text, .Data, .P2align, .Balign, .Long:
+            strings.write_string(builder, "  ")
+            strings.write_string(builder, asm_mnemonics[instruction.op])
+            if value, is_constant := instruction.first.(Asm_Immediate); is_constant {
+                strings.write_byte(builder, ' ')
+                strings.write_int(builder, int(value))
+            }
+            else if instruction.first != nil {
+                strings.write_byte(builder, ' ')
+                write_asm_operand(builder, instruction.first)
+                strings.write_string(builder, " - ")
+                write_asm_operand(builder, instruction.second)
+            }
+            strings.write_byte(builder, '\n')
+            return
+    }
+
+    strings.write_string(builder, "  ")
+    strings.write_string(builder, asm_mnemonics[instruction.op])
+    #partial switch instruction.op {
+        case .Set, .Jcc:
+            strings.write_string(builder, asm_condition_names[instruction.condition])
+        case .Jmp, .Jmp_Indirect, .Call, .Ret, .Lea, .Movslq, .Movzbl, .Cdq:
+        case:
+            _, first_is_reg := instruction.first.(Asm_Reg)
+            _, second_is_reg := instruction.second.(Asm_Reg)
+            if instruction.first != nil && !first_is_reg && !second_is_reg {
+                strings.write_byte(builder, asm_width_suffixes[instruction.width])
+            }
+    }
+    if instruction.first != nil {
+        strings.write_string(builder, " *" if instruction.op == .Jmp_Indirect else " ")
+        write_asm_operand(builder, instruction.first)
+    }
+    if instruction.second != nil {
+        strings.write_string(builder, ", ")
+        write_asm_operand(builder, instruction.second)
+    }
+    strings.write_byte(builder, '\n')
+}
+
+// Writes the records as AT&T syntax, one per line, into a buffer sized up front from the number of records
+write_asm :: proc(code: []Asm_Instruction) -> string {
+    builder := strings.builder_make_len_cap(0, len(code) * ASM_BYTES_PER_INSTRUCTION)
+    for instruction in code do write_asm_instruction(&builder, instruction)
+    return strings.to_string(builder)
+}
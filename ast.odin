@@ -2,6 +2,8 @@ package occm
 
 import "core:fmt"
 import "core:reflect"
+import "core:mem"
+import "core:mem/virtual"
 import "base:runtime"
 
 Program :: struct {
@@ -11,14 +13,14 @@ Program :: struct {
 Default_Label :: struct{}
 
 Label :: union {
-    string,
+    Atom,
     int, // For case labels
     Default_Label,
 }
 
+// Nodes hold slices rather than dynamic arrays, since the tree is not changed after parsing, and labels are kept in
+// a side table, since almost no statements have them. That keeps every node at a pointer and a slice at most.
 Ast_Node :: struct {
-    labels: [dynamic]Label,
-
     // Common stuff would go here
     variant: union {
         Function_Declaration_Node,
@@ -82,15 +84,15 @@ Ast_Node :: struct {
 
 Function_Declaration_Node :: struct {
     storage_specifiers: bit_set[Storage_Specifier],
-    name: string,
-    params: [dynamic]string,
+    name: Atom,
+    params: []Atom,
 }
 
 Function_Definition_Node :: struct {
     storage_specifiers: bit_set[Storage_Specifier],
-    name: string,
-    params: [dynamic]string,
-    body: [dynamic]^Ast_Node,
+    name: Atom,
+    params: []Atom,
+    body: []^Ast_Node,
 }
 
 Int_Constant_Node :: struct {
@@ -98,7 +100,7 @@ Int_Constant_Node :: struct {
 }
 
 Ident_Node :: struct {
-    var_name: string,
+    var_name: Atom,
 }
 
 Negate_Node :: struct {
@@ -158,7 +160,7 @@ Return_Node :: struct {
 }
 
 Goto_Node :: struct {
-    label: string
+    label: Atom,
 }
 
 Storage_Specifier :: enum {
@@ -168,17 +170,17 @@ Storage_Specifier :: enum {
 
 Decl_Assign_Node :: struct {
     storage_specifiers: bit_set[Storage_Specifier],
-    var_name: string,
+    var_name: Atom,
     right: ^Ast_Node,
 }
 
 Decl_Node :: struct {
     storage_specifiers: bit_set[Storage_Specifier],
-    var_name: string,
+    var_name: Atom,
 }
 
 Compound_Statement_Node :: struct {
-    statements: [dynamic]^Ast_Node,
+    statements: []^Ast_Node,
 }
 
 Ternary_Node :: struct {
@@ -188,8 +190,8 @@ Ternary_Node :: struct {
 }
 
 Function_Call_Node :: struct {
-    name: string,
-    args: [dynamic]^Ast_Node,
+    name: Atom,
+    args: []^Ast_Node,
 }
 
 If_Node :: struct {
@@ -216,32 +218,73 @@ Switch_Node :: struct {
     block: ^Ast_Node,
 }
 
+// Every node of the program being compiled, and everything the parser allocates along with them, lives in one arena.
+// The tree is released all at once when the program has been emitted, instead of being leaked node by node.
+Ast_Store :: struct {
+    arena: virtual.Arena,
+    allocator: mem.Allocator, // Allocates from `arena`
+    initialized: bool,
+    labels: map[^Ast_Node][]Label,
+}
+
+ast_store: Ast_Store
+
+ast_allocator :: proc() -> mem.Allocator {
+    if !ast_store.initialized {
+        if virtual.arena_init_growing(&ast_store.arena) != nil {
+            fmt.eprintln("Could not allocate memory for the syntax tree")
+            exit_with_error()
+        }
+        ast_store.initialized = true
+        ast_store.allocator = virtual.arena_allocator(&ast_store.arena)
+        ast_store.labels = make(map[^Ast_Node][]Label, ast_store.allocator)
+    }
+    // Counted for -timings, which would otherwise miss everything the parser allocates
+    return counting_allocator(&ast_store.allocator)
+}
+
+// Frees every node in O(1). Also called before parsing, in case an error abandoned the last program before it was
+// released.
+release_ast :: proc() {
+    if !ast_store.initialized do return
+    virtual.arena_free_all(&ast_store.arena)
+    ast_store.labels = make(map[^Ast_Node][]Label, ast_store.allocator)
+}
+
+node_labels :: proc(node: ^Ast_Node) -> []Label {
+    return ast_store.labels[node]
+}
+
+set_node_labels :: proc(node: ^Ast_Node, labels: []Label) {
+    if len(labels) > 0 do ast_store.labels[node] = labels
+}
+
 make_node_0 :: proc($T: typeid) -> ^Ast_Node {
-    node := new(Ast_Node)
+    node := new(Ast_Node, ast_allocator())
     node.variant = T{}
     return node
 }
 
 make_node_1 :: proc($T: typeid, inner: $I) -> ^Ast_Node {
-    node := new(Ast_Node)
+    node := new(Ast_Node, ast_allocator())
     node.variant = T{inner}
     return node
 }
 
 make_node_2 :: proc($T: typeid, first: $F, second: $S) -> ^Ast_Node {
-    node := new(Ast_Node)
+    node := new(Ast_Node, ast_allocator())
     node.variant = T{first, second}
     return node
 }
 
 make_node_3 :: proc($T: typeid, first: $F, second: $S, third: $H) -> ^Ast_Node {
-    node := new(Ast_Node)
+    node := new(Ast_Node, ast_allocator())
     node.variant = T{first, second, third}
     return node
 }
 
 make_node_4 :: proc($T: typeid, first: $F, second: $S, third: $H, fourth: $O) -> ^Ast_Node {
-    node := new(Ast_Node)
+    node := new(Ast_Node, ast_allocator())
     node.variant = T{first, second, third, fourth}
     return node
 }
@@ -254,13 +297,13 @@ print_indent :: proc(indent: int) {
     }
 }
 
-pretty_print_node :: proc(node: Ast_Node, indent := 0) {
+pretty_print_node :: proc(node: ^Ast_Node, indent := 0) {
     print_indent(indent)
 
-    for label in node.labels {
+    for label in node_labels(node) {
         switch l in label {
-            case string:
-                fmt.printf("%v: ", l)
+            case Atom:
+                fmt.printf("%v: ", atom_text(l))
             case int:
                 fmt.printf("case %v: ", l)
             case Default_Label:
@@ -279,21 +322,32 @@ pretty_print_node :: proc(node: Ast_Node, indent := 0) {
         switch v in reflect.struct_field_value_by_name(node_variant, field_name) {
             case ^Ast_Node:
                 fmt.println("(")
-                pretty_print_node(v^, indent + 1)
+                pretty_print_node(v, indent + 1)
                 fmt.println()
                 print_indent(indent)
                 fmt.print(")")
 
-            case [dynamic]^Ast_Node:
+            case []^Ast_Node:
                 fmt.println("(")
                 for node, i in v {
                     if i > 0 do fmt.println(",")
-                    pretty_print_node(node^, indent + 1)
+                    pretty_print_node(node, indent + 1)
                 }
                 fmt.println()
                 print_indent(indent)
                 fmt.print(")")
 
+            case Atom:
+                fmt.printf("%v", atom_text(v))
+
+            case []Atom:
+                fmt.print("[")
+                for atom, i in v {
+                    if i > 0 do fmt.print(", ")
+                    fmt.print(atom_text(atom))
+                }
+                fmt.print("]")
+
             case:
                 fmt.printf("%v", v)
         }
@@ -308,7 +362,7 @@ pretty_print_program :: proc(program: Program) {
     else {
         fmt.println("program(")
         for child in program.children {
-            pretty_print_node(child^, 1)
+            pretty_print_node(child, 1)
             fmt.println(",")
         }
         fmt.println(")")
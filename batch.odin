@@ -0,0 +1,169 @@
+package occm
+
+// Batch mode compiles many independent groups of files in one process, so the test harness does not pay for a process
+// start and a gcc spawn per test. Groups are compiled one at a time, and linked by a small pool of concurrent gcc jobs.
+//
+// The manifest has one group per line, with the files of a group separated by tabs. One JSON record is written to stdout
+// per group, in the order the groups finish:
+//   {"group": 0, "status": "ok", "exit_code": 0, "executable": "0_return_2.exe", "stdout": "", "stderr": ""}
+// status is one of "ok", "compile_error" or "link_error". stdout and stderr hold the diagnostics printed while compiling.
+import "core:fmt"
+import "core:os"
+import "core:strings"
+import "core:c/libc"
+import "core:encoding/json"
+import "core:mem/virtual"
+import path "core:path/filepath"
+import "core:container/queue"
+
+DEFAULT_LINK_JOBS :: 4
+
+Batch_Result :: struct {
+    group: int,
+    status: string,
+    exit_code: i32,
+    executable: string,
+    stdout: string,
+    stderr: string,
+}
+
+// A group whose gcc job is still running. Everything it allocated lives in its arena, which is freed when it is reported.
+Batch_Job :: struct {
+    index: int,
+    arena: ^virtual.Arena,
+    gcc: Gcc_Job,
+    stdout: strings.Builder,
+    stderr: strings.Builder,
+}
+
+read_batch_manifest :: proc(manifest_file: string) -> (groups: [][]string, ok: bool) {
+    data, read_ok := os.read_entire_file(manifest_file)
+    if !read_ok do return nil, false
+
+    group_list: [dynamic][]string
+    for line in strings.split_lines(strings.trim_right_space(string(data))) {
+        trimmed := strings.trim_right(line, "\r")
+        if trimmed == "" do continue
+        append(&group_list, strings.split(trimmed, "\t"))
+    }
+    return group_list[:], true
+}
+
+// Returns false if compilation failed, in which case the diagnostics are in the job's builders. A gcc that could not be
+// started is not a compile error, it is reported as a link error when the job is finished.
+// Errors deep in the compiler jump straight back here, so this must not rely on any of its locals after setjmp returns.
+try_start_batch_job :: proc(job: ^Batch_Job, source_files: []string) -> (ok: bool) {
+    jump_buffer: libc.jmp_buf
+    if libc.setjmp(&jump_buffer) != 0 {
+        error_jump_buffer = nil
+        return false
+    }
+    error_jump_buffer = &jump_buffer
+
+    asm_prefix := fmt.tprintf("%v_", job.index)
+    out_file := fmt.aprintf("%v%v.exe", asm_prefix, path.stem(path.base(source_files[0])))
+    start_compile_group(&job.gcc, source_files, out_file, asm_prefix = asm_prefix)
+
+    error_jump_buffer = nil
+    return true
+}
+
+report_batch_result :: proc(result: Batch_Result) {
+    record, err := json.marshal(result, allocator = context.temp_allocator)
+    if err != nil {
+        fmt.eprintfln("Could not encode the result of group %v", result.group)
+        return
+    }
+    fmt.println(string(record))
+}
+
+finish_batch_job :: proc(job: ^Batch_Job) {
+    exit_code := finish_compile_group(&job.gcc)
+    result := Batch_Result{
+        group = job.index,
+        status = "ok" if exit_code == 0 else "link_error",
+        exit_code = exit_code,
+        executable = job.gcc.out_file if exit_code == 0 else "",
+        stdout = strings.to_string(job.stdout),
+        stderr = strings.to_string(job.stderr),
+    }
+    report_batch_result(result)
+
+    virtual.arena_destroy(job.arena)
+    free(job.arena)
+    free_all(context.temp_allocator)
+}
+
+compile_batch :: proc(manifest_file: string, link_jobs: int) {
+    groups, ok := read_batch_manifest(manifest_file)
+    if !ok {
+        fmt.eprintfln("Could not read from %v", manifest_file)
+        os.exit(1)
+    }
+
+    child_stdout_to_stderr = true
+    defer child_stdout_to_stderr = false
+
+    pending: queue.Queue(^Batch_Job)
+    queue.init(&pending)
+    defer queue.destroy(&pending)
+
+    for source_files, index in groups {
+        if len(source_files) == 0 do continue
+
+        // Make room in the link pool before compiling, so that at most `link_jobs` gcc processes run at once
+        for queue.len(pending) >= link_jobs {
+            job := queue.pop_front(&pending)
+            finish_batch_job(job)
+            free(job)
+        }
+
+        job := new(Batch_Job)
+        job.index = index
+        job.arena = new(virtual.Arena)
+        if virtual.arena_init_growing(job.arena) != nil {
+            fmt.eprintln("Could not allocate memory for batch compilation")
+            os.exit(1)
+        }
+
+        {
+            context.allocator = virtual.arena_allocator(job.arena)
+            strings.builder_init(&job.stdout)
+            strings.builder_init(&job.stderr)
+
+            // Every group is compiled as if by a fresh process
+            current_label = 1
+            diagnostic_stdout = &job.stdout
+            diagnostic_stderr = &job.stderr
+            compiled := try_start_batch_job(job, source_files)
+            diagnostic_stdout = nil
+            diagnostic_stderr = nil
+
+            if !compiled {
+                finish_compile_group(&job.gcc)
+                report_batch_result(Batch_Result{
+                    group = index,
+                    status = "compile_error",
+                    exit_code = 1,
+                    stdout = strings.to_string(job.stdout),
+                    stderr = strings.to_string(job.stderr),
+                })
+            }
+            else {
+                queue.push_back(&pending, job)
+                continue
+            }
+        }
+
+        virtual.arena_destroy(job.arena)
+        free(job.arena)
+        free(job)
+        free_all(context.temp_allocator)
+    }
+
+    for queue.len(pending) > 0 {
+        job := queue.pop_front(&pending)
+        finish_batch_job(job)
+        free(job)
+    }
+}
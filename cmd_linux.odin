@@ -0,0 +1,69 @@
+package occm
+
+// POSIX counterpart of cmd_windows.odin. The argument vector is handed straight to exec, so no shell or command line quoting is involved.
+import "core:strings"
+import "core:sys/posix"
+
+// A child process started by `start_command`
+Process :: struct {
+    pid: posix.pid_t,
+}
+
+// Runs a command with `input` written to its standard input. If `input` is nil, the child inherits our standard input.
+run_command :: proc(argv: []string, input: []u8 = nil) -> (exit_code: i32) {
+    process, ok := start_command(argv, input)
+    if !ok do return -1
+    return wait_command(process)
+}
+
+// Starts a command without waiting for it to exit. `input` is written to its standard input before this returns.
+// If `stdout_to_stderr` is set, the child's standard output goes to our standard error.
+start_command :: proc(argv: []string, input: []u8 = nil, stdout_to_stderr := false) -> (process: Process, ok: bool) {
+    c_argv := make([]cstring, len(argv) + 1, context.temp_allocator)
+    for arg, i in argv {
+        c_argv[i] = strings.clone_to_cstring(arg, context.temp_allocator)
+    }
+    c_argv[len(argv)] = nil
+
+    pipe_fds: [2]posix.FD
+    if input != nil && posix.pipe(&pipe_fds) != .OK do return {}, false
+
+    pid := posix.fork()
+    if pid == -1 do return {}, false
+
+    if pid == 0 {
+        if input != nil {
+            posix.dup2(pipe_fds[0], posix.STDIN_FILENO)
+            posix.close(pipe_fds[0])
+            posix.close(pipe_fds[1])
+        }
+        if stdout_to_stderr {
+            posix.dup2(posix.STDERR_FILENO, posix.STDOUT_FILENO)
+        }
+        posix.execvp(c_argv[0], raw_data(c_argv))
+        posix._exit(127) // Only reached if exec failed
+    }
+
+    if input != nil {
+        posix.close(pipe_fds[0])
+        remaining := input
+        for len(remaining) > 0 {
+            written := posix.write(pipe_fds[1], raw_data(remaining), uint(len(remaining)))
+            if written <= 0 do break
+            remaining = remaining[written:]
+        }
+        posix.close(pipe_fds[1])
+    }
+
+    return Process{pid}, true
+}
+
+wait_command :: proc(process: Process) -> (exit_code: i32) {
+    status: i32
+    for posix.waitpid(process.pid, &status, {}) == -1 {
+        if posix.errno() != .EINTR do return -1
+    }
+
+    if posix.WIFEXITED(status) do return posix.WEXITSTATUS(status)
+    return 128 + i32(posix.WTERMSIG(status))
+}
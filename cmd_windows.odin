@@ -0,0 +1,108 @@
+package occm
+
+// It's annoying that this is platform specific, but we need functions for executing gcc from within this process and Odin does not provide a cross-platform way of doing it.
+import "core:strings"
+import "core:sys/windows"
+
+// CreateProcessW takes a single command line, so the argument vector is quoted following the rules of CommandLineToArgvW
+build_command_line :: proc(argv: []string) -> string {
+    builder: strings.Builder
+    strings.builder_init_none(&builder, context.temp_allocator)
+    for arg, i in argv {
+        if i > 0 do strings.write_byte(&builder, ' ')
+        if len(arg) > 0 && strings.index_any(arg, " \t\"") == -1 {
+            strings.write_string(&builder, arg)
+            continue
+        }
+
+        strings.write_byte(&builder, '"')
+        backslashes := 0
+        for c in transmute([]u8)arg {
+            if c == '\\' {
+                backslashes += 1
+                continue
+            }
+            if c == '"' {
+                // Backslashes before a quote need escaping, as does the quote itself
+                for _ in 0..<backslashes * 2 + 1 do strings.write_byte(&builder, '\\')
+            }
+            else {
+                for _ in 0..<backslashes do strings.write_byte(&builder, '\\')
+            }
+            backslashes = 0
+            strings.write_byte(&builder, c)
+        }
+        for _ in 0..<backslashes * 2 do strings.write_byte(&builder, '\\')
+        strings.write_byte(&builder, '"')
+    }
+    return strings.to_string(builder)
+}
+
+// A child process started by `start_command`
+Process :: struct {
+    process: windows.HANDLE,
+    thread: windows.HANDLE,
+}
+
+// Runs a command with `input` written to its standard input. If `input` is nil, the child inherits our standard input.
+run_command :: proc(argv: []string, input: []u8 = nil) -> (exit_code: i32) {
+    process, ok := start_command(argv, input)
+    if !ok do return -1
+    return wait_command(process)
+}
+
+// Starts a command without waiting for it to exit. `input` is written to its standard input before this returns.
+// If `stdout_to_stderr` is set, the child's standard output goes to our standard error.
+start_command :: proc(argv: []string, input: []u8 = nil, stdout_to_stderr := false) -> (process: Process, ok: bool) {
+    command_wstring := windows.utf8_to_wstring(build_command_line(argv))
+
+    s_info: windows.STARTUPINFOW
+    s_info.cb = size_of(s_info)
+    p_info: windows.PROCESS_INFORMATION = ---
+
+    read_pipe, write_pipe: windows.HANDLE
+    if input != nil {
+        security := windows.SECURITY_ATTRIBUTES{
+            nLength = size_of(windows.SECURITY_ATTRIBUTES),
+            bInheritHandle = true,
+        }
+        if !windows.CreatePipe(&read_pipe, &write_pipe, &security, 0) do return {}, false
+        // Only the read end may be inherited, otherwise the child holds its own write end open and never sees the end of its input
+        windows.SetHandleInformation(write_pipe, windows.HANDLE_FLAG_INHERIT, 0)
+
+    }
+
+    if input != nil || stdout_to_stderr {
+        s_info.dwFlags |= windows.STARTF_USESTDHANDLES
+        s_info.hStdInput = read_pipe if input != nil else windows.GetStdHandle(windows.STD_INPUT_HANDLE)
+        s_info.hStdOutput = windows.GetStdHandle(windows.STD_ERROR_HANDLE if stdout_to_stderr else windows.STD_OUTPUT_HANDLE)
+        s_info.hStdError = windows.GetStdHandle(windows.STD_ERROR_HANDLE)
+    }
+
+    created := windows.CreateProcessW(nil, command_wstring, nil, nil, true, 0, nil, nil, &s_info, &p_info)
+
+    if input != nil {
+        windows.CloseHandle(read_pipe)
+        remaining := input
+        for created && len(remaining) > 0 {
+            written: windows.DWORD
+            if !windows.WriteFile(write_pipe, raw_data(remaining), windows.DWORD(len(remaining)), &written, nil) do break
+            remaining = remaining[written:]
+        }
+        windows.CloseHandle(write_pipe)
+    }
+
+    if !created do return {}, false
+    return Process{p_info.hProcess, p_info.hThread}, true
+}
+
+wait_command :: proc(process: Process) -> (exit_code: i32) {
+    windows.WaitForSingleObject(process.process, windows.INFINITE)
+
+    e_code: u32 = ---
+    windows.GetExitCodeProcess(process.process, &e_code)
+    windows.CloseHandle(process.process)
+    windows.CloseHandle(process.thread)
+
+    return transmute(i32)e_code
+}
@@ -0,0 +1,57 @@
+package occm
+
+// Identifiers are interned by the lexer into atoms, small integers that are equal exactly when the names are. Every
+// later stage keys its tables by atom and compares names as integers, and only looks the text up again to write it
+// into the assembly.
+//
+// The table is shared by every file the process compiles, so it lives in its own arena rather than with the tree.
+import "core:fmt"
+import "core:strings"
+import "core:mem"
+import "core:mem/virtual"
+
+Atom :: distinct u32
+
+NO_ATOM :: Atom(0) // Interned from the empty string
+INT_ATOM :: Atom(1) // The name of the only type, for Variable_Type and Function_Type
+
+Intern_Table :: struct {
+    arena: virtual.Arena,
+    initialized: bool,
+    atoms: map[string]Atom,
+    texts: [dynamic]string, // Indexed by atom
+}
+
+intern_table: Intern_Table
+
+intern_allocator :: proc() -> mem.Allocator {
+    if !intern_table.initialized {
+        if virtual.arena_init_growing(&intern_table.arena) != nil {
+            fmt.eprintln("Could not allocate memory for the identifier table")
+            exit_with_error()
+        }
+        intern_table.initialized = true
+        allocator := virtual.arena_allocator(&intern_table.arena)
+        intern_table.atoms = make(map[string]Atom, allocator)
+        intern_table.texts = make([dynamic]string, allocator)
+        assert(intern("") == NO_ATOM)
+        assert(intern("int") == INT_ATOM)
+    }
+    return virtual.arena_allocator(&intern_table.arena)
+}
+
+// Returns the atom for `text`, copying the text into the table the first time it is seen
+intern :: proc(text: string) -> Atom {
+    allocator := intern_allocator()
+    if atom, found := intern_table.atoms[text]; found do return atom
+
+    atom := Atom(len(intern_table.texts))
+    owned := strings.clone(text, allocator)
+    append(&intern_table.texts, owned)
+    intern_table.atoms[owned] = atom
+    return atom
+}
+
+atom_text :: proc(atom: Atom) -> string {
+    return intern_table.texts[atom]
+}
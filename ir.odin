@@ -0,0 +1,691 @@
+package occm
+
+// A three-address intermediate representation, optimized by optimize.odin and emitted by regalloc.odin.
+// Every local variable and intermediate value becomes a temporary, and all control flow becomes labels and jumps.
+// Variables with static storage are not temporaries, they are read and written with explicit loads and stores.
+import "core:fmt"
+import "core:slice"
+
+Ir_Temp :: distinct int
+
+NO_TEMP :: Ir_Temp(-1)
+
+// An operand is either a constant or a temporary
+Ir_Operand :: union {
+    int,
+    Ir_Temp,
+}
+
+Ir_Op :: enum {
+    Copy, // dest = left
+    Negate, // dest = -left
+    Bit_Not, // dest = ~left
+    Bool_Not, // dest = !left
+    Add, // dest = left + right, and so on for the other binary operators
+    Subtract,
+    Multiply,
+    Divide,
+    Modulo,
+    Bit_And,
+    Bit_Or,
+    Bit_Xor,
+    Shift_Left,
+    Shift_Right,
+    Equal,
+    Not_Equal,
+    Less,
+    Less_Equal,
+    More,
+    More_Equal,
+    Load_Global, // dest = name
+    Store_Global, // name = left
+    Get_Param, // dest = parameter number `param`
+    Call, // dest = name(args)
+    Label, // label:
+    Jump, // goto label
+    Jump_If_Zero, // if left == 0 goto label
+    Jump_If_Not_Zero, // if left != 0 goto label
+    Return, // return left
+}
+
+Ir_Instruction :: struct {
+    op: Ir_Op,
+    dest: Ir_Temp,
+    left: Ir_Operand,
+    right: Ir_Operand,
+    label: int,
+    param: int,
+    name: string,
+    args: []Ir_Operand,
+}
+
+Ir_Function :: struct {
+    name: string,
+    global: bool,
+    instructions: [dynamic]Ir_Instruction,
+    temp_count: int,
+}
+
+Ir_Static_Variable :: struct {
+    name: string,
+    global: bool,
+    value: int,
+}
+
+Ir_Program :: struct {
+    functions: [dynamic]Ir_Function,
+    static_variables: [dynamic]Ir_Static_Variable,
+}
+
+// A variable is either a temporary or the symbol of a variable with static storage
+Ir_Variable :: union {
+    Ir_Temp,
+    string,
+}
+
+// The variable behind every name visible at the current point of lowering, see symbols.odin
+Ir_Scope :: Symbol_Table(Ir_Variable)
+
+Ir_Builder :: struct {
+    program: ^Ir_Program,
+    function: ^Ir_Function,
+    static_variable_indices: map[string]int,
+    user_labels: map[Atom]int,
+    loop_labels: [dynamic]Loop_Labels,
+    switch_infos: [dynamic]Switch_Info,
+    containing_control_flows: [dynamic]Containing_Control_Flow,
+}
+
+lookup_ir_variable :: proc(scope: ^Ir_Scope, name: Atom) -> Ir_Variable {
+    if variable, ok := lookup_symbol(scope, name); ok {
+        return variable
+    }
+    unreachable()
+}
+
+new_temp :: proc(builder: ^Ir_Builder) -> Ir_Temp {
+    temp := Ir_Temp(builder.function.temp_count)
+    builder.function.temp_count += 1
+    return temp
+}
+
+new_label :: proc() -> int {
+    label := current_label
+    current_label += 1
+    return label
+}
+
+ir_emit :: proc(builder: ^Ir_Builder, instruction: Ir_Instruction) {
+    instruction := instruction
+    if !ir_op_defines_dest(instruction.op) {
+        instruction.dest = NO_TEMP
+    }
+    append(&builder.function.instructions, instruction)
+}
+
+ir_emit_label :: proc(builder: ^Ir_Builder, label: int) {
+    ir_emit(builder, Ir_Instruction{op = .Label, label = label})
+}
+
+ir_emit_jump :: proc(builder: ^Ir_Builder, op: Ir_Op, label: int, condition: Ir_Operand = nil) {
+    ir_emit(builder, Ir_Instruction{op = op, left = condition, label = label})
+}
+
+ir_op_defines_dest :: proc(op: Ir_Op) -> bool {
+    #partial switch op {
+        case .Store_Global, .Label, .Jump, .Jump_If_Zero, .Jump_If_Not_Zero, .Return:
+            return false
+    }
+    return true
+}
+
+read_variable :: proc(builder: ^Ir_Builder, scope: ^Ir_Scope, name: Atom) -> Ir_Operand {
+    switch v in lookup_ir_variable(scope, name) {
+        case Ir_Temp:
+            return v
+
+        case string:
+            temp := new_temp(builder)
+            ir_emit(builder, Ir_Instruction{op = .Load_Global, dest = temp, name = v})
+            return temp
+    }
+    unreachable()
+}
+
+write_variable :: proc(builder: ^Ir_Builder, scope: ^Ir_Scope, name: Atom, value: Ir_Operand) {
+    switch v in lookup_ir_variable(scope, name) {
+        case Ir_Temp:
+            if temp, is_temp := value.(Ir_Temp); is_temp && temp == v do return
+            ir_emit(builder, Ir_Instruction{op = .Copy, dest = v, left = value})
+
+        case string:
+            ir_emit(builder, Ir_Instruction{op = .Store_Global, left = value, name = v})
+    }
+}
+
+// Variables with static storage are initialised by the assembler, so their initialisers must be constants
+evaluate_constant_initializer :: proc(init: ^Ast_Node) -> int {
+    #partial switch e in init.variant {
+        case Int_Constant_Node:
+            return e.value
+
+        case Negate_Node:
+            return -evaluate_constant_initializer(e.expr)
+
+        case Bit_Negate_Node:
+            return ~evaluate_constant_initializer(e.expr)
+    }
+    semantic_error("Variables with static storage must be initialised with a constant")
+    return 0
+}
+
+define_static_variable :: proc(builder: ^Ir_Builder, name: string, global: bool, value: int, has_value: bool) {
+    if index, found := builder.static_variable_indices[name]; found {
+        // A tentative definition does not override an earlier initialiser
+        if has_value do builder.program.static_variables[index].value = value
+        return
+    }
+    builder.static_variable_indices[name] = len(builder.program.static_variables)
+    append(&builder.program.static_variables, Ir_Static_Variable{name, global, value})
+}
+
+lower_program :: proc(program: Program) -> Ir_Program {
+    result: Ir_Program
+    builder := Ir_Builder{
+        program = &result,
+        static_variable_indices = make(map[string]int),
+        user_labels = make(map[Atom]int),
+        loop_labels = make([dynamic]Loop_Labels),
+        switch_infos = make([dynamic]Switch_Info),
+        containing_control_flows = make([dynamic]Containing_Control_Flow),
+    }
+    file_scope := make_symbol_table(Ir_Variable)
+    defer delete_symbol_table(&file_scope)
+
+    for node in program.children {
+        #partial switch n in node.variant {
+            case Decl_Node:
+                define_symbol(&file_scope, n.var_name, atom_text(n.var_name))
+                // 'extern' without an initialiser only declares a variable that is defined elsewhere
+                if n.linkage != .External {
+                    define_static_variable(&builder, atom_text(n.var_name), n.linkage != .Internal, 0, false)
+                }
+
+            case Decl_Assign_Node:
+                define_symbol(&file_scope, n.var_name, atom_text(n.var_name))
+                define_static_variable(&builder, atom_text(n.var_name), n.linkage != .Internal, evaluate_constant_initializer(n.right), true)
+
+            case Function_Definition_Node:
+                lower_function(&builder, n, &file_scope)
+        }
+    }
+
+    return result
+}
+
+lower_function :: proc(builder: ^Ir_Builder, function: Function_Definition_Node, scope: ^Ir_Scope) {
+    append(&builder.program.functions, Ir_Function{
+        name = atom_text(function.name),
+        global = function.linkage != .Internal,
+        instructions = make([dynamic]Ir_Instruction),
+    })
+    builder.function = slice.last_ptr(builder.program.functions[:])
+
+    clear(&builder.user_labels)
+    for label in validate_and_gather_function_labels(function) {
+        if name, is_normal := label.(Atom); is_normal {
+            builder.user_labels[name] = new_label()
+        }
+    }
+
+    enter_scope(scope)
+    defer exit_scope(scope)
+    for param, i in function.params {
+        temp := new_temp(builder)
+        define_symbol(scope, param, temp)
+        ir_emit(builder, Ir_Instruction{op = .Get_Param, dest = temp, param = i})
+    }
+
+    for block_item in function.body {
+        lower_block_item(builder, block_item, scope)
+    }
+
+    // Falling off the end of a function returns 0, which is what 'main' requires
+    ir_emit(builder, Ir_Instruction{op = .Return, left = 0})
+}
+
+lower_block_item :: proc(builder: ^Ir_Builder, block_item: ^Ast_Node, scope: ^Ir_Scope) {
+    #partial switch item in block_item.variant {
+        case Decl_Assign_Node:
+            if item.linkage == .Internal {
+                symbol := fmt.aprintf("%v.%v", atom_text(item.var_name), new_label())
+                define_static_variable(builder, symbol, false, evaluate_constant_initializer(item.right), true)
+                define_symbol(scope, item.var_name, symbol)
+            }
+            else if item.linkage == .External {
+                define_symbol(scope, item.var_name, atom_text(item.var_name))
+            }
+            else {
+                // The variable is in scope in its own initialiser
+                define_symbol(scope, item.var_name, new_temp(builder))
+                write_variable(builder, scope, item.var_name, lower_expr(builder, item.right, scope))
+            }
+
+        case Decl_Node:
+            if item.linkage == .Internal {
+                symbol := fmt.aprintf("%v.%v", atom_text(item.var_name), new_label())
+                define_static_variable(builder, symbol, false, 0, true)
+                define_symbol(scope, item.var_name, symbol)
+            }
+            else if item.linkage == .External {
+                define_symbol(scope, item.var_name, atom_text(item.var_name))
+            }
+            else {
+                define_symbol(scope, item.var_name, new_temp(builder))
+            }
+
+        case Function_Declaration_Node: // Do nothing
+
+        case Function_Definition_Node: // This is a semantic error, but will be caught in the validation step
+            unreachable()
+
+        case:
+            lower_statement(builder, block_item, scope)
+    }
+}
+
+lower_statement :: proc(builder: ^Ir_Builder, statement: ^Ast_Node, scope: ^Ir_Scope) {
+    for label in node_labels(statement) {
+        switch l in label {
+            case Atom:
+                ir_emit_label(builder, builder.user_labels[l])
+            case int, Default_Label:
+                if len(builder.switch_infos) == 0 do semantic_error("'case' and 'default' labels must be in a 'switch'")
+                switch_info := slice.last_ptr(builder.switch_infos[:])
+                ir_emit_label(builder, switch_info.current_label)
+                switch_info.current_label += 1
+        }
+    }
+
+    #partial switch stmt in statement.variant {
+        case Null_Statement_Node: // Do nothing
+
+        case Return_Node:
+            ir_emit(builder, Ir_Instruction{op = .Return, left = lower_expr(builder, stmt.expr, scope)})
+
+        case If_Node:
+            end_label := new_label()
+            ir_emit_jump(builder, .Jump_If_Zero, end_label, lower_expr(builder, stmt.condition, scope))
+            lower_statement(builder, stmt.if_true, scope)
+            ir_emit_label(builder, end_label)
+
+        case If_Else_Node:
+            else_label := new_label()
+            end_label := new_label()
+            ir_emit_jump(builder, .Jump_If_Zero, else_label, lower_expr(builder, stmt.condition, scope))
+            lower_statement(builder, stmt.if_true, scope)
+            ir_emit_jump(builder, .Jump, end_label)
+            ir_emit_label(builder, else_label)
+            lower_statement(builder, stmt.if_false, scope)
+            ir_emit_label(builder, end_label)
+
+        case While_Node:
+            labels := Loop_Labels{continue_label = new_label(), break_label = new_label()}
+            append(&builder.loop_labels, labels)
+            append(&builder.containing_control_flows, Containing_Control_Flow.Loop)
+            ir_emit_label(builder, labels.continue_label)
+            ir_emit_jump(builder, .Jump_If_Zero, labels.break_label, lower_expr(builder, stmt.condition, scope))
+            lower_statement(builder, stmt.if_true, scope)
+            ir_emit_jump(builder, .Jump, labels.continue_label)
+            ir_emit_label(builder, labels.break_label)
+            pop(&builder.containing_control_flows)
+            pop(&builder.loop_labels)
+
+        case Do_While_Node:
+            start_label := new_label()
+            labels := Loop_Labels{continue_label = new_label(), break_label = new_label()}
+            append(&builder.loop_labels, labels)
+            append(&builder.containing_control_flows, Containing_Control_Flow.Loop)
+            ir_emit_label(builder, start_label)
+            lower_statement(builder, stmt.if_true, scope)
+            ir_emit_label(builder, labels.continue_label)
+            ir_emit_jump(builder, .Jump_If_Not_Zero, start_label, lower_expr(builder, stmt.condition, scope))
+            ir_emit_label(builder, labels.break_label)
+            pop(&builder.containing_control_flows)
+            pop(&builder.loop_labels)
+
+        case For_Node:
+            enter_scope(scope)
+            defer exit_scope(scope)
+
+            start_label := new_label()
+            labels := Loop_Labels{continue_label = new_label(), break_label = new_label()}
+            append(&builder.loop_labels, labels)
+            append(&builder.containing_control_flows, Containing_Control_Flow.Loop)
+            lower_block_item(builder, stmt.pre_condition, scope)
+            ir_emit_label(builder, start_label)
+            ir_emit_jump(builder, .Jump_If_Zero, labels.break_label, lower_expr(builder, stmt.condition, scope))
+            lower_statement(builder, stmt.if_true, scope)
+            ir_emit_label(builder, labels.continue_label)
+            if stmt.post_condition != nil {
+                lower_expr(builder, stmt.post_condition, scope)
+            }
+            ir_emit_jump(builder, .Jump, start_label)
+            ir_emit_label(builder, labels.break_label)
+            pop(&builder.containing_control_flows)
+            pop(&builder.loop_labels)
+
+        case Continue_Node:
+            ir_emit_jump(builder, .Jump, slice.last(builder.loop_labels[:]).continue_label)
+
+        case Break_Node:
+            if slice.last(builder.containing_control_flows[:]) == .Loop {
+                ir_emit_jump(builder, .Jump, slice.last(builder.loop_labels[:]).break_label)
+            }
+            else {
+                ir_emit_jump(builder, .Jump, switch_end_label(slice.last(builder.switch_infos[:])))
+            }
+
+        case Goto_Node:
+            ir_emit_jump(builder, .Jump, builder.user_labels[stmt.label])
+
+        case Switch_Node:
+            switch_info := get_switch_info(stmt, nil)
+            append(&builder.switch_infos, switch_info)
+            append(&builder.containing_control_flows, Containing_Control_Flow.Switch)
+            current_label = switch_end_label(switch_info) + 1
+
+            value := lower_expr(builder, stmt.expr, scope)
+            // Every case is tested before falling back to 'default', wherever it appears in the body
+            default_label := switch_end_label(switch_info)
+            for label, i in switch_info.labels {
+                switch l in label {
+                    case int:
+                        matches := new_temp(builder)
+                        ir_emit(builder, Ir_Instruction{op = .Equal, dest = matches, left = value, right = l})
+                        ir_emit_jump(builder, .Jump_If_Not_Zero, switch_info.start_label + i, matches)
+
+                    case Default_Label:
+                        default_label = switch_info.start_label + i
+
+                    case Atom:
+                        unreachable()
+                }
+            }
+            ir_emit_jump(builder, .Jump, default_label)
+
+            lower_statement(builder, stmt.block, scope)
+            ir_emit_label(builder, switch_end_label(switch_info))
+            pop(&builder.containing_control_flows)
+            pop(&builder.switch_infos)
+
+        case Compound_Statement_Node:
+            enter_scope(scope)
+            defer exit_scope(scope)
+            for block_item in stmt.statements {
+                lower_block_item(builder, block_item, scope)
+            }
+
+        case:
+            lower_expr(builder, statement, scope)
+    }
+}
+
+lower_unary :: proc(builder: ^Ir_Builder, op: Ir_Op, inner: ^Ast_Node, scope: ^Ir_Scope) -> Ir_Operand {
+    value := lower_expr(builder, inner, scope)
+    dest := new_temp(builder)
+    ir_emit(builder, Ir_Instruction{op = op, dest = dest, left = value})
+    return dest
+}
+
+lower_binary :: proc(builder: ^Ir_Builder, op: Ir_Op, left: ^Ast_Node, right: ^Ast_Node, scope: ^Ir_Scope) -> Ir_Operand {
+    left_value := lower_expr(builder, left, scope)
+    right_value := lower_expr(builder, right, scope)
+    dest := new_temp(builder)
+    ir_emit(builder, Ir_Instruction{op = op, dest = dest, left = left_value, right = right_value})
+    return dest
+}
+
+// `x op= y` evaluates `y` before reading `x`, the same as the stack machine backend
+lower_compound_assign :: proc(builder: ^Ir_Builder, op: Ir_Op, left: ^Ast_Node, right: ^Ast_Node, scope: ^Ir_Scope) -> Ir_Operand {
+    name := left.variant.(Ident_Node).var_name
+    right_value := lower_expr(builder, right, scope)
+    left_value := read_variable(builder, scope, name)
+    dest := new_temp(builder)
+    ir_emit(builder, Ir_Instruction{op = op, dest = dest, left = left_value, right = right_value})
+    write_variable(builder, scope, name, dest)
+    return dest
+}
+
+lower_increment :: proc(builder: ^Ir_Builder, op: Ir_Op, inner: ^Ast_Node, scope: ^Ir_Scope, postfix: bool) -> Ir_Operand {
+    name := inner.variant.(Ident_Node).var_name
+    old_value := read_variable(builder, scope, name)
+    result: Ir_Operand = old_value
+    if postfix {
+        // The variable's own temporary is about to change, so the old value needs a copy
+        saved := new_temp(builder)
+        ir_emit(builder, Ir_Instruction{op = .Copy, dest = saved, left = old_value})
+        result = saved
+    }
+    new_value := new_temp(builder)
+    ir_emit(builder, Ir_Instruction{op = op, dest = new_value, left = old_value, right = 1})
+    write_variable(builder, scope, name, new_value)
+    return result if postfix else new_value
+}
+
+// && short circuits on a zero operand, || on a non-zero one
+lower_logical :: proc(builder: ^Ir_Builder, is_and: bool, left: ^Ast_Node, right: ^Ast_Node, scope: ^Ir_Scope) -> Ir_Operand {
+    short_circuit_op: Ir_Op = .Jump_If_Zero if is_and else .Jump_If_Not_Zero
+    short_circuit_value := 0 if is_and else 1
+
+    result := new_temp(builder)
+    short_circuit_label := new_label()
+    end_label := new_label()
+    ir_emit_jump(builder, short_circuit_op, short_circuit_label, lower_expr(builder, left, scope))
+    ir_emit_jump(builder, short_circuit_op, short_circuit_label, lower_expr(builder, right, scope))
+    ir_emit(builder, Ir_Instruction{op = .Copy, dest = result, left = 1 - short_circuit_value})
+    ir_emit_jump(builder, .Jump, end_label)
+    ir_emit_label(builder, short_circuit_label)
+    ir_emit(builder, Ir_Instruction{op = .Copy, dest = result, left = short_circuit_value})
+    ir_emit_label(builder, end_label)
+    return result
+}
+
+lower_expr :: proc(builder: ^Ir_Builder, expr: ^Ast_Node, scope: ^Ir_Scope) -> Ir_Operand {
+    #partial switch e in expr.variant {
+        case Int_Constant_Node:
+            return e.value
+
+        case Ident_Node:
+            return read_variable(builder, scope, e.var_name)
+
+        case Negate_Node: return lower_unary(builder, .Negate, e.expr, scope)
+        case Bit_Negate_Node: return lower_unary(builder, .Bit_Not, e.expr, scope)
+        case Boolean_Negate_Node: return lower_unary(builder, .Bool_Not, e.expr, scope)
+        case Pre_Decrement_Node: return lower_increment(builder, .Subtract, e.expr, scope, false)
+        case Pre_Increment_Node: return lower_increment(builder, .Add, e.expr, scope, false)
+        case Post_Decrement_Node: return lower_increment(builder, .Subtract, e.expr, scope, true)
+        case Post_Increment_Node: return lower_increment(builder, .Add, e.expr, scope, true)
+
+        case Add_Node: return lower_binary(builder, .Add, e.left, e.right, scope)
+        case Subtract_Node: return lower_binary(builder, .Subtract, e.left, e.right, scope)
+        case Multiply_Node: return lower_binary(builder, .Multiply, e.left, e.right, scope)
+        case Modulo_Node: return lower_binary(builder, .Modulo, e.left, e.right, scope)
+        case Divide_Node: return lower_binary(builder, .Divide, e.left, e.right, scope)
+        case Boolean_Equal_Node: return lower_binary(builder, .Equal, e.left, e.right, scope)
+        case Boolean_Not_Equal_Node: return lower_binary(builder, .Not_Equal, e.left, e.right, scope)
+        case Less_Node: return lower_binary(builder, .Less, e.left, e.right, scope)
+        case Less_Equal_Node: return lower_binary(builder, .Less_Equal, e.left, e.right, scope)
+        case More_Node: return lower_binary(builder, .More, e.left, e.right, scope)
+        case More_Equal_Node: return lower_binary(builder, .More_Equal, e.left, e.right, scope)
+        case Bit_And_Node: return lower_binary(builder, .Bit_And, e.left, e.right, scope)
+        case Bit_Or_Node: return lower_binary(builder, .Bit_Or, e.left, e.right, scope)
+        case Bit_Xor_Node: return lower_binary(builder, .Bit_Xor, e.left, e.right, scope)
+        case Shift_Left_Node: return lower_binary(builder, .Shift_Left, e.left, e.right, scope)
+        case Shift_Right_Node: return lower_binary(builder, .Shift_Right, e.left, e.right, scope)
+
+        case Boolean_And_Node: return lower_logical(builder, true, e.left, e.right, scope)
+        case Boolean_Or_Node: return lower_logical(builder, false, e.left, e.right, scope)
+
+        case Equal_Node:
+            value := lower_expr(builder, e.right, scope)
+            write_variable(builder, scope, e.left.variant.(Ident_Node).var_name, value)
+            return value
+
+        case Plus_Equal_Node: return lower_compound_assign(builder, .Add, e.left, e.right, scope)
+        case Minus_Equal_Node: return lower_compound_assign(builder, .Subtract, e.left, e.right, scope)
+        case Times_Equal_Node: return lower_compound_assign(builder, .Multiply, e.left, e.right, scope)
+        case Divide_Equal_Node: return lower_compound_assign(builder, .Divide, e.left, e.right, scope)
+        case Modulo_Equal_Node: return lower_compound_assign(builder, .Modulo, e.left, e.right, scope)
+        case Xor_Equal_Node: return lower_compound_assign(builder, .Bit_Xor, e.left, e.right, scope)
+        case Or_Equal_Node: return lower_compound_assign(builder, .Bit_Or, e.left, e.right, scope)
+        case And_Equal_Node: return lower_compound_assign(builder, .Bit_And, e.left, e.right, scope)
+        case Shift_Left_Equal_Node: return lower_compound_assign(builder, .Shift_Left, e.left, e.right, scope)
+        case Shift_Right_Equal_Node: return lower_compound_assign(builder, .Shift_Right, e.left, e.right, scope)
+
+        case Ternary_Node:
+            result := new_temp(builder)
+            else_label := new_label()
+            end_label := new_label()
+            ir_emit_jump(builder, .Jump_If_Zero, else_label, lower_expr(builder, e.condition, scope))
+            ir_emit(builder, Ir_Instruction{op = .Copy, dest = result, left = lower_expr(builder, e.if_true, scope)})
+            ir_emit_jump(builder, .Jump, end_label)
+            ir_emit_label(builder, else_label)
+            ir_emit(builder, Ir_Instruction{op = .Copy, dest = result, left = lower_expr(builder, e.if_false, scope)})
+            ir_emit_label(builder, end_label)
+            return result
+
+        case Function_Call_Node:
+            args := make([]Ir_Operand, len(e.args))
+            for arg, i in e.args {
+                args[i] = lower_expr(builder, arg, scope)
+            }
+            dest := new_temp(builder)
+            ir_emit(builder, Ir_Instruction{op = .Call, dest = dest, name = atom_text(e.name), args = args})
+            return dest
+
+        case:
+            fmt.println(expr)
+            panic("Not a valid expression!")
+    }
+}
+
+// Control flow and liveness analysis, shared by the optimizer and the register allocator
+
+Basic_Block :: struct {
+    start: int, // Index of the first instruction
+    end: int, // Index of the last instruction
+    successors: [dynamic]int,
+}
+
+// A set of small non-negative integers, one bit each. Used for sets of temporaries and of instructions.
+Bit_Vector :: []u64
+
+make_bit_vector :: proc(size: int, allocator := context.allocator) -> Bit_Vector {
+    return make(Bit_Vector, (size + 63) / 64, allocator)
+}
+
+bit_vector_add :: proc(set: Bit_Vector, index: int) {
+    set[index / 64] |= 1 << u64(index % 64)
+}
+
+bit_vector_remove :: proc(set: Bit_Vector, index: int) {
+    set[index / 64] &~= 1 << u64(index % 64)
+}
+
+bit_vector_contains :: proc(set: Bit_Vector, index: int) -> bool {
+    return set[index / 64] & (1 << u64(index % 64)) != 0
+}
+
+ir_uses :: proc(instruction: Ir_Instruction, uses: ^[dynamic]Ir_Temp) {
+    clear(uses)
+    if temp, is_temp := instruction.left.(Ir_Temp); is_temp do append(uses, temp)
+    if temp, is_temp := instruction.right.(Ir_Temp); is_temp do append(uses, temp)
+    for arg in instruction.args {
+        if temp, is_temp := arg.(Ir_Temp); is_temp do append(uses, temp)
+    }
+}
+
+find_basic_blocks :: proc(function: Ir_Function) -> [dynamic]Basic_Block {
+    blocks := make([dynamic]Basic_Block)
+    label_blocks := make(map[int]int, context.temp_allocator)
+
+    instructions := function.instructions[:]
+    start := 0
+    for instruction, i in instructions {
+        ends_block := i == len(instructions) - 1
+        #partial switch instruction.op {
+            case .Jump, .Jump_If_Zero, .Jump_If_Not_Zero, .Return:
+                ends_block = true
+        }
+        if !ends_block && instructions[i + 1].op == .Label do ends_block = true
+
+        if ends_block {
+            if instructions[start].op == .Label do label_blocks[instructions[start].label] = len(blocks)
+            append(&blocks, Basic_Block{start = start, end = i})
+            start = i + 1
+        }
+    }
+
+    for &block, i in blocks {
+        last := instructions[block.end]
+        #partial switch last.op {
+            case .Jump:
+                append(&block.successors, label_blocks[last.label])
+            case .Jump_If_Zero, .Jump_If_Not_Zero:
+                append(&block.successors, label_blocks[last.label])
+                if i + 1 < len(blocks) do append(&block.successors, i + 1)
+            case .Return:
+            case:
+                if i + 1 < len(blocks) do append(&block.successors, i + 1)
+        }
+    }
+
+    return blocks
+}
+
+delete_basic_blocks :: proc(blocks: [dynamic]Basic_Block) {
+    for block in blocks do delete(block.successors)
+    delete(blocks)
+}
+
+// Finds the temporaries live on entry to and exit from each block, by the usual backwards dataflow. The sets are
+// allocated with the temp allocator.
+compute_liveness :: proc(function: Ir_Function, blocks: []Basic_Block) -> (live_in, live_out: []Bit_Vector) {
+    instructions := function.instructions[:]
+    uses := make([dynamic]Ir_Temp, context.temp_allocator)
+    gen := make([]Bit_Vector, len(blocks), context.temp_allocator)
+    kill := make([]Bit_Vector, len(blocks), context.temp_allocator)
+    live_in = make([]Bit_Vector, len(blocks), context.temp_allocator)
+    live_out = make([]Bit_Vector, len(blocks), context.temp_allocator)
+    for block, b in blocks {
+        gen[b] = make_bit_vector(function.temp_count, context.temp_allocator)
+        kill[b] = make_bit_vector(function.temp_count, context.temp_allocator)
+        live_in[b] = make_bit_vector(function.temp_count, context.temp_allocator)
+        live_out[b] = make_bit_vector(function.temp_count, context.temp_allocator)
+        for instruction in instructions[block.start:block.end + 1] {
+            ir_uses(instruction, &uses)
+            for temp in uses {
+                if !bit_vector_contains(kill[b], int(temp)) do bit_vector_add(gen[b], int(temp))
+            }
+            if instruction.dest != NO_TEMP do bit_vector_add(kill[b], int(instruction.dest))
+        }
+    }
+
+    for changed := true; changed; {
+        changed = false
+        #reverse for block, b in blocks {
+            for successor in block.successors {
+                for word, w in live_in[successor] do live_out[b][w] |= word
+            }
+            for w in 0..<len(live_in[b]) {
+                word := gen[b][w] | (live_out[b][w] &~ kill[b][w])
+                if word != live_in[b][w] {
+                    live_in[b][w] = word
+                    changed = true
+                }
+            }
+        }
+    }
+    return live_in, live_out
+}
@@ -7,11 +7,13 @@ import "core:strconv"
 import "core:slice"
 import path "core:path/filepath"
 import "core:container/queue"
+import "core:c/libc"
 
 LOG :: #config(LOG, false)
 
 Token_Type :: enum {
     EndOfFile,
+    LexError, // Only produced by tokenize, which reports the error once the parser reaches it
     LParen,
     RParen,
     LBrace,
@@ -74,16 +76,16 @@ Token_Type :: enum {
     Semicolon,
 }
 
-Token_Data :: union {int}
+Token_Data :: union {int, Atom} // The value of an IntConstant, or the interned name of an Ident
 
 Token :: struct {
     type: Token_Type,
     text: string,
     data: Token_Data,
 
-    // For lexical error messages
-    line: int,
-    char: int,
+    // Byte offsets of the start and end of the token, turned into a line and column only for error messages
+    offset: int,
+    end: int,
 }
 
 construct_token :: proc(lexer: ^Lexer, type: Token_Type, length: int, data: Token_Data = nil) -> Token {
@@ -92,8 +94,8 @@ construct_token :: proc(lexer: ^Lexer, type: Token_Type, length: int, data: Toke
         type = type,
         text = text,
         data = data,
-        line = lexer.line,
-        char = lexer.char - len(text)
+        offset = lexer.code_index - length,
+        end = lexer.code_index,
     }
 }
 
@@ -104,30 +106,28 @@ Lexer :: struct {
 
     // For lexical error messages
     file: string,
-    line: int,
-    char: int,
 
     // Queue of consumed tokens
     // This is to avoid having to construct a temporary lexer when peeking tokens
     consumed: [CONSUMED_SIZE]Token,
     consumed_head: int,
     consumed_tail: int,
+
+    // With -tokenize the whole file is lexed up front into `tokens`, ending with an EndOfFile or LexError token, and the
+    // parser reads it from `token_index` on instead of going through the queue
+    tokens: []Token,
+    token_index: int,
+    // How many of `tokens` the parser has looked at, so parse errors point where they would without -tokenize
+    tokens_seen: int,
+    tokenizing: bool,
 }
 
 lexer_advance :: proc(lexer: ^Lexer) {
-    c := lexer.code[lexer.code_index]
     lexer.code_index += 1
-    if c == '\n' {
-        lexer.line += 1
-        lexer.char = 0
-    }
-    else {
-        lexer.char += 1
-    }
 }
 
 lexer_eat_whitespace :: proc(lexer: ^Lexer) {
-    for lexer.code_index < len(lexer.code) && is_ascii_whitespace_byte(lexer.code[lexer.code_index]) {
+    for lexer.code_index < len(lexer.code) && .Whitespace in byte_classes[lexer.code[lexer.code_index]] {
         lexer_advance(lexer)
     }
 }
@@ -195,156 +195,193 @@ pop_from_consumed :: proc(lexer: ^Lexer) -> Token {
     return token
 }
 
+// Byte offsets into the source. Spans never cross a line.
 Span :: struct {
-    line: int,
-    char_start: int,
-    char_end: int,
+    start: int,
+    end: int,
 }
 
-find_line :: proc(code: string, line_index: int) -> string {
-    code := code
-    index := 0
-    line: string
-
-    for l in strings.split_lines_iterator(&code) {
-        if index == line_index {
-            line = l
-        }
-        index += 1
+// Returns the offset at which each line of `code` starts. Only built when a diagnostic needs a line number.
+find_line_starts :: proc(code: string, allocator := context.temp_allocator) -> []int {
+    starts := make([dynamic]int, allocator)
+    append(&starts, 0)
+    for c, i in transmute([]u8)code {
+        if c == '\n' do append(&starts, i + 1)
     }
+    return starts[:]
+}
+
+// Returns the zero based line and column of a byte offset
+find_position :: proc(line_starts: []int, offset: int) -> (line, char: int) {
+    index, found := slice.binary_search(line_starts, offset)
+    line = index if found else index - 1
+    return line, offset - line_starts[line]
+}
+
+// Returns the text of a line, without its line ending
+find_line :: proc(code: string, line_starts: []int, line: int) -> string {
+    end := line_starts[line + 1] - 1 if line + 1 < len(line_starts) else len(code)
+    return strings.trim_suffix(code[line_starts[line]:end], "\r")
+}
+
+// Diagnostics normally go to stdout and stderr. In batch mode they are captured into these builders instead, so they can be reported per group.
+diagnostic_stdout: ^strings.Builder
+diagnostic_stderr: ^strings.Builder
+
+print_diagnostic :: proc(format: string, args: ..any) {
+    if diagnostic_stdout != nil do fmt.sbprintf(diagnostic_stdout, format, ..args)
+    else do fmt.printf(format, ..args)
+}
 
-    return line
+eprint_diagnostic :: proc(format: string, args: ..any) {
+    if diagnostic_stderr != nil do fmt.sbprintf(diagnostic_stderr, format, ..args)
+    else do fmt.eprintf(format, ..args)
+}
+
+// In batch mode stdout carries the result stream, so child processes write their standard output to stderr instead
+child_stdout_to_stderr := false
+
+// Set by -regalloc, see regalloc.odin
+use_register_allocator := false
+
+// Set by -tokenize, see tokenize
+tokenize_up_front := false
+
+// Set by the batch driver so that an error abandons the current group instead of exiting the whole process
+error_jump_buffer: ^libc.jmp_buf
+
+exit_with_error :: proc() -> ! {
+    if error_jump_buffer != nil {
+        libc.longjmp(error_jump_buffer, 1)
+    }
+    report_timings()
+    os.exit(1)
 }
 
 mark_span :: proc(code: string, span: Span) {
-    line := find_line(code, span.line)
-    prefix := fmt.tprintf("    %v  | ", span.line + 1)
-    fmt.printfln("%v%v", prefix, line)
-    for _ in 0..<len(prefix) + span.char_start {
-        fmt.print(" ")
+    line_starts := find_line_starts(code)
+    line, char := find_position(line_starts, span.start)
+    prefix := fmt.tprintf("    %v  | ", line + 1)
+    print_diagnostic("%v%v\n", prefix, find_line(code, line_starts, line))
+    for _ in 0..<len(prefix) + char {
+        print_diagnostic(" ")
     }
-    for _ in span.char_start..<span.char_end {
-        fmt.print("^")
+    for _ in span.start..<span.end {
+        print_diagnostic("^")
     }
-    fmt.println()
+    print_diagnostic("\n")
 }
 
 span_token :: proc(token: Token) -> Span {
     if token.type == .EndOfFile {
-        return Span{token.line, token.char, token.char + 1}
+        return Span{token.offset, token.offset + 1}
     }
     else {
-        return Span{token.line, token.char, token.char + len(token.text)}
+        return Span{token.offset, token.end}
     }
 }
 
+// While tokenizing, the error becomes a LexError token instead, so that a parse error before it is still reported first
 lex_error :: proc(lexer: ^Lexer) {
-    fmt.eprintfln("%v(%v:%v) Lex error! Unexpected character %c", lexer.file, lexer.line + 1, lexer.char + 1, lexer.code[lexer.code_index])
-    mark_span(lexer.code, Span{lexer.line, lexer.char, lexer.char + 1})
-    os.exit(1)
+    if lexer.tokenizing {
+        push_to_consumed(lexer, Token{
+            type = .LexError,
+            offset = lexer.code_index,
+            end = lexer.code_index + 1,
+        })
+        return
+    }
+    report_lex_error(lexer, lexer.code_index)
+}
+
+report_lex_error :: proc(lexer: ^Lexer, index: int) {
+    line, char := find_position(find_line_starts(lexer.code), index)
+    eprint_diagnostic("%v(%v:%v) Lex error! Unexpected character %c\n", lexer.file, line + 1, char + 1, lexer.code[index])
+    mark_span(lexer.code, Span{index, index + 1})
+    exit_with_error()
 }
 
 consume_int_constant_token :: proc(lexer: ^Lexer) {
-    assert(is_ascii_digit_byte(lexer.code[lexer.code_index]))
+    assert(.Digit in byte_classes[lexer.code[lexer.code_index]])
 
     start_index := lexer.code_index
-    for lexer.code_index < len(lexer.code) && is_ascii_digit_byte(lexer.code[lexer.code_index]) {
+    for lexer.code_index < len(lexer.code) && .Digit in byte_classes[lexer.code[lexer.code_index]] {
         lexer_advance(lexer)
     }
 
     // We need to catch identifiers that start with a number here, and are therefore invalid.
-    if lexer.code_index < len(lexer.code) && is_ascii_alpha_byte(lexer.code[lexer.code_index]) {
+    if lexer.code_index < len(lexer.code) && .Alpha in byte_classes[lexer.code[lexer.code_index]] {
         lex_error(lexer)
+        return
     }
 
     text := lexer.code[start_index:lexer.code_index]
     push_to_consumed(lexer, construct_token(lexer, .IntConstant, len(text), strconv.atoi(text)))
 }
 
+Keyword :: struct {
+    text: string,
+    type: Token_Type,
+}
+
+MAX_KEYWORD_LENGTH :: 8
+
+// Keywords grouped by length, so an identifier is only compared against the few keywords it could be. Most identifiers
+// are ruled out by the length alone, and the rest by their first byte.
+keywords_by_length := [MAX_KEYWORD_LENGTH + 1][]Keyword{
+    2 = {{"if", .IfKeyword}, {"do", .DoKeyword}},
+    3 = {{"int", .IntKeyword}, {"for", .ForKeyword}},
+    4 = {{"void", .VoidKeyword}, {"else", .ElseKeyword}, {"goto", .GotoKeyword}, {"case", .CaseKeyword}},
+    5 = {{"while", .WhileKeyword}, {"break", .BreakKeyword}},
+    6 = {{"return", .ReturnKeyword}, {"switch", .SwitchKeyword}, {"static", .StaticKeyword}, {"extern", .ExternKeyword}},
+    7 = {{"default", .DefaultKeyword}},
+    8 = {{"continue", .ContinueKeyword}},
+}
+
+// Returns the keyword token type for `text`, or .Ident if it is not a keyword
+keyword_type :: proc(text: string) -> Token_Type {
+    if len(text) > MAX_KEYWORD_LENGTH do return .Ident
+    for keyword in keywords_by_length[len(text)] {
+        if keyword.text[0] == text[0] && keyword.text == text do return keyword.type
+    }
+    return .Ident
+}
+
 consume_keyword_or_ident_token :: proc(lexer: ^Lexer) {
-    assert(is_ident_start_byte(lexer.code[lexer.code_index]))
+    assert(.Ident_Start in byte_classes[lexer.code[lexer.code_index]])
     start_index := lexer.code_index 
     lexer_advance(lexer)
 
-    for lexer.code_index < len(lexer.code) && is_ident_tail_byte(lexer.code[lexer.code_index]) {
+    for lexer.code_index < len(lexer.code) && .Ident_Tail in byte_classes[lexer.code[lexer.code_index]] {
         lexer_advance(lexer)
     }
 
     text := lexer.code[start_index:lexer.code_index]
-    token: Token = ---
-    switch {
-        case text == "return":
-            token = construct_token(lexer, .ReturnKeyword, len("return"))
-
-        case text == "int":
-            token = construct_token(lexer, .IntKeyword, len("int"))
-
-        case text == "void":
-            token = construct_token(lexer, .VoidKeyword, len("void"))
-
-        case text == "if":
-            token = construct_token(lexer, .IfKeyword, len("if"))
-
-        case text == "else":
-            token = construct_token(lexer, .ElseKeyword, len("else"))
-
-        case text == "goto":
-            token = construct_token(lexer, .GotoKeyword, len("goto"))
-
-        case text == "while":
-            token = construct_token(lexer, .WhileKeyword, len("while"))
-
-        case text == "do":
-            token = construct_token(lexer, .DoKeyword, len("do"))
-
-        case text == "for":
-            token = construct_token(lexer, .ForKeyword, len("for"))
-
-        case text == "continue":
-            token = construct_token(lexer, .ContinueKeyword, len("continue"))
-
-        case text == "break":
-            token = construct_token(lexer, .BreakKeyword, len("break"))
-
-        case text == "switch":
-            token = construct_token(lexer, .SwitchKeyword, len("switch"))
-
-        case text == "case":
-            token = construct_token(lexer, .CaseKeyword, len("case"))
-
-        case text == "default":
-            token = construct_token(lexer, .DefaultKeyword, len("default"))
-
-        case text == "static":
-            token = construct_token(lexer, .StaticKeyword, len("static"))
-
-        case text == "extern":
-            token = construct_token(lexer, .ExternKeyword, len("extern"))
-
-        case:
-            token = construct_token(lexer, .Ident, len(text))
-    }
-    push_to_consumed(lexer, token)
+    type := keyword_type(text)
+    push_to_consumed(lexer, construct_token(lexer, type, len(text), intern(text) if type == .Ident else nil))
 }
 
-is_ascii_digit_byte :: proc(c: u8) -> bool {
-    return '0' <= c && c <= '9'
+Byte_Class :: enum u8 {
+    Whitespace,
+    Digit,
+    Alpha,
+    Ident_Start,
+    Ident_Tail,
 }
 
-is_ascii_alpha_byte :: proc(c: u8) -> bool {
-    return ('a' <= c && c <= 'z') || ('A' <= c && c <= 'Z')
-}
-
-is_ascii_whitespace_byte :: proc(c: u8) -> bool {
-    return c == '\n' || c == '\r' || c == ' ' || c == '\f' || c == '\t'
-}
-
-is_ident_start_byte :: proc(c: u8) -> bool {
-    return is_ascii_alpha_byte(c) || c == '_'
-}
+Byte_Classes :: bit_set[Byte_Class; u8]
 
-is_ident_tail_byte :: proc(c: u8) -> bool {
-    return is_ascii_alpha_byte(c) || is_ascii_digit_byte(c) || c == '_'
+// The classes of every byte, so the lexer tests a byte with one load instead of a chain of comparisons
+byte_classes := [256]Byte_Classes{
+    '\t' = {.Whitespace},
+    '\n' = {.Whitespace},
+    '\f' = {.Whitespace},
+    '\r' = {.Whitespace},
+    ' ' = {.Whitespace},
+    '0'..='9' = {.Digit, .Ident_Tail},
+    'A'..='Z' = {.Alpha, .Ident_Start, .Ident_Tail},
+    'a'..='z' = {.Alpha, .Ident_Start, .Ident_Tail},
+    '_' = {.Ident_Start, .Ident_Tail},
 }
 
 consume_token :: proc(lexer: ^Lexer) {
@@ -355,17 +392,17 @@ consume_token :: proc(lexer: ^Lexer) {
         if lexer.code_index >= len(lexer.code) {
             push_to_consumed(lexer, Token{
                 type = .EndOfFile,
-                line = lexer.line,
-                char = lexer.char,
+                offset = lexer.code_index,
+                end = lexer.code_index,
             })
             return
         }
 
-        if is_ascii_digit_byte(lexer.code[lexer.code_index]) {
+        if .Digit in byte_classes[lexer.code[lexer.code_index]] {
             consume_int_constant_token(lexer)
             return
         }
-        else if is_ident_start_byte(lexer.code[lexer.code_index]) {
+        else if .Ident_Start in byte_classes[lexer.code[lexer.code_index]] {
             consume_keyword_or_ident_token(lexer)
             return
         }
@@ -598,7 +635,9 @@ consume_token :: proc(lexer: ^Lexer) {
                     token = construct_token(lexer, .Equal, 1)
                 }
 
-            case: lex_error(lexer)
+            case:
+                lex_error(lexer)
+                return
         }
         break
     }
@@ -606,7 +645,38 @@ consume_token :: proc(lexer: ^Lexer) {
     push_to_consumed(lexer, token)
 }
 
+// Lexes the rest of the file into `lexer.tokens`, which end with either an EndOfFile or a LexError token
+tokenize :: proc(lexer: ^Lexer) {
+    // Tokens average a few bytes each, so this is usually enough to avoid growing the array
+    tokens := make([dynamic]Token, 0, len(lexer.code) / 4 + 1)
+    lexer.tokenizing = true
+    for {
+        consume_token(lexer)
+        token := pop_from_consumed(lexer)
+        append(&tokens, token)
+        if token.type == .EndOfFile || token.type == .LexError do break
+    }
+    lexer.tokenizing = false
+    lexer.tokens = tokens[:]
+    lexer.token_index = 0
+    lexer.tokens_seen = 0
+}
+
+// Marks `tokens[index]` as looked at by the parser. Reaching a LexError is where lazy lexing would have failed.
+see_token :: proc(lexer: ^Lexer, index: int) -> Token {
+    token := lexer.tokens[index]
+    lexer.tokens_seen = max(lexer.tokens_seen, index + 1)
+    if token.type == .LexError do report_lex_error(lexer, token.offset)
+    return token
+}
+
 take_token :: proc(lexer: ^Lexer) -> Token {
+    if lexer.tokens != nil {
+        token := see_token(lexer, lexer.token_index)
+        if token.type != .EndOfFile do lexer.token_index += 1
+        return token
+    }
+
     if consumed_is_empty(lexer) {
         consume_token(lexer)
     }
@@ -622,6 +692,10 @@ take_token :: proc(lexer: ^Lexer) -> Token {
 }
 
 look_ahead :: proc(lexer: ^Lexer, steps: int) -> Token {
+    if lexer.tokens != nil {
+        return see_token(lexer, min(lexer.token_index + steps - 1, len(lexer.tokens) - 1))
+    }
+
     assert(steps < CONSUMED_SIZE)
     for consumed_len(lexer) < steps {
         consume_token(lexer)
@@ -638,11 +712,19 @@ matches_linkage_specifier :: proc(type: Token_Type) -> bool {
 }
 
 parse_error :: proc(parser: ^Parser, message: string, span: Span = {}) {
-    fmt.eprintfln("%v(%v:%v) Parse error! %v", parser.lexer.file, parser.lexer.line + 1, parser.lexer.char + 1, message)
+    // Without -tokenize the lexer is at the end of the furthest token the parser has looked at
+    offset := parser.lexer.code_index
+    if parser.lexer.tokens != nil {
+        // The lexer has already run to the end of the file, so work out where it would have stopped
+        offset = 0
+        if parser.lexer.tokens_seen > 0 do offset = parser.lexer.tokens[parser.lexer.tokens_seen - 1].end
+    }
+    line, char := find_position(find_line_starts(parser.lexer.code), offset)
+    eprint_diagnostic("%v(%v:%v) Parse error! %v\n", parser.lexer.file, line + 1, char + 1, message)
     if span != {} {
         mark_span(parser.lexer.code, span)
     }
-    os.exit(1)
+    exit_with_error()
 }
 
 parse_program :: proc(parser: ^Parser) -> Program {
@@ -691,7 +773,7 @@ parse_definition_or_declaration :: proc(parser: ^Parser) -> ^Ast_Node {
     if !has_type do parse_error(parser, "Expected a type", span_token(token))
 
     if token.type != .Ident do parse_error(parser, "Expected an identifier", span_token(token))
-    name := token.text
+    name := token.data.(Atom)
     token_after_name := take_token(&parser.lexer)
     #partial switch token_after_name.type {
         case .Semicolon:
@@ -708,11 +790,11 @@ parse_definition_or_declaration :: proc(parser: ^Parser) -> ^Ast_Node {
             token = take_token(&parser.lexer)
             #partial switch token.type {
                 case .Semicolon:
-                    return make_node_3(Function_Declaration_Node, linkage, name, params)
+                    return make_node_3(Function_Declaration_Node, linkage, name, params[:])
 
                 case .LBrace:
                     body := parse_block_item_list(parser)
-                    return make_node_4(Function_Definition_Node, linkage, name, params, body)
+                    return make_node_4(Function_Definition_Node, linkage, name, params[:], body[:])
 
                 case:
                     parse_error(parser, "Expected a ';' or '{'", span_token(token))
@@ -725,8 +807,8 @@ parse_definition_or_declaration :: proc(parser: ^Parser) -> ^Ast_Node {
     unreachable()
 }
 
-parse_function_params :: proc(parser: ^Parser) -> [dynamic]string {
-    params := make([dynamic]string)
+parse_function_params :: proc(parser: ^Parser) -> [dynamic]Atom {
+    params := make([dynamic]Atom)
     token := look_ahead(&parser.lexer, 1)
     if token.type == .RParen {
         take_token(&parser.lexer)
@@ -744,7 +826,7 @@ parse_function_params :: proc(parser: ^Parser) -> [dynamic]string {
         if token.type != .IntKeyword do parse_error(parser, "Expected a type in function parameter", span_token(token))
         token = take_token(&parser.lexer)
         if token.type != .Ident do parse_error(parser, "Expected an identifier in function parameter", span_token(token))
-        append(&params, token.text)
+        append(&params, token.data.(Atom))
         token = take_token(&parser.lexer)
         if token.type == .RParen do break
         if token.type != .Comma do parse_error(parser, "Expected a ',' separating function parameters", span_token(token))
@@ -823,7 +905,7 @@ parse_labels :: proc(parser: ^Parser) -> [dynamic]Label {
                 if next.type != .Colon do break loop
                 take_token(&parser.lexer)
                 take_token(&parser.lexer)
-                append(&labels, token.text)
+                append(&labels, token.data.(Atom))
 
             case:
                 break loop
@@ -874,7 +956,7 @@ parse_statement :: proc(parser: ^Parser, labels: [dynamic]Label = nil) -> ^Ast_N
             take_token(&parser.lexer)
             token = take_token(&parser.lexer)
             if token.type != .Ident do parse_error(parser, "Expected a label name after 'goto'.", span_token(token))
-            label := token.text
+            label := token.data.(Atom)
             token = take_token(&parser.lexer)
             if token.type != .Semicolon do parse_error(parser, "Expected a semicolon after 'goto' statement.", span_token(token))
             result = make_node_1(Goto_Node, label)
@@ -960,7 +1042,7 @@ parse_statement :: proc(parser: ^Parser, labels: [dynamic]Label = nil) -> ^Ast_N
         case .LBrace:
             take_token(&parser.lexer)
             statements := parse_block_item_list(parser)
-            result = make_node_1(Compound_Statement_Node, statements)
+            result = make_node_1(Compound_Statement_Node, statements[:])
 
         case:
             result = parse_expression(parser)
@@ -968,7 +1050,7 @@ parse_statement :: proc(parser: ^Parser, labels: [dynamic]Label = nil) -> ^Ast_N
             if token.type != .Semicolon do parse_error(parser, "Expected a semicolon after expression statement.", span_token(token))
     }
 
-    result.labels = labels
+    set_node_labels(result, labels[:])
     return result
 }
 
@@ -1177,8 +1259,8 @@ parse_expression :: proc(parser: ^Parser, min_prec := 0) -> ^Ast_Node {
 }
 
 semantic_error :: proc(message: string) {
-    fmt.eprintfln("Semantic error! %v", message)
-    os.exit(1)
+    eprint_diagnostic("Semantic error! %v\n", message)
+    exit_with_error()
 }
 
 parse_expression_leaf :: proc(parser: ^Parser) -> ^Ast_Node {
@@ -1216,7 +1298,7 @@ parse_expression_leaf :: proc(parser: ^Parser) -> ^Ast_Node {
             return parse_postfix_operators(parser, inner)
 
         case .Ident:
-            name := token.text
+            name := token.data.(Atom)
             token = look_ahead(&parser.lexer, 2)
 
             if token.type == .LParen {
@@ -1242,7 +1324,7 @@ parse_expression_leaf :: proc(parser: ^Parser) -> ^Ast_Node {
                     take_token(&parser.lexer)
                 }
 
-                return make_node_2(Function_Call_Node, name, params)
+                return make_node_2(Function_Call_Node, name, params[:])
             }
             else {
                 take_token(&parser.lexer)
@@ -1271,7 +1353,7 @@ parse_for_precondition :: proc(parser: ^Parser) -> ^Ast_Node {
         token_1 := look_ahead(&parser.lexer, 2)
         token_2 := look_ahead(&parser.lexer, 3)
         if token_1.type != .Ident do parse_error(parser, "Expected an identifier in declaration.", span_token(token))
-        var_name := token_1.text
+        var_name := token_1.data.(Atom)
 
         statement: ^Ast_Node = ---
         if token_2.type == .Semicolon {
@@ -1341,8 +1423,8 @@ contains_duplicate :: proc(list: $L/[]$E) -> bool {
 }
 
 validate_and_gather_block_item_labels :: proc(block_item: ^Ast_Node, labels: ^[dynamic]Label) {
-    for label in block_item.labels {
-        if _, is_normal := label.(string); is_normal && contains(label, labels[:]) do semantic_error("Duplicate labels not allowed.")
+    for label in node_labels(block_item) {
+        if _, is_normal := label.(Atom); is_normal && contains(label, labels[:]) do semantic_error("Duplicate labels not allowed.")
         append(labels, label)
     }
 
@@ -1383,14 +1465,9 @@ validate_and_gather_function_labels :: proc(function: Function_Definition_Node)
     return labels
 }
 
-get_offset :: proc(offsets: ^Scoped_Variable_Offsets, var_name: string) -> int {
-    offsets := offsets
-    for offsets != nil {
-        defer offsets = offsets.parent
-        
-        if offset, ok := offsets.offsets[var_name]; ok {
-            return offset
-        }
+get_offset :: proc(offsets: ^Scoped_Variable_Offsets, var_name: Atom) -> int {
+    if offset, ok := lookup_symbol(offsets, var_name); ok {
+        return offset
     }
     unreachable()
 }
@@ -1413,57 +1490,40 @@ Object_Kind :: enum {
 
 Variable_Type :: struct {
     linkage: Linkage,
-    type: string
+    type: Atom,
 }
 
 Function_Type :: struct {
     linkage: Linkage,
-    return_type: string,
+    return_type: Atom,
     param_count: int,
 }
 
 Type_And_Validation_Info :: struct {
     control_flows: [dynamic]Containing_Control_Flow,
-    defined_functions: map[string]struct{},
-    defined_global_vars: map[string]struct{},
+    defined_functions: map[Atom]struct{},
+    defined_global_vars: map[Atom]struct{},
 
     // NOTE: Function types are defined globally, even if declarations are in a non-global lexical scope
-    function_types: map[string]Function_Type,
-    extern_symbols: map[string]struct{},
+    function_types: map[Atom]Function_Type,
+    extern_symbols: map[Atom]struct{},
 }
 
-Scoped_Type_And_Validation_Info :: struct {
-    parent: ^Scoped_Type_And_Validation_Info,
-    variable_types: map[string]Variable_Type,
-
-    // NOTE: This is required for implementing shadowing. Function types are global, but function identifiers can still shadow/be shadowed.
-    object_kinds: map[string]Object_Kind
+// NOTE: The object kind is required for implementing shadowing. Function types are global, but function identifiers can still shadow/be shadowed.
+Scoped_Object :: struct {
+    kind: Object_Kind,
+    variable_type: Variable_Type, // Only for variables
 }
 
-make_scoped_type_and_validation_info :: proc(parent: ^Scoped_Type_And_Validation_Info) -> ^Scoped_Type_And_Validation_Info {
-    scoped_info := new(Scoped_Type_And_Validation_Info)
-    scoped_info.parent = parent
-    scoped_info.variable_types = make(map[string]Variable_Type)
-    scoped_info.object_kinds = make(map[string]Object_Kind)
-    return scoped_info
-}
+// Every identifier visible at the current point of validation, see symbols.odin
+Scoped_Type_And_Validation_Info :: Symbol_Table(Scoped_Object)
 
-delete_scoped_type_and_validation_info :: proc(scoped_info: ^Scoped_Type_And_Validation_Info) {
-    delete(scoped_info.variable_types)
-    delete(scoped_info.object_kinds)
-    free(scoped_info)
-}
-
-add_variable_with_type :: proc(scoped_info: ^Scoped_Type_And_Validation_Info, name: string, linkage: Linkage, type: string) {
-    scoped_info.object_kinds[name] = .Variable
-    scoped_info.variable_types[name] = Variable_Type{
-        linkage,
-        type,
-    }
+add_variable_with_type :: proc(scoped_info: ^Scoped_Type_And_Validation_Info, name: Atom, linkage: Linkage, type: Atom) {
+    define_symbol(scoped_info, name, Scoped_Object{.Variable, Variable_Type{linkage, type}})
 }
 
-add_function_with_type :: proc(scoped_info: ^Scoped_Type_And_Validation_Info, info: ^Type_And_Validation_Info, name: string, linkage: Linkage, return_type: string, param_count: int) {
-    scoped_info.object_kinds[name] = .Function
+add_function_with_type :: proc(scoped_info: ^Scoped_Type_And_Validation_Info, info: ^Type_And_Validation_Info, name: Atom, linkage: Linkage, return_type: Atom, param_count: int) {
+    define_symbol(scoped_info, name, Scoped_Object{kind = .Function})
     info.function_types[name] = Function_Type{
         linkage,
         return_type,
@@ -1472,15 +1532,16 @@ add_function_with_type :: proc(scoped_info: ^Scoped_Type_And_Validation_Info, in
 }
 
 validate_program :: proc(program: Program) {
-    scoped_info := make_scoped_type_and_validation_info(nil)
-    defer delete_scoped_type_and_validation_info(scoped_info)
+    symbols := make_symbol_table(Scoped_Object)
+    defer delete_symbol_table(&symbols)
+    scoped_info := &symbols
     
     info := Type_And_Validation_Info{
         make([dynamic]Containing_Control_Flow),
-        make(map[string]struct{}),
-        make(map[string]struct{}),
-        make(map[string]Function_Type),
-        make(map[string]struct{}),
+        make(map[Atom]struct{}),
+        make(map[Atom]struct{}),
+        make(map[Atom]Function_Type),
+        make(map[Atom]struct{}),
     }
     defer delete(info.control_flows)
 
@@ -1488,30 +1549,30 @@ validate_program :: proc(program: Program) {
         #partial switch c in child.variant {
             case Decl_Node:
                 if c.var_name in info.defined_global_vars do semantic_error("Duplicate definition of variable in global scope")
-                if kind, found := scoped_info.object_kinds[c.var_name]; found && kind == .Function {
+                if kind, found := get_object_kind_in_scope(scoped_info, c.var_name); found && kind == .Function {
                     semantic_error("Redeclaration of function as variable")
                 }
                 info.defined_global_vars[c.var_name] = {}
-                add_variable_with_type(scoped_info, c.var_name, c.linkage, "int")
+                add_variable_with_type(scoped_info, c.var_name, c.linkage, INT_ATOM)
 
             case Decl_Assign_Node:
                 if c.var_name in info.defined_global_vars do semantic_error("Duplicate definition of variable in global scope")
-                if kind, found := scoped_info.object_kinds[c.var_name]; found && kind == .Function {
+                if kind, found := get_object_kind_in_scope(scoped_info, c.var_name); found && kind == .Function {
                     semantic_error("Redeclaration of function as variable")
                 }
                 info.defined_global_vars[c.var_name] = {}
-                add_variable_with_type(scoped_info, c.var_name, c.linkage, "int")
+                add_variable_with_type(scoped_info, c.var_name, c.linkage, INT_ATOM)
 
             case Function_Declaration_Node:
-                if kind, found := scoped_info.object_kinds[c.name]; found && kind == .Variable {
+                if kind, found := get_object_kind_in_scope(scoped_info, c.name); found && kind == .Variable {
                     semantic_error("Redeclaration of function as variable")
                 }
                 if contains_duplicate(c.params[:]) do semantic_error("Duplicate function parameters not allowed")
                 if has_conflicting_function_type(&info, c.linkage, c.name, len(c.params)) do semantic_error("Conflicting function types")
-                add_function_with_type(scoped_info, &info, c.name, c.linkage, "int", len(c.params))
+                add_function_with_type(scoped_info, &info, c.name, c.linkage, INT_ATOM, len(c.params))
 
             case Function_Definition_Node:
-                if kind, found := scoped_info.object_kinds[c.name]; found && kind == .Variable {
+                if kind, found := get_object_kind_in_scope(scoped_info, c.name); found && kind == .Variable {
                     semantic_error("Redeclaration of function as variable")
                 }
                 if contains_duplicate(c.params[:]) do semantic_error("Duplicate function parameters not allowed")
@@ -1519,16 +1580,16 @@ validate_program :: proc(program: Program) {
                 info.defined_functions[c.name] = {}
                 if has_conflicting_function_type(&info, c.linkage, c.name, len(c.params)) do semantic_error("Conflicting function types")
                 labels := validate_and_gather_function_labels(c)
-                add_function_with_type(scoped_info, &info, c.name, c.linkage, "int", len(c.params))
+                add_function_with_type(scoped_info, &info, c.name, c.linkage, INT_ATOM, len(c.params))
 
-                new_scoped_info := make_scoped_type_and_validation_info(scoped_info)
-                defer delete_scoped_type_and_validation_info(new_scoped_info)
+                enter_scope(scoped_info)
+                defer exit_scope(scoped_info)
                 for param in c.params {
-                    add_variable_with_type(new_scoped_info, param, .None, "int")
+                    add_variable_with_type(scoped_info, param, .None, INT_ATOM)
                 }
 
                 for block_item in c.body {
-                    validate_block_item(block_item, &info, new_scoped_info, labels[:])
+                    validate_block_item(block_item, &info, scoped_info, labels[:])
                 }
 
             case:
@@ -1537,20 +1598,18 @@ validate_program :: proc(program: Program) {
     }
 }
 
-get_object_kind :: proc(scoped_info: ^Scoped_Type_And_Validation_Info, name: string) -> (kind: Object_Kind, found: bool) {
-    scoped_info := scoped_info
-    for scoped_info != nil {
-        defer scoped_info = scoped_info.parent
-
-        if kind, found = scoped_info.object_kinds[name]; found {
-            return kind, true
-        }
-    }
+get_object_kind :: proc(scoped_info: ^Scoped_Type_And_Validation_Info, name: Atom) -> (kind: Object_Kind, found: bool) {
+    object := lookup_symbol(scoped_info, name) or_return
+    return object.kind, true
+}
 
-    return nil, false
+// Only finds identifiers declared in the innermost scope
+get_object_kind_in_scope :: proc(scoped_info: ^Scoped_Type_And_Validation_Info, name: Atom) -> (kind: Object_Kind, found: bool) {
+    object := lookup_symbol_in_scope(scoped_info, name) or_return
+    return object.kind, true
 }
 
-has_conflicting_function_type :: proc(info: ^Type_And_Validation_Info, linkage: Linkage, name: string, param_count: int) -> bool {
+has_conflicting_function_type :: proc(info: ^Type_And_Validation_Info, linkage: Linkage, name: Atom, param_count: int) -> bool {
     type, found := info.function_types[name]
     if !found do return false
     else {
@@ -1561,7 +1620,7 @@ has_conflicting_function_type :: proc(info: ^Type_And_Validation_Info, linkage:
 validate_block_item :: proc(block_item: ^Ast_Node, info: ^Type_And_Validation_Info, scoped_info: ^Scoped_Type_And_Validation_Info, labels: []Label) {
     #partial switch item in block_item.variant {
         case Decl_Assign_Node:
-            if kind, found := scoped_info.object_kinds[item.var_name]; found {
+            if kind, found := get_object_kind_in_scope(scoped_info, item.var_name); found {
                 if kind == .Variable {
                     semantic_error("Duplicate declarations of the same variable is not allowed")
                 }
@@ -1569,11 +1628,11 @@ validate_block_item :: proc(block_item: ^Ast_Node, info: ^Type_And_Validation_In
                     semantic_error("Variable names must be distinct from function names")
                 }
             }
-            add_variable_with_type(scoped_info, item.var_name, item.linkage, "int")
+            add_variable_with_type(scoped_info, item.var_name, item.linkage, INT_ATOM)
             validate_expr(item.right, info, scoped_info)
 
         case Decl_Node: // Space on the stack is already allocated by emit_function
-            if kind, found := scoped_info.object_kinds[item.var_name]; found {
+            if kind, found := get_object_kind_in_scope(scoped_info, item.var_name); found {
                 if kind == .Variable {
                     semantic_error("Duplicate declarations of the same variable is not allowed")
                 }
@@ -1581,14 +1640,14 @@ validate_block_item :: proc(block_item: ^Ast_Node, info: ^Type_And_Validation_In
                     semantic_error("Variable names must be distinct from function names")
                 }
             }
-            add_variable_with_type(scoped_info, item.var_name, item.linkage, "int")
+            add_variable_with_type(scoped_info, item.var_name, item.linkage, INT_ATOM)
 
         case Function_Declaration_Node:
-            if kind, found := scoped_info.object_kinds[item.name]; found && kind == .Variable {
+            if kind, found := get_object_kind_in_scope(scoped_info, item.name); found && kind == .Variable {
                 semantic_error("Function names must be distinct from variable names")
             }
             if has_conflicting_function_type(info, item.linkage, item.name, len(item.params)) do semantic_error("Conflicting function types")
-            add_function_with_type(scoped_info, info, item.name, item.linkage, "int", len(item.params))
+            add_function_with_type(scoped_info, info, item.name, item.linkage, INT_ATOM, len(item.params))
 
         case Function_Definition_Node:
             semantic_error("Function definitions cannot be nested in scopes")
@@ -1628,14 +1687,14 @@ validate_statement :: proc(statement: ^Ast_Node, info: ^Type_And_Validation_Info
 
         case For_Node:
             append(&info.control_flows, Containing_Control_Flow.Loop)
-            new_scoped_info := make_scoped_type_and_validation_info(scoped_info)
-            defer delete_scoped_type_and_validation_info(new_scoped_info)
-            validate_block_item(stmt.pre_condition, info, new_scoped_info, labels) // @TODO: This is much too strong of a function here
-            validate_expr(stmt.condition, info, new_scoped_info)
+            enter_scope(scoped_info)
+            defer exit_scope(scoped_info)
+            validate_block_item(stmt.pre_condition, info, scoped_info, labels) // @TODO: This is much too strong of a function here
+            validate_expr(stmt.condition, info, scoped_info)
             if stmt.post_condition != nil {
-                validate_expr(stmt.post_condition, info, new_scoped_info)
+                validate_expr(stmt.post_condition, info, scoped_info)
             }
-            validate_statement(stmt.if_true, info, new_scoped_info, labels)
+            validate_statement(stmt.if_true, info, scoped_info, labels)
             pop(&info.control_flows)
 
         case Continue_Node:
@@ -1658,11 +1717,11 @@ validate_statement :: proc(statement: ^Ast_Node, info: ^Type_And_Validation_Info
             pop(&info.control_flows)
 
         case Compound_Statement_Node:
-            new_scoped_info := make_scoped_type_and_validation_info(scoped_info)
-            defer delete_scoped_type_and_validation_info(new_scoped_info)
+            enter_scope(scoped_info)
+            defer exit_scope(scoped_info)
 
             for block_item in stmt.statements {
-                validate_block_item(block_item, info, new_scoped_info, labels)
+                validate_block_item(block_item, info, scoped_info, labels)
             }
 
         case:
@@ -1828,6 +1887,10 @@ Switch_Info :: struct {
     start_label: int,
     current_label: int,
     labels: [dynamic]Label,
+
+    // For finding duplicate labels without searching `labels`
+    case_values: map[int]struct{},
+    has_default: bool,
 }
 
 switch_end_label :: proc(info: Switch_Info) -> int {
@@ -1848,66 +1911,52 @@ Emit_Info :: struct {
     containing_control_flows: [dynamic]Containing_Control_Flow,
 }
 
-Scoped_Variable_Offsets :: struct {
-    parent: ^Scoped_Variable_Offsets,
-    offsets: map[string]int,
-}
-
-make_scoped_variable_offsets :: proc(parent: ^Scoped_Variable_Offsets) -> ^Scoped_Variable_Offsets {
-    offsets := new(Scoped_Variable_Offsets)
-    offsets.parent = parent
-    offsets.offsets = make(map[string]int)
-    return offsets
-}
-
-delete_scoped_variable_offsets :: proc(offsets: ^Scoped_Variable_Offsets) {
-    delete(offsets.offsets)
-    free(offsets)
-}
+// The %rbp offset of every variable visible at the current point of emission, see symbols.odin
+Scoped_Variable_Offsets :: Symbol_Table(int)
 
 current_label := 1 //@TODO: Put this in Emit_Info
 
-emit_label :: proc(builder: ^strings.Builder, label := -1) {
+emit_label :: proc(builder: ^Asm_Builder, label := -1) {
     if label == -1 {
-        fmt.sbprintfln(builder, "L%v:", current_label)
+        asm_emit(builder, .Label, Asm_Label(current_label))
         current_label += 1
     }
     else {
-        fmt.sbprintfln(builder, "L%v:", label)
+        asm_emit(builder, .Label, Asm_Label(label))
     }
 }
 
-emit_unary_op :: proc(builder: ^strings.Builder, op: ^Ast_Node, offsets: ^Scoped_Variable_Offsets, info: ^Emit_Info) {
+emit_unary_op :: proc(builder: ^Asm_Builder, op: ^Ast_Node, offsets: ^Scoped_Variable_Offsets, info: ^Emit_Info) {
     #partial switch o in op.variant {
         case Negate_Node:
             emit_expr(builder, o.expr, offsets, info)
-            fmt.sbprintln(builder, "  neg %eax")
+            asm_emit(builder, .Neg, EAX)
 
         case Bit_Negate_Node:
             emit_expr(builder, o.expr, offsets, info)
-            fmt.sbprintln(builder, "  not %eax")
+            asm_emit(builder, .Not, EAX)
 
         case Boolean_Negate_Node:
             emit_expr(builder, o.expr, offsets, info)
-            fmt.sbprintln(builder, "  cmp $0, %eax")
-            fmt.sbprintln(builder, "  mov $0, %eax")
-            fmt.sbprintln(builder, "  sete %al")
+            asm_emit(builder, .Cmp, Asm_Immediate(0), EAX)
+            asm_emit(builder, .Mov, Asm_Immediate(0), EAX)
+            asm_emit_set(builder, .E)
 
         case Pre_Decrement_Node:
-            fmt.sbprintfln(builder, "  decl %v(%%rbp)", get_offset(offsets, o.expr.variant.(Ident_Node).var_name))
-            fmt.sbprintfln(builder, "  mov %v(%%rbp), %%eax", get_offset(offsets, o.expr.variant.(Ident_Node).var_name))
+            asm_emit(builder, .Dec, rbp_offset(get_offset(offsets, o.expr.variant.(Ident_Node).var_name)))
+            asm_emit(builder, .Mov, rbp_offset(get_offset(offsets, o.expr.variant.(Ident_Node).var_name)), EAX)
 
         case Pre_Increment_Node:
-            fmt.sbprintfln(builder, "  incl %v(%%rbp)", get_offset(offsets, o.expr.variant.(Ident_Node).var_name))
-            fmt.sbprintfln(builder, "  mov %v(%%rbp), %%eax", get_offset(offsets, o.expr.variant.(Ident_Node).var_name))
+            asm_emit(builder, .Inc, rbp_offset(get_offset(offsets, o.expr.variant.(Ident_Node).var_name)))
+            asm_emit(builder, .Mov, rbp_offset(get_offset(offsets, o.expr.variant.(Ident_Node).var_name)), EAX)
 
         case Post_Decrement_Node:
-            fmt.sbprintfln(builder, "  mov %v(%%rbp), %%eax", get_offset(offsets, o.expr.variant.(Ident_Node).var_name))
-            fmt.sbprintfln(builder, "  decl %v(%%rbp)", get_offset(offsets, o.expr.variant.(Ident_Node).var_name))
+            asm_emit(builder, .Mov, rbp_offset(get_offset(offsets, o.expr.variant.(Ident_Node).var_name)), EAX)
+            asm_emit(builder, .Dec, rbp_offset(get_offset(offsets, o.expr.variant.(Ident_Node).var_name)))
 
         case Post_Increment_Node:
-            fmt.sbprintfln(builder, "  mov %v(%%rbp), %%eax", get_offset(offsets, o.expr.variant.(Ident_Node).var_name))
-            fmt.sbprintfln(builder, "  incl %v(%%rbp)", get_offset(offsets, o.expr.variant.(Ident_Node).var_name))
+            asm_emit(builder, .Mov, rbp_offset(get_offset(offsets, o.expr.variant.(Ident_Node).var_name)), EAX)
+            asm_emit(builder, .Inc, rbp_offset(get_offset(offsets, o.expr.variant.(Ident_Node).var_name)))
 
         case:
             fmt.println(op)
@@ -1915,193 +1964,193 @@ emit_unary_op :: proc(builder: ^strings.Builder, op: ^Ast_Node, offsets: ^Scoped
     }
 }
 
-emit_binary_op :: proc(builder: ^strings.Builder, op: ^Ast_Node, vars: ^Scoped_Variable_Offsets, info: ^Emit_Info) {
+emit_binary_op :: proc(builder: ^Asm_Builder, op: ^Ast_Node, vars: ^Scoped_Variable_Offsets, info: ^Emit_Info) {
     #partial switch o in op.variant {
         case Add_Node:
             emit_expr(builder, o.left, vars, info)
-            fmt.sbprintln(builder, "  push %rax")
+            asm_emit(builder, .Push, RAX)
             emit_expr(builder, o.right, vars, info)
-            fmt.sbprintln(builder, "  pop %rbx")
-            fmt.sbprintln(builder, "  add %ebx, %eax")
+            asm_emit(builder, .Pop, RBX)
+            asm_emit(builder, .Add, EBX, EAX)
         
         case Subtract_Node:
             emit_expr(builder, o.left, vars, info)
-            fmt.sbprintln(builder, "  push %rax")
+            asm_emit(builder, .Push, RAX)
             emit_expr(builder, o.right, vars, info)
-            fmt.sbprintln(builder, "  pop %rbx")
-            fmt.sbprintln(builder, "  sub %eax, %ebx")
-            fmt.sbprintln(builder, "  mov %ebx, %eax")
+            asm_emit(builder, .Pop, RBX)
+            asm_emit(builder, .Sub, EAX, EBX)
+            asm_emit(builder, .Mov, EBX, EAX)
 
         case Multiply_Node:
             emit_expr(builder, o.left, vars, info)
-            fmt.sbprintln(builder, "  push %rax")
+            asm_emit(builder, .Push, RAX)
             emit_expr(builder, o.right, vars, info)
-            fmt.sbprintln(builder, "  pop %rbx")
-            fmt.sbprintln(builder, "  push %rdx") // rdx could be a function parameter, so we need to save it
-            fmt.sbprintln(builder, "  imul %ebx")
-            fmt.sbprintln(builder, "  pop %rdx")
+            asm_emit(builder, .Pop, RBX)
+            asm_emit(builder, .Push, RDX) // rdx could be a function parameter, so we need to save it
+            asm_emit(builder, .Imul, EBX)
+            asm_emit(builder, .Pop, RDX)
 
         case Modulo_Node:
             emit_expr(builder, o.left, vars, info)
-            fmt.sbprintln(builder, "  push %rax")
+            asm_emit(builder, .Push, RAX)
             emit_expr(builder, o.right, vars, info)
-            fmt.sbprintln(builder, "  pop %rbx")
-            fmt.sbprintln(builder, "  push %rcx") // rcx could be a function parameter, so we need to save it
-            fmt.sbprintln(builder, "  push %rdx") // rdx could be a function parameter, so we need to save it
-            fmt.sbprintln(builder, "  xor %edx, %edx")
-            fmt.sbprintln(builder, "  cmp $0, %ebx")
-            fmt.sbprintfln(builder, "  jge L%v", current_label)
-            fmt.sbprintln(builder, "  dec %edx")
+            asm_emit(builder, .Pop, RBX)
+            asm_emit(builder, .Push, RCX) // rcx could be a function parameter, so we need to save it
+            asm_emit(builder, .Push, RDX) // rdx could be a function parameter, so we need to save it
+            asm_emit(builder, .Xor, EDX, EDX)
+            asm_emit(builder, .Cmp, Asm_Immediate(0), EBX)
+            asm_emit_jump(builder, .Ge, current_label)
+            asm_emit(builder, .Dec, EDX)
             emit_label(builder)
-            fmt.sbprintln(builder, "  mov %eax, %ecx")
-            fmt.sbprintln(builder, "  mov %ebx, %eax")
-            fmt.sbprintln(builder, "  idiv %ecx")
-            fmt.sbprintln(builder, "  mov %edx, %eax")
-            fmt.sbprintln(builder, "  pop %rdx")
-            fmt.sbprintln(builder, "  pop %rcx")
+            asm_emit(builder, .Mov, EAX, ECX)
+            asm_emit(builder, .Mov, EBX, EAX)
+            asm_emit(builder, .Idiv, ECX)
+            asm_emit(builder, .Mov, EDX, EAX)
+            asm_emit(builder, .Pop, RDX)
+            asm_emit(builder, .Pop, RCX)
 
         case Divide_Node:
             emit_expr(builder, o.left, vars, info)
-            fmt.sbprintln(builder, "  push %rax")
+            asm_emit(builder, .Push, RAX)
             emit_expr(builder, o.right, vars, info)
-            fmt.sbprintln(builder, "  pop %rbx")
-            fmt.sbprintln(builder, "  push %rcx") // rcx could be a function parameter, so we need to save it
-            fmt.sbprintln(builder, "  push %rdx") // rdx could be a function parameter, so we need to save it
-            fmt.sbprintln(builder, "  xor %edx, %edx")
-            fmt.sbprintln(builder, "  cmp $0, %ebx")
-            fmt.sbprintfln(builder, "  jge L%v", current_label)
-            fmt.sbprintln(builder, "  dec %edx")
+            asm_emit(builder, .Pop, RBX)
+            asm_emit(builder, .Push, RCX) // rcx could be a function parameter, so we need to save it
+            asm_emit(builder, .Push, RDX) // rdx could be a function parameter, so we need to save it
+            asm_emit(builder, .Xor, EDX, EDX)
+            asm_emit(builder, .Cmp, Asm_Immediate(0), EBX)
+            asm_emit_jump(builder, .Ge, current_label)
+            asm_emit(builder, .Dec, EDX)
             emit_label(builder)
-            fmt.sbprintln(builder, "  mov %eax, %ecx")
-            fmt.sbprintln(builder, "  mov %ebx, %eax")
-            fmt.sbprintln(builder, "  idiv %ecx")
-            fmt.sbprintln(builder, "  pop %rdx")
-            fmt.sbprintln(builder, "  pop %rcx")
+            asm_emit(builder, .Mov, EAX, ECX)
+            asm_emit(builder, .Mov, EBX, EAX)
+            asm_emit(builder, .Idiv, ECX)
+            asm_emit(builder, .Pop, RDX)
+            asm_emit(builder, .Pop, RCX)
 
         case Boolean_And_Node:
             emit_expr(builder, o.left, vars, info)
-            fmt.sbprintln(builder, "  cmp $0, %eax")
+            asm_emit(builder, .Cmp, Asm_Immediate(0), EAX)
             label := current_label
             current_label += 1
-            fmt.sbprintfln(builder, "  je L%v", label)
+            asm_emit_jump(builder, .E, label)
             emit_expr(builder, o.right, vars, info)
-            fmt.sbprintln(builder, "  cmp $0, %eax")
-            fmt.sbprintfln(builder, "  je L%v", label)
-            fmt.sbprintln(builder, "  mov $1, %eax")
+            asm_emit(builder, .Cmp, Asm_Immediate(0), EAX)
+            asm_emit_jump(builder, .E, label)
+            asm_emit(builder, .Mov, Asm_Immediate(1), EAX)
             emit_label(builder, label)
 
         case Boolean_Or_Node:
             emit_expr(builder, o.left, vars, info)
-            fmt.sbprintln(builder, "  cmp $0, %eax")
+            asm_emit(builder, .Cmp, Asm_Immediate(0), EAX)
             label := current_label
             current_label += 2 
-            fmt.sbprintfln(builder, "  jne L%v", label)
+            asm_emit_jump(builder, .Ne, label)
             emit_expr(builder, o.right, vars, info)
-            fmt.sbprintln(builder, "  cmp $0, %eax")
-            fmt.sbprintfln(builder, "  je L%v", label + 1)
+            asm_emit(builder, .Cmp, Asm_Immediate(0), EAX)
+            asm_emit_jump(builder, .E, label + 1)
             emit_label(builder, label)
-            fmt.sbprintln(builder, "    mov $1, %eax")
+            asm_emit(builder, .Mov, Asm_Immediate(1), EAX)
             emit_label(builder, label + 1)
 
         case Boolean_Equal_Node:
             emit_expr(builder, o.left, vars, info)
-            fmt.sbprintln(builder, "  push %rax")
+            asm_emit(builder, .Push, RAX)
             emit_expr(builder, o.right, vars, info)
-            fmt.sbprintln(builder, "  pop %rbx")
-            fmt.sbprintln(builder, "  cmp %eax, %ebx")
-            fmt.sbprintln(builder, "  mov $0, %eax")
-            fmt.sbprintln(builder, "  sete %al")
+            asm_emit(builder, .Pop, RBX)
+            asm_emit(builder, .Cmp, EAX, EBX)
+            asm_emit(builder, .Mov, Asm_Immediate(0), EAX)
+            asm_emit_set(builder, .E)
 
         case Boolean_Not_Equal_Node:
             emit_expr(builder, o.left, vars, info)
-            fmt.sbprintln(builder, "  push %rax")
+            asm_emit(builder, .Push, RAX)
             emit_expr(builder, o.right, vars, info)
-            fmt.sbprintln(builder, "  pop %rbx")
-            fmt.sbprintln(builder, "  cmp %eax, %ebx")
-            fmt.sbprintln(builder, "  mov $0, %eax")
-            fmt.sbprintln(builder, "  setne %al")
+            asm_emit(builder, .Pop, RBX)
+            asm_emit(builder, .Cmp, EAX, EBX)
+            asm_emit(builder, .Mov, Asm_Immediate(0), EAX)
+            asm_emit_set(builder, .Ne)
 
         case Less_Node:
             emit_expr(builder, o.left, vars, info)
-            fmt.sbprintln(builder, "  push %rax")
+            asm_emit(builder, .Push, RAX)
             emit_expr(builder, o.right, vars, info)
-            fmt.sbprintln(builder, "  pop %rbx")
-            fmt.sbprintln(builder, "  cmp %eax, %ebx")
-            fmt.sbprintln(builder, "  mov $0, %eax")
-            fmt.sbprintln(builder, "  setnge %al")
+            asm_emit(builder, .Pop, RBX)
+            asm_emit(builder, .Cmp, EAX, EBX)
+            asm_emit(builder, .Mov, Asm_Immediate(0), EAX)
+            asm_emit_set(builder, .L)
 
         case Less_Equal_Node:
             emit_expr(builder, o.left, vars, info)
-            fmt.sbprintln(builder, "  push %rax")
+            asm_emit(builder, .Push, RAX)
             emit_expr(builder, o.right, vars, info)
-            fmt.sbprintln(builder, "  pop %rbx")
-            fmt.sbprintln(builder, "  cmp %eax, %ebx")
-            fmt.sbprintln(builder, "  mov $0, %eax")
-            fmt.sbprintln(builder, "  setle %al")
+            asm_emit(builder, .Pop, RBX)
+            asm_emit(builder, .Cmp, EAX, EBX)
+            asm_emit(builder, .Mov, Asm_Immediate(0), EAX)
+            asm_emit_set(builder, .Le)
 
         case More_Node:
             emit_expr(builder, o.left, vars, info)
-            fmt.sbprintln(builder, "  push %rax")
+            asm_emit(builder, .Push, RAX)
             emit_expr(builder, o.right, vars, info)
-            fmt.sbprintln(builder, "  pop %rbx")
-            fmt.sbprintln(builder, "  cmp %eax, %ebx")
-            fmt.sbprintln(builder, "  mov $0, %eax")
-            fmt.sbprintln(builder, "  setnle %al")
+            asm_emit(builder, .Pop, RBX)
+            asm_emit(builder, .Cmp, EAX, EBX)
+            asm_emit(builder, .Mov, Asm_Immediate(0), EAX)
+            asm_emit_set(builder, .G)
 
         case More_Equal_Node:
             emit_expr(builder, o.left, vars, info)
-            fmt.sbprintln(builder, "  push %rax")
+            asm_emit(builder, .Push, RAX)
             emit_expr(builder, o.right, vars, info)
-            fmt.sbprintln(builder, "  pop %rbx")
-            fmt.sbprintln(builder, "  cmp %eax, %ebx")
-            fmt.sbprintln(builder, "  mov $0, %eax")
-            fmt.sbprintln(builder, "  setge %al")
+            asm_emit(builder, .Pop, RBX)
+            asm_emit(builder, .Cmp, EAX, EBX)
+            asm_emit(builder, .Mov, Asm_Immediate(0), EAX)
+            asm_emit_set(builder, .Ge)
 
         case Bit_And_Node:
             emit_expr(builder, o.left, vars, info)
-            fmt.sbprintln(builder, "  push %rax")
+            asm_emit(builder, .Push, RAX)
             emit_expr(builder, o.right, vars, info)
-            fmt.sbprintln(builder, "  pop %rbx")
-            fmt.sbprintln(builder, "  and %ebx, %eax")
+            asm_emit(builder, .Pop, RBX)
+            asm_emit(builder, .And, EBX, EAX)
 
         case Bit_Or_Node:
             emit_expr(builder, o.left, vars, info)
-            fmt.sbprintln(builder, "  push %rax")
+            asm_emit(builder, .Push, RAX)
             emit_expr(builder, o.right, vars, info)
-            fmt.sbprintln(builder, "  pop %rbx")
-            fmt.sbprintln(builder, "  or %ebx, %eax")
+            asm_emit(builder, .Pop, RBX)
+            asm_emit(builder, .Or, EBX, EAX)
 
         case Bit_Xor_Node:
             emit_expr(builder, o.left, vars, info)
-            fmt.sbprintln(builder, "  push %rax")
+            asm_emit(builder, .Push, RAX)
             emit_expr(builder, o.right, vars, info)
-            fmt.sbprintln(builder, "  pop %rbx")
-            fmt.sbprintln(builder, "  xor %ebx, %eax")
+            asm_emit(builder, .Pop, RBX)
+            asm_emit(builder, .Xor, EBX, EAX)
 
         // @TODO: This will need some semantics passes, but we are skipping them for now until we have type checking since a lot of the semantics depends on this
         case Shift_Left_Node:
             emit_expr(builder, o.left, vars, info)
-            fmt.sbprintln(builder, "  push %rax")
+            asm_emit(builder, .Push, RAX)
             emit_expr(builder, o.right, vars, info)
-            fmt.sbprintln(builder, "  pop %rbx")
-            fmt.sbprintln(builder, "  push %rcx") // rcx may be a function parameter
-            fmt.sbprintln(builder, "  mov %eax, %ecx")
-            fmt.sbprintln(builder, "  mov %ebx, %eax")
-            fmt.sbprintln(builder, "  shl %cl, %eax")
-            fmt.sbprintln(builder, "  pop %rcx")
+            asm_emit(builder, .Pop, RBX)
+            asm_emit(builder, .Push, RCX) // rcx may be a function parameter
+            asm_emit(builder, .Mov, EAX, ECX)
+            asm_emit(builder, .Mov, EBX, EAX)
+            asm_emit(builder, .Shl, CL, EAX)
+            asm_emit(builder, .Pop, RCX)
 
         case Shift_Right_Node:
             emit_expr(builder, o.left, vars, info)
-            fmt.sbprintln(builder, "  push %rax")
+            asm_emit(builder, .Push, RAX)
             emit_expr(builder, o.right, vars, info)
-            fmt.sbprintln(builder, "  pop %rbx")
-            fmt.sbprintln(builder, "  push %rcx") // rcx may be a function parameter
-            fmt.sbprintln(builder, "  mov %eax, %ecx")
-            fmt.sbprintln(builder, "  mov %ebx, %eax")
+            asm_emit(builder, .Pop, RBX)
+            asm_emit(builder, .Push, RCX) // rcx may be a function parameter
+            asm_emit(builder, .Mov, EAX, ECX)
+            asm_emit(builder, .Mov, EBX, EAX)
             // @TODO: Whether this is a logical or arithmetic shift depends on the type of the left expression. Since we assume everything is a signed int for now,
             // we do an arithmetic shift right.
-            fmt.sbprintln(builder, "  sar %cl, %eax")
-            fmt.sbprintln(builder, "  pop %rcx")
+            asm_emit(builder, .Sar, CL, EAX)
+            asm_emit(builder, .Pop, RCX)
 
         case:
             fmt.println(op)
@@ -2109,93 +2158,93 @@ emit_binary_op :: proc(builder: ^strings.Builder, op: ^Ast_Node, vars: ^Scoped_V
     }
 }
 
-emit_assign_op :: proc(builder: ^strings.Builder, op: ^Ast_Node, offsets: ^Scoped_Variable_Offsets, info: ^Emit_Info) {
+emit_assign_op :: proc(builder: ^Asm_Builder, op: ^Ast_Node, offsets: ^Scoped_Variable_Offsets, info: ^Emit_Info) {
     #partial switch o in op.variant {
         case Equal_Node:
             emit_expr(builder, o.right, offsets, info)
-            fmt.sbprintfln(builder, "  mov %%eax, %v(%%rbp)", get_offset(offsets, o.left.variant.(Ident_Node).var_name))
+            asm_emit(builder, .Mov, EAX, rbp_offset(get_offset(offsets, o.left.variant.(Ident_Node).var_name)))
 
         case Plus_Equal_Node:
             emit_expr(builder, o.right, offsets, info)
-            fmt.sbprintfln(builder, "  mov %v(%%rbp), %%ebx", get_offset(offsets, o.left.variant.(Ident_Node).var_name))
-            fmt.sbprintln(builder, "  add %ebx, %eax")
-            fmt.sbprintfln(builder, "  mov %%eax, %v(%%rbp)", get_offset(offsets, o.left.variant.(Ident_Node).var_name))
+            asm_emit(builder, .Mov, rbp_offset(get_offset(offsets, o.left.variant.(Ident_Node).var_name)), EBX)
+            asm_emit(builder, .Add, EBX, EAX)
+            asm_emit(builder, .Mov, EAX, rbp_offset(get_offset(offsets, o.left.variant.(Ident_Node).var_name)))
             
         case Minus_Equal_Node:
             emit_expr(builder, o.right, offsets, info)
-            fmt.sbprintln(builder, "  mov %eax, %ebx")
-            fmt.sbprintfln(builder, "  mov %v(%%rbp), %%eax", get_offset(offsets, o.left.variant.(Ident_Node).var_name))
-            fmt.sbprintln(builder, "  sub %ebx, %eax")
-            fmt.sbprintfln(builder, "  mov %%eax, %v(%%rbp)", get_offset(offsets, o.left.variant.(Ident_Node).var_name))
+            asm_emit(builder, .Mov, EAX, EBX)
+            asm_emit(builder, .Mov, rbp_offset(get_offset(offsets, o.left.variant.(Ident_Node).var_name)), EAX)
+            asm_emit(builder, .Sub, EBX, EAX)
+            asm_emit(builder, .Mov, EAX, rbp_offset(get_offset(offsets, o.left.variant.(Ident_Node).var_name)))
 
         case Times_Equal_Node:
             emit_expr(builder, o.right, offsets, info)
-            fmt.sbprintfln(builder, "  mov %v(%%rbp), %%ebx", get_offset(offsets, o.left.variant.(Ident_Node).var_name))
-            fmt.sbprintln(builder, "  push %rdx") // rdx could be a function parameter, so we need to save it
-            fmt.sbprintln(builder, "  imul %ebx, %eax")
-            fmt.sbprintln(builder, "  pop %rdx")
-            fmt.sbprintfln(builder, "  mov %%eax, %v(%%rbp)", get_offset(offsets, o.left.variant.(Ident_Node).var_name))
+            asm_emit(builder, .Mov, rbp_offset(get_offset(offsets, o.left.variant.(Ident_Node).var_name)), EBX)
+            asm_emit(builder, .Push, RDX) // rdx could be a function parameter, so we need to save it
+            asm_emit(builder, .Imul, EBX, EAX)
+            asm_emit(builder, .Pop, RDX)
+            asm_emit(builder, .Mov, EAX, rbp_offset(get_offset(offsets, o.left.variant.(Ident_Node).var_name)))
 
         case Divide_Equal_Node:
             emit_expr(builder, o.right, offsets, info)
-            fmt.sbprintln(builder, "  mov %eax, %ebx")
-            fmt.sbprintfln(builder, "  mov %v(%%rbp), %%eax", get_offset(offsets, o.left.variant.(Ident_Node).var_name))
-            fmt.sbprintln(builder, "  xor %edx, %edx")
-            fmt.sbprintln(builder, "  cmp $0, %eax")
-            fmt.sbprintfln(builder, "  jge L%v", current_label)
-            fmt.sbprintln(builder, "  dec %edx")
+            asm_emit(builder, .Mov, EAX, EBX)
+            asm_emit(builder, .Mov, rbp_offset(get_offset(offsets, o.left.variant.(Ident_Node).var_name)), EAX)
+            asm_emit(builder, .Xor, EDX, EDX)
+            asm_emit(builder, .Cmp, Asm_Immediate(0), EAX)
+            asm_emit_jump(builder, .Ge, current_label)
+            asm_emit(builder, .Dec, EDX)
             emit_label(builder)
-            fmt.sbprintln(builder, "  idiv %ebx")
-            fmt.sbprintfln(builder, "  mov %%eax, %v(%%rbp)", get_offset(offsets, o.left.variant.(Ident_Node).var_name))
+            asm_emit(builder, .Idiv, EBX)
+            asm_emit(builder, .Mov, EAX, rbp_offset(get_offset(offsets, o.left.variant.(Ident_Node).var_name)))
 
         case Modulo_Equal_Node:
             emit_expr(builder, o.right, offsets, info)
-            fmt.sbprintln(builder, "  mov %eax, %ebx")
-            fmt.sbprintfln(builder, "  mov %v(%%rbp), %%eax", get_offset(offsets, o.left.variant.(Ident_Node).var_name))
-            fmt.sbprintln(builder, "  xor %edx, %edx")
-            fmt.sbprintln(builder, "  cmp $0, %ebx")
-            fmt.sbprintfln(builder, "  jge L%v", current_label)
-            fmt.sbprintln(builder, "  dec %edx")
+            asm_emit(builder, .Mov, EAX, EBX)
+            asm_emit(builder, .Mov, rbp_offset(get_offset(offsets, o.left.variant.(Ident_Node).var_name)), EAX)
+            asm_emit(builder, .Xor, EDX, EDX)
+            asm_emit(builder, .Cmp, Asm_Immediate(0), EBX)
+            asm_emit_jump(builder, .Ge, current_label)
+            asm_emit(builder, .Dec, EDX)
             emit_label(builder)
-            fmt.sbprintln(builder, "  idiv %ebx")
-            fmt.sbprintfln(builder, "  mov %%edx, %v(%%rbp)", get_offset(offsets, o.left.variant.(Ident_Node).var_name))
-            fmt.sbprintln(builder, "  mov %edx, %eax")
+            asm_emit(builder, .Idiv, EBX)
+            asm_emit(builder, .Mov, EDX, rbp_offset(get_offset(offsets, o.left.variant.(Ident_Node).var_name)))
+            asm_emit(builder, .Mov, EDX, EAX)
 
         case Xor_Equal_Node:
             emit_expr(builder, o.right, offsets, info)
-            fmt.sbprintfln(builder, "  mov %v(%%rbp), %%ebx", get_offset(offsets, o.left.variant.(Ident_Node).var_name))
-            fmt.sbprintln(builder, "  xor %ebx, %eax")
-            fmt.sbprintfln(builder, "  mov %%eax, %v(%%rbp)", get_offset(offsets, o.left.variant.(Ident_Node).var_name))
+            asm_emit(builder, .Mov, rbp_offset(get_offset(offsets, o.left.variant.(Ident_Node).var_name)), EBX)
+            asm_emit(builder, .Xor, EBX, EAX)
+            asm_emit(builder, .Mov, EAX, rbp_offset(get_offset(offsets, o.left.variant.(Ident_Node).var_name)))
 
         case Or_Equal_Node:
             emit_expr(builder, o.right, offsets, info)
-            fmt.sbprintfln(builder, "  mov %v(%%rbp), %%ebx", get_offset(offsets, o.left.variant.(Ident_Node).var_name))
-            fmt.sbprintln(builder, "  or %ebx, %eax")
-            fmt.sbprintfln(builder, "  mov %%eax, %v(%%rbp)", get_offset(offsets, o.left.variant.(Ident_Node).var_name))
+            asm_emit(builder, .Mov, rbp_offset(get_offset(offsets, o.left.variant.(Ident_Node).var_name)), EBX)
+            asm_emit(builder, .Or, EBX, EAX)
+            asm_emit(builder, .Mov, EAX, rbp_offset(get_offset(offsets, o.left.variant.(Ident_Node).var_name)))
 
         case And_Equal_Node:
             emit_expr(builder, o.right, offsets, info)
-            fmt.sbprintfln(builder, "  mov %v(%%rbp), %%ebx", get_offset(offsets, o.left.variant.(Ident_Node).var_name))
-            fmt.sbprintln(builder, "  and %ebx, %eax")
-            fmt.sbprintfln(builder, "  mov %%eax, %v(%%rbp)", get_offset(offsets, o.left.variant.(Ident_Node).var_name))
+            asm_emit(builder, .Mov, rbp_offset(get_offset(offsets, o.left.variant.(Ident_Node).var_name)), EBX)
+            asm_emit(builder, .And, EBX, EAX)
+            asm_emit(builder, .Mov, EAX, rbp_offset(get_offset(offsets, o.left.variant.(Ident_Node).var_name)))
 
         case Shift_Left_Equal_Node:
             emit_expr(builder, o.right, offsets, info)
-            fmt.sbprintln(builder, "  push %rcx") // rcx could be a function parameter, so we need to save it
-            fmt.sbprintln(builder, "  mov %eax, %ecx")
-            fmt.sbprintfln(builder, "  mov %v(%%rbp), %%eax", get_offset(offsets, o.left.variant.(Ident_Node).var_name))
-            fmt.sbprintln(builder, "  shl %cl, %eax")
-            fmt.sbprintln(builder, "  pop %rcx")
-            fmt.sbprintfln(builder, "  mov %%eax, %v(%%rbp)", get_offset(offsets, o.left.variant.(Ident_Node).var_name))
+            asm_emit(builder, .Push, RCX) // rcx could be a function parameter, so we need to save it
+            asm_emit(builder, .Mov, EAX, ECX)
+            asm_emit(builder, .Mov, rbp_offset(get_offset(offsets, o.left.variant.(Ident_Node).var_name)), EAX)
+            asm_emit(builder, .Shl, CL, EAX)
+            asm_emit(builder, .Pop, RCX)
+            asm_emit(builder, .Mov, EAX, rbp_offset(get_offset(offsets, o.left.variant.(Ident_Node).var_name)))
 
         case Shift_Right_Equal_Node:
             emit_expr(builder, o.right, offsets, info)
-            fmt.sbprintln(builder, "  push %rcx") // rcx could be a function parameter, so we need to save it
-            fmt.sbprintln(builder, "  mov %eax, %ecx")
-            fmt.sbprintfln(builder, "  mov %v(%%rbp), %%eax", get_offset(offsets, o.left.variant.(Ident_Node).var_name))
-            fmt.sbprintln(builder, "  shr %cl, %eax")
-            fmt.sbprintln(builder, "  pop %rcx")
-            fmt.sbprintfln(builder, "  mov %%eax, %v(%%rbp)", get_offset(offsets, o.left.variant.(Ident_Node).var_name))
+            asm_emit(builder, .Push, RCX) // rcx could be a function parameter, so we need to save it
+            asm_emit(builder, .Mov, EAX, ECX)
+            asm_emit(builder, .Mov, rbp_offset(get_offset(offsets, o.left.variant.(Ident_Node).var_name)), EAX)
+            asm_emit(builder, .Shr, CL, EAX)
+            asm_emit(builder, .Pop, RCX)
+            asm_emit(builder, .Mov, EAX, rbp_offset(get_offset(offsets, o.left.variant.(Ident_Node).var_name)))
 
         case:
             fmt.println(op)
@@ -2203,13 +2252,13 @@ emit_assign_op :: proc(builder: ^strings.Builder, op: ^Ast_Node, offsets: ^Scope
     }
 }
 
-emit_expr :: proc(builder: ^strings.Builder, expr: ^Ast_Node, vars: ^Scoped_Variable_Offsets, info: ^Emit_Info) {
+emit_expr :: proc(builder: ^Asm_Builder, expr: ^Ast_Node, vars: ^Scoped_Variable_Offsets, info: ^Emit_Info) {
     #partial switch e in expr.variant {
         case Int_Constant_Node:
-            fmt.sbprintfln(builder, "  mov $%v, %%eax", e.value)
+            asm_emit(builder, .Mov, Asm_Immediate(e.value), EAX)
 
         case Ident_Node:
-            fmt.sbprintfln(builder, "  mov %v(%%rbp), %%eax", get_offset(vars, e.var_name))
+            asm_emit(builder, .Mov, rbp_offset(get_offset(vars, e.var_name)), EAX)
 
         case Negate_Node: emit_unary_op(builder, expr, vars, info)
         case Bit_Negate_Node: emit_unary_op(builder, expr, vars, info)
@@ -2254,65 +2303,114 @@ emit_expr :: proc(builder: ^strings.Builder, expr: ^Ast_Node, vars: ^Scoped_Vari
         case Ternary_Node:
             label := current_label
             current_label += 2
-            emit_expr(builder, e.condition, vars, info)
-            fmt.sbprintln(builder, "  cmp $0, %eax")
-            fmt.sbprintfln(builder, "  je L%v", label)
+            emit_branch(builder, e.condition, vars, info, label, false)
             emit_expr(builder, e.if_true, vars, info)
-            fmt.sbprintfln(builder, "  jmp L%v", label + 1)
+            asm_emit(builder, .Jmp, Asm_Label(label + 1))
             emit_label(builder, label)
             emit_expr(builder, e.if_false, vars, info)
             emit_label(builder, label + 1)
 
         case Function_Call_Node:
-            // x64 calling convention
-            // - First argument in rcx
-            // - Second argument in rdx
-            // - Third argument in r8
-            // - Fourth argument in r9
-            // - Remaining args pushed right-to-left to stack
-            if len(e.args) > 0 {
-                emit_expr(builder, e.args[0], vars, info)
-                fmt.sbprintln(builder, "  mov %rax, %rcx")
+            // The first arguments go in register_param_sources and the rest are pushed right to left. Every argument
+            // is evaluated onto the stack first, since evaluating a later one can clobber the argument registers.
+            register_args := min(len(e.args), REGISTER_PARAMS)
+            stack_args := len(e.args) - register_args
+
+            // %rsp has to be 16 byte aligned at the call. The frame is, so only what the body has pushed since and the
+            // stack arguments can throw it off.
+            padding := 8 if (builder.stack_bytes + stack_args * 8) % 16 != 0 else 0
+            if padding > 0 do asm_emit(builder, .Sub, Asm_Immediate(padding), RSP)
+            #reverse for arg in e.args {
+                emit_expr(builder, arg, vars, info)
+                asm_emit(builder, .Push, RAX)
             }
-            if len(e.args) > 1 {
-                emit_expr(builder, e.args[1], vars, info)
-                fmt.sbprintln(builder, "  mov %rax, %rdx")
+            for source in register_param_sources[:register_args] {
+                asm_emit(builder, .Pop, source)
             }
-            if len(e.args) > 2 {
-                emit_expr(builder, e.args[2], vars, info)
-                fmt.sbprintln(builder, "  mov %rax, %r8")
+
+            when CALLEE_SHADOW_SPACE > 0 {
+                asm_emit(builder, .Sub, Asm_Immediate(CALLEE_SHADOW_SPACE), RSP)
             }
-            if len(e.args) > 3 {
-                emit_expr(builder, e.args[3], vars, info)
-                fmt.sbprintln(builder, "  mov %rax, %r9")
+            asm_emit(builder, .Call, Asm_Symbol(e.name))
+            cleanup := stack_args * 8 + padding + CALLEE_SHADOW_SPACE
+            if cleanup > 0 do asm_emit(builder, .Add, Asm_Immediate(cleanup), RSP)
+
+        case:
+            fmt.println(expr)
+            panic("Not a valid expression!")
+    }
+}
+
+// Emits a condition that only decides a branch: jumps to `label` if the condition's truth is `jump_if`, and falls
+// through otherwise. Comparisons jump on the flags of their cmp, and && and || jump straight to wherever their result
+// decides, so no 0 or 1 is ever materialized in %eax and tested again.
+emit_branch :: proc(builder: ^Asm_Builder, condition: ^Ast_Node, vars: ^Scoped_Variable_Offsets, info: ^Emit_Info, label: int, jump_if: bool) {
+    #partial switch c in condition.variant {
+        case Boolean_Equal_Node: emit_compare_branch(builder, c.left, c.right, .E, vars, info, label, jump_if)
+        case Boolean_Not_Equal_Node: emit_compare_branch(builder, c.left, c.right, .Ne, vars, info, label, jump_if)
+        case Less_Node: emit_compare_branch(builder, c.left, c.right, .L, vars, info, label, jump_if)
+        case Less_Equal_Node: emit_compare_branch(builder, c.left, c.right, .Le, vars, info, label, jump_if)
+        case More_Node: emit_compare_branch(builder, c.left, c.right, .G, vars, info, label, jump_if)
+        case More_Equal_Node: emit_compare_branch(builder, c.left, c.right, .Ge, vars, info, label, jump_if)
+
+        case Boolean_And_Node:
+            if jump_if {
+                skip_label := current_label
+                current_label += 1
+                emit_branch(builder, c.left, vars, info, skip_label, false)
+                emit_branch(builder, c.right, vars, info, label, true)
+                emit_label(builder, skip_label)
             }
-            if len(e.args) > 4 {
-                #reverse for arg in e.args[4:] {
-                    emit_expr(builder, arg, vars, info)
-                    fmt.sbprintln(builder, "  push %rax")
-                }
+            else {
+                emit_branch(builder, c.left, vars, info, label, false)
+                emit_branch(builder, c.right, vars, info, label, false)
             }
-            fmt.sbprintfln(builder, "  call %v", e.name)
-            if len(e.args) > 4 {
-                fmt.sbprintfln(builder, "  add $%v, %%rsp", len(e.args[4:]) * 8)
+
+        case Boolean_Or_Node:
+            if jump_if {
+                emit_branch(builder, c.left, vars, info, label, true)
+                emit_branch(builder, c.right, vars, info, label, true)
+            }
+            else {
+                skip_label := current_label
+                current_label += 1
+                emit_branch(builder, c.left, vars, info, skip_label, true)
+                emit_branch(builder, c.right, vars, info, label, false)
+                emit_label(builder, skip_label)
             }
 
+        case Boolean_Negate_Node:
+            emit_branch(builder, c.expr, vars, info, label, !jump_if)
+
+        case Int_Constant_Node:
+            if (c.value != 0) == jump_if do asm_emit(builder, .Jmp, Asm_Label(label))
+
         case:
-            fmt.println(expr)
-            panic("Not a valid expression!")
+            emit_expr(builder, condition, vars, info)
+            asm_emit(builder, .Cmp, Asm_Immediate(0), EAX)
+            asm_emit_jump(builder, Asm_Condition.Ne if jump_if else Asm_Condition.E, label)
     }
 }
 
-emit_block_item :: proc(builder: ^strings.Builder, block_item: ^Ast_Node, offsets: ^Scoped_Variable_Offsets, info: ^Emit_Info, function_name: string) {
+emit_compare_branch :: proc(builder: ^Asm_Builder, left, right: ^Ast_Node, condition: Asm_Condition, vars: ^Scoped_Variable_Offsets, info: ^Emit_Info, label: int, jump_if: bool) {
+    emit_expr(builder, left, vars, info)
+    asm_emit(builder, .Push, RAX)
+    emit_expr(builder, right, vars, info)
+    asm_emit(builder, .Pop, RBX)
+    asm_emit(builder, .Cmp, EAX, EBX)
+    asm_emit_jump(builder, condition if jump_if else asm_inverse_conditions[condition], label)
+}
+
+emit_block_item :: proc(builder: ^Asm_Builder, block_item: ^Ast_Node, offsets: ^Scoped_Variable_Offsets, info: ^Emit_Info, function_name: Atom) {
     #partial switch item in block_item.variant {
         case Decl_Assign_Node:
-            offsets.offsets[item.var_name] = info.variable_offset
+            define_symbol(offsets, item.var_name, info.variable_offset)
             info.variable_offset -= 8
             emit_expr(builder, item.right, offsets, info)
-            fmt.sbprintfln(builder, "  mov %%eax, %v(%%rbp)", get_offset(offsets, item.var_name))
+            asm_emit(builder, .Mov, EAX, rbp_offset(get_offset(offsets, item.var_name)))
 
-        case Decl_Node: // Space on the stack is already allocated by emit_function
-            offsets.offsets[item.var_name] = info.variable_offset
+        case Decl_Node: // Space on the stack is already allocated by emit_function, see count_function_variable_slots
+            define_symbol(offsets, item.var_name, info.variable_offset)
             info.variable_offset -= 8
 
         case Function_Declaration_Node: // Do nothing
@@ -2326,11 +2424,11 @@ emit_block_item :: proc(builder: ^strings.Builder, block_item: ^Ast_Node, offset
 
 }
 
-emit_statement :: proc(builder: ^strings.Builder, statement: ^Ast_Node, parent_offsets: ^Scoped_Variable_Offsets, info: ^Emit_Info, function_name: string) {
-    for label in statement.labels {
+emit_statement :: proc(builder: ^Asm_Builder, statement: ^Ast_Node, offsets: ^Scoped_Variable_Offsets, info: ^Emit_Info, function_name: Atom) {
+    for label in node_labels(statement) {
         switch l in label {
-            case string:
-                fmt.sbprintfln(builder, "_%v@%v:", l, function_name)
+            case Atom:
+                asm_emit(builder, .Label, Asm_User_Label{l, function_name})
             case int, Default_Label:
                 if len(info.switch_infos) == 0 do semantic_error("'case' and 'default' labels must be in a 'switch'")
                 switch_info := slice.last_ptr(info.switch_infos[:])
@@ -2343,28 +2441,24 @@ emit_statement :: proc(builder: ^strings.Builder, statement: ^Ast_Node, parent_o
         case Null_Statement_Node: // Do nothing
 
         case Return_Node:
-            emit_expr(builder, stmt.expr, parent_offsets, info)
-            fmt.sbprintfln(builder, "  jmp %v_done", function_name)
+            emit_expr(builder, stmt.expr, offsets, info)
+            asm_emit(builder, .Jmp, Asm_Function_End(function_name))
 
         case If_Node:
             label := current_label
             current_label += 1
-            emit_expr(builder, stmt.condition, parent_offsets, info)
-            fmt.sbprintln(builder, "  cmp $0, %eax")
-            fmt.sbprintfln(builder, "  je L%v", label)
-            emit_statement(builder, stmt.if_true, parent_offsets, info, function_name)
+            emit_branch(builder, stmt.condition, offsets, info, label, false)
+            emit_statement(builder, stmt.if_true, offsets, info, function_name)
             emit_label(builder, label)
 
         case If_Else_Node:
             label := current_label
             current_label += 2
-            emit_expr(builder, stmt.condition, parent_offsets, info)
-            fmt.sbprintln(builder, "  cmp $0, %eax")
-            fmt.sbprintfln(builder, "  je L%v", label)
-            emit_statement(builder, stmt.if_true, parent_offsets, info, function_name)
-            fmt.sbprintfln(builder, "  jmp L%v", label + 1)
+            emit_branch(builder, stmt.condition, offsets, info, label, false)
+            emit_statement(builder, stmt.if_true, offsets, info, function_name)
+            asm_emit(builder, .Jmp, Asm_Label(label + 1))
             emit_label(builder, label)
-            emit_statement(builder, stmt.if_false, parent_offsets, info, function_name)
+            emit_statement(builder, stmt.if_false, offsets, info, function_name)
             emit_label(builder, label + 1)
 
         case While_Node:
@@ -2373,11 +2467,9 @@ emit_statement :: proc(builder: ^strings.Builder, statement: ^Ast_Node, parent_o
             append(&info.loop_labels, Loop_Labels{continue_label = label, break_label = label + 1})
             append(&info.containing_control_flows, Containing_Control_Flow.Loop)
             emit_label(builder, label)
-            emit_expr(builder, stmt.condition, parent_offsets, info)
-            fmt.sbprintln(builder, "  cmp $0, %eax")
-            fmt.sbprintfln(builder, "  je L%v", label + 1)
-            emit_statement(builder, stmt.if_true, parent_offsets, info, function_name)
-            fmt.sbprintfln(builder, "  jmp L%v", label)
+            emit_branch(builder, stmt.condition, offsets, info, label + 1, false)
+            emit_statement(builder, stmt.if_true, offsets, info, function_name)
+            asm_emit(builder, .Jmp, Asm_Label(label))
             emit_label(builder, label + 1)
             pop(&info.containing_control_flows)
             pop(&info.loop_labels)
@@ -2388,18 +2480,18 @@ emit_statement :: proc(builder: ^strings.Builder, statement: ^Ast_Node, parent_o
             append(&info.loop_labels, Loop_Labels{continue_label = label + 1, break_label = label + 2})
             append(&info.containing_control_flows, Containing_Control_Flow.Loop)
             emit_label(builder, label)
-            emit_statement(builder, stmt.if_true, parent_offsets, info, function_name)
+            emit_statement(builder, stmt.if_true, offsets, info, function_name)
             emit_label(builder, label + 1)
-            emit_expr(builder, stmt.condition, parent_offsets, info)
-            fmt.sbprintln(builder, "  cmp $0, %eax")
-            fmt.sbprintfln(builder, "  je L%v", label + 2)
-            fmt.sbprintfln(builder, "  jmp L%v", label)
+            emit_branch(builder, stmt.condition, offsets, info, label, true)
             emit_label(builder, label + 2)
             pop(&info.containing_control_flows)
             pop(&info.loop_labels)
 
         case For_Node:
-            offsets := make_scoped_variable_offsets(parent_offsets)
+            enter_scope(offsets)
+            defer exit_scope(offsets)
+            scope_offset := info.variable_offset
+            defer info.variable_offset = scope_offset // Later sibling scopes reuse the slots
 
             label := current_label
             current_label += 3
@@ -2407,33 +2499,31 @@ emit_statement :: proc(builder: ^strings.Builder, statement: ^Ast_Node, parent_o
             append(&info.containing_control_flows, Containing_Control_Flow.Loop)
             emit_block_item(builder, stmt.pre_condition, offsets, info, function_name)
             emit_label(builder, label)
-            emit_expr(builder, stmt.condition, offsets, info)
-            fmt.sbprintln(builder, "  cmp $0, %eax")
-            fmt.sbprintfln(builder, "  je L%v", label + 2)
+            emit_branch(builder, stmt.condition, offsets, info, label + 2, false)
             emit_statement(builder, stmt.if_true, offsets, info, function_name)
             emit_label(builder, label + 1)
             if stmt.post_condition != nil {
                 emit_expr(builder, stmt.post_condition, offsets, info)
             }
-            fmt.sbprintfln(builder, "  jmp L%v", label)
+            asm_emit(builder, .Jmp, Asm_Label(label))
             emit_label(builder, label + 2)
             pop(&info.containing_control_flows)
             pop(&info.loop_labels)
 
         case Continue_Node:
-            fmt.sbprintfln(builder, "  jmp L%v", slice.last(info.loop_labels[:]).continue_label)
+            asm_emit(builder, .Jmp, Asm_Label(slice.last(info.loop_labels[:]).continue_label))
 
         case Break_Node:
             last_control_flow := slice.last(info.containing_control_flows[:])
             if last_control_flow == .Loop {
-                fmt.sbprintfln(builder, "  jmp L%v", slice.last(info.loop_labels[:]).break_label)
+                asm_emit(builder, .Jmp, Asm_Label(slice.last(info.loop_labels[:]).break_label))
             }
             else {
-                fmt.sbprintfln(builder, "  jmp L%v", switch_end_label(slice.last(info.switch_infos[:])))
+                asm_emit(builder, .Jmp, Asm_Label(switch_end_label(slice.last(info.switch_infos[:]))))
             }
 
         case Goto_Node:
-            fmt.sbprintfln(builder, "  jmp _%v@%v", stmt.label, function_name)
+            asm_emit(builder, .Jmp, Asm_User_Label{stmt.label, function_name})
 
         case Switch_Node:
             switch_info := get_switch_info(stmt, info)
@@ -2441,100 +2531,111 @@ emit_statement :: proc(builder: ^strings.Builder, statement: ^Ast_Node, parent_o
             append(&info.containing_control_flows, Containing_Control_Flow.Switch)
             current_label = switch_end_label(switch_info) + 1
 
-            emit_expr(builder, stmt.expr, parent_offsets, info)
+            emit_expr(builder, stmt.expr, offsets, info)
+            cases := make([dynamic]Switch_Case, context.temp_allocator)
+            default_label := switch_end_label(switch_info)
             for label, i in switch_info.labels {
                 switch l in label {
                     case int:
-                        fmt.sbprintfln(builder, "  cmp $%v, %%eax", l)
-                        fmt.sbprintfln(builder, "  je L%v", switch_info.start_label + i)
+                        append(&cases, Switch_Case{l, switch_info.start_label + i})
 
                     case Default_Label:
-                        fmt.sbprintfln(builder, "  jmp L%v", switch_info.start_label + i)
+                        default_label = switch_info.start_label + i
 
-                    case string:
+                    case Atom:
                         unreachable()
                 }
             }
-            fmt.sbprintfln(builder, "  jmp L%v", switch_end_label(switch_info))
+            slice.sort_by(cases[:], proc(a, b: Switch_Case) -> bool { return a.value < b.value })
+            emit_switch_dispatch(builder, cases[:], default_label)
 
-            emit_statement(builder, stmt.block, parent_offsets, info, function_name)
+            emit_statement(builder, stmt.block, offsets, info, function_name)
             emit_label(builder, switch_end_label(switch_info))
             pop(&info.containing_control_flows)
             pop(&info.switch_infos)
 
         case Compound_Statement_Node:
-            offsets := make_scoped_variable_offsets(parent_offsets)
+            enter_scope(offsets)
+            defer exit_scope(offsets)
+            scope_offset := info.variable_offset
+            defer info.variable_offset = scope_offset // Later sibling scopes reuse the slots
             for block_item in stmt.statements {
                 emit_block_item(builder, block_item, offsets, info, function_name)
             }
 
         case:
-            emit_expr(builder, statement, parent_offsets, info)
+            emit_expr(builder, statement, offsets, info)
     }
 }
 
-count_function_variable_declarations :: proc(function: Function_Definition_Node) -> int {
-    declarations := 0
-
+// The most stack slots the function's variables need at once. A scope's variables die when it ends, so sibling scopes
+// reuse the same slots, as emit_statement does when it leaves a scope.
+count_function_variable_slots :: proc(function: Function_Definition_Node) -> int {
+    live, most := 0, 0
     for block_item in function.body {
-        declarations += count_block_item_variable_declarations(block_item)
+        count_block_item_variable_slots(block_item, &live, &most)
     }
-
-    return declarations
+    return most
 }
 
-count_block_item_variable_declarations :: proc(block_item: ^Ast_Node) -> int {
-    declarations := 0
-
+count_block_item_variable_slots :: proc(block_item: ^Ast_Node, live, most: ^int) {
     #partial switch stmt in block_item.variant {
         case Decl_Node, Decl_Assign_Node:
-            declarations += 1
+            live^ += 1
+            most^ = max(most^, live^)
 
         case If_Node:
-            declarations += count_block_item_variable_declarations(stmt.if_true)
+            count_block_item_variable_slots(stmt.if_true, live, most)
 
         case If_Else_Node:
-            declarations += count_block_item_variable_declarations(stmt.if_true)
-            declarations += count_block_item_variable_declarations(stmt.if_false)
+            count_block_item_variable_slots(stmt.if_true, live, most)
+            count_block_item_variable_slots(stmt.if_false, live, most)
 
         case While_Node:
-            declarations += count_block_item_variable_declarations(stmt.if_true)            
+            count_block_item_variable_slots(stmt.if_true, live, most)
 
         case Do_While_Node:
-            declarations += count_block_item_variable_declarations(stmt.if_true)            
+            count_block_item_variable_slots(stmt.if_true, live, most)
 
         case For_Node:
-            #partial switch pre in stmt.pre_condition.variant {
-                case Decl_Node, Decl_Assign_Node:
-                    declarations += 1
-            }
-            declarations += count_block_item_variable_declarations(stmt.if_true)            
+            scope_start := live^
+            count_block_item_variable_slots(stmt.pre_condition, live, most)
+            count_block_item_variable_slots(stmt.if_true, live, most)
+            live^ = scope_start
+
         case Switch_Node:
-            declarations += count_block_item_variable_declarations(stmt.block)
+            count_block_item_variable_slots(stmt.block, live, most)
 
         case Compound_Statement_Node:
+            scope_start := live^
             for statement in stmt.statements {
-                declarations += count_block_item_variable_declarations(statement)
+                count_block_item_variable_slots(statement, live, most)
             }
+            live^ = scope_start
     }
-
-    return declarations
 }
 
 get_switch_info :: proc(statement: Switch_Node, info: ^Emit_Info) -> Switch_Info {
     result: Switch_Info
     result.start_label = current_label
     result.labels = make([dynamic]Label)
+    result.case_values = make(map[int]struct{}, context.temp_allocator)
     get_switch_labels(&result, statement.block)
     result.current_label = result.start_label
     return result
 }
 
 get_switch_labels :: proc(info: ^Switch_Info, statement: ^Ast_Node) {
-    for label in statement.labels {
+    for label in node_labels(statement) {
         #partial switch l in label {
-            case int, Default_Label:
-                if contains(label, info.labels[:]) do semantic_error("Duplicate 'case' or 'default' label")
+            case int:
+                if l in info.case_values do semantic_error("Duplicate 'case' or 'default' label")
+                info.case_values[l] = {}
+                append(&info.labels, label)
+
+            case Default_Label:
+                if info.has_default do semantic_error("Duplicate 'case' or 'default' label")
+                info.has_default = true
                 append(&info.labels, label)
         }
     }
@@ -2563,193 +2664,520 @@ get_switch_labels :: proc(info: ^Switch_Info, statement: ^Ast_Node) {
     }
 }
 
-emit_function :: proc(builder: ^strings.Builder, function: Function_Definition_Node, parent_offsets: ^Scoped_Variable_Offsets) {
-    labels := validate_and_gather_function_labels(function)
+Switch_Case :: struct {
+    value: int,
+    label: int,
+}
 
-    fmt.sbprintfln(builder, ".globl %v", function.name)
-    fmt.sbprintfln(builder, "%v:", function.name)
-    fmt.sbprintln(builder, "  push %rbp")
-    fmt.sbprintln(builder, "  mov %rsp, %rbp")
+// Case ranges at least this dense, with at least this many cases, get a jump table
+JUMP_TABLE_MIN_CASES :: 4
+JUMP_TABLE_MIN_DENSITY :: 0.4
 
-    // Function parameters follow the x64 calling convention
-    // "Note that space is always allocated for the register parameters, even if the parameters themselves are never homed to the stack;
-    // a callee is guaranteed that space has been allocated for all its parameters."
-    rsp_decrement := count_function_variable_declarations(function) * 8 + 32 // 32 = 8 * 4 is the space for the register variables
-    fmt.sbprintfln(builder, "  sub $%v, %%rsp", rsp_decrement)
+// Up to this many cases are compared one after another rather than split further
+SWITCH_LINEAR_CASES :: 3
+
+// Jumps to the label of the case matching %eax, or to `default_label`. `cases` is sorted by value. A dense enough range
+// of cases gets a jump table, otherwise the cases are split around the middle one, giving a balanced compare tree whose
+// leaves may still be jump tables for dense clusters.
+emit_switch_dispatch :: proc(builder: ^Asm_Builder, cases: []Switch_Case, default_label: int) {
+    if len(cases) >= JUMP_TABLE_MIN_CASES {
+        span := slice.last(cases).value - cases[0].value + 1
+        if f64(len(cases)) >= JUMP_TABLE_MIN_DENSITY * f64(span) {
+            emit_jump_table(builder, cases, default_label)
+            return
+        }
+    }
+
+    if len(cases) <= SWITCH_LINEAR_CASES {
+        for c in cases {
+            asm_emit(builder, .Cmp, Asm_Immediate(c.value), EAX)
+            asm_emit_jump(builder, .E, c.label)
+        }
+        asm_emit(builder, .Jmp, Asm_Label(default_label))
+        return
+    }
+
+    middle := len(cases) / 2
+    upper_label := current_label
+    current_label += 1
+    asm_emit(builder, .Cmp, Asm_Immediate(cases[middle].value), EAX)
+    asm_emit_jump(builder, .E, cases[middle].label)
+    asm_emit_jump(builder, .G, upper_label)
+    emit_switch_dispatch(builder, cases[:middle], default_label)
+    emit_label(builder, upper_label)
+    emit_switch_dispatch(builder, cases[middle + 1:], default_label)
+}
+
+// The table holds 32 bit offsets from its own start, so it needs no relocations, and sits in the code straight after
+// the indirect jump
+emit_jump_table :: proc(builder: ^Asm_Builder, cases: []Switch_Case, default_label: int) {
+    low := cases[0].value
+    span := slice.last(cases).value - low + 1
+    table_label := current_label
+    current_label += 1
+
+    // The index is used as all of %rax below, so the top half has to be cleared. Writing %eax does that, but the switch
+    // value may have come from a call that left it undefined, so it is written even when there is nothing to subtract.
+    if low != 0 do asm_emit(builder, .Sub, Asm_Immediate(low), EAX)
+    else do asm_emit(builder, .Mov, EAX, EAX)
+    // Unsigned, so values below the first case wrap around and fail too
+    asm_emit(builder, .Cmp, Asm_Immediate(span - 1), EAX)
+    asm_emit_jump(builder, .A, default_label)
+    asm_emit(builder, .Lea, Asm_Memory{label = i32(table_label), base = .Rip}, RCX)
+    asm_emit(builder, .Movslq, Asm_Memory{base = .Rcx, index = .Rax, scale = 4}, RDX)
+    asm_emit(builder, .Add, RCX, RDX)
+    asm_emit(builder, .Jmp_Indirect, RDX)
+    asm_emit(builder, .P2align, Asm_Immediate(2))
+    emit_label(builder, table_label)
+    next := 0
+    for value in low..<low + span {
+        target := default_label
+        if cases[next].value == value {
+            target = cases[next].label
+            next += 1
+        }
+        asm_emit(builder, .Long, Asm_Label(target), Asm_Label(table_label))
+    }
+}
+
+// What a function body needs from its frame, read off its code once it has been emitted
+Frame_Usage :: struct {
+    makes_calls: bool,
+    uses_rbp: bool,
+    homes_used: [REGISTER_PARAMS]bool, // Register parameters the body reads or writes in their home slots
+}
+
+// Where the first arguments are passed, following the host's calling convention as regalloc.odin does. Win64 callers
+// also reserve shadow space right above the return address for the callee to home its register parameters in.
+when ODIN_OS == .Windows {
+    REGISTER_PARAMS :: 4
+    register_param_sources := [REGISTER_PARAMS]Asm_Reg{RCX, RDX, R8, R9}
+    CALLEE_SHADOW_SPACE :: 32
+}
+else {
+    REGISTER_PARAMS :: 6
+    register_param_sources := [REGISTER_PARAMS]Asm_Reg{RDI, RSI, RDX, RCX, R8, R9}
+    CALLEE_SHADOW_SPACE :: 0
+}
+
+scan_frame_usage :: proc(code: []Asm_Instruction) -> (usage: Frame_Usage) {
+    for instruction in code {
+        if instruction.op == .Call do usage.makes_calls = true
+        operands := [2]Asm_Operand{instruction.first, instruction.second}
+        for operand in operands {
+            if .Rbp in asm_operand_registers(operand) do usage.uses_rbp = true
+            memory, is_memory := operand.(Asm_Memory)
+            if is_memory && memory.base == .Rbp && memory.offset < 0 && int(-memory.offset) <= REGISTER_PARAMS * 8 {
+                usage.homes_used[-memory.offset / 8 - 1] = true
+            }
+        }
+    }
+    return
+}
+
+// The frame holds a home slot for each register parameter, then the function's variables, sharing slots between
+// sibling scopes, rounded up so that %rsp stays 16 byte aligned. Shadow space for callees is reserved at each call
+// instead, above anything pushed before it. The body is emitted before the prologue, so that parameters it never uses
+// are not homed, and leaf functions that never touch the frame skip setting one up at all.
+emit_function :: proc(builder: ^Asm_Builder, function: Function_Definition_Node, offsets: ^Scoped_Variable_Offsets) {
+    labels := validate_and_gather_function_labels(function)
+    register_params := min(len(function.params), REGISTER_PARAMS)
 
     info := Emit_Info{
         labels = labels[:],
         loop_labels = make([dynamic]Loop_Labels),
-        variable_offset = -40, // Just after the register variables
+        variable_offset = -(register_params + 1) * 8, // Just after the register parameters
         switch_infos = make([dynamic]Switch_Info),
         containing_control_flows = make([dynamic]Containing_Control_Flow)
     }
 
-    offsets := make_scoped_variable_offsets(parent_offsets)
-    if len(function.params) > 0 {
-        fmt.sbprintln(builder, "  mov %rcx, -8(%rbp)")
-        offsets.offsets[function.params[0]] = -8
-    }
-    if len(function.params) > 1 {
-        fmt.sbprintln(builder, "  mov %rdx, -16(%rbp)")
-        offsets.offsets[function.params[1]] = -16
-    }
-    if len(function.params) > 2 {
-        fmt.sbprintln(builder, "  mov %r8, -24(%rbp)")
-        offsets.offsets[function.params[2]] = -24
+    enter_scope(offsets)
+    defer exit_scope(offsets)
+    for param, i in function.params[:register_params] {
+        define_symbol(offsets, param, -(i + 1) * 8)
     }
-    if len(function.params) > 3 {
-        fmt.sbprintln(builder, "  mov %r9, -32(%rbp)")
-        offsets.offsets[function.params[3]] = -32
-    }
-    if len(function.params) > 4 {
-        #reverse for param, i in function.params[4:] {
-            offsets.offsets[param] = i * 8 + 16 // Add 16 to allow for the CALL instruction pushing RIP and flags on the stack
+    if len(function.params) > register_params {
+        #reverse for param, i in function.params[register_params:] {
+            // Above the return address, the saved %rbp and the caller's shadow space
+            define_symbol(offsets, param, 16 + CALLEE_SHADOW_SPACE + i * 8)
         }
     }
 
+    body: Asm_Builder
+    defer delete(body.code)
     for statement in function.body {
-        emit_block_item(builder, statement, offsets, &info, function.name)
+        emit_block_item(&body, statement, offsets, &info, function.name)
+    }
+
+    if atom_text(function.name) == "main" {
+        asm_emit(&body, .Xor, EAX, EAX)
     }
 
-    if function.name == "main" {
-        fmt.sbprintln(builder, "  xor %eax, %eax")
+    usage := scan_frame_usage(body.code[:])
+    has_frame := usage.uses_rbp || usage.makes_calls
+    frame_size := (register_params + count_function_variable_slots(function)) * 8
+    frame_size = (frame_size + 15) &~ 15
+
+    asm_emit(builder, .Globl, Asm_Symbol(function.name))
+    asm_emit(builder, .Label, Asm_Symbol(function.name))
+    if has_frame {
+        asm_emit(builder, .Push, RBP)
+        asm_emit(builder, .Mov, RSP, RBP)
+        if frame_size > 0 do asm_emit(builder, .Sub, Asm_Immediate(frame_size), RSP)
+        for source, i in register_param_sources[:register_params] {
+            if usage.homes_used[i] do asm_emit(builder, .Mov, source, rbp_offset(-(i + 1) * 8))
+        }
     }
 
-    fmt.sbprintfln(builder, "%v_done:", function.name)
-    fmt.sbprintfln(builder, "  add $%v, %%rsp", rsp_decrement)
-      
-    fmt.sbprintln(builder, "  pop %rbp")
-    fmt.sbprintln(builder, "  ret")
+    append(&builder.code, ..body.code[:])
+
+    asm_emit(builder, .Label, Asm_Function_End(function.name))
+    if has_frame {
+        if frame_size > 0 do asm_emit(builder, .Add, Asm_Immediate(frame_size), RSP)
+        asm_emit(builder, .Pop, RBP)
+    }
+    asm_emit(builder, .Ret)
 }
 
-emit :: proc(program: Program) -> string {
-    builder: strings.Builder
-    offsets := make_scoped_variable_offsets(nil) // Global scope has no parent
+emit :: proc(program: Program) -> (assembly: string, rewrites: Peephole_Counts) {
+    builder: Asm_Builder
+    defer delete(builder.code)
+    offsets := make_symbol_table(int)
+    defer delete_symbol_table(&offsets)
 
     for node in program.children {
         if def, is_def := node.variant.(Function_Definition_Node); is_def {
-            emit_function(&builder, def, offsets)
+            emit_function(&builder, def, &offsets)
         }
     }
 
-    return strings.to_string(builder)
+    if peephole_optimize do rewrites = peephole(&builder.code)
+    return write_asm(builder.code[:]), rewrites
 }
 
-compile_to_assembly :: proc(source_file: string) -> (asm_file: string) {
-    // No need to compile assembly files
-    if path.ext(source_file) == ".s" do return source_file
-
-    file_base := path.stem(path.base(source_file))
-    asm_file = fmt.aprintf("%v.s", file_base)
+Options :: struct {
+    assembly: bool, // Generate assembly files instead of an executable
+    to_stdout: bool, // With -assembly, write the assembly to stdout instead of to files
+    pipe: bool, // Pipe generated assembly to gcc instead of writing temporary .s files
+    batch: bool, // Treat the single argument as a batch manifest, see batch.odin
+    link_jobs: int, // With -batch, the number of gcc processes that may run at once
+    timings_file: string, // Report per stage timings to this file, or to stderr if it is "-"
+    regalloc: bool, // Generate code with the register allocating backend instead of the stack machine
+    tokenize: bool, // Lex each file into a token array before parsing it
+    peephole: bool, // Run the peephole optimizer over the generated code, see peephole.odin
+    peephole_stats: bool, // Report how many rewrites each peephole rule made in every file
+    optimizations: Optimizations, // Optimization passes to run over the IR, see optimize.odin
+}
 
-    code, ok := os.read_entire_file(source_file)
-    if !ok {
-        fmt.eprintfln("Could not read from %v", source_file)
-        return ""
+// Lexes, parses, validates and emits a single source file, returning the generated assembly
+generate_assembly :: proc(source_file: string) -> (assembly: string, ok: bool) {
+    code, read_ok := os.read_entire_file(source_file)
+    if !read_ok {
+        eprint_diagnostic("Could not read from %v\n", source_file)
+        return "", false
     }
 
+    release_ast()
     parser := Parser{Lexer{code = string(code[:]), file = source_file}}
-    program := parse_program(&parser)
+    if tokenize_up_front {
+        // The tokens are only needed while parsing, so they go with the tree
+        context.allocator = ast_allocator()
+        lex_mark := begin_stage()
+        tokenize(&parser.lexer)
+        end_stage(.Lex, lex_mark)
+    }
+    mark := begin_stage()
+    program: Program
+    {
+        // Everything the parser allocates belongs to the tree, see Ast_Store
+        context.allocator = ast_allocator()
+        program = parse_program(&parser)
+    }
+    end_stage(.Parse, mark)
     when LOG {
         fmt.println("------ AST ------")
         pretty_print_program(program)
     }
 
+    mark = begin_stage()
     validate_program(program)
-
-    assembly := emit(program)
+    end_stage(.Validate, mark)
+
+    mark = begin_stage()
+    optimize_before := stage_timings[.Optimize]
+    rewrites: Peephole_Counts
+    if use_register_allocator || optimizations != {} {
+        ir := lower_program(program)
+        optimize_mark := begin_stage()
+        optimize_program(&ir, optimizations)
+        end_stage(.Optimize, optimize_mark)
+        assembly, rewrites = emit_ir_program(ir, use_register_allocator)
+    }
+    else do assembly, rewrites = emit(program)
+    if report_peephole_rewrites do print_peephole_counts(source_file, rewrites)
+    end_stage(.Emit, mark)
+    exclude_nested_stage(.Emit, .Optimize, optimize_before)
+    release_ast()
     when LOG {
         fmt.println("\n\n------ ASSEMBLY ------")
         fmt.println(assembly)
     }
 
+    return assembly, true
+}
+
+compile_to_assembly :: proc(source_file: string, asm_prefix := "") -> (asm_file: string) {
+    // No need to compile assembly files
+    if path.ext(source_file) == ".s" do return source_file
+
+    file_base := path.stem(path.base(source_file))
+    asm_file = fmt.aprintf("%v%v.s", asm_prefix, file_base)
+
+    assembly, ok := generate_assembly(source_file)
+    if !ok do return ""
+
     when LOG {
         fmt.printfln("Assembling to %v", asm_file)
     }
+    mark := begin_stage()
     ok = os.write_entire_file(asm_file, transmute([]u8)assembly)
+    end_stage(.Write, mark)
     if !ok {
-        fmt.eprintfln("Could not write to %v", asm_file)
-        os.exit(1)
+        eprint_diagnostic("Could not write to %v\n", asm_file)
+        exit_with_error()
     }
 
     return asm_file
 }
 
-compile_from_files :: proc(source_files: []string) -> (exec_file: string) {
-    file_base := path.stem(path.base(source_files[0]))
-    out_file := fmt.aprintf("%v.exe", file_base)
+// Writes the assembly for each source file to stdout, each preceded by a marker line naming its source file
+compile_to_stdout :: proc(source_files: []string) {
+    for file in source_files {
+        if path.ext(file) == ".s" do continue
+
+        assembly, ok := generate_assembly(file)
+        if !ok do os.exit(1)
+        fmt.printfln("# occm-file: %v", file)
+        fmt.print(assembly)
+    }
+}
+
+// A gcc invocation that has been started but not yet waited on
+Gcc_Job :: struct {
+    process: Process,
+    started: bool,
+    out_file: string,
+    to_delete: [dynamic]string,
+    gcc_mark: Stage_Mark, // Timings for the gcc stage run from starting gcc to it exiting
+}
+
+// Compiles every source file to assembly and starts gcc to assemble and link them, without waiting for it to finish.
+// Temporary assembly files are named with `asm_prefix`, so that several groups can be in flight in the same directory.
+// `job` is filled in as files are written, so the caller can still clean up if an error jumps out part of the way through.
+start_compile_group :: proc(job: ^Gcc_Job, source_files: []string, out_file: string, pipe := false, asm_prefix := "") {
+    job.out_file = out_file
+    job.to_delete = make([dynamic]string)
 
     asm_files: [dynamic]string
-    to_delete: [dynamic]string
     defer delete(asm_files)
 
+    // gcc only has one standard input, so at most one generated file can be piped to it. The rest go through temporary files.
+    piped_assembly: string
+    has_piped_assembly := false
+
     for file in source_files {
-        asm_file := compile_to_assembly(file)
+        if pipe && !has_piped_assembly && path.ext(file) != ".s" {
+            if assembly, ok := generate_assembly(file); ok {
+                piped_assembly = assembly
+                has_piped_assembly = true
+                continue
+            }
+        }
+
+        asm_file := compile_to_assembly(file, asm_prefix)
+        if asm_file == "" do exit_with_error()
         append(&asm_files, asm_file)
         if asm_file != file {
-            append(&to_delete, asm_file)
+            append(&job.to_delete, asm_file)
         }
 
         when LOG {
             fmt.printfln("Compiling %v to assembly...", asm_file)
         }
     }
-    compile_with_gcc(asm_files[:], out_file)
-    
+
+    job.gcc_mark = begin_stage()
+    if has_piped_assembly {
+        job.process, job.started = start_gcc(asm_files[:], out_file, piped_assembly)
+    }
+    else {
+        job.process, job.started = start_gcc(asm_files[:], out_file)
+    }
+}
+
+// Waits for gcc to finish and removes the temporary assembly files
+finish_compile_group :: proc(job: ^Gcc_Job) -> (exit_code: i32) {
+    exit_code = -1
+    if job.started {
+        exit_code = wait_command(job.process)
+        end_stage(.Gcc, job.gcc_mark)
+    }
+
     when LOG {
         fmt.println("Deleting asm files...")
     }
-    for file in to_delete do os.remove(file)
+    for file in job.to_delete do os.remove(file)
+    delete(job.to_delete)
+
+    return exit_code
+}
+
+compile_from_files :: proc(source_files: []string, pipe := false) -> (exec_file: string) {
+    file_base := path.stem(path.base(source_files[0]))
+    out_file := fmt.aprintf("%v.exe", file_base)
+
+    job: Gcc_Job
+    start_compile_group(&job, source_files, out_file, pipe)
+    if finish_compile_group(&job) != 0 {
+        fmt.eprintfln("Failed to compile with gcc")
+    }
 
     return out_file
 }
 
-compile_with_gcc :: proc(in_files: []string, out_file: string) {
-    command: strings.Builder
-    strings.builder_init_none(&command, context.temp_allocator)
-    fmt.sbprintf(&command, "gcc ")
-    for file in in_files {
-        fmt.sbprintf(&command, "%v ", file)
+// If `stdin_assembly` is given, it is assembled from gcc's standard input alongside `in_files`
+start_gcc :: proc(in_files: []string, out_file: string, stdin_assembly: Maybe(string) = nil) -> (process: Process, ok: bool) {
+    argv := make([dynamic]string, context.temp_allocator)
+    append(&argv, "gcc")
+    if _, has_input := stdin_assembly.?; has_input {
+        append(&argv, "-x", "assembler", "-", "-x", "none")
     }
-    fmt.sbprintf(&command, "-o %v", out_file)
-    exit_code := run_command_as_process(strings.to_string(command))
-    if exit_code != 0 {
-        fmt.eprintfln("Failed to compile with gcc")
+    append(&argv, ..in_files)
+    append(&argv, "-o", out_file)
+
+    if assembly, has_input := stdin_assembly.?; has_input {
+        return start_command(argv[:], transmute([]u8)assembly, child_stdout_to_stderr)
     }
+    return start_command(argv[:], stdout_to_stderr = child_stdout_to_stderr)
 }
 
 usage :: proc() {
-    fmt.eprintln("USAGE: occm [-assembly] <source_files>")
+    fmt.eprintln("USAGE: occm [-assembly [-stdout]] [-pipe] <source_files>")
+    fmt.eprintln("       occm -batch [-link-jobs <n>] <manifest>")
+    fmt.eprintln("       Either form accepts -timings <file>, -tokenize, -regalloc, -peephole, -peephole-stats and the")
+    fmt.eprintln("       optimization flags")
     fmt.eprintln("source_files:")
     fmt.eprintln("  Names of the c source files to compile")
     fmt.eprintln("-assembly:")
     fmt.eprintln("  Generate assembly files instead of an executable")
+    fmt.eprintln("-stdout:")
+    fmt.eprintln("  With -assembly, write the assembly to stdout instead of to files")
+    fmt.eprintln("-pipe:")
+    fmt.eprintln("  Pipe the generated assembly to gcc instead of writing temporary .s files")
+    fmt.eprintln("-batch:")
+    fmt.eprintln("  Compile every group listed in the manifest, one group per line with its files separated by tabs,")
+    fmt.eprintln("  and write one JSON result per group to stdout")
+    fmt.eprintln("-link-jobs:")
+    fmt.eprintfln("  With -batch, the number of gcc processes to run at once (default %v)", DEFAULT_LINK_JOBS)
+    fmt.eprintln("-timings:")
+    fmt.eprintln("  Write the wall time and allocations of each compiler stage as JSON to the file, or to stderr if it is -")
+    fmt.eprintln("  Lexing is only reported as its own stage with -tokenize, and is part of parsing otherwise")
+    fmt.eprintln("-tokenize:")
+    fmt.eprintln("  Lex each file completely before parsing it, instead of lexing tokens as the parser asks for them")
+    fmt.eprintln("-regalloc:")
+    fmt.eprintln("  Generate code with the register allocating backend, which follows the host calling convention")
+    fmt.eprintln("-peephole:")
+    fmt.eprintln("  Clean up the generated code with peephole rewrites before writing it out")
+    fmt.eprintln("-peephole-stats:")
+    fmt.eprintln("  With -peephole, report how many rewrites each peephole rule made in every file")
+    fmt.eprintln("-fold-constants, -propagate-copies, -eliminate-unreachable-code, -eliminate-dead-stores:")
+    fmt.eprintln("  Run the given optimization pass, repeating the enabled passes until none of them changes anything")
+    fmt.eprintln("-optimize:")
+    fmt.eprintln("  Run every optimization pass")
 }
 
 main :: proc() {
-    filenames: []string = ---
-    assembly := false
-    if len(os.args) <= 1 {
+    options := Options{link_jobs = DEFAULT_LINK_JOBS}
+    filenames := os.args[1:]
+    for len(filenames) > 0 && strings.has_prefix(filenames[0], "-") {
+        switch filenames[0] {
+            case "-assembly":
+                options.assembly = true
+            case "-stdout":
+                options.to_stdout = true
+            case "-pipe":
+                options.pipe = true
+            case "-batch":
+                options.batch = true
+            case "-tokenize":
+                options.tokenize = true
+            case "-regalloc":
+                options.regalloc = true
+            case "-peephole":
+                options.peephole = true
+            case "-peephole-stats":
+                options.peephole_stats = true
+            case "-fold-constants":
+                options.optimizations += {.Fold_Constants}
+            case "-propagate-copies":
+                options.optimizations += {.Propagate_Copies}
+            case "-eliminate-unreachable-code":
+                options.optimizations += {.Eliminate_Unreachable_Code}
+            case "-eliminate-dead-stores":
+                options.optimizations += {.Eliminate_Dead_Stores}
+            case "-optimize":
+                options.optimizations = ALL_OPTIMIZATIONS
+            case "-link-jobs":
+                jobs, ok := 0, false
+                if len(filenames) > 1 do jobs, ok = strconv.parse_int(filenames[1])
+                if !ok || jobs < 1 {
+                    fmt.eprintln("-link-jobs expects a positive number")
+                    usage()
+                    return
+                }
+                options.link_jobs = jobs
+                filenames = filenames[1:]
+            case "-timings":
+                if len(filenames) < 2 {
+                    fmt.eprintln("-timings expects a file name")
+                    usage()
+                    return
+                }
+                options.timings_file = filenames[1]
+                filenames = filenames[1:]
+            case:
+                fmt.eprintfln("Unknown option %v", filenames[0])
+                usage()
+                return
+        }
+        filenames = filenames[1:]
+    }
+
+    if len(filenames) == 0 {
         usage()
         return
     }
-    else if os.args[1] == "-assembly" {
-        if len(os.args) <= 2 {
+
+    use_register_allocator = options.regalloc
+    tokenize_up_front = options.tokenize
+    peephole_optimize = options.peephole
+    report_peephole_rewrites = options.peephole_stats
+    optimizations = options.optimizations
+    if options.timings_file != "" {
+        context.allocator = enable_timings(options.timings_file)
+    }
+    defer report_timings()
+
+    if options.batch {
+        if len(filenames) != 1 {
             usage()
             return
         }
-        else {
-            assembly = true
-            filenames = os.args[2:]
-        }
+        compile_batch(filenames[0], options.link_jobs)
     }
-    else {
-        filenames = os.args[1:]
-    }
-
-    if assembly {
+    else if options.assembly && options.to_stdout do compile_to_stdout(filenames)
+    else if options.assembly {
         for filename in filenames do compile_to_assembly(filename)
     }
-    else do compile_from_files(filenames)
+    else do compile_from_files(filenames, options.pipe)
 }
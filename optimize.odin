@@ -0,0 +1,324 @@
+package occm
+
+// Optimization passes over the IR, enabled one at a time with -fold-constants, -propagate-copies,
+// -eliminate-unreachable-code and -eliminate-dead-stores, or all together with -optimize.
+//
+// Each pass can expose work for the others: a folded condition turns a branch into a jump, which makes code unreachable,
+// which removes copies that were blocking propagation, and so on. So the enabled passes are repeated over each function
+// until none of them changes it.
+import "core:slice"
+
+Optimization :: enum {
+    Fold_Constants,
+    Propagate_Copies,
+    Eliminate_Unreachable_Code,
+    Eliminate_Dead_Stores,
+}
+
+Optimizations :: bit_set[Optimization]
+
+ALL_OPTIMIZATIONS :: Optimizations{.Fold_Constants, .Propagate_Copies, .Eliminate_Unreachable_Code, .Eliminate_Dead_Stores}
+
+// Set from the command line
+optimizations: Optimizations
+
+optimize_program :: proc(program: ^Ir_Program, optimizations: Optimizations) {
+    if optimizations == {} do return
+    for &function in program.functions {
+        optimize_function(&function, optimizations)
+    }
+}
+
+optimize_function :: proc(function: ^Ir_Function, optimizations: Optimizations) {
+    for {
+        changed := false
+        if .Fold_Constants in optimizations && fold_constants(function) do changed = true
+        if .Eliminate_Unreachable_Code in optimizations && eliminate_unreachable_code(function) do changed = true
+        if .Propagate_Copies in optimizations && propagate_copies(function) do changed = true
+        if .Eliminate_Dead_Stores in optimizations && eliminate_dead_stores(function) do changed = true
+        if !changed do break
+    }
+}
+
+// Removes every instruction marked in `remove`, keeping the order of the rest
+remove_instructions :: proc(function: ^Ir_Function, remove: []bool) {
+    kept := 0
+    for instruction, i in function.instructions {
+        if remove[i] do continue
+        function.instructions[kept] = instruction
+        kept += 1
+    }
+    resize(&function.instructions, kept)
+}
+
+// Folds a binary operator the way the generated code would compute it, on 32 bit ints. Division by zero and INT_MIN / -1
+// are left for run time, since they trap there.
+fold_binary :: proc(op: Ir_Op, left, right: int) -> (result: int, ok: bool) {
+    a, b := i32(left), i32(right)
+    #partial switch op {
+        case .Add: return int(a + b), true
+        case .Subtract: return int(a - b), true
+        case .Multiply: return int(a * b), true
+        case .Divide, .Modulo:
+            if b == 0 || (a == min(i32) && b == -1) do return 0, false
+            return int(a / b) if op == .Divide else int(a % b), true
+        case .Bit_And: return int(a & b), true
+        case .Bit_Or: return int(a | b), true
+        case .Bit_Xor: return int(a ~ b), true
+        // Like the shift instructions, only the low 5 bits of the count are used
+        case .Shift_Left: return int(a << u32(b & 31)), true
+        case .Shift_Right: return int(a >> u32(b & 31)), true
+        case .Equal: return 1 if a == b else 0, true
+        case .Not_Equal: return 1 if a != b else 0, true
+        case .Less: return 1 if a < b else 0, true
+        case .Less_Equal: return 1 if a <= b else 0, true
+        case .More: return 1 if a > b else 0, true
+        case .More_Equal: return 1 if a >= b else 0, true
+    }
+    return 0, false
+}
+
+fold_unary :: proc(op: Ir_Op, value: int) -> int {
+    a := i32(value)
+    #partial switch op {
+        case .Negate: return int(-a)
+        case .Bit_Not: return int(~a)
+        case .Bool_Not: return 1 if a == 0 else 0
+    }
+    unreachable()
+}
+
+// Replaces operations on constants with copies of their result, and conditional jumps on constants with an
+// unconditional jump or nothing
+fold_constants :: proc(function: ^Ir_Function) -> (changed: bool) {
+    remove := make([]bool, len(function.instructions), context.temp_allocator)
+    for &instruction, i in function.instructions {
+        #partial switch instruction.op {
+            case .Negate, .Bit_Not, .Bool_Not:
+                if value, is_constant := instruction.left.(int); is_constant {
+                    instruction = Ir_Instruction{op = .Copy, dest = instruction.dest, left = fold_unary(instruction.op, value)}
+                    changed = true
+                }
+
+            case .Add ..= .More_Equal:
+                left, left_is_constant := instruction.left.(int)
+                right, right_is_constant := instruction.right.(int)
+                if !left_is_constant || !right_is_constant do break
+                if result, ok := fold_binary(instruction.op, left, right); ok {
+                    instruction = Ir_Instruction{op = .Copy, dest = instruction.dest, left = result}
+                    changed = true
+                }
+
+            case .Jump_If_Zero, .Jump_If_Not_Zero:
+                value, is_constant := instruction.left.(int)
+                if !is_constant do break
+                if (value == 0) == (instruction.op == .Jump_If_Zero) {
+                    instruction = Ir_Instruction{op = .Jump, dest = NO_TEMP, label = instruction.label}
+                }
+                else {
+                    remove[i] = true
+                }
+                changed = true
+        }
+    }
+    remove_instructions(function, remove)
+    return changed
+}
+
+// Removes blocks that cannot be reached from the start of the function, then jumps to the block that follows anyway,
+// then labels that nothing jumps to
+eliminate_unreachable_code :: proc(function: ^Ir_Function) -> (changed: bool) {
+    instructions := function.instructions[:]
+    if len(instructions) == 0 do return false
+    blocks := find_basic_blocks(function^)
+    defer delete_basic_blocks(blocks)
+
+    reachable := make([]bool, len(blocks), context.temp_allocator)
+    worklist := make([dynamic]int, context.temp_allocator)
+    append(&worklist, 0)
+    reachable[0] = true
+    for len(worklist) > 0 {
+        block := pop(&worklist)
+        for successor in blocks[block].successors {
+            if reachable[successor] do continue
+            reachable[successor] = true
+            append(&worklist, successor)
+        }
+    }
+
+    remove := make([]bool, len(instructions), context.temp_allocator)
+    for block, b in blocks {
+        if reachable[b] do continue
+        for i in block.start..=block.end do remove[i] = true
+        changed = true
+    }
+
+    next_label := -1 // The label at the start of the next reachable block, if it has one
+    #reverse for block, b in blocks {
+        if !reachable[b] do continue
+        last := instructions[block.end]
+        #partial switch last.op {
+            case .Jump, .Jump_If_Zero, .Jump_If_Not_Zero:
+                if last.label == next_label {
+                    remove[block.end] = true
+                    changed = true
+                }
+        }
+        next_label = instructions[block.start].label if instructions[block.start].op == .Label else -1
+    }
+
+    targets := make(map[int]bool, context.temp_allocator)
+    for instruction, i in instructions {
+        #partial switch instruction.op {
+            case .Jump, .Jump_If_Zero, .Jump_If_Not_Zero:
+                if !remove[i] do targets[instruction.label] = true
+        }
+    }
+    for instruction, i in instructions {
+        if instruction.op == .Label && !remove[i] && !(instruction.label in targets) {
+            remove[i] = true
+            changed = true
+        }
+    }
+
+    remove_instructions(function, remove)
+    return changed
+}
+
+Copy_Info :: struct {
+    dest: Ir_Temp,
+    source: Ir_Operand,
+}
+
+// Replaces uses of the destination of a copy with its source, wherever that copy reaches with neither side redefined
+// since. Copies that would copy a value onto itself are removed.
+propagate_copies :: proc(function: ^Ir_Function) -> (changed: bool) {
+    instructions := function.instructions[:]
+
+    // Number every copy, and list the copies that each temporary appears in so they can be killed when it is redefined
+    copies := make([dynamic]Copy_Info, context.temp_allocator)
+    copy_index := make([]int, len(instructions), context.temp_allocator)
+    copies_of := make([][dynamic]int, function.temp_count, context.temp_allocator)
+    for instruction, i in instructions {
+        copy_index[i] = -1
+        if instruction.op != .Copy do continue
+        copy_index[i] = len(copies)
+        append(&copies_of[instruction.dest], len(copies))
+        if source, is_temp := instruction.left.(Ir_Temp); is_temp && source != instruction.dest {
+            append(&copies_of[source], len(copies))
+        }
+        append(&copies, Copy_Info{instruction.dest, instruction.left})
+    }
+    if len(copies) == 0 do return false
+
+    transfer :: proc(reaching: Bit_Vector, instruction: Ir_Instruction, index: int, copies_of: [][dynamic]int) {
+        if instruction.dest == NO_TEMP do return
+        for copy_id in copies_of[instruction.dest] do bit_vector_remove(reaching, copy_id)
+        if index != -1 && instruction.left != Ir_Operand(instruction.dest) do bit_vector_add(reaching, index)
+    }
+
+    blocks := find_basic_blocks(function^)
+    defer delete_basic_blocks(blocks)
+    predecessors := make([][dynamic]int, len(blocks), context.temp_allocator)
+    for block, b in blocks {
+        for successor in block.successors do append(&predecessors[successor], b)
+    }
+
+    // Forward dataflow where a copy reaches a block only if it reaches along every path. Blocks start out with every
+    // copy so that loops can settle, except ones without predecessors, which nothing reaches.
+    reaching_in := make([]Bit_Vector, len(blocks), context.temp_allocator)
+    reaching_out := make([]Bit_Vector, len(blocks), context.temp_allocator)
+    for _, b in blocks {
+        reaching_in[b] = make_bit_vector(len(copies), context.temp_allocator)
+        reaching_out[b] = make_bit_vector(len(copies), context.temp_allocator)
+        for &word in reaching_out[b] do word = ~u64(0)
+    }
+    for iterating := true; iterating; {
+        iterating = false
+        for block, b in blocks {
+            for &word, w in reaching_in[b] {
+                word = ~u64(0) if len(predecessors[b]) > 0 && b != 0 else 0
+                for predecessor in predecessors[b] do word &= reaching_out[predecessor][w]
+            }
+            reaching := slice.clone(reaching_in[b], context.temp_allocator)
+            for i in block.start..=block.end do transfer(reaching, instructions[i], copy_index[i], copies_of)
+            if !slice.equal(reaching, reaching_out[b]) {
+                copy(reaching_out[b], reaching)
+                iterating = true
+            }
+        }
+    }
+
+    replace :: proc(operand: ^Ir_Operand, reaching: Bit_Vector, copies: []Copy_Info, copies_of: [][dynamic]int) -> bool {
+        temp, is_temp := operand.(Ir_Temp)
+        if !is_temp do return false
+        for copy_id in copies_of[temp] {
+            if copies[copy_id].dest == temp && bit_vector_contains(reaching, copy_id) {
+                operand^ = copies[copy_id].source
+                return true
+            }
+        }
+        return false
+    }
+
+    remove := make([]bool, len(instructions), context.temp_allocator)
+    for block, b in blocks {
+        reaching := reaching_in[b]
+        for i in block.start..=block.end {
+            instruction := &instructions[i]
+            if replace(&instruction.left, reaching, copies[:], copies_of) do changed = true
+            if replace(&instruction.right, reaching, copies[:], copies_of) do changed = true
+            for &arg in instruction.args {
+                if replace(&arg, reaching, copies[:], copies_of) do changed = true
+            }
+
+            if instruction.op == .Copy {
+                // Either a copy onto itself, or the same copy already reaches here
+                redundant := instruction.left == Ir_Operand(instruction.dest)
+                for copy_id in copies_of[instruction.dest] {
+                    if bit_vector_contains(reaching, copy_id) && copies[copy_id].dest == instruction.dest && copies[copy_id].source == instruction.left {
+                        redundant = true
+                    }
+                }
+                if redundant {
+                    remove[i] = true
+                    changed = true
+                    continue
+                }
+            }
+            transfer(reaching, instructions[i], copy_index[i], copies_of)
+        }
+    }
+
+    remove_instructions(function, remove)
+    return changed
+}
+
+// Removes instructions whose result is never read. Calls are kept for their side effects.
+eliminate_dead_stores :: proc(function: ^Ir_Function) -> (changed: bool) {
+    instructions := function.instructions[:]
+    blocks := find_basic_blocks(function^)
+    defer delete_basic_blocks(blocks)
+    _, live_out := compute_liveness(function^, blocks[:])
+
+    uses := make([dynamic]Ir_Temp, context.temp_allocator)
+    remove := make([]bool, len(instructions), context.temp_allocator)
+    for block, b in blocks {
+        live := live_out[b]
+        #reverse for instruction, i in instructions[block.start:block.end + 1] {
+            if instruction.dest != NO_TEMP {
+                if instruction.op != .Call && !bit_vector_contains(live, int(instruction.dest)) {
+                    remove[block.start + i] = true
+                    changed = true
+                    continue
+                }
+                bit_vector_remove(live, int(instruction.dest))
+            }
+            ir_uses(instruction, &uses)
+            for temp in uses do bit_vector_add(live, int(temp))
+        }
+    }
+
+    remove_instructions(function, remove)
+    return changed
+}
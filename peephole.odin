@@ -0,0 +1,214 @@
+package occm
+
+// A peephole optimizer over the instruction records of either backend, enabled with -peephole. Each rule looks at the
+// instructions starting at one position and either rewrites some of them or leaves them alone. The rules are tried at
+// every position in table order, and whole passes repeat until none of them fires, since one rewrite often exposes
+// another. New rules only need an entry in Peephole_Rule and peephole_rules.
+//
+// With -peephole-stats the number of rewrites made by each rule is reported for every file.
+
+Peephole_Rule :: enum {
+    Push_Pop,
+    Store_Load,
+    Forward_Move,
+    Jump_To_Next,
+    Set_Branch,
+    Compare_Zero,
+}
+
+Peephole_Counts :: [Peephole_Rule]int
+
+// Returns how many instructions at the start of `code` were replaced by the ones appended to `out`, or 0 and appends
+// nothing if the rule does not apply
+Peephole_Rewrite :: #type proc(code: []Asm_Instruction, out: ^[dynamic]Asm_Instruction) -> int
+
+Peephole_Entry :: struct {
+    name: string,
+    rewrite: Peephole_Rewrite,
+}
+
+peephole_rules := [Peephole_Rule]Peephole_Entry{
+    .Push_Pop = {"push_pop", rewrite_push_pop},
+    .Store_Load = {"store_load", rewrite_store_load},
+    .Forward_Move = {"forward_move", rewrite_forward_move},
+    .Jump_To_Next = {"jump_to_next", rewrite_jump_to_next},
+    .Set_Branch = {"set_branch", rewrite_set_branch},
+    .Compare_Zero = {"compare_zero", rewrite_compare_zero},
+}
+
+// Set by -peephole
+peephole_optimize := false
+
+// Set by -peephole-stats
+report_peephole_rewrites := false
+
+peephole :: proc(code: ^[dynamic]Asm_Instruction) -> (counts: Peephole_Counts) {
+    out := make([dynamic]Asm_Instruction, 0, len(code^))
+    defer delete(out)
+    for {
+        changed := false
+        clear(&out)
+        for i := 0; i < len(code^); {
+            consumed := 0
+            for entry, rule in peephole_rules {
+                consumed = entry.rewrite(code^[i:], &out)
+                if consumed > 0 {
+                    counts[rule] += 1
+                    break
+                }
+            }
+            if consumed == 0 {
+                append(&out, code^[i])
+                consumed = 1
+            }
+            else do changed = true
+            i += consumed
+        }
+        if !changed do return
+        resize(code, len(out))
+        copy(code^[:], out[:])
+    }
+}
+
+print_peephole_counts :: proc(source_file: string, counts: Peephole_Counts) {
+    eprint_diagnostic("Peephole rewrites in %v:", source_file)
+    for entry, rule in peephole_rules {
+        eprint_diagnostic(" %v %v", entry.name, counts[rule])
+    }
+    eprint_diagnostic("\n")
+}
+
+asm_operand_registers :: proc(operand: Asm_Operand) -> Asm_Registers {
+    #partial switch o in operand {
+        case Asm_Reg:
+            return {o.register}
+        case Asm_Memory:
+            registers := Asm_Registers{o.base}
+            if o.scale != 0 do registers += {o.index}
+            return registers
+    }
+    return {}
+}
+
+// Every register the instruction reads or writes, including the ones it uses implicitly
+asm_instruction_registers :: proc(instruction: Asm_Instruction) -> Asm_Registers {
+    registers := asm_operand_registers(instruction.first) + asm_operand_registers(instruction.second)
+    #partial switch instruction.op {
+        case .Imul:
+            if instruction.second == nil do registers += {.Rax, .Rdx}
+        case .Idiv, .Cdq:
+            registers += {.Rax, .Rdx}
+        case .Push, .Pop:
+            registers += {.Rsp}
+    }
+    return registers
+}
+
+// Control flow and directives, which no rewrite may move anything across
+is_asm_barrier :: proc(op: Asm_Op) -> bool {
+    #partial switch op {
+        case .Label, .Globl, .Text, .Data, .P2align, .Balign, .Long, .Set, .Jcc, .Jmp, .Jmp_Indirect, .Call, .Ret:
+            return true
+    }
+    return false
+}
+
+is_asm_move_to_register :: proc(instruction: Asm_Instruction) -> (destination: Asm_Reg, ok: bool) {
+    if instruction.op != .Mov do return {}, false
+    destination, ok = instruction.second.(Asm_Reg)
+    return
+}
+
+// push %rA; pop %rB becomes mov %rA, %rB, or nothing if A is B. One instruction in between is allowed as long as it
+// leaves B and the stack alone, and then the move goes first, before it can change A.
+rewrite_push_pop :: proc(code: []Asm_Instruction, out: ^[dynamic]Asm_Instruction) -> int {
+    if len(code) < 2 || code[0].op != .Push do return 0
+    source, source_is_reg := code[0].first.(Asm_Reg)
+    if !source_is_reg do return 0
+
+    pop_index := 1
+    if code[1].op != .Pop {
+        if len(code) < 3 || code[2].op != .Pop do return 0
+        if is_asm_barrier(code[1].op) do return 0
+        pop_index = 2
+    }
+    destination, destination_is_reg := code[pop_index].first.(Asm_Reg)
+    if !destination_is_reg do return 0
+    if pop_index == 2 {
+        used := asm_instruction_registers(code[1])
+        if destination.register in used || .Rsp in used do return 0
+    }
+
+    if destination.register != source.register {
+        append(out, Asm_Instruction{op = .Mov, first = source, second = destination})
+    }
+    if pop_index == 2 do append(out, code[1])
+    return pop_index + 1
+}
+
+// mov %eax, -8(%rbp); mov -8(%rbp), %eax only needs the store
+rewrite_store_load :: proc(code: []Asm_Instruction, out: ^[dynamic]Asm_Instruction) -> int {
+    if len(code) < 2 || code[0].op != .Mov || code[1].op != .Mov do return 0
+    _, first_is_memory := code[0].first.(Asm_Memory)
+    _, second_is_memory := code[0].second.(Asm_Memory)
+    if first_is_memory == second_is_memory do return 0
+    if !asm_operands_equal(code[0].first, code[1].second) || !asm_operands_equal(code[0].second, code[1].first) do return 0
+
+    append(out, code[0])
+    return 2
+}
+
+// mov S, %eax; mov %rax, %rbx; mov T, %eax loads S straight into %ebx when T does not read %eax, which is overwritten
+// anyway. Both forms leave %rbx holding S zero extended.
+rewrite_forward_move :: proc(code: []Asm_Instruction, out: ^[dynamic]Asm_Instruction) -> int {
+    if len(code) < 3 do return 0
+    loaded, loads := is_asm_move_to_register(code[0])
+    copied, copies := is_asm_move_to_register(code[1])
+    reloaded, reloads := is_asm_move_to_register(code[2])
+    if !loads || !copies || !reloads do return 0
+    if loaded.width != .Dword || !is_asm_register(code[1].first, loaded.register) do return 0
+    if copied.register == loaded.register || copied.width == .Byte do return 0
+    if reloaded.register != loaded.register || reloaded.width == .Byte do return 0
+    if loaded.register in asm_operand_registers(code[2].first) do return 0
+
+    append(out, Asm_Instruction{op = .Mov, first = code[0].first, second = Asm_Reg{copied.register, .Dword}})
+    append(out, code[2])
+    return 3
+}
+
+// A jump to a label that directly follows it
+rewrite_jump_to_next :: proc(code: []Asm_Instruction, out: ^[dynamic]Asm_Instruction) -> int {
+    if code[0].op != .Jmp && code[0].op != .Jcc do return 0
+    for instruction in code[1:] {
+        if instruction.op != .Label do return 0
+        if asm_operands_equal(instruction.first, code[0].first) do return 1
+    }
+    return 0
+}
+
+// mov $0, %eax; set<cc> %al; cmp $0, %eax; je L tests the flags that set<cc> already read, so the cmp can go and the
+// branch can use the condition directly. The boolean is still materialized in case something else reads it.
+rewrite_set_branch :: proc(code: []Asm_Instruction, out: ^[dynamic]Asm_Instruction) -> int {
+    if len(code) < 4 do return 0
+    cleared, clears := is_asm_move_to_register(code[0])
+    if !clears || cleared != EAX || !asm_operands_equal(code[0].first, Asm_Immediate(0)) do return 0
+    if code[1].op != .Set || code[2].op != .Cmp || code[3].op != .Jcc do return 0
+    if !asm_operands_equal(code[2].first, Asm_Immediate(0)) || !asm_operands_equal(code[2].second, EAX) do return 0
+    if code[3].condition != .E && code[3].condition != .Ne do return 0
+
+    condition := code[1].condition
+    if code[3].condition == .E do condition = asm_inverse_conditions[condition]
+    append(out, code[0], code[1])
+    append(out, Asm_Instruction{op = .Jcc, condition = condition, first = code[3].first})
+    return 4
+}
+
+// cmp $0, %eax sets the flags the same way as the shorter test %eax, %eax
+rewrite_compare_zero :: proc(code: []Asm_Instruction, out: ^[dynamic]Asm_Instruction) -> int {
+    if code[0].op != .Cmp || !asm_operands_equal(code[0].first, Asm_Immediate(0)) do return 0
+    register, is_reg := code[0].second.(Asm_Reg)
+    if !is_reg do return 0
+
+    append(out, Asm_Instruction{op = .Test, first = register, second = register})
+    return 1
+}
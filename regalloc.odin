@@ -0,0 +1,606 @@
+package occm
+
+// The register allocating backend, selected with -regalloc. The AST is lowered to the IR in ir.odin, temporaries are
+// assigned registers by linear scan over their live intervals, and the result is emitted as x64 assembly.
+// Optimized code goes through the same emitter without -regalloc, with every temporary given its own stack slot.
+//
+// Unlike the stack machine backend, this one follows the host's calling convention (System V on Linux and macOS,
+// Microsoft x64 on Windows), so generated code can call and be called by code compiled with gcc.
+import "core:slice"
+import "base:intrinsics"
+
+Register :: enum {
+    Rax,
+    Rbx,
+    Rcx,
+    Rdx,
+    Rsi,
+    Rdi,
+    R8,
+    R9,
+    R10,
+    R11,
+    R12,
+    R13,
+    R14,
+    R15,
+}
+
+// Registers as the instruction records name them
+asm_registers := [Register]Asm_Register{
+    .Rax = .Rax, .Rbx = .Rbx, .Rcx = .Rcx, .Rdx = .Rdx, .Rsi = .Rsi, .Rdi = .Rdi, .R8 = .R8, .R9 = .R9,
+    .R10 = .R10, .R11 = .R11, .R12 = .R12, .R13 = .R13, .R14 = .R14, .R15 = .R15,
+}
+
+// rax and rdx are needed by idiv, rcx by variable shifts, and r10 and r11 are scratch registers for instructions
+// that cannot take two memory operands. None of them are ever allocated to a temporary, which leaves 9 registers, 5
+// of them callee-saved on System V. The chapter 20 tests are written for 12, so the ones that need more than linear
+// scan has are listed in LINEAR_SCAN_PRESSURE_TESTS in test/asm_checks.py.
+when ODIN_OS == .Windows {
+    argument_registers := [?]Register{.Rcx, .Rdx, .R8, .R9}
+    CALLER_SAVED_REGISTERS :: bit_set[Register]{.R8, .R9}
+    CALLEE_SAVED_REGISTERS :: bit_set[Register]{.Rbx, .Rsi, .Rdi, .R12, .R13, .R14, .R15}
+    SHADOW_SPACE :: 32 // The caller always reserves space for the callee to spill its register arguments
+}
+else {
+    argument_registers := [?]Register{.Rdi, .Rsi, .Rdx, .Rcx, .R8, .R9}
+    CALLER_SAVED_REGISTERS :: bit_set[Register]{.Rsi, .Rdi, .R8, .R9}
+    CALLEE_SAVED_REGISTERS :: bit_set[Register]{.Rbx, .R12, .R13, .R14, .R15}
+    SHADOW_SPACE :: 0
+}
+
+// An offset from %rbp, for temporaries that did not get a register
+Stack_Slot :: distinct int
+
+Location :: union {
+    Register,
+    Stack_Slot,
+}
+
+Live_Interval :: struct {
+    temp: Ir_Temp,
+    start: int,
+    end: int,
+    crosses_call: bool,
+}
+
+Allocation :: struct {
+    locations: []Location,
+    saved_registers: [dynamic]Register,
+    frame_size: int,
+}
+
+// Builds one interval per temporary, spanning every point at which it is live. Liveness is found by the usual
+// backwards dataflow over basic blocks, so values that are live around a loop cover the whole loop.
+build_live_intervals :: proc(function: Ir_Function) -> [dynamic]Live_Interval {
+    instructions := function.instructions[:]
+    blocks := find_basic_blocks(function)
+    defer delete_basic_blocks(blocks)
+
+    uses := make([dynamic]Ir_Temp, context.temp_allocator)
+    live_in, live_out := compute_liveness(function, blocks[:])
+
+    intervals := make([dynamic]Live_Interval, function.temp_count)
+    for &interval, temp in intervals {
+        interval = Live_Interval{temp = Ir_Temp(temp), start = max(int), end = -1}
+    }
+    extend :: proc(interval: ^Live_Interval, position: int) {
+        interval.start = min(interval.start, position)
+        interval.end = max(interval.end, position)
+    }
+
+    calls_before := make([]int, len(instructions) + 1, context.temp_allocator)
+    for instruction, i in instructions {
+        calls_before[i + 1] = calls_before[i] + (1 if instruction.op == .Call else 0)
+        ir_uses(instruction, &uses)
+        for temp in uses do extend(&intervals[temp], i)
+        if instruction.dest != NO_TEMP do extend(&intervals[instruction.dest], i)
+    }
+
+    for block, b in blocks {
+        for w in 0..<len(live_in[b]) {
+            for bits := live_in[b][w]; bits != 0; bits &= bits - 1 {
+                extend(&intervals[w * 64 + int(intrinsics.count_trailing_zeros(bits))], block.start)
+            }
+            for bits := live_out[b][w]; bits != 0; bits &= bits - 1 {
+                extend(&intervals[w * 64 + int(intrinsics.count_trailing_zeros(bits))], block.end)
+            }
+        }
+    }
+
+    // A value used as an argument ends at its call and a call's result starts there, so neither crosses it
+    for &interval in intervals {
+        if interval.end < 0 do continue
+        interval.crosses_call = calls_before[interval.end] - calls_before[interval.start + 1] > 0
+    }
+
+    return intervals
+}
+
+// Linear scan register allocation (Poletto and Sarkar). Intervals are visited in order of their start, and when no
+// register is free the interval that ends last is spilled. Values that live across a call may only use callee saved
+// registers, so nothing needs saving around calls.
+allocate_registers :: proc(function: Ir_Function) -> Allocation {
+    intervals := build_live_intervals(function)
+    defer delete(intervals)
+
+    allocation := Allocation{
+        locations = make([]Location, function.temp_count),
+        saved_registers = make([dynamic]Register),
+    }
+
+    live := make([dynamic]Live_Interval, context.temp_allocator)
+    for interval in intervals {
+        if interval.end >= 0 do append(&live, interval)
+    }
+    slice.sort_by(live[:], proc(a, b: Live_Interval) -> bool { return a.start < b.start })
+
+    active := make([dynamic]Live_Interval, context.temp_allocator) // Sorted by end
+    free_registers := CALLER_SAVED_REGISTERS | CALLEE_SAVED_REGISTERS
+    used_registers: bit_set[Register]
+    spill_count := 0
+
+    for interval in live {
+        // An interval that ends where this one starts is only read there, and every instruction reads its operands
+        // before writing its result, so the two can share a register
+        for len(active) > 0 && active[0].end <= interval.start {
+            free_registers += {allocation.locations[active[0].temp].(Register)}
+            ordered_remove(&active, 0)
+        }
+
+        allowed := CALLEE_SAVED_REGISTERS if interval.crosses_call else CALLER_SAVED_REGISTERS | CALLEE_SAVED_REGISTERS
+        available := free_registers & allowed
+        if available != {} {
+            // Caller saved registers are free to use, callee saved ones have to be saved in the prologue
+            if available & CALLER_SAVED_REGISTERS != {} do available &= CALLER_SAVED_REGISTERS
+            register := first_register(available)
+            free_registers -= {register}
+            used_registers += {register}
+            allocation.locations[interval.temp] = register
+            insert_active_interval(&active, interval)
+            continue
+        }
+
+        // Spill whichever of this interval and the active ones it could take a register from ends last
+        victim := -1
+        #reverse for other, i in active {
+            if allocation.locations[other.temp].(Register) in allowed {
+                victim = i
+                break
+            }
+        }
+        if victim != -1 && active[victim].end > interval.end {
+            register := allocation.locations[active[victim].temp].(Register)
+            allocation.locations[active[victim].temp] = Stack_Slot(spill_count)
+            ordered_remove(&active, victim)
+            allocation.locations[interval.temp] = register
+            insert_active_interval(&active, interval)
+        }
+        else {
+            allocation.locations[interval.temp] = Stack_Slot(spill_count)
+        }
+        spill_count += 1
+    }
+
+    for register in used_registers & CALLEE_SAVED_REGISTERS {
+        append(&allocation.saved_registers, register)
+    }
+
+    // Spill slots sit below the saved registers. Until now they held slot numbers, which become offsets from %rbp here.
+    saved_size := len(allocation.saved_registers) * 8
+    for &location in allocation.locations {
+        if slot, is_slot := location.(Stack_Slot); is_slot {
+            location = Stack_Slot(-(saved_size + (int(slot) + 1) * 8))
+        }
+    }
+    allocation.frame_size = spill_count * 8
+    if (saved_size + allocation.frame_size) % 16 != 0 do allocation.frame_size += 8 // Keep %rsp 16 byte aligned for calls
+
+    return allocation
+}
+
+first_register :: proc(registers: bit_set[Register]) -> Register {
+    for register in registers do return register
+    unreachable()
+}
+
+insert_active_interval :: proc(active: ^[dynamic]Live_Interval, interval: Live_Interval) {
+    index := len(active)
+    for other, i in active {
+        if other.end > interval.end {
+            index = i
+            break
+        }
+    }
+    inject_at(active, index, interval)
+}
+
+register_32 :: proc(register: Register) -> Asm_Reg {
+    return Asm_Reg{asm_registers[register], .Dword}
+}
+
+register_64 :: proc(register: Register) -> Asm_Reg {
+    return Asm_Reg{asm_registers[register], .Qword}
+}
+
+location_operand :: proc(location: Location) -> Asm_Operand {
+    switch l in location {
+        case Register:
+            return register_32(l)
+        case Stack_Slot:
+            return rbp_offset(int(l))
+    }
+    unreachable()
+}
+
+location_operand_64 :: proc(location: Location) -> Asm_Operand {
+    if register, is_register := location.(Register); is_register do return register_64(register)
+    return location_operand(location)
+}
+
+ir_operand :: proc(allocation: ^Allocation, operand: Ir_Operand) -> Asm_Operand {
+    switch o in operand {
+        case int:
+            return Asm_Immediate(o)
+        case Ir_Temp:
+            return location_operand(allocation.locations[o])
+    }
+    unreachable()
+}
+
+ir_operand_64 :: proc(allocation: ^Allocation, operand: Ir_Operand) -> Asm_Operand {
+    if temp, is_temp := operand.(Ir_Temp); is_temp do return location_operand_64(allocation.locations[temp])
+    return ir_operand(allocation, operand)
+}
+
+// A variable with static storage, addressed relative to %rip
+global_operand :: proc(name: string) -> Asm_Memory {
+    return Asm_Memory{symbol = intern(name), base = .Rip}
+}
+
+operand_is_memory :: proc(allocation: ^Allocation, operand: Ir_Operand) -> bool {
+    temp, is_temp := operand.(Ir_Temp)
+    if !is_temp do return false
+    _, is_slot := allocation.locations[temp].(Stack_Slot)
+    return is_slot
+}
+
+operand_register :: proc(allocation: ^Allocation, operand: Ir_Operand) -> (register: Register, ok: bool) {
+    temp, is_temp := operand.(Ir_Temp)
+    if !is_temp do return {}, false
+    return allocation.locations[temp].(Register)
+}
+
+emit_move :: proc(builder: ^Asm_Builder, allocation: ^Allocation, source: Ir_Operand, dest: Location) {
+    source_operand := ir_operand(allocation, source)
+    dest_operand := location_operand(dest)
+    if asm_operands_equal(source_operand, dest_operand) do return
+
+    _, dest_is_memory := dest.(Stack_Slot)
+    if dest_is_memory && operand_is_memory(allocation, source) {
+        asm_emit(builder, .Mov, source_operand, R10D)
+        asm_emit(builder, .Mov, R10D, dest_operand)
+    }
+    else {
+        asm_emit(builder, .Mov, source_operand, dest_operand)
+    }
+}
+
+// The register an instruction computes its result in. That is the destination itself if it is a register that the
+// right operand does not need, and r10 otherwise.
+working_register :: proc(allocation: ^Allocation, instruction: Ir_Instruction) -> Register {
+    dest, dest_is_register := allocation.locations[instruction.dest].(Register)
+    if !dest_is_register do return .R10
+    if right, right_is_register := operand_register(allocation, instruction.right); right_is_register && right == dest do return .R10
+    return dest
+}
+
+emit_parameters :: proc(builder: ^Asm_Builder, allocation: ^Allocation, params: []Ir_Instruction) {
+    // Moving the register parameters one at a time is only safe if no destination is the source of a later parameter
+    sources: bit_set[Register]
+    for instruction in params {
+        if instruction.param < len(argument_registers) do sources += {argument_registers[instruction.param]}
+    }
+    direct := true
+    for instruction in params {
+        dest, is_register := allocation.locations[instruction.dest].(Register)
+        if is_register && dest in sources && (instruction.param >= len(argument_registers) || dest != argument_registers[instruction.param]) {
+            direct = false
+        }
+    }
+
+    if !direct {
+        #reverse for instruction in params {
+            if instruction.param < len(argument_registers) {
+                asm_emit(builder, .Push, register_64(argument_registers[instruction.param]))
+            }
+        }
+    }
+    for instruction in params {
+        dest := allocation.locations[instruction.dest]
+        if instruction.param >= len(argument_registers) {
+            // Above the return address and saved %rbp, after the caller's shadow space
+            offset := 16 + SHADOW_SPACE + (instruction.param - len(argument_registers)) * 8
+            if _, dest_is_memory := dest.(Stack_Slot); dest_is_memory {
+                asm_emit(builder, .Mov, rbp_offset(offset), R10D)
+                asm_emit(builder, .Mov, R10D, location_operand(dest))
+            }
+            else {
+                asm_emit(builder, .Mov, rbp_offset(offset), location_operand(dest))
+            }
+        }
+        else if direct {
+            source := argument_registers[instruction.param]
+            if register, is_register := dest.(Register); !is_register || register != source {
+                asm_emit(builder, .Mov, register_32(source), location_operand(dest))
+            }
+        }
+        else {
+            asm_emit(builder, .Pop, location_operand_64(dest), width = .Qword)
+        }
+    }
+}
+
+emit_call :: proc(builder: ^Asm_Builder, allocation: ^Allocation, instruction: Ir_Instruction) {
+    register_count := min(len(instruction.args), len(argument_registers))
+    register_args := instruction.args[:register_count]
+    stack_args := instruction.args[register_count:]
+
+    padding := 8 if len(stack_args) % 2 == 1 else 0
+    if padding > 0 do asm_emit(builder, .Sub, Asm_Immediate(8), RSP)
+    #reverse for arg in stack_args {
+        asm_emit(builder, .Push, ir_operand_64(allocation, arg), width = .Qword)
+    }
+
+    // As with parameters, moving the arguments one at a time is only safe if no argument register is overwritten
+    // before a later argument is read from it
+    direct := true
+    for arg, i in register_args {
+        for later in register_args[i + 1:] {
+            if register, is_register := operand_register(allocation, later); is_register && register == argument_registers[i] {
+                direct = false
+            }
+        }
+    }
+    if direct {
+        for arg, i in register_args {
+            asm_emit(builder, .Mov, ir_operand(allocation, arg), register_32(argument_registers[i]))
+        }
+    }
+    else {
+        #reverse for arg in register_args {
+            asm_emit(builder, .Push, ir_operand_64(allocation, arg), width = .Qword)
+        }
+        for _, i in register_args {
+            asm_emit(builder, .Pop, register_64(argument_registers[i]))
+        }
+    }
+
+    when SHADOW_SPACE > 0 {
+        asm_emit(builder, .Sub, Asm_Immediate(SHADOW_SPACE), RSP)
+    }
+    asm_emit(builder, .Call, Asm_Symbol(intern(instruction.name)))
+    cleanup := len(stack_args) * 8 + padding + SHADOW_SPACE
+    if cleanup > 0 do asm_emit(builder, .Add, Asm_Immediate(cleanup), RSP)
+
+    dest := allocation.locations[instruction.dest]
+    if register, is_register := dest.(Register); !is_register || register != .Rax {
+        asm_emit(builder, .Mov, EAX, location_operand(dest))
+    }
+}
+
+emit_ir_instruction :: proc(builder: ^Asm_Builder, allocation: ^Allocation, function: Ir_Function, index: int) {
+    instruction := function.instructions[index]
+    dest: Location
+    if instruction.dest != NO_TEMP do dest = allocation.locations[instruction.dest]
+
+    switch instruction.op {
+        case .Copy:
+            emit_move(builder, allocation, instruction.left, dest)
+
+        case .Negate, .Bit_Not:
+            work := working_register(allocation, instruction)
+            asm_emit(builder, .Mov, ir_operand(allocation, instruction.left), register_32(work))
+            asm_emit(builder, Asm_Op.Neg if instruction.op == .Negate else Asm_Op.Not, register_32(work))
+            emit_move_from_register(builder, work, dest)
+
+        case .Bool_Not:
+            if value, is_constant := instruction.left.(int); is_constant {
+                emit_move(builder, allocation, 1 if value == 0 else 0, dest)
+                break
+            }
+            asm_emit(builder, .Cmp, Asm_Immediate(0), ir_operand(allocation, instruction.left))
+            asm_emit_set(builder, .E, R11B)
+            asm_emit(builder, .Movzbl, R11B, R11D)
+            emit_move_from_register(builder, .R11, dest)
+
+        case .Add, .Subtract, .Multiply, .Bit_And, .Bit_Or, .Bit_Xor:
+            op: Asm_Op
+            #partial switch instruction.op {
+                case .Add: op = .Add
+                case .Subtract: op = .Sub
+                case .Multiply: op = .Imul
+                case .Bit_And: op = .And
+                case .Bit_Or: op = .Or
+                case .Bit_Xor: op = .Xor
+            }
+            work := working_register(allocation, instruction)
+            emit_move_to_register(builder, allocation, instruction.left, work)
+            asm_emit(builder, op, ir_operand(allocation, instruction.right), register_32(work))
+            emit_move_from_register(builder, work, dest)
+
+        case .Divide, .Modulo:
+            emit_move_to_register(builder, allocation, instruction.left, .Rax)
+            asm_emit(builder, .Cdq)
+            divisor := ir_operand(allocation, instruction.right)
+            if _, is_constant := instruction.right.(int); is_constant {
+                asm_emit(builder, .Mov, divisor, R10D)
+                divisor = R10D
+            }
+            asm_emit(builder, .Idiv, divisor)
+            emit_move_from_register(builder, .Rax if instruction.op == .Divide else .Rdx, dest)
+
+        case .Shift_Left, .Shift_Right:
+            op := Asm_Op.Sal if instruction.op == .Shift_Left else Asm_Op.Sar
+            count := ir_operand(allocation, instruction.right)
+            if _, is_constant := instruction.right.(int); !is_constant {
+                emit_move_to_register(builder, allocation, instruction.right, .Rcx)
+                count = CL
+            }
+            // The count is already in %cl, so the destination can be written even if it held the count
+            work := Register.R10
+            if register, is_register := dest.(Register); is_register do work = register
+            emit_move_to_register(builder, allocation, instruction.left, work)
+            asm_emit(builder, op, count, register_32(work))
+            emit_move_from_register(builder, work, dest)
+
+        case .Equal, .Not_Equal, .Less, .Less_Equal, .More, .More_Equal:
+            condition: Asm_Condition
+            #partial switch instruction.op {
+                case .Equal: condition = .E
+                case .Not_Equal: condition = .Ne
+                case .Less: condition = .L
+                case .Less_Equal: condition = .Le
+                case .More: condition = .G
+                case .More_Equal: condition = .Ge
+            }
+            left := ir_operand(allocation, instruction.left)
+            _, left_is_constant := instruction.left.(int)
+            if left_is_constant || (operand_is_memory(allocation, instruction.left) && operand_is_memory(allocation, instruction.right)) {
+                emit_move_to_register(builder, allocation, instruction.left, .R10)
+                left = R10D
+            }
+            asm_emit(builder, .Cmp, ir_operand(allocation, instruction.right), left)
+            asm_emit_set(builder, condition, R11B)
+            asm_emit(builder, .Movzbl, R11B, R11D)
+            emit_move_from_register(builder, .R11, dest)
+
+        case .Load_Global:
+            if register, is_register := dest.(Register); is_register {
+                asm_emit(builder, .Mov, global_operand(instruction.name), register_32(register))
+            }
+            else {
+                asm_emit(builder, .Mov, global_operand(instruction.name), R10D)
+                emit_move_from_register(builder, .R10, dest)
+            }
+
+        case .Store_Global:
+            source := ir_operand(allocation, instruction.left)
+            if operand_is_memory(allocation, instruction.left) {
+                emit_move_to_register(builder, allocation, instruction.left, .R10)
+                source = R10D
+            }
+            asm_emit(builder, .Mov, source, global_operand(instruction.name))
+
+        case .Get_Param:
+            // Parameters are all read at once at the start of the function, see emit_parameters
+            if index > 0 && function.instructions[index - 1].op == .Get_Param do break
+            end := index
+            for end < len(function.instructions) && function.instructions[end].op == .Get_Param do end += 1
+            emit_parameters(builder, allocation, function.instructions[index:end])
+
+        case .Call:
+            emit_call(builder, allocation, instruction)
+
+        case .Label:
+            asm_emit(builder, .Label, Asm_Label(instruction.label))
+
+        case .Jump:
+            asm_emit(builder, .Jmp, Asm_Label(instruction.label))
+
+        case .Jump_If_Zero, .Jump_If_Not_Zero:
+            if value, is_constant := instruction.left.(int); is_constant {
+                if (value == 0) == (instruction.op == .Jump_If_Zero) do asm_emit(builder, .Jmp, Asm_Label(instruction.label))
+                break
+            }
+            asm_emit(builder, .Cmp, Asm_Immediate(0), ir_operand(allocation, instruction.left))
+            asm_emit_jump(builder, .E if instruction.op == .Jump_If_Zero else .Ne, instruction.label)
+
+        case .Return:
+            emit_move_to_register(builder, allocation, instruction.left, .Rax)
+            if index != len(function.instructions) - 1 {
+                asm_emit(builder, .Jmp, Asm_Function_End(intern(function.name)))
+            }
+    }
+}
+
+emit_move_to_register :: proc(builder: ^Asm_Builder, allocation: ^Allocation, source: Ir_Operand, register: Register) {
+    source_operand := ir_operand(allocation, source)
+    if asm_operands_equal(source_operand, register_32(register)) do return
+    asm_emit(builder, .Mov, source_operand, register_32(register))
+}
+
+emit_move_from_register :: proc(builder: ^Asm_Builder, register: Register, dest: Location) {
+    if dest_register, is_register := dest.(Register); is_register && dest_register == register do return
+    asm_emit(builder, .Mov, register_32(register), location_operand(dest))
+}
+
+emit_allocated_function :: proc(builder: ^Asm_Builder, function: Ir_Function, allocation: ^Allocation) {
+    name := intern(function.name)
+    asm_emit(builder, .Text)
+    if function.global do asm_emit(builder, .Globl, Asm_Symbol(name))
+    asm_emit(builder, .Label, Asm_Symbol(name))
+    asm_emit(builder, .Push, RBP)
+    asm_emit(builder, .Mov, RSP, RBP)
+    for register in allocation.saved_registers {
+        asm_emit(builder, .Push, register_64(register))
+    }
+    if allocation.frame_size > 0 do asm_emit(builder, .Sub, Asm_Immediate(allocation.frame_size), RSP)
+
+    for _, i in function.instructions {
+        emit_ir_instruction(builder, allocation, function, i)
+    }
+
+    asm_emit(builder, .Label, Asm_Function_End(name))
+    if len(allocation.saved_registers) > 0 {
+        asm_emit(builder, .Lea, rbp_offset(-len(allocation.saved_registers) * 8), RSP)
+        #reverse for register in allocation.saved_registers {
+            asm_emit(builder, .Pop, register_64(register))
+        }
+    }
+    else {
+        asm_emit(builder, .Mov, RBP, RSP)
+    }
+    asm_emit(builder, .Pop, RBP)
+    asm_emit(builder, .Ret)
+}
+
+emit_static_variables :: proc(builder: ^Asm_Builder, variables: []Ir_Static_Variable) {
+    for variable in variables {
+        name := intern(variable.name)
+        asm_emit(builder, .Data)
+        if variable.global do asm_emit(builder, .Globl, Asm_Symbol(name))
+        asm_emit(builder, .Balign, Asm_Immediate(4))
+        asm_emit(builder, .Label, Asm_Symbol(name))
+        asm_emit(builder, .Long, Asm_Immediate(variable.value))
+    }
+}
+
+allocate_stack_slots :: proc(function: Ir_Function) -> Allocation {
+    allocation := Allocation{
+        locations = make([]Location, function.temp_count),
+        saved_registers = make([dynamic]Register),
+    }
+    for &location, temp in allocation.locations {
+        location = Stack_Slot(-(temp + 1) * 8)
+    }
+    allocation.frame_size = function.temp_count * 8
+    if allocation.frame_size % 16 != 0 do allocation.frame_size += 8
+    return allocation
+}
+
+emit_ir_program :: proc(program: Ir_Program, use_registers: bool) -> (assembly: string, rewrites: Peephole_Counts) {
+    builder: Asm_Builder
+    defer delete(builder.code)
+
+    for function in program.functions {
+        allocation := allocate_registers(function) if use_registers else allocate_stack_slots(function)
+        emit_allocated_function(&builder, function, &allocation)
+        delete(allocation.locations)
+        delete(allocation.saved_registers)
+    }
+    emit_static_variables(&builder, program.static_variables[:])
+
+    if peephole_optimize do rewrites = peephole(&builder.code)
+    return write_asm(builder.code[:]), rewrites
+}
@@ -0,0 +1,73 @@
+package occm
+
+// A flat symbol table shared by the validator, the stack machine emitter and the IR lowering. Every name, as an atom
+// (see interning.odin), maps straight to its innermost visible definition, so a lookup is a single map access however
+// deeply the scopes are nested.
+//
+// Defining a name records whatever it shadowed in a log, and each open scope remembers where its part of the log
+// starts. Leaving a scope replays its part of the log backwards, restoring the shadowed definitions and removing the
+// new ones, so entering and leaving scopes allocates nothing once the log has grown to the deepest nesting.
+
+Symbol :: struct($T: typeid) {
+    value: T,
+    depth: int, // Number of scopes open when the symbol was defined, 0 for file scope
+}
+
+Shadowed_Symbol :: struct($T: typeid) {
+    name: Atom,
+    previous: Symbol(T),
+    existed: bool,
+}
+
+Symbol_Table :: struct($T: typeid) {
+    symbols: map[Atom]Symbol(T),
+    shadowed: [dynamic]Shadowed_Symbol(T),
+    scope_starts: [dynamic]int, // Length of `shadowed` when each open scope was entered
+}
+
+make_symbol_table :: proc($T: typeid) -> Symbol_Table(T) {
+    return Symbol_Table(T){
+        symbols = make(map[Atom]Symbol(T)),
+        shadowed = make([dynamic]Shadowed_Symbol(T)),
+        scope_starts = make([dynamic]int),
+    }
+}
+
+delete_symbol_table :: proc(table: ^Symbol_Table($T)) {
+    delete(table.symbols)
+    delete(table.shadowed)
+    delete(table.scope_starts)
+}
+
+enter_scope :: proc(table: ^Symbol_Table($T)) {
+    append(&table.scope_starts, len(table.shadowed))
+}
+
+exit_scope :: proc(table: ^Symbol_Table($T)) {
+    start := pop(&table.scope_starts)
+    #reverse for entry in table.shadowed[start:] {
+        if entry.existed do table.symbols[entry.name] = entry.previous
+        else do delete_key(&table.symbols, entry.name)
+    }
+    resize(&table.shadowed, start)
+}
+
+define_symbol :: proc(table: ^Symbol_Table($T), name: Atom, value: T) {
+    previous, existed := table.symbols[name]
+    append(&table.shadowed, Shadowed_Symbol(T){name, previous, existed})
+    table.symbols[name] = Symbol(T){value, len(table.scope_starts)}
+}
+
+// Finds the innermost visible definition of `name`
+lookup_symbol :: proc(table: ^Symbol_Table($T), name: Atom) -> (value: T, found: bool) {
+    symbol, ok := table.symbols[name]
+    if !ok do return {}, false
+    return symbol.value, true
+}
+
+// Finds `name` only if it was defined in the innermost open scope
+lookup_symbol_in_scope :: proc(table: ^Symbol_Table($T), name: Atom) -> (value: T, found: bool) {
+    symbol, ok := table.symbols[name]
+    if !ok || symbol.depth != len(table.scope_starts) do return {}, false
+    return symbol.value, true
+}
@@ -0,0 +1,327 @@
+from pathlib import Path
+import re
+
+# Checks on the assembly occm generates for the optimization chapters, run by `run_tests.py -check-asm`.
+#
+# The chapter 19 and 20 READMEs describe what the upstream test script looks for in the `target*` functions of each
+# test. The upstream script keeps a table of expectations per test, which is not part of this repo, so each suite gets
+# the generic form of its rule instead:
+#   constant_folding              only moves, jumps and `xor reg, reg` outside the prologue and epilogue
+#   unreachable_code_elimination  no jumps, labels or calls
+#   copy_propagation              no moves of a location onto itself
+#   dead_store_elimination        no store that is overwritten or returned past before it is read
+#   whole_pipeline                only moves, jumps and `xor reg, reg`, as for constant folding
+#   chapter 20                    no spilled values, except in the tests listed below
+# Every chapter 19 suite is also checked for blocks that cannot be reached, which is straight-line code after an
+# unconditional jump or a return.
+#
+# Alongside pass/fail, each checked test reports metrics on its target functions: the number of instructions outside
+# the prologue and epilogue, and the number of stack slots used for spilled values.
+
+LOCAL_LABEL = re.compile(r"L\d+$")
+STACK_SLOT = re.compile(r"-\d+\(%rbp\)")
+OPERAND_SEPARATOR = re.compile(r",\s*(?![^()]*\))")
+CONSTANT = re.compile(r"\$-?\d+$")
+
+# Registers that prologues save and epilogues restore, under either calling convention
+SAVED_REGISTERS = {"%rbp", "%rbx", "%rsi", "%rdi", "%r12", "%r13", "%r14", "%r15"}
+
+JUMPS = {"jmp", "je", "jne", "jl", "jle", "jg", "jge", "jz", "jnz", "ja", "jae", "jb", "jbe"}
+
+# Tests that are only run for their behaviour, because they cover code that must not be optimized away or edge cases
+UNCHECKED_DIRECTORIES = {"dont_propagate", "dont_elim"}
+UNCHECKED_TESTS = {"keep_final_jump", "empty", "infinite_loop", "remove_jump_keep_label"}
+# Unreachable code tests where only the calls have to go
+CALLS_ONLY_TESTS = {"dead_branch_inside_loop", "dead_after_if_else"}
+# Dead store tests where everything but the returned constant has to go
+RETURN_ONLY_TESTS = {"simple", "delete_arithmetic_ops", "delete_dead_pt_ii_instructions"}
+# Copy propagation tests where removing a redundant copy makes every branch dead
+NO_CONTROL_FLOW_TESTS = {"redundant_copies"}
+
+# Chapter 20 tests that have to spill, with the most stack slots their target functions may use. Each must spill at least
+# once. Upstream expects one spilled value in each, or five for optimistic_coloring, with 12 allocatable registers of
+# which 5 are callee-saved. On System V, occm's linear scan also has 5 callee-saved registers but only 9 in all, see
+# regalloc.odin, so force_spill, whose two cliques of 12 need every register, may spill 3 more values from each clique.
+SPILL_TESTS = {
+    "force_spill": 7,
+    "force_spill_doubles": 1,
+    "force_spill_mixed_ints": 1,
+    "test_spill_metric": 1,
+    "test_spill_metric_2": 1,
+    "optimistic_coloring": 5,
+    "no_george_test_for_pseudos": 1,
+}
+# Chapter 20 tests that upstream expects not to spill, but that need more registers than linear scan has. Some keep more
+# than 9 values live at once, for the 12 registers upstream allocates. The rest rely on an interference graph that leaves
+# out the holes in a value's live range, which linear scan's intervals include, so 6 values need the 5 callee-saved
+# registers. They are still run for their behaviour, and their spills are reported in the metrics.
+LINEAR_SCAN_PRESSURE_TESTS = {
+    "use_all_hardregs", "track_arg_registers", "rewrite_regression_test", "preserve_across_fun_call", "loop",
+    "cmp_no_updates", "briggs_coalesce", "coalesce_prevents_spill", "george_dont_coalesce", "george_dont_coalesce_2",
+    "george_off_by_one",
+}
+
+class Instruction:
+    def __init__(self, opcode: str, operands: list[str]):
+        self.opcode = opcode
+        self.operands = operands
+
+    def __str__(self) -> str:
+        return f"{self.opcode} {', '.join(self.operands)}".strip()
+
+class AsmFunction:
+    def __init__(self, name: str):
+        self.name = name
+        # Instructions in order, with labels as instructions whose opcode is ":"
+        self.instructions: list[Instruction] = []
+
+    def epilogue_label(self) -> str:
+        return f"{self.name}_done"
+
+    def is_frame_instruction(self, instruction: Instruction) -> bool:
+        opcode, operands = instruction.opcode, instruction.operands
+        if opcode in ("push", "pushq", "pop", "popq"):
+            return operands[0] in SAVED_REGISTERS
+        if opcode == "ret":
+            return True
+        if opcode in ("mov", "movq") and operands in (["%rsp", "%rbp"], ["%rbp", "%rsp"]):
+            return True
+        if opcode in ("sub", "subq", "add", "addq", "lea", "leaq") and operands[-1] == "%rsp":
+            return True
+        return operands == [self.epilogue_label()] and opcode in (":", "jmp")
+
+    # The instructions that do the function's work, without its prologue, epilogue or labels
+    def body(self) -> list[Instruction]:
+        return [instruction for instruction in self.instructions if instruction.opcode != ":" and not self.is_frame_instruction(instruction)]
+
+    def labels(self) -> list[str]:
+        return [instruction.operands[0] for instruction in self.instructions if instruction.opcode == ":" and instruction.operands[0] != self.epilogue_label()]
+
+def parse_instruction(line: str) -> Instruction:
+    opcode, _, operands = line.partition(" ")
+    operands = operands.strip()
+    return Instruction(opcode, OPERAND_SEPARATOR.split(operands) if operands != "" else [])
+
+# Splits assembly into its functions. A function starts at any label in the text section other than one of its own
+# local labels, which are the L<n> labels, user labels like _name@function and the epilogue label.
+def parse_assembly(assembly: str) -> dict[str, AsmFunction]:
+    functions = {}
+    current = None
+    in_text = True
+    for line in assembly.splitlines():
+        line = line.split("#", 1)[0].strip()
+        if line == "":
+            continue
+
+        if line.startswith("."):
+            directive = line.split()[0]
+            if directive in (".data", ".bss", ".section"):
+                in_text = directive == ".section" and ".text" in line
+            elif directive == ".text":
+                in_text = True
+            continue
+
+        if line.endswith(":"):
+            label = line.removesuffix(":")
+            if not in_text:
+                current = None
+            elif current is not None and (LOCAL_LABEL.match(label) or "@" in label or label == current.epilogue_label()):
+                current.instructions.append(Instruction(":", [label]))
+            else:
+                current = functions.setdefault(label, AsmFunction(label))
+            continue
+
+        if current is not None:
+            current.instructions.append(parse_instruction(line))
+    return functions
+
+# Names a register by its 64 bit form, so that %eax, %ax and %al all alias %rax
+def register_key(operand: str) -> str | None:
+    match = re.fullmatch(r"%([er]?)(ax|bx|cx|dx|si|di|sp|bp)|%(al|bl|cl|dl)|%(r\d+)[dwb]?", operand)
+    if match is None:
+        return None
+    if match.group(2) is not None:
+        return "r" + match.group(2)
+    if match.group(3) is not None:
+        return "r" + match.group(3)[0] + "x"
+    return match.group(4)
+
+def location_key(operand: str) -> str | None:
+    if STACK_SLOT.fullmatch(operand):
+        return operand
+    return register_key(operand)
+
+# The locations an instruction reads and writes, including the implicit operands of cdq and idiv
+def reads_and_writes(instruction: Instruction) -> tuple[set[str], set[str]]:
+    opcode, operands = instruction.opcode, instruction.operands
+    keys = [location_key(operand) for operand in operands]
+    reads = set()
+    writes = set()
+    if opcode.startswith("mov") or opcode.startswith("set") or opcode in ("pop", "popq", "lea", "leaq"):
+        # The last operand is only written
+        for key in keys[:-1]:
+            if key is not None: reads.add(key)
+        if keys and keys[-1] is not None: writes.add(keys[-1])
+    else:
+        for key in keys:
+            if key is not None: reads.add(key)
+        if opcode not in ("cmp", "cmpl", "cmpq", "test", "testl", "push", "pushq") and keys and keys[-1] is not None:
+            writes.add(keys[-1])
+
+    # Registers also read through memory operands, e.g. the base register of -8(%rbp)
+    for operand in operands:
+        for register in re.findall(r"\((%\w+)", operand):
+            reads.add(register_key(register))
+
+    if opcode in ("cdq", "cltd"):
+        reads.add("rax")
+        writes.add("rdx")
+    elif opcode in ("idiv", "idivl", "div", "divl"):
+        reads.update(("rax", "rdx"))
+        writes.update(("rax", "rdx"))
+    return reads, writes
+
+def find_dead_stores(function: AsmFunction) -> list[Instruction]:
+    dead = []
+    pending: dict[str, Instruction] = {} # Locations stored to in this block and not read since
+    for instruction in function.instructions:
+        opcode = instruction.opcode
+        if function.is_frame_instruction(instruction) and opcode in ("ret", "jmp", ":"):
+            # Leaving the function, where only the return value in eax is still live
+            dead += [store for location, store in pending.items() if location != "rax"]
+            pending = {}
+            continue
+        if opcode == ":" or opcode in JUMPS or opcode in ("call", "callq"):
+            # Stores may be read in another block or by the callee
+            pending = {}
+            continue
+        if function.is_frame_instruction(instruction):
+            continue
+
+        reads, writes = reads_and_writes(instruction)
+        for location in reads:
+            pending.pop(location, None)
+        for location in writes:
+            if location in pending:
+                dead.append(pending.pop(location))
+            if opcode.startswith("mov") and opcode != "movzbl":
+                pending[location] = instruction
+    return dead
+
+def find_unreachable_code(function: AsmFunction) -> list[Instruction]:
+    unreachable = []
+    after_exit = False
+    for instruction in function.instructions:
+        if instruction.opcode == ":":
+            after_exit = False
+        elif after_exit:
+            unreachable.append(instruction)
+        elif instruction.opcode in ("jmp", "ret"):
+            after_exit = True
+    return unreachable
+
+def is_computation_free(instruction: Instruction) -> bool:
+    if instruction.opcode in ("mov", "movl", "movq", "jmp"):
+        return True
+    return instruction.opcode in ("xor", "xorl", "xorq") and len(instruction.operands) == 2 and instruction.operands[0] == instruction.operands[1]
+
+def spill_slots(function: AsmFunction) -> set[str]:
+    return {operand for instruction in function.body() for operand in instruction.operands if STACK_SLOT.fullmatch(operand)}
+
+def source_path(group: list[Path]) -> Path:
+    return next(path for path in group if path.suffix == ".c")
+
+def is_checked(group: list[Path]) -> bool:
+    path = source_path(group)
+    if path.parts[0] not in ("chapter_19", "chapter_20"):
+        return False
+    return path.stem not in UNCHECKED_TESTS and UNCHECKED_DIRECTORIES.isdisjoint(path.parts)
+
+# The flags a group is compiled with so that its suite's optimizations are on
+def suite_flags(group: list[Path]) -> list[str]:
+    chapter = source_path(group).parts[0]
+    if chapter == "chapter_19":
+        return ["-optimize"]
+    elif chapter == "chapter_20":
+        return ["-optimize", "-regalloc"]
+    return []
+
+def check_function(path: Path, function: AsmFunction) -> str | None:
+    chapter = path.parts[0]
+    suite = path.parts[1]
+    test = path.stem
+    body = function.body()
+
+    def fail(rule: str, instructions: list[Instruction]) -> str:
+        return f"{function.name}: {rule}: {'; '.join(str(instruction) for instruction in instructions[:3])}"
+
+    if chapter == "chapter_20":
+        slots = spill_slots(function)
+        if test in SPILL_TESTS:
+            if len(slots) == 0:
+                return f"{function.name}: expected to spill, but used no stack slots"
+            if len(slots) > SPILL_TESTS[test]:
+                return f"{function.name}: spilled to {len(slots)} stack slots, expected at most {SPILL_TESTS[test]}"
+        elif test not in LINEAR_SCAN_PRESSURE_TESTS and len(slots) > 0:
+            return f"{function.name}: spilled to {len(slots)} stack slots"
+        return None
+
+    unreachable = find_unreachable_code(function)
+    if len(unreachable) > 0:
+        return fail("unreachable code", unreachable)
+
+    if suite in ("constant_folding", "whole_pipeline"):
+        computations = [instruction for instruction in body if not is_computation_free(instruction)]
+        if len(computations) > 0:
+            return fail("computation left after folding", computations)
+
+    elif suite == "unreachable_code_elimination":
+        calls = [instruction for instruction in body if instruction.opcode in ("call", "callq")]
+        if len(calls) > 0:
+            return fail("call left in dead code", calls)
+        if test not in CALLS_ONLY_TESTS:
+            jumps = [instruction for instruction in body if instruction.opcode in JUMPS]
+            if len(jumps) > 0:
+                return fail("jump left after eliminating dead branches", jumps)
+            if len(function.labels()) > 0:
+                return f"{function.name}: labels left after eliminating dead branches: {', '.join(function.labels())}"
+
+    elif suite == "copy_propagation":
+        self_copies = [instruction for instruction in body if instruction.opcode.startswith("mov") and len(set(instruction.operands)) == 1]
+        if len(self_copies) > 0:
+            return fail("copy onto itself", self_copies)
+        if test in NO_CONTROL_FLOW_TESTS:
+            jumps = [instruction for instruction in body if instruction.opcode in JUMPS]
+            if len(jumps) > 0 or len(function.labels()) > 0:
+                return fail("control flow left after removing redundant copies", jumps)
+
+    elif suite == "dead_store_elimination":
+        if test in RETURN_ONLY_TESTS:
+            if len(body) != 1 or not body[0].opcode.startswith("mov") or body[0].operands[-1] != "%eax" or not CONSTANT.match(body[0].operands[0]):
+                return fail("expected only a constant moved into %eax", body)
+        dead = find_dead_stores(function)
+        if len(dead) > 0:
+            return fail("dead store", dead)
+
+    return None
+
+# Returns a failure message, or None if every target function follows its suite's rules, along with the metrics of the
+# target functions
+def check_group(group: list[Path], assembly: dict[Path, str]) -> tuple[str | None, dict[str, int]]:
+    path = source_path(group)
+    metrics = {"instructions": 0, "spill_slots": 0}
+    source_assembly = next((text for asm_path, text in assembly.items() if asm_path.resolve() == path.resolve()), None)
+    if source_assembly is None:
+        return f"No assembly was generated for {path}", metrics
+
+    targets = [function for name, function in parse_assembly(source_assembly).items() if name.startswith("target")]
+    if len(targets) == 0:
+        return f"No target functions in the assembly for {path}", metrics
+
+    message = None
+    for function in targets:
+        metrics["instructions"] += len(function.body())
+        metrics["spill_slots"] += len(spill_slots(function))
+        if message is None:
+            message = check_function(path, function)
+    return message, metrics
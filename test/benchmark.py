@@ -0,0 +1,231 @@
+from pathlib import Path
+import argparse
+import json
+import math
+import subprocess
+import sys
+import tempfile
+import time
+
+import common
+
+# Compiler throughput benchmarks. Every test in the chapters is tiny, so these generate programs that grow with a size
+# parameter and time occm on each size step. The compiler is run with -assembly -stdout, so gcc is not part of the timing.
+#
+# Results can be saved as a baseline, and later runs flag any step that got slower than the baseline by more than the
+# threshold. Each benchmark also reports how its time grows with size, to catch superlinear behaviour.
+#
+# With -stage, only the time occm reports for that stage through -timings is kept, which takes process startup and the
+# other stages out of the numbers. occm only times lexing on its own when it lexes each file up front, so `-stage lex`
+# also passes -tokenize. `-stage lex -only identifiers` is the lexer microbenchmark.
+
+BASELINE_PATH = Path(".benchmark_baseline.json")
+
+# The stages occm reports with -timings that happen while generating assembly
+STAGES = ["lex", "parse", "validate", "optimize", "emit"]
+
+def nested_expressions(n: int) -> str:
+    # Parenthesised so that each level recurses through parse_expression and emit_expr
+    operators = ["+", "-", "*", "/", "%", "<<", "&", "|", "^"]
+    expr = "x"
+    for i in range(n):
+        expr = f"({expr} {operators[i % len(operators)]} {i % 7 + 1})"
+    # A flat chain of mixed precedence operators exercises precedence climbing without deep recursion
+    chain = " ".join(f"{i % 9 + 1} {operators[i % 3]}" for i in range(n)) + " x"
+    return f"int main(void) {{\n    int x = 3;\n    int y = {expr};\n    return y + {chain};\n}}\n"
+
+def many_statements(n: int) -> str:
+    lines = ["int main(void) {", "    int v0 = 1;"]
+    for i in range(1, n):
+        if i % 3 == 0:
+            lines.append(f"    v{i - 1} = v{i - 1} * 2 + v{i // 2};")
+            lines.append(f"    int v{i} = v{i - 1} - {i};")
+        elif i % 3 == 1:
+            lines.append(f"    int v{i} = v{i - 1} + {i};")
+        else:
+            lines.append(f"    int v{i} = v{i - 1} ? v{i // 2} : {i};")
+            lines.append(f"    if (v{i} > {i}) v{i} = v{i} - 1; else v{i} = v{i} + 1;")
+    lines.append(f"    return v{n - 1};")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+def many_functions(n: int) -> str:
+    lines = ["int f0(int a, int b) {", "    return a + b;", "}"]
+    for i in range(1, n):
+        lines.append(f"int f{i}(int a, int b) {{")
+        lines.append(f"    int c = f{i - 1}(b, a) + {i};")
+        lines.append(f"    return c - a * b;")
+        lines.append("}")
+    lines.append("int main(void) {")
+    lines.append(f"    return f{n - 1}(1, 2);")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+def long_switch(n: int) -> str:
+    lines = ["int main(void) {", "    int x = 7;", "    int y = 0;", "    switch (x) {"]
+    for i in range(n):
+        # Spread the case values out so that they are not a dense range
+        lines.append(f"        case {i * 3}:")
+        lines.append(f"            y = y + {i};")
+        if i % 4 != 3:
+            lines.append("            break;")
+    lines.append("        default:")
+    lines.append("            y = -1;")
+    lines.append("    }")
+    lines.append("    return y;")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+def goto_graph(n: int) -> str:
+    lines = ["int main(void) {", "    int x = 0;", "    goto l0;"]
+    for i in range(n):
+        lines.append(f"l{i}:")
+        lines.append("    x = x + 1;")
+        # Every label has a forward edge and a backward edge, so the graph is densely connected
+        lines.append(f"    if (x > {n * 2}) goto l{n};")
+        lines.append(f"    if (x % {i % 5 + 2} == 0) goto l{(i * 31 + 7) % n};")
+    lines.append(f"l{n}:")
+    lines.append("    return x;")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+def identifiers(n: int) -> str:
+    # Identifiers that share a length and first byte with keywords, or are keywords with a prefix or suffix, so the keyword
+    # lookup cannot rule them out cheaply. Long runs of whitespace and digits exercise the byte classes.
+    names = ["iff", "done", "intx", "fort", "voids", "elsewhere", "got", "cases", "whiles", "breaks", "returned",
+        "switched", "statics", "externs", "defaults", "continued", "_int", "return_", "sw1tch", "Default"]
+    lines = []
+    for i in range(n):
+        lines.append(f"int {names[i % len(names)]}{i}(int a, int b) {{")
+        lines.append(f"    int {names[(i + 3) % len(names)]} = a + 1234567;")
+        lines.append(f"    int {names[(i + 7) % len(names)]} = {names[(i + 3) % len(names)]} * b;")
+        lines.append(f"    if ({names[(i + 7) % len(names)]} > {names[(i + 3) % len(names)]})        return {names[(i + 7) % len(names)]};")
+        lines.append(f"    else return {names[(i + 3) % len(names)]} - 987654;")
+        lines.append("}")
+    lines.append("int main(void) {")
+    lines.append("    return 0;")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+# Each benchmark with the size of its first step
+BENCHMARKS = {
+    "nested_expressions": (nested_expressions, 100),
+    "many_statements": (many_statements, 500),
+    "many_functions": (many_functions, 250),
+    "long_switch": (long_switch, 250),
+    "goto_graph": (goto_graph, 250),
+    "identifiers": (identifiers, 1000),
+}
+
+# Returns the fastest time over `repeat` runs, or None if occm failed. That is the wall time of the whole process, or the
+# time occm reports for `stage` if one is given.
+def time_compiler(source_path: Path, repeat: int, stage: str | None = None) -> float | None:
+    best = None
+    timings_path = source_path.with_suffix(".timings.json")
+    for _ in range(repeat):
+        timings_flags = ["-timings", timings_path] if stage is not None else []
+        if stage == "lex":
+            timings_flags.append("-tokenize")
+        start = time.perf_counter()
+        result = subprocess.run(
+                [common.compiler_path()] + timings_flags + ["-assembly", "-stdout", source_path],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
+            )
+        elapsed = time.perf_counter() - start
+        if result.returncode != 0:
+            print(result.stderr.decode(errors="replace"), file=sys.stderr)
+            return None
+        if stage is not None:
+            with open(timings_path, "r") as f:
+                elapsed = json.load(f)[stage]["nanoseconds"] / 1e9
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+def load_baseline(baseline_path: Path) -> dict[str, float]:
+    try:
+        with open(baseline_path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_baseline(baseline_path: Path, results: dict[str, float]):
+    with open(baseline_path, "w", newline="\n") as f:
+        json.dump(results, f, indent=4, sort_keys=True)
+        f.write("\n")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-norebuild", action="store_true", help="Use the existing compiler instead of rebuilding it")
+    parser.add_argument("-only", action="append", choices=BENCHMARKS.keys(), help="Only run the given benchmark, may be repeated")
+    parser.add_argument("-steps", type=int, default=4, help="Number of size steps, each double the last")
+    parser.add_argument("-scale", type=float, default=1, help="Multiplier for the size of the first step")
+    parser.add_argument("-repeat", type=int, default=3, help="Runs per step, the fastest is kept")
+    parser.add_argument("-baseline", default=str(BASELINE_PATH), help="Baseline file to compare against or save to")
+    parser.add_argument("-save-baseline", action="store_true", help="Record these results as the new baseline")
+    parser.add_argument("-threshold", type=float, default=0.2, help="Flag steps slower than the baseline by this fraction")
+    parser.add_argument("-stage", choices=STAGES, help="Time only this compiler stage instead of the whole process")
+    parser.add_argument("-max-growth", type=float, default=1.5, help="Flag steps whose time grows faster than size to this power")
+    args = parser.parse_args()
+
+    if not args.norebuild:
+        common.rebuild_compiler()
+
+    baseline = load_baseline(Path(args.baseline))
+    results = {}
+    regressions = []
+
+    with tempfile.TemporaryDirectory(prefix="occm_bench_") as scratch_dir:
+        for name in args.only or BENCHMARKS.keys():
+            generator, first_size = BENCHMARKS[name]
+            print(f"{name}:")
+            previous = None
+            for step in range(args.steps):
+                size = max(1, int(first_size * args.scale)) * 2 ** step
+                source_path = Path(scratch_dir, f"{name}_{size}.c")
+                with open(source_path, "w") as f:
+                    f.write(generator(size))
+
+                elapsed = time_compiler(source_path, args.repeat, args.stage)
+                if elapsed is None:
+                    print(f"  {size:>8}  FAILED to compile")
+                    regressions.append(f"{name}/{size} failed to compile")
+                    break
+
+                key = f"{name}/{size}" if args.stage is None else f"{name}/{size}/{args.stage}"
+                results[key] = elapsed
+                line = f"  {size:>8}  {elapsed * 1000:>10.2f} ms"
+
+                # Time ~ size^growth, so linear code has a growth near 1. Process startup dominates tiny sizes and pulls it down.
+                if previous is not None:
+                    previous_size, previous_elapsed = previous
+                    growth = math.log(elapsed / previous_elapsed) / math.log(size / previous_size)
+                    line += f"  growth {growth:>5.2f}"
+                    if growth > args.max_growth:
+                        line += "  SUPERLINEAR"
+                        regressions.append(f"{key} grows with exponent {growth:.2f}")
+
+                if key in baseline:
+                    change = elapsed / baseline[key] - 1
+                    line += f"  {change * 100:>+7.1f}% vs baseline"
+                    if change > args.threshold:
+                        line += "  REGRESSION"
+                        regressions.append(f"{key} is {change * 100:.1f}% slower than the baseline")
+
+                print(line)
+                previous = (size, elapsed)
+
+    if args.save_baseline:
+        baseline.update(results)
+        save_baseline(Path(args.baseline), baseline)
+        print(f"Saved baseline to {args.baseline}")
+
+    if len(regressions) > 0:
+        print(f"{len(regressions)} problems found:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -2,1667 +2,91 @@ from pathlib import Path
 import os
 import sys
 import subprocess
+import hashlib
+import time
 
-test_groups = [
-    [Path("chapter_1\\invalid_lex\\at_sign.c")],
-    [Path("chapter_1\\invalid_lex\\backslash.c")],
-    [Path("chapter_1\\invalid_lex\\backtick.c")],
-    [Path("chapter_1\\invalid_lex\\invalid_identifier.c")],
-    [Path("chapter_1\\invalid_lex\\invalid_identifier_2.c")],
-    [Path("chapter_1\\invalid_parse\\end_before_expr.c")],
-    [Path("chapter_1\\invalid_parse\\extra_junk.c")],
-    [Path("chapter_1\\invalid_parse\\invalid_function_name.c")],
-    [Path("chapter_1\\invalid_parse\\keyword_wrong_case.c")],
-    [Path("chapter_1\\invalid_parse\\missing_type.c")],
-    [Path("chapter_1\\invalid_parse\\misspelled_keyword.c")],
-    [Path("chapter_1\\invalid_parse\\not_expression.c")],
-    [Path("chapter_1\\invalid_parse\\no_semicolon.c")],
-    [Path("chapter_1\\invalid_parse\\space_in_keyword.c")],
-    [Path("chapter_1\\invalid_parse\\switched_parens.c")],
-    [Path("chapter_1\\invalid_parse\\unclosed_brace.c")],
-    [Path("chapter_1\\invalid_parse\\unclosed_paren.c")],
-    [Path("chapter_1\\valid\\multi_digit.c")],
-    [Path("chapter_1\\valid\\newlines.c")],
-    [Path("chapter_1\\valid\\no_newlines.c")],
-    [Path("chapter_1\\valid\\return_0.c")],
-    [Path("chapter_1\\valid\\return_2.c")],
-    [Path("chapter_1\\valid\\spaces.c")],
-    [Path("chapter_1\\valid\\tabs.c")],
-    [Path("chapter_2\\invalid_parse\\extra_paren.c")],
-    [Path("chapter_2\\invalid_parse\\missing_const.c")],
-    [Path("chapter_2\\invalid_parse\\missing_semicolon.c")],
-    [Path("chapter_2\\invalid_parse\\nested_missing_const.c")],
-    [Path("chapter_2\\invalid_parse\\parenthesize_operand.c")],
-    [Path("chapter_2\\invalid_parse\\unclosed_paren.c")],
-    [Path("chapter_2\\invalid_parse\\wrong_order.c")],
-    [Path("chapter_2\\valid\\bitwise.c")],
-    [Path("chapter_2\\valid\\bitwise_int_min.c")],
-    [Path("chapter_2\\valid\\bitwise_zero.c")],
-    [Path("chapter_2\\valid\\neg.c")],
-    [Path("chapter_2\\valid\\negate_int_max.c")],
-    [Path("chapter_2\\valid\\neg_zero.c")],
-    [Path("chapter_2\\valid\\nested_ops.c")],
-    [Path("chapter_2\\valid\\nested_ops_2.c")],
-    [Path("chapter_2\\valid\\parens.c")],
-    [Path("chapter_2\\valid\\parens_2.c")],
-    [Path("chapter_2\\valid\\parens_3.c")],
-    [Path("chapter_2\\valid\\redundant_parens.c")],
-    [Path("chapter_3\\invalid_parse\\double_operation.c")],
-    [Path("chapter_3\\invalid_parse\\imbalanced_paren.c")],
-    [Path("chapter_3\\invalid_parse\\malformed_paren.c")],
-    [Path("chapter_3\\invalid_parse\\misplaced_semicolon.c")],
-    [Path("chapter_3\\invalid_parse\\missing_first_op.c")],
-    [Path("chapter_3\\invalid_parse\\missing_open_paren.c")],
-    [Path("chapter_3\\invalid_parse\\missing_second_op.c")],
-    [Path("chapter_3\\invalid_parse\\no_semicolon.c")],
-    [Path("chapter_3\\invalid_parse\\extra_credit\\bitwise_double_operator.c")],
-    [Path("chapter_3\\valid\\add.c")],
-    [Path("chapter_3\\valid\\associativity.c")],
-    [Path("chapter_3\\valid\\associativity_2.c")],
-    [Path("chapter_3\\valid\\associativity_3.c")],
-    [Path("chapter_3\\valid\\associativity_and_precedence.c")],
-    [Path("chapter_3\\valid\\div.c")],
-    [Path("chapter_3\\valid\\div_neg.c")],
-    [Path("chapter_3\\valid\\mod.c")],
-    [Path("chapter_3\\valid\\mod_negative.c")],
-    [Path("chapter_3\\valid\\mult.c")],
-    [Path("chapter_3\\valid\\parens.c")],
-    [Path("chapter_3\\valid\\precedence.c")],
-    [Path("chapter_3\\valid\\sub.c")],
-    [Path("chapter_3\\valid\\sub_neg.c")],
-    [Path("chapter_3\\valid\\unop_add.c")],
-    [Path("chapter_3\\valid\\unop_parens.c")],
-    [Path("chapter_3\\valid\\extra_credit\\bitwise_and.c")],
-    [Path("chapter_3\\valid\\extra_credit\\bitwise_or.c")],
-    [Path("chapter_3\\valid\\extra_credit\\bitwise_precedence.c")],
-    [Path("chapter_3\\valid\\extra_credit\\bitwise_shiftl.c")],
-    [Path("chapter_3\\valid\\extra_credit\\bitwise_shiftr.c")],
-    [Path("chapter_3\\valid\\extra_credit\\bitwise_shiftr_negative.c")],
-    [Path("chapter_3\\valid\\extra_credit\\bitwise_shift_associativity.c")],
-    [Path("chapter_3\\valid\\extra_credit\\bitwise_shift_associativity_2.c")],
-    [Path("chapter_3\\valid\\extra_credit\\bitwise_shift_precedence.c")],
-    [Path("chapter_3\\valid\\extra_credit\\bitwise_variable_shift_count.c")],
-    [Path("chapter_3\\valid\\extra_credit\\bitwise_xor.c")],
-    [Path("chapter_4\\invalid_parse\\missing_const.c")],
-    [Path("chapter_4\\invalid_parse\\missing_first_op.c")],
-    [Path("chapter_4\\invalid_parse\\missing_operand.c")],
-    [Path("chapter_4\\invalid_parse\\missing_second_op.c")],
-    [Path("chapter_4\\invalid_parse\\missing_semicolon.c")],
-    [Path("chapter_4\\invalid_parse\\unary_missing_semicolon.c")],
-    [Path("chapter_4\\valid\\and_false.c")],
-    [Path("chapter_4\\valid\\and_short_circuit.c")],
-    [Path("chapter_4\\valid\\and_true.c")],
-    [Path("chapter_4\\valid\\associativity.c")],
-    [Path("chapter_4\\valid\\compare_arithmetic_results.c")],
-    [Path("chapter_4\\valid\\eq_false.c")],
-    [Path("chapter_4\\valid\\eq_precedence.c")],
-    [Path("chapter_4\\valid\\eq_true.c")],
-    [Path("chapter_4\\valid\\ge_false.c")],
-    [Path("chapter_4\\valid\\ge_true.c")],
-    [Path("chapter_4\\valid\\gt_false.c")],
-    [Path("chapter_4\\valid\\gt_true.c")],
-    [Path("chapter_4\\valid\\le_false.c")],
-    [Path("chapter_4\\valid\\le_true.c")],
-    [Path("chapter_4\\valid\\lt_false.c")],
-    [Path("chapter_4\\valid\\lt_true.c")],
-    [Path("chapter_4\\valid\\multi_short_circuit.c")],
-    [Path("chapter_4\\valid\\nested_ops.c")],
-    [Path("chapter_4\\valid\\ne_false.c")],
-    [Path("chapter_4\\valid\\ne_true.c")],
-    [Path("chapter_4\\valid\\not.c")],
-    [Path("chapter_4\\valid\\not_sum.c")],
-    [Path("chapter_4\\valid\\not_sum_2.c")],
-    [Path("chapter_4\\valid\\not_zero.c")],
-    [Path("chapter_4\\valid\\operate_on_booleans.c")],
-    [Path("chapter_4\\valid\\or_false.c")],
-    [Path("chapter_4\\valid\\or_short_circuit.c")],
-    [Path("chapter_4\\valid\\or_true.c")],
-    [Path("chapter_4\\valid\\precedence.c")],
-    [Path("chapter_4\\valid\\precedence_2.c")],
-    [Path("chapter_4\\valid\\precedence_3.c")],
-    [Path("chapter_4\\valid\\precedence_4.c")],
-    [Path("chapter_4\\valid\\precedence_5.c")],
-    [Path("chapter_4\\valid\\extra_credit\\bitwise_and_precedence.c")],
-    [Path("chapter_4\\valid\\extra_credit\\bitwise_or_precedence.c")],
-    [Path("chapter_4\\valid\\extra_credit\\bitwise_shift_precedence.c")],
-    [Path("chapter_4\\valid\\extra_credit\\bitwise_xor_precedence.c")],
-    [Path("chapter_5\\invalid_parse\\compound_invalid_operator.c")],
-    [Path("chapter_5\\invalid_parse\\declare_keyword_as_var.c")],
-    [Path("chapter_5\\invalid_parse\\invalid_specifier.c")],
-    [Path("chapter_5\\invalid_parse\\invalid_type.c")],
-    [Path("chapter_5\\invalid_parse\\invalid_variable_name.c")],
-    [Path("chapter_5\\invalid_parse\\malformed_compound_assignment.c")],
-    [Path("chapter_5\\invalid_parse\\malformed_decrement.c")],
-    [Path("chapter_5\\invalid_parse\\malformed_increment.c")],
-    [Path("chapter_5\\invalid_parse\\malformed_less_equal.c")],
-    [Path("chapter_5\\invalid_parse\\malformed_not_equal.c")],
-    [Path("chapter_5\\invalid_parse\\missing_semicolon.c")],
-    [Path("chapter_5\\invalid_parse\\return_in_assignment.c")],
-    [Path("chapter_5\\invalid_parse\\extra_credit\\binary_decrement.c")],
-    [Path("chapter_5\\invalid_parse\\extra_credit\\binary_increment.c")],
-    [Path("chapter_5\\invalid_parse\\extra_credit\\compound_initializer.c")],
-    [Path("chapter_5\\invalid_parse\\extra_credit\\increment_declaration.c")],
-    [Path("chapter_5\\invalid_semantics\\declared_after_use.c")],
-    [Path("chapter_5\\invalid_semantics\\invalid_lvalue.c")],
-    [Path("chapter_5\\invalid_semantics\\invalid_lvalue_2.c")],
-    [Path("chapter_5\\invalid_semantics\\mixed_precedence_assignment.c")],
-    [Path("chapter_5\\invalid_semantics\\redefine.c")],
-    [Path("chapter_5\\invalid_semantics\\undeclared_var.c")],
-    [Path("chapter_5\\invalid_semantics\\undeclared_var_and.c")],
-    [Path("chapter_5\\invalid_semantics\\undeclared_var_compare.c")],
-    [Path("chapter_5\\invalid_semantics\\undeclared_var_unary.c")],
-    [Path("chapter_5\\invalid_semantics\\use_then_redefine.c")],
-    [Path("chapter_5\\invalid_semantics\\extra_credit\\compound_invalid_lvalue.c")],
-    [Path("chapter_5\\invalid_semantics\\extra_credit\\compound_invalid_lvalue_2.c")],
-    [Path("chapter_5\\invalid_semantics\\extra_credit\\postfix_decr_non_lvalue.c")],
-    [Path("chapter_5\\invalid_semantics\\extra_credit\\postfix_incr_non_lvalue.c")],
-    [Path("chapter_5\\invalid_semantics\\extra_credit\\prefix_decr_non_lvalue.c")],
-    [Path("chapter_5\\invalid_semantics\\extra_credit\\prefix_incr_non_lvalue.c")],
-    [Path("chapter_5\\invalid_semantics\\extra_credit\\undeclared_bitwise_op.c")],
-    [Path("chapter_5\\invalid_semantics\\extra_credit\\undeclared_compound_assignment.c")],
-    [Path("chapter_5\\invalid_semantics\\extra_credit\\undeclared_compound_assignment_use.c")],
-    [Path("chapter_5\\invalid_semantics\\extra_credit\\undeclared_postfix_decr.c")],
-    [Path("chapter_5\\invalid_semantics\\extra_credit\\undeclared_prefix_incr.c")],
-    [Path("chapter_5\\valid\\add_variables.c")],
-    [Path("chapter_5\\valid\\allocate_temps_and_vars.c")],
-    [Path("chapter_5\\valid\\assign.c")],
-    [Path("chapter_5\\valid\\assignment_in_initializer.c")],
-    [Path("chapter_5\\valid\\assignment_lowest_precedence.c")],
-    [Path("chapter_5\\valid\\assign_val_in_initializer.c")],
-    [Path("chapter_5\\valid\\empty_function_body.c")],
-    [Path("chapter_5\\valid\\exp_then_declaration.c")],
-    [Path("chapter_5\\valid\\kw_var_names.c")],
-    [Path("chapter_5\\valid\\local_var_missing_return.c")],
-    [Path("chapter_5\\valid\\mixed_precedence_assignment.c")],
-    [Path("chapter_5\\valid\\non_short_circuit_or.c")],
-    [Path("chapter_5\\valid\\null_statement.c")],
-    [Path("chapter_5\\valid\\null_then_return.c")],
-    [Path("chapter_5\\valid\\return_var.c")],
-    [Path("chapter_5\\valid\\short_circuit_and_fail.c")],
-    [Path("chapter_5\\valid\\short_circuit_or.c")],
-    [Path("chapter_5\\valid\\unused_exp.c")],
-    [Path("chapter_5\\valid\\use_assignment_result.c")],
-    [Path("chapter_5\\valid\\use_val_in_own_initializer.c")],
-    [Path("chapter_5\\valid\\extra_credit\\bitwise_in_initializer.c")],
-    [Path("chapter_5\\valid\\extra_credit\\bitwise_ops_vars.c")],
-    [Path("chapter_5\\valid\\extra_credit\\bitwise_shiftl_variable.c")],
-    [Path("chapter_5\\valid\\extra_credit\\bitwise_shiftr_assign.c")],
-    [Path("chapter_5\\valid\\extra_credit\\compound_assignment_chained.c")],
-    [Path("chapter_5\\valid\\extra_credit\\compound_assignment_lowest_precedence.c")],
-    [Path("chapter_5\\valid\\extra_credit\\compound_assignment_use_result.c")],
-    [Path("chapter_5\\valid\\extra_credit\\compound_bitwise_and.c")],
-    [Path("chapter_5\\valid\\extra_credit\\compound_bitwise_assignment_lowest_precedence.c")],
-    [Path("chapter_5\\valid\\extra_credit\\compound_bitwise_chained.c")],
-    [Path("chapter_5\\valid\\extra_credit\\compound_bitwise_or.c")],
-    [Path("chapter_5\\valid\\extra_credit\\compound_bitwise_shiftl.c")],
-    [Path("chapter_5\\valid\\extra_credit\\compound_bitwise_shiftr.c")],
-    [Path("chapter_5\\valid\\extra_credit\\compound_bitwise_xor.c")],
-    [Path("chapter_5\\valid\\extra_credit\\compound_divide.c")],
-    [Path("chapter_5\\valid\\extra_credit\\compound_minus.c")],
-    [Path("chapter_5\\valid\\extra_credit\\compound_mod.c")],
-    [Path("chapter_5\\valid\\extra_credit\\compound_multiply.c")],
-    [Path("chapter_5\\valid\\extra_credit\\compound_plus.c")],
-    [Path("chapter_5\\valid\\extra_credit\\incr_expression_statement.c")],
-    [Path("chapter_5\\valid\\extra_credit\\incr_in_binary_expr.c")],
-    [Path("chapter_5\\valid\\extra_credit\\incr_parenthesized.c")],
-    [Path("chapter_5\\valid\\extra_credit\\postfix_incr_and_decr.c")],
-    [Path("chapter_5\\valid\\extra_credit\\postfix_precedence.c")],
-    [Path("chapter_5\\valid\\extra_credit\\prefix_incr_and_decr.c")],
-    [Path("chapter_6\\invalid_lex\\extra_credit\\bad_label.c")],
-    [Path("chapter_6\\invalid_parse\\declaration_as_statement.c")],
-    [Path("chapter_6\\invalid_parse\\empty_if_body.c")],
-    [Path("chapter_6\\invalid_parse\\if_assignment.c")],
-    [Path("chapter_6\\invalid_parse\\if_no_parens.c")],
-    [Path("chapter_6\\invalid_parse\\incomplete_ternary.c")],
-    [Path("chapter_6\\invalid_parse\\malformed_ternary.c")],
-    [Path("chapter_6\\invalid_parse\\malformed_ternary_2.c")],
-    [Path("chapter_6\\invalid_parse\\mismatched_nesting.c")],
-    [Path("chapter_6\\invalid_parse\\wrong_ternary_delimiter.c")],
-    [Path("chapter_6\\invalid_parse\\extra_credit\\goto_without_label.c")],
-    [Path("chapter_6\\invalid_parse\\extra_credit\\kw_label.c")],
-    [Path("chapter_6\\invalid_parse\\extra_credit\\label_declaration.c")],
-    [Path("chapter_6\\invalid_parse\\extra_credit\\label_expression_clause.c")],
-    [Path("chapter_6\\invalid_parse\\extra_credit\\label_outside_function.c")],
-    [Path("chapter_6\\invalid_parse\\extra_credit\\label_without_statement.c")],
-    [Path("chapter_6\\invalid_parse\\extra_credit\\parenthesized_label.c")],
-    [Path("chapter_6\\invalid_semantics\\invalid_var_in_if.c")],
-    [Path("chapter_6\\invalid_semantics\\ternary_assign.c")],
-    [Path("chapter_6\\invalid_semantics\\undeclared_var_in_ternary.c")],
-    [Path("chapter_6\\invalid_semantics\\extra_credit\\duplicate_labels.c")],
-    [Path("chapter_6\\invalid_semantics\\extra_credit\\goto_missing_label.c")],
-    [Path("chapter_6\\invalid_semantics\\extra_credit\\goto_variable.c")],
-    [Path("chapter_6\\invalid_semantics\\extra_credit\\undeclared_var_in_labeled_statement.c")],
-    [Path("chapter_6\\invalid_semantics\\extra_credit\\use_label_as_variable.c")],
-    [Path("chapter_6\\valid\\assign_ternary.c")],
-    [Path("chapter_6\\valid\\binary_condition.c")],
-    [Path("chapter_6\\valid\\binary_false_condition.c")],
-    [Path("chapter_6\\valid\\else.c")],
-    [Path("chapter_6\\valid\\if_nested.c")],
-    [Path("chapter_6\\valid\\if_nested_2.c")],
-    [Path("chapter_6\\valid\\if_nested_3.c")],
-    [Path("chapter_6\\valid\\if_nested_4.c")],
-    [Path("chapter_6\\valid\\if_nested_5.c")],
-    [Path("chapter_6\\valid\\if_not_taken.c")],
-    [Path("chapter_6\\valid\\if_null_body.c")],
-    [Path("chapter_6\\valid\\if_taken.c")],
-    [Path("chapter_6\\valid\\lh_assignment.c")],
-    [Path("chapter_6\\valid\\multiple_if.c")],
-    [Path("chapter_6\\valid\\nested_ternary.c")],
-    [Path("chapter_6\\valid\\nested_ternary_2.c")],
-    [Path("chapter_6\\valid\\rh_assignment.c")],
-    [Path("chapter_6\\valid\\ternary.c")],
-    [Path("chapter_6\\valid\\ternary_middle_assignment.c")],
-    [Path("chapter_6\\valid\\ternary_middle_binop.c")],
-    [Path("chapter_6\\valid\\ternary_precedence.c")],
-    [Path("chapter_6\\valid\\ternary_rh_binop.c")],
-    [Path("chapter_6\\valid\\ternary_short_circuit.c")],
-    [Path("chapter_6\\valid\\ternary_short_circuit_2.c")],
-    [Path("chapter_6\\valid\\extra_credit\\bitwise_ternary.c")],
-    [Path("chapter_6\\valid\\extra_credit\\compound_assign_ternary.c")],
-    [Path("chapter_6\\valid\\extra_credit\\compound_if_expression.c")],
-    [Path("chapter_6\\valid\\extra_credit\\goto_after_declaration.c")],
-    [Path("chapter_6\\valid\\extra_credit\\goto_backwards.c")],
-    [Path("chapter_6\\valid\\extra_credit\\goto_label.c")],
-    [Path("chapter_6\\valid\\extra_credit\\goto_label_and_var.c")],
-    [Path("chapter_6\\valid\\extra_credit\\goto_label_main.c")],
-    [Path("chapter_6\\valid\\extra_credit\\goto_label_main_2.c")],
-    [Path("chapter_6\\valid\\extra_credit\\goto_nested_label.c")],
-    [Path("chapter_6\\valid\\extra_credit\\label_all_statements.c")],
-    [Path("chapter_6\\valid\\extra_credit\\label_token.c")],
-    [Path("chapter_6\\valid\\extra_credit\\lh_compound_assignment.c")],
-    [Path("chapter_6\\valid\\extra_credit\\postfix_if.c")],
-    [Path("chapter_6\\valid\\extra_credit\\postfix_in_ternary.c")],
-    [Path("chapter_6\\valid\\extra_credit\\prefix_if.c")],
-    [Path("chapter_6\\valid\\extra_credit\\prefix_in_ternary.c")],
-    [Path("chapter_6\\valid\\extra_credit\\unused_label.c")],
-    [Path("chapter_6\\valid\\extra_credit\\whitespace_after_label.c")],
-    [Path("chapter_7\\invalid_parse\\extra_brace.c")],
-    [Path("chapter_7\\invalid_parse\\missing_brace.c")],
-    [Path("chapter_7\\invalid_parse\\missing_semicolon.c")],
-    [Path("chapter_7\\invalid_parse\\ternary_blocks.c")],
-    [Path("chapter_7\\invalid_semantics\\double_define.c")],
-    [Path("chapter_7\\invalid_semantics\\double_define_after_scope.c")],
-    [Path("chapter_7\\invalid_semantics\\out_of_scope.c")],
-    [Path("chapter_7\\invalid_semantics\\use_before_declare.c")],
-    [Path("chapter_7\\invalid_semantics\\extra_credit\\different_labels_same_scope.c")],
-    [Path("chapter_7\\invalid_semantics\\extra_credit\\duplicate_labels_different_scopes.c")],
-    [Path("chapter_7\\invalid_semantics\\extra_credit\\goto_use_before_declare.c")],
-    [Path("chapter_7\\valid\\assign_to_self.c")],
-    [Path("chapter_7\\valid\\assign_to_self_2.c")],
-    [Path("chapter_7\\valid\\declaration_only.c")],
-    [Path("chapter_7\\valid\\empty_blocks.c")],
-    [Path("chapter_7\\valid\\hidden_then_visible.c")],
-    [Path("chapter_7\\valid\\hidden_variable.c")],
-    [Path("chapter_7\\valid\\inner_uninitialized.c")],
-    [Path("chapter_7\\valid\\multiple_vars_same_name.c")],
-    [Path("chapter_7\\valid\\nested_if.c")],
-    [Path("chapter_7\\valid\\similar_var_names.c")],
-    [Path("chapter_7\\valid\\use_in_inner_scope.c")],
-    [Path("chapter_7\\valid\\extra_credit\\compound_subtract_in_block.c")],
-    [Path("chapter_7\\valid\\extra_credit\\goto_before_declaration.c")],
-    [Path("chapter_7\\valid\\extra_credit\\goto_inner_scope.c")],
-    [Path("chapter_7\\valid\\extra_credit\\goto_outer_scope.c")],
-    [Path("chapter_7\\valid\\extra_credit\\goto_sibling_scope.c")],
-    [Path("chapter_8\\invalid_parse\\decl_as_loop_body.c")],
-    [Path("chapter_8\\invalid_parse\\do_extra_semicolon.c")],
-    [Path("chapter_8\\invalid_parse\\do_missing_semicolon.c")],
-    [Path("chapter_8\\invalid_parse\\do_while_empty_parens.c")],
-    [Path("chapter_8\\invalid_parse\\extra_for_header_clause.c")],
-    [Path("chapter_8\\invalid_parse\\invalid_for_declaration.c")],
-    [Path("chapter_8\\invalid_parse\\missing_for_header_clause.c")],
-    [Path("chapter_8\\invalid_parse\\paren_mismatch.c")],
-    [Path("chapter_8\\invalid_parse\\statement_in_condition.c")],
-    [Path("chapter_8\\invalid_parse\\while_missing_paren.c")],
-    [Path("chapter_8\\invalid_parse\\extra_credit\\compound_assignment_invalid_decl.c")],
-    [Path("chapter_8\\invalid_parse\\extra_credit\\label_in_loop_header.c")],
-    [Path("chapter_8\\invalid_parse\\extra_credit\\label_is_not_block.c")],
-    [Path("chapter_8\\invalid_parse\\extra_credit\\switch_case_declaration.c")],
-    [Path("chapter_8\\invalid_parse\\extra_credit\\switch_goto_case.c")],
-    [Path("chapter_8\\invalid_parse\\extra_credit\\switch_missing_case_value.c")],
-    [Path("chapter_8\\invalid_parse\\extra_credit\\switch_missing_paren.c")],
-    [Path("chapter_8\\invalid_parse\\extra_credit\\switch_no_condition.c")],
-    [Path("chapter_8\\invalid_semantics\\break_not_in_loop.c")],
-    [Path("chapter_8\\invalid_semantics\\continue_not_in_loop.c")],
-    [Path("chapter_8\\invalid_semantics\\out_of_scope_do_loop.c")],
-    [Path("chapter_8\\invalid_semantics\\out_of_scope_loop_variable.c")],
-    [Path("chapter_8\\invalid_semantics\\extra_credit\\case_continue.c")],
-    [Path("chapter_8\\invalid_semantics\\extra_credit\\case_outside_switch.c")],
-    [Path("chapter_8\\invalid_semantics\\extra_credit\\default_continue.c")],
-    [Path("chapter_8\\invalid_semantics\\extra_credit\\default_outside_switch.c")],
-    [Path("chapter_8\\invalid_semantics\\extra_credit\\different_cases_same_scope.c")],
-    [Path("chapter_8\\invalid_semantics\\extra_credit\\duplicate_case.c")],
-    [Path("chapter_8\\invalid_semantics\\extra_credit\\duplicate_case_in_labeled_switch.c")],
-    [Path("chapter_8\\invalid_semantics\\extra_credit\\duplicate_case_in_nested_statement.c")],
-    [Path("chapter_8\\invalid_semantics\\extra_credit\\duplicate_default.c")],
-    [Path("chapter_8\\invalid_semantics\\extra_credit\\duplicate_default_in_nested_statement.c")],
-    [Path("chapter_8\\invalid_semantics\\extra_credit\\duplicate_label_in_default.c")],
-    [Path("chapter_8\\invalid_semantics\\extra_credit\\duplicate_label_in_loop.c")],
-    [Path("chapter_8\\invalid_semantics\\extra_credit\\duplicate_variable_in_switch.c")],
-    [Path("chapter_8\\invalid_semantics\\extra_credit\\labeled_break_outside_loop.c")],
-    [Path("chapter_8\\invalid_semantics\\extra_credit\\non_constant_case.c")],
-    [Path("chapter_8\\invalid_semantics\\extra_credit\\switch_continue.c")],
-    [Path("chapter_8\\invalid_semantics\\extra_credit\\undeclared_variable_in_case.c")],
-    [Path("chapter_8\\invalid_semantics\\extra_credit\\undeclared_variable_in_default.c")],
-    [Path("chapter_8\\invalid_semantics\\extra_credit\\undeclared_var_switch_expression.c")],
-    [Path("chapter_8\\invalid_semantics\\extra_credit\\undefined_label_in_case.c")],
-    [Path("chapter_8\\valid\\break.c")],
-    [Path("chapter_8\\valid\\break_immediate.c")],
-    [Path("chapter_8\\valid\\continue.c")],
-    [Path("chapter_8\\valid\\continue_empty_post.c")],
-    [Path("chapter_8\\valid\\do_while.c")],
-    [Path("chapter_8\\valid\\do_while_break_immediate.c")],
-    [Path("chapter_8\\valid\\empty_expression.c")],
-    [Path("chapter_8\\valid\\empty_loop_body.c")],
-    [Path("chapter_8\\valid\\for.c")],
-    [Path("chapter_8\\valid\\for_absent_condition.c")],
-    [Path("chapter_8\\valid\\for_absent_post.c")],
-    [Path("chapter_8\\valid\\for_decl.c")],
-    [Path("chapter_8\\valid\\for_nested_shadow.c")],
-    [Path("chapter_8\\valid\\for_shadow.c")],
-    [Path("chapter_8\\valid\\multi_break.c")],
-    [Path("chapter_8\\valid\\multi_continue_same_loop.c")],
-    [Path("chapter_8\\valid\\nested_break.c")],
-    [Path("chapter_8\\valid\\nested_continue.c")],
-    [Path("chapter_8\\valid\\nested_loop.c")],
-    [Path("chapter_8\\valid\\null_for_header.c")],
-    [Path("chapter_8\\valid\\while.c")],
-    [Path("chapter_8\\valid\\extra_credit\\case_block.c")],
-    [Path("chapter_8\\valid\\extra_credit\\compound_assignment_controlling_expression.c")],
-    [Path("chapter_8\\valid\\extra_credit\\compound_assignment_for_loop.c")],
-    [Path("chapter_8\\valid\\extra_credit\\duffs_device.c")],
-    [Path("chapter_8\\valid\\extra_credit\\goto_bypass_condition.c")],
-    [Path("chapter_8\\valid\\extra_credit\\goto_bypass_init_exp.c")],
-    [Path("chapter_8\\valid\\extra_credit\\goto_bypass_post_exp.c")],
-    [Path("chapter_8\\valid\\extra_credit\\label_loops_breaks_and_continues.c")],
-    [Path("chapter_8\\valid\\extra_credit\\label_loop_body.c")],
-    [Path("chapter_8\\valid\\extra_credit\\loop_header_postfix_and_prefix.c")],
-    [Path("chapter_8\\valid\\extra_credit\\loop_in_switch.c")],
-    [Path("chapter_8\\valid\\extra_credit\\post_exp_incr.c")],
-    [Path("chapter_8\\valid\\extra_credit\\switch.c")],
-    [Path("chapter_8\\valid\\extra_credit\\switch_assign_in_condition.c")],
-    [Path("chapter_8\\valid\\extra_credit\\switch_break.c")],
-    [Path("chapter_8\\valid\\extra_credit\\switch_decl.c")],
-    [Path("chapter_8\\valid\\extra_credit\\switch_default.c")],
-    [Path("chapter_8\\valid\\extra_credit\\switch_default_fallthrough.c")],
-    [Path("chapter_8\\valid\\extra_credit\\switch_default_not_last.c")],
-    [Path("chapter_8\\valid\\extra_credit\\switch_default_only.c")],
-    [Path("chapter_8\\valid\\extra_credit\\switch_empty.c")],
-    [Path("chapter_8\\valid\\extra_credit\\switch_fallthrough.c")],
-    [Path("chapter_8\\valid\\extra_credit\\switch_goto_mid_case.c")],
-    [Path("chapter_8\\valid\\extra_credit\\switch_in_loop.c")],
-    [Path("chapter_8\\valid\\extra_credit\\switch_nested_cases.c")],
-    [Path("chapter_8\\valid\\extra_credit\\switch_nested_not_taken.c")],
-    [Path("chapter_8\\valid\\extra_credit\\switch_nested_switch.c")],
-    [Path("chapter_8\\valid\\extra_credit\\switch_not_taken.c")],
-    [Path("chapter_8\\valid\\extra_credit\\switch_no_case.c")],
-    [Path("chapter_8\\valid\\extra_credit\\switch_single_case.c")],
-    [Path("chapter_8\\valid\\extra_credit\\switch_with_continue.c")],
-    [Path("chapter_8\\valid\\extra_credit\\switch_with_continue_2.c")],
-    [Path("chapter_9\\invalid_declarations\\assign_to_fun_call.c")],
-    [Path("chapter_9\\invalid_declarations\\decl_params_with_same_name.c")],
-    [Path("chapter_9\\invalid_declarations\\nested_function_definition.c")],
-    [Path("chapter_9\\invalid_declarations\\params_with_same_name.c")],
-    [Path("chapter_9\\invalid_declarations\\redefine_fun_as_var.c")],
-    [Path("chapter_9\\invalid_declarations\\redefine_parameter.c")],
-    [Path("chapter_9\\invalid_declarations\\redefine_var_as_fun.c")],
-    [Path("chapter_9\\invalid_declarations\\undeclared_fun.c")],
-    [Path("chapter_9\\invalid_declarations\\wrong_parameter_names.c")],
-    [Path("chapter_9\\invalid_declarations\\extra_credit\\call_label_as_function.c")],
-    [Path("chapter_9\\invalid_declarations\\extra_credit\\compound_assign_to_fun_call.c")],
-    [Path("chapter_9\\invalid_declarations\\extra_credit\\decrement_fun_call.c")],
-    [Path("chapter_9\\invalid_declarations\\extra_credit\\increment_fun_call.c")],
-    [Path("chapter_9\\invalid_labels\\extra_credit\\goto_cross_function.c")],
-    [Path("chapter_9\\invalid_labels\\extra_credit\\goto_function.c")],
-    [Path("chapter_9\\invalid_parse\\call_non_identifier.c")],
-    [Path("chapter_9\\invalid_parse\\decl_wrong_closing_delim.c")],
-    [Path("chapter_9\\invalid_parse\\funcall_wrong_closing_delim.c")],
-    [Path("chapter_9\\invalid_parse\\function_call_declaration.c")],
-    [Path("chapter_9\\invalid_parse\\function_returning_function.c")],
-    [Path("chapter_9\\invalid_parse\\fun_decl_for_loop.c")],
-    [Path("chapter_9\\invalid_parse\\initialize_function_as_variable.c")],
-    [Path("chapter_9\\invalid_parse\\trailing_comma.c")],
-    [Path("chapter_9\\invalid_parse\\trailing_comma_decl.c")],
-    [Path("chapter_9\\invalid_parse\\unclosed_paren_decl.c")],
-    [Path("chapter_9\\invalid_parse\\var_init_in_param_list.c")],
-    [Path("chapter_9\\invalid_types\\assign_fun_to_variable.c")],
-    [Path("chapter_9\\invalid_types\\assign_value_to_function.c")],
-    [Path("chapter_9\\invalid_types\\call_variable_as_function.c")],
-    [Path("chapter_9\\invalid_types\\conflicting_function_declarations.c")],
-    [Path("chapter_9\\invalid_types\\conflicting_local_function_declaration.c")],
-    [Path("chapter_9\\invalid_types\\divide_by_function.c")],
-    [Path("chapter_9\\invalid_types\\multiple_function_definitions.c")],
-    [Path("chapter_9\\invalid_types\\multiple_function_definitions_2.c")],
-    [Path("chapter_9\\invalid_types\\too_few_args.c")],
-    [Path("chapter_9\\invalid_types\\too_many_args.c")],
-    [Path("chapter_9\\invalid_types\\extra_credit\\bitwise_op_function.c")],
-    [Path("chapter_9\\invalid_types\\extra_credit\\compound_assign_function_lhs.c")],
-    [Path("chapter_9\\invalid_types\\extra_credit\\compound_assign_function_rhs.c")],
-    [Path("chapter_9\\invalid_types\\extra_credit\\postfix_incr_fun_name.c")],
-    [Path("chapter_9\\invalid_types\\extra_credit\\prefix_decr_fun_name.c")],
-    [Path("chapter_9\\invalid_types\\extra_credit\\switch_on_function.c")],
-    [Path("chapter_9\\valid\\arguments_in_registers\\dont_clobber_edx.c")],
-    [Path("chapter_9\\valid\\arguments_in_registers\\expression_args.c")],
-    [Path("chapter_9\\valid\\arguments_in_registers\\fibonacci.c")],
-    [Path("chapter_9\\valid\\arguments_in_registers\\forward_decl_multi_arg.c")],
-    [Path("chapter_9\\valid\\arguments_in_registers\\hello_world.c")],
-    [Path("chapter_9\\valid\\arguments_in_registers\\parameters_are_preserved.c")],
-    [Path("chapter_9\\valid\\arguments_in_registers\\parameter_shadows_function.c")],
-    [Path("chapter_9\\valid\\arguments_in_registers\\parameter_shadows_own_function.c")],
-    [Path("chapter_9\\valid\\arguments_in_registers\\param_shadows_local_var.c")],
-    [Path("chapter_9\\valid\\arguments_in_registers\\single_arg.c")],
-    [Path("chapter_9\\valid\\extra_credit\\compound_assign_function_result.c")],
-    [Path("chapter_9\\valid\\extra_credit\\dont_clobber_ecx.c")],
-    [Path("chapter_9\\valid\\extra_credit\\goto_label_multiple_functions.c")],
-    [Path("chapter_9\\valid\\extra_credit\\goto_shared_name.c")],
-    [Path("chapter_9\\valid\\extra_credit\\label_naming_scheme.c")],
-    [
-        Path("chapter_9\\valid\\libraries\\addition.c"),
-        Path("chapter_9\\valid\\libraries\\addition_client.c"),
-    ],
-    [
-        Path("chapter_9\\valid\\libraries\\many_args.c"),
-        Path("chapter_9\\valid\\libraries\\many_args_client.c"),
-    ],
-    [
-        Path("chapter_9\\valid\\libraries\\system_call.c"),
-        Path("chapter_9\\valid\\libraries\\system_call_client.c"),
-    ],
-    [
-        Path("chapter_9\\valid\\libraries\\no_function_calls\\division.c"),
-        Path("chapter_9\\valid\\libraries\\no_function_calls\\division_client.c"),
-    ],
-    [
-        Path("chapter_9\\valid\\libraries\\no_function_calls\\local_stack_variables.c"),
-        Path("chapter_9\\valid\\libraries\\no_function_calls\\local_stack_variables_client.c"),
-    ],
-    [Path("chapter_9\\valid\\no_arguments\\forward_decl.c")],
-    [Path("chapter_9\\valid\\no_arguments\\function_shadows_variable.c")],
-    [Path("chapter_9\\valid\\no_arguments\\multiple_declarations.c")],
-    [Path("chapter_9\\valid\\no_arguments\\no_return_value.c")],
-    [Path("chapter_9\\valid\\no_arguments\\precedence.c")],
-    [Path("chapter_9\\valid\\no_arguments\\use_function_in_expression.c")],
-    [Path("chapter_9\\valid\\no_arguments\\variable_shadows_function.c")],
-    [Path("chapter_9\\valid\\stack_arguments\\call_putchar.c")],
-    [Path("chapter_9\\valid\\stack_arguments\\lots_of_arguments.c")],
-    [
-        Path("chapter_9\\valid\\stack_arguments\\stack_alignment_check_linux.s"),
-        Path("chapter_9\\valid\\stack_arguments\\stack_alignment.c"),
-    ],
-    [
-        Path("chapter_9\\valid\\stack_arguments\\stack_alignment_check_osx.s"),
-        Path("chapter_9\\valid\\stack_arguments\\stack_alignment.c"),
-    ],
-    [Path("chapter_9\\valid\\stack_arguments\\test_for_memory_leaks.c")],
-    [Path("chapter_10\\invalid_declarations\\conflicting_local_declarations.c")],
-    [Path("chapter_10\\invalid_declarations\\extern_follows_local_var.c")],
-    [Path("chapter_10\\invalid_declarations\\extern_follows_static_local_var.c")],
-    [Path("chapter_10\\invalid_declarations\\local_var_follows_extern.c")],
-    [Path("chapter_10\\invalid_declarations\\out_of_scope_extern_var.c")],
-    [Path("chapter_10\\invalid_declarations\\redefine_param_as_identifier_with_linkage.c")],
-    [Path("chapter_10\\invalid_declarations\\undeclared_global_variable.c")],
-    [Path("chapter_10\\invalid_labels\\extra_credit\\goto_global_var.c")],
-    [Path("chapter_10\\invalid_parse\\extern_param.c")],
-    [Path("chapter_10\\invalid_parse\\missing_parameter_list.c")],
-    [Path("chapter_10\\invalid_parse\\missing_type_specifier.c")],
-    [Path("chapter_10\\invalid_parse\\multi_storage_class_fun.c")],
-    [Path("chapter_10\\invalid_parse\\multi_storage_class_var.c")],
-    [Path("chapter_10\\invalid_parse\\static_and_extern.c")],
-    [Path("chapter_10\\invalid_parse\\static_param.c")],
-    [Path("chapter_10\\invalid_parse\\extra_credit\\extern_label.c")],
-    [Path("chapter_10\\invalid_parse\\extra_credit\\file_scope_label.c")],
-    [Path("chapter_10\\invalid_parse\\extra_credit\\static_label.c")],
-    [Path("chapter_10\\invalid_types\\conflicting_function_linkage.c")],
-    [Path("chapter_10\\invalid_types\\conflicting_function_linkage_2.c")],
-    [Path("chapter_10\\invalid_types\\conflicting_global_definitions.c")],
-    [Path("chapter_10\\invalid_types\\conflicting_variable_linkage.c")],
-    [Path("chapter_10\\invalid_types\\conflicting_variable_linkage_2.c")],
-    [Path("chapter_10\\invalid_types\\extern_for_loop_counter.c")],
-    [Path("chapter_10\\invalid_types\\extern_variable_initializer.c")],
-    [Path("chapter_10\\invalid_types\\non_constant_static_initializer.c")],
-    [Path("chapter_10\\invalid_types\\non_constant_static_local_initializer.c")],
-    [Path("chapter_10\\invalid_types\\redeclare_file_scope_var_as_fun.c")],
-    [Path("chapter_10\\invalid_types\\redeclare_fun_as_file_scope_var.c")],
-    [Path("chapter_10\\invalid_types\\redeclare_fun_as_var.c")],
-    [Path("chapter_10\\invalid_types\\static_block_scope_function_declaration.c")],
-    [Path("chapter_10\\invalid_types\\static_for_loop_counter.c")],
-    [Path("chapter_10\\invalid_types\\use_file_scope_variable_as_fun.c")],
-    [Path("chapter_10\\invalid_types\\extra_credit\\static_var_case.c")],
-    [Path("chapter_10\\valid\\distinct_local_and_extern.c")],
-    [Path("chapter_10\\valid\\extern_block_scope_variable.c")],
-    [Path("chapter_10\\valid\\multiple_static_file_scope_vars.c")],
-    [Path("chapter_10\\valid\\multiple_static_local.c")],
-    [Path("chapter_10\\valid\\push_arg_on_page_boundary.c")],
-    [Path("chapter_10\\valid\\shadow_static_local_var.c")],
-    [Path("chapter_10\\valid\\static_local_multiple_scopes.c")],
-    [Path("chapter_10\\valid\\static_local_uninitialized.c")],
-    [Path("chapter_10\\valid\\static_recursive_call.c")],
-    [Path("chapter_10\\valid\\static_then_extern.c")],
-    [Path("chapter_10\\valid\\static_variables_in_expressions.c")],
-    [Path("chapter_10\\valid\\tentative_definition.c")],
-    [Path("chapter_10\\valid\\type_before_storage_class.c")],
-    [Path("chapter_10\\valid\\extra_credit\\bitwise_ops_file_scope_vars.c")],
-    [Path("chapter_10\\valid\\extra_credit\\compound_assignment_static_var.c")],
-    [Path("chapter_10\\valid\\extra_credit\\goto_skip_static_initializer.c")],
-    [Path("chapter_10\\valid\\extra_credit\\increment_global_vars.c")],
-    [Path("chapter_10\\valid\\extra_credit\\label_file_scope_var_same_name.c")],
-    [Path("chapter_10\\valid\\extra_credit\\label_static_var_same_name.c")],
-    [Path("chapter_10\\valid\\extra_credit\\switch_on_extern.c")],
-    [Path("chapter_10\\valid\\extra_credit\\switch_skip_extern_decl.c")],
-    [Path("chapter_10\\valid\\extra_credit\\switch_skip_static_initializer.c")],
-    [Path("chapter_10\\valid\\extra_credit\\libraries\\same_label_same_fun.c")],
-    [Path("chapter_10\\valid\\extra_credit\\libraries\\same_label_same_fun_client.c")],
-    [Path("chapter_10\\valid\\libraries\\external_linkage_function.c")],
-    [Path("chapter_10\\valid\\libraries\\external_linkage_function_client.c")],
-    [Path("chapter_10\\valid\\libraries\\external_tentative_var.c")],
-    [Path("chapter_10\\valid\\libraries\\external_tentative_var_client.c")],
-    [Path("chapter_10\\valid\\libraries\\external_variable.c")],
-    [Path("chapter_10\\valid\\libraries\\external_variable_client.c")],
-    [Path("chapter_10\\valid\\libraries\\external_var_scoping.c")],
-    [Path("chapter_10\\valid\\libraries\\external_var_scoping_client.c")],
-    [Path("chapter_10\\valid\\libraries\\internal_hides_external_linkage.c")],
-    [Path("chapter_10\\valid\\libraries\\internal_hides_external_linkage_client.c")],
-    [Path("chapter_10\\valid\\libraries\\internal_linkage_function.c")],
-    [Path("chapter_10\\valid\\libraries\\internal_linkage_function_client.c")],
-    [Path("chapter_10\\valid\\libraries\\internal_linkage_var.c")],
-    [Path("chapter_10\\valid\\libraries\\internal_linkage_var_client.c")],
-    [Path("chapter_11\\invalid_labels\\extra_credit\\bitshift_duplicate_cases.c")],
-    [Path("chapter_11\\invalid_labels\\extra_credit\\switch_duplicate_cases.c")],
-    [Path("chapter_11\\invalid_labels\\extra_credit\\switch_duplicate_cases_2.c")],
-    [Path("chapter_11\\invalid_lex\\invalid_suffix.c")],
-    [Path("chapter_11\\invalid_lex\\invalid_suffix2.c")],
-    [Path("chapter_11\\invalid_parse\\bad_specifiers.c")],
-    [Path("chapter_11\\invalid_parse\\empty_cast.c")],
-    [Path("chapter_11\\invalid_parse\\fun_name_long.c")],
-    [Path("chapter_11\\invalid_parse\\invalid_cast.c")],
-    [Path("chapter_11\\invalid_parse\\invalid_suffix.c")],
-    [Path("chapter_11\\invalid_parse\\long_constant_as_var.c")],
-    [Path("chapter_11\\invalid_parse\\missing_cast_parentheses.c")],
-    [Path("chapter_11\\invalid_parse\\var_name_long.c")],
-    [Path("chapter_11\\invalid_types\\call_long_as_function.c")],
-    [Path("chapter_11\\invalid_types\\cast_lvalue.c")],
-    [Path("chapter_11\\invalid_types\\conflicting_function_types.c")],
-    [Path("chapter_11\\invalid_types\\conflicting_global_types.c")],
-    [Path("chapter_11\\invalid_types\\conflicting_variable_types.c")],
-    [Path("chapter_11\\valid\\explicit_casts\\sign_extend.c")],
-    [Path("chapter_11\\valid\\explicit_casts\\truncate.c")],
-    [Path("chapter_11\\valid\\extra_credit\\bitshift.c")],
-    [Path("chapter_11\\valid\\extra_credit\\bitwise_long_op.c")],
-    [Path("chapter_11\\valid\\extra_credit\\compound_assign_to_int.c")],
-    [Path("chapter_11\\valid\\extra_credit\\compound_assign_to_long.c")],
-    [Path("chapter_11\\valid\\extra_credit\\compound_bitshift.c")],
-    [Path("chapter_11\\valid\\extra_credit\\compound_bitwise.c")],
-    [Path("chapter_11\\valid\\extra_credit\\increment_long.c")],
-    [Path("chapter_11\\valid\\extra_credit\\switch_int.c")],
-    [Path("chapter_11\\valid\\extra_credit\\switch_long.c")],
-    [Path("chapter_11\\valid\\implicit_casts\\common_type.c")],
-    [Path("chapter_11\\valid\\implicit_casts\\convert_by_assignment.c")],
-    [Path("chapter_11\\valid\\implicit_casts\\convert_function_arguments.c")],
-    [Path("chapter_11\\valid\\implicit_casts\\convert_static_initializer.c")],
-    [Path("chapter_11\\valid\\implicit_casts\\long_constants.c")],
-    [Path("chapter_11\\valid\\libraries\\long_args.c")],
-    [Path("chapter_11\\valid\\libraries\\long_args_client.c")],
-    [Path("chapter_11\\valid\\libraries\\long_global_var.c")],
-    [Path("chapter_11\\valid\\libraries\\long_global_var_client.c")],
-    [Path("chapter_11\\valid\\libraries\\maintain_stack_alignment.c")],
-    [Path("chapter_11\\valid\\libraries\\maintain_stack_alignment_client.c")],
-    [Path("chapter_11\\valid\\libraries\\return_long.c")],
-    [Path("chapter_11\\valid\\libraries\\return_long_client.c")],
-    [Path("chapter_11\\valid\\long_expressions\\arithmetic_ops.c")],
-    [Path("chapter_11\\valid\\long_expressions\\assign.c")],
-    [Path("chapter_11\\valid\\long_expressions\\comparisons.c")],
-    [Path("chapter_11\\valid\\long_expressions\\large_constants.c")],
-    [Path("chapter_11\\valid\\long_expressions\\logical.c")],
-    [Path("chapter_11\\valid\\long_expressions\\long_and_int_locals.c")],
-    [Path("chapter_11\\valid\\long_expressions\\long_args.c")],
-    [Path("chapter_11\\valid\\long_expressions\\multi_op.c")],
-    [Path("chapter_11\\valid\\long_expressions\\return_long.c")],
-    [Path("chapter_11\\valid\\long_expressions\\rewrite_large_multiply_regression.c")],
-    [Path("chapter_11\\valid\\long_expressions\\simple.c")],
-    [Path("chapter_11\\valid\\long_expressions\\static_long.c")],
-    [Path("chapter_11\\valid\\long_expressions\\type_specifiers.c")],
-    [Path("chapter_12\\invalid_labels\\extra_credit\\switch_duplicate_cases.c")],
-    [Path("chapter_12\\invalid_lex\\invalid_suffix.c")],
-    [Path("chapter_12\\invalid_lex\\invalid_suffix_2.c")],
-    [Path("chapter_12\\invalid_parse\\bad_specifiers.c")],
-    [Path("chapter_12\\invalid_parse\\bad_specifiers_2.c")],
-    [Path("chapter_12\\invalid_types\\conflicting_signed_unsigned.c")],
-    [Path("chapter_12\\invalid_types\\conflicting_uint_ulong.c")],
-    [Path("chapter_12\\valid\\explicit_casts\\chained_casts.c")],
-    [Path("chapter_12\\valid\\explicit_casts\\extension.c")],
-    [Path("chapter_12\\valid\\explicit_casts\\rewrite_movz_regression.c")],
-    [Path("chapter_12\\valid\\explicit_casts\\round_trip_casts.c")],
-    [Path("chapter_12\\valid\\explicit_casts\\same_size_conversion.c")],
-    [Path("chapter_12\\valid\\explicit_casts\\truncate.c")],
-    [Path("chapter_12\\valid\\extra_credit\\bitwise_unsigned_ops.c")],
-    [Path("chapter_12\\valid\\extra_credit\\bitwise_unsigned_shift.c")],
-    [Path("chapter_12\\valid\\extra_credit\\compound_assign_uint.c")],
-    [Path("chapter_12\\valid\\extra_credit\\compound_bitshift.c")],
-    [Path("chapter_12\\valid\\extra_credit\\compound_bitwise.c")],
-    [Path("chapter_12\\valid\\extra_credit\\postfix_precedence.c")],
-    [Path("chapter_12\\valid\\extra_credit\\switch_uint.c")],
-    [Path("chapter_12\\valid\\extra_credit\\unsigned_incr_decr.c")],
-    [Path("chapter_12\\valid\\implicit_casts\\common_type.c")],
-    [Path("chapter_12\\valid\\implicit_casts\\convert_by_assignment.c")],
-    [Path("chapter_12\\valid\\implicit_casts\\promote_constants.c")],
-    [Path("chapter_12\\valid\\implicit_casts\\static_initializers.c")],
-    [Path("chapter_12\\valid\\libraries\\unsigned_args.c")],
-    [Path("chapter_12\\valid\\libraries\\unsigned_args_client.c")],
-    [Path("chapter_12\\valid\\libraries\\unsigned_global_var.c")],
-    [Path("chapter_12\\valid\\libraries\\unsigned_global_var_client.c")],
-    [Path("chapter_12\\valid\\type_specifiers\\signed_type_specifiers.c")],
-    [Path("chapter_12\\valid\\type_specifiers\\unsigned_type_specifiers.c")],
-    [Path("chapter_12\\valid\\unsigned_expressions\\arithmetic_ops.c")],
-    [Path("chapter_12\\valid\\unsigned_expressions\\arithmetic_wraparound.c")],
-    [Path("chapter_12\\valid\\unsigned_expressions\\comparisons.c")],
-    [Path("chapter_12\\valid\\unsigned_expressions\\locals.c")],
-    [Path("chapter_12\\valid\\unsigned_expressions\\logical.c")],
-    [Path("chapter_12\\valid\\unsigned_expressions\\simple.c")],
-    [Path("chapter_12\\valid\\unsigned_expressions\\static_variables.c")],
-    [Path("chapter_13\\helper_libs\\nan.c")],
-    [Path("chapter_13\\invalid_lex\\another_bad_constant.c")],
-    [Path("chapter_13\\invalid_lex\\bad_exponent_suffix.c")],
-    [Path("chapter_13\\invalid_lex\\malformed_const.c")],
-    [Path("chapter_13\\invalid_lex\\malformed_exponent.c")],
-    [Path("chapter_13\\invalid_lex\\missing_exponent.c")],
-    [Path("chapter_13\\invalid_lex\\missing_negative_exponent.c")],
-    [Path("chapter_13\\invalid_lex\\yet_another_bad_constant.c")],
-    [Path("chapter_13\\invalid_parse\\invalid_type_specifier.c")],
-    [Path("chapter_13\\invalid_parse\\invalid_type_specifier_2.c")],
-    [Path("chapter_13\\invalid_types\\complement_double.c")],
-    [Path("chapter_13\\invalid_types\\mod_double.c")],
-    [Path("chapter_13\\invalid_types\\mod_double_2.c")],
-    [Path("chapter_13\\invalid_types\\extra_credit\\bitwise_and.c")],
-    [Path("chapter_13\\invalid_types\\extra_credit\\bitwise_or.c")],
-    [Path("chapter_13\\invalid_types\\extra_credit\\bitwise_shift_double.c")],
-    [Path("chapter_13\\invalid_types\\extra_credit\\bitwise_shift_double_2.c")],
-    [Path("chapter_13\\invalid_types\\extra_credit\\bitwise_xor.c")],
-    [Path("chapter_13\\invalid_types\\extra_credit\\compound_bitwise_and.c")],
-    [Path("chapter_13\\invalid_types\\extra_credit\\compound_bitwise_xor.c")],
-    [Path("chapter_13\\invalid_types\\extra_credit\\compound_left_bitshift.c")],
-    [Path("chapter_13\\invalid_types\\extra_credit\\compound_mod.c")],
-    [Path("chapter_13\\invalid_types\\extra_credit\\compound_mod_2.c")],
-    [Path("chapter_13\\invalid_types\\extra_credit\\compound_right_bitshift.c")],
-    [Path("chapter_13\\invalid_types\\extra_credit\\switch_double_case.c")],
-    [Path("chapter_13\\invalid_types\\extra_credit\\switch_on_double.c")],
-    [Path("chapter_13\\valid\\constants\\constant_doubles.c")],
-    [Path("chapter_13\\valid\\constants\\round_constants.c")],
-    [Path("chapter_13\\valid\\explicit_casts\\cvttsd2si_rewrite.c")],
-    [Path("chapter_13\\valid\\explicit_casts\\double_to_signed.c")],
-    [Path("chapter_13\\valid\\explicit_casts\\double_to_unsigned.c")],
-    [Path("chapter_13\\valid\\explicit_casts\\rewrite_cvttsd2si_regression.c")],
-    [Path("chapter_13\\valid\\explicit_casts\\signed_to_double.c")],
-    [Path("chapter_13\\valid\\explicit_casts\\unsigned_to_double.c")],
-    [Path("chapter_13\\valid\\extra_credit\\compound_assign.c")],
-    [Path("chapter_13\\valid\\extra_credit\\compound_assign_implicit_cast.c")],
-    [Path("chapter_13\\valid\\extra_credit\\incr_and_decr.c")],
-    [Path("chapter_13\\valid\\extra_credit\\nan.c")],
-    [Path("chapter_13\\valid\\floating_expressions\\arithmetic_ops.c")],
-    [Path("chapter_13\\valid\\floating_expressions\\comparisons.c")],
-    [Path("chapter_13\\valid\\floating_expressions\\logical.c")],
-    [Path("chapter_13\\valid\\floating_expressions\\loop_controlling_expression.c")],
-    [Path("chapter_13\\valid\\floating_expressions\\simple.c")],
-    [Path("chapter_13\\valid\\floating_expressions\\static_initialized_double.c")],
-    [Path("chapter_13\\valid\\function_calls\\double_and_int_parameters.c")],
-    [Path("chapter_13\\valid\\function_calls\\double_and_int_params_recursive.c")],
-    [Path("chapter_13\\valid\\function_calls\\double_parameters.c")],
-    [Path("chapter_13\\valid\\function_calls\\push_xmm.c")],
-    [Path("chapter_13\\valid\\function_calls\\return_double.c")],
-    [Path("chapter_13\\valid\\function_calls\\standard_library_call.c")],
-    [Path("chapter_13\\valid\\function_calls\\use_arg_after_fun_call.c")],
-    [Path("chapter_13\\valid\\implicit_casts\\common_type.c")],
-    [Path("chapter_13\\valid\\implicit_casts\\complex_arithmetic_common_type.c")],
-    [Path("chapter_13\\valid\\implicit_casts\\convert_for_assignment.c")],
-    [Path("chapter_13\\valid\\implicit_casts\\static_initializers.c")],
-    [Path("chapter_13\\valid\\libraries\\double_and_int_params_recursive.c")],
-    [Path("chapter_13\\valid\\libraries\\double_and_int_params_recursive_client.c")],
-    [Path("chapter_13\\valid\\libraries\\double_parameters.c")],
-    [Path("chapter_13\\valid\\libraries\\double_parameters_client.c")],
-    [Path("chapter_13\\valid\\libraries\\double_params_and_result.c")],
-    [Path("chapter_13\\valid\\libraries\\double_params_and_result_client.c")],
-    [Path("chapter_13\\valid\\libraries\\extern_double.c")],
-    [Path("chapter_13\\valid\\libraries\\extern_double_client.c")],
-    [Path("chapter_13\\valid\\libraries\\use_arg_after_fun_call.c")],
-    [Path("chapter_13\\valid\\libraries\\use_arg_after_fun_call_client.c")],
-    [Path("chapter_13\\valid\\special_values\\infinity.c")],
-    [Path("chapter_13\\valid\\special_values\\negative_zero.c")],
-    [Path("chapter_13\\valid\\special_values\\subnormal_not_zero.c")],
-    [Path("chapter_14\\invalid_declarations\\extra_credit\\addr_of_label.c")],
-    [Path("chapter_14\\invalid_declarations\\extra_credit\\deref_label.c")],
-    [Path("chapter_14\\invalid_parse\\abstract_function_declarator.c")],
-    [Path("chapter_14\\invalid_parse\\cast_to_declarator.c")],
-    [Path("chapter_14\\invalid_parse\\malformed_abstract_declarator.c")],
-    [Path("chapter_14\\invalid_parse\\malformed_declarator.c")],
-    [Path("chapter_14\\invalid_parse\\malformed_function_declarator.c")],
-    [Path("chapter_14\\invalid_parse\\malformed_function_declarator_2.c")],
-    [Path("chapter_14\\invalid_types\\address_of_address.c")],
-    [Path("chapter_14\\invalid_types\\address_of_assignment.c")],
-    [Path("chapter_14\\invalid_types\\address_of_constant.c")],
-    [Path("chapter_14\\invalid_types\\address_of_ternary.c")],
-    [Path("chapter_14\\invalid_types\\assign_int_to_pointer.c")],
-    [Path("chapter_14\\invalid_types\\assign_int_var_to_pointer.c")],
-    [Path("chapter_14\\invalid_types\\assign_to_address.c")],
-    [Path("chapter_14\\invalid_types\\assign_wrong_pointer_type.c")],
-    [Path("chapter_14\\invalid_types\\bad_null_pointer_constant.c")],
-    [Path("chapter_14\\invalid_types\\cast_double_to_pointer.c")],
-    [Path("chapter_14\\invalid_types\\cast_pointer_to_double.c")],
-    [Path("chapter_14\\invalid_types\\compare_mixed_pointer_types.c")],
-    [Path("chapter_14\\invalid_types\\compare_pointer_to_ulong.c")],
-    [Path("chapter_14\\invalid_types\\complement_pointer.c")],
-    [Path("chapter_14\\invalid_types\\dereference_non_pointer.c")],
-    [Path("chapter_14\\invalid_types\\divide_pointer.c")],
-    [Path("chapter_14\\invalid_types\\invalid_pointer_initializer.c")],
-    [Path("chapter_14\\invalid_types\\invalid_static_initializer.c")],
-    [Path("chapter_14\\invalid_types\\multiply_pointers.c")],
-    [Path("chapter_14\\invalid_types\\multiply_pointers_2.c")],
-    [Path("chapter_14\\invalid_types\\negate_pointer.c")],
-    [Path("chapter_14\\invalid_types\\pass_pointer_as_int.c")],
-    [Path("chapter_14\\invalid_types\\return_wrong_pointer_type.c")],
-    [Path("chapter_14\\invalid_types\\ternary_mixed_pointer_types.c")],
-    [Path("chapter_14\\invalid_types\\extra_credit\\bitwise_and_pointer.c")],
-    [Path("chapter_14\\invalid_types\\extra_credit\\bitwise_compound_assign_to_pointer.c")],
-    [Path("chapter_14\\invalid_types\\extra_credit\\bitwise_compound_assign_with_pointer.c")],
-    [Path("chapter_14\\invalid_types\\extra_credit\\bitwise_lshift_pointer.c")],
-    [Path("chapter_14\\invalid_types\\extra_credit\\bitwise_or_pointer.c")],
-    [Path("chapter_14\\invalid_types\\extra_credit\\bitwise_rshift_pointer.c")],
-    [Path("chapter_14\\invalid_types\\extra_credit\\bitwise_xor_pointer.c")],
-    [Path("chapter_14\\invalid_types\\extra_credit\\compound_assignment_not_lval.c")],
-    [Path("chapter_14\\invalid_types\\extra_credit\\compound_assign_thru_ptr_not_lval.c")],
-    [Path("chapter_14\\invalid_types\\extra_credit\\compound_divide_pointer.c")],
-    [Path("chapter_14\\invalid_types\\extra_credit\\compound_mod_pointer.c")],
-    [Path("chapter_14\\invalid_types\\extra_credit\\compound_multiply_pointer.c")],
-    [Path("chapter_14\\invalid_types\\extra_credit\\postfix_decr_not_lvalue.c")],
-    [Path("chapter_14\\invalid_types\\extra_credit\\prefix_incr_not_lvalue.c")],
-    [Path("chapter_14\\invalid_types\\extra_credit\\switch_on_pointer.c")],
-    [Path("chapter_14\\valid\\casts\\cast_between_pointer_types.c")],
-    [Path("chapter_14\\valid\\casts\\null_pointer_conversion.c")],
-    [Path("chapter_14\\valid\\casts\\pointer_int_casts.c")],
-    [Path("chapter_14\\valid\\comparisons\\compare_pointers.c")],
-    [Path("chapter_14\\valid\\comparisons\\compare_to_null.c")],
-    [Path("chapter_14\\valid\\comparisons\\pointers_as_conditions.c")],
-    [Path("chapter_14\\valid\\declarators\\abstract_declarators.c")],
-    [Path("chapter_14\\valid\\declarators\\declarators.c")],
-    [Path("chapter_14\\valid\\declarators\\declare_pointer_in_for_loop.c")],
-    [Path("chapter_14\\valid\\dereference\\address_of_dereference.c")],
-    [Path("chapter_14\\valid\\dereference\\dereference_expression_result.c")],
-    [Path("chapter_14\\valid\\dereference\\multilevel_indirection.c")],
-    [Path("chapter_14\\valid\\dereference\\read_through_pointers.c")],
-    [Path("chapter_14\\valid\\dereference\\simple.c")],
-    [Path("chapter_14\\valid\\dereference\\static_var_indirection.c")],
-    [Path("chapter_14\\valid\\dereference\\update_through_pointers.c")],
-    [Path("chapter_14\\valid\\extra_credit\\bitshift_dereferenced_ptrs.c")],
-    [Path("chapter_14\\valid\\extra_credit\\bitwise_ops_with_dereferenced_ptrs.c")],
-    [Path("chapter_14\\valid\\extra_credit\\compound_assign_conversion.c")],
-    [Path("chapter_14\\valid\\extra_credit\\compound_assign_through_pointer.c")],
-    [Path("chapter_14\\valid\\extra_credit\\compound_bitwise_dereferenced_ptrs.c")],
-    [Path("chapter_14\\valid\\extra_credit\\eval_compound_lhs_once.c")],
-    [Path("chapter_14\\valid\\extra_credit\\incr_and_decr_through_pointer.c")],
-    [Path("chapter_14\\valid\\extra_credit\\switch_dereferenced_pointer.c")],
-    [Path("chapter_14\\valid\\function_calls\\address_of_argument.c")],
-    [Path("chapter_14\\valid\\function_calls\\return_pointer.c")],
-    [Path("chapter_14\\valid\\function_calls\\update_value_through_pointer_parameter.c")],
-    [Path("chapter_14\\valid\\libraries\\global_pointer.c")],
-    [Path("chapter_14\\valid\\libraries\\global_pointer_client.c")],
-    [Path("chapter_14\\valid\\libraries\\static_pointer.c")],
-    [Path("chapter_14\\valid\\libraries\\static_pointer_client.c")],
-    [Path("chapter_15\\invalid_parse\\array_of_functions.c")],
-    [Path("chapter_15\\invalid_parse\\array_of_functions_2.c")],
-    [Path("chapter_15\\invalid_parse\\double_declarator.c")],
-    [Path("chapter_15\\invalid_parse\\empty_initializer_list.c")],
-    [Path("chapter_15\\invalid_parse\\malformed_abstract_array_declarator.c")],
-    [Path("chapter_15\\invalid_parse\\malformed_abstract_array_declarator_2.c")],
-    [Path("chapter_15\\invalid_parse\\malformed_array_declarator.c")],
-    [Path("chapter_15\\invalid_parse\\malformed_array_declarator_2.c")],
-    [Path("chapter_15\\invalid_parse\\malformed_array_declarator_3.c")],
-    [Path("chapter_15\\invalid_parse\\malformed_type_name.c")],
-    [Path("chapter_15\\invalid_parse\\malformed_type_name_2.c")],
-    [Path("chapter_15\\invalid_parse\\mismatched_subscript.c")],
-    [Path("chapter_15\\invalid_parse\\negative_array_dimension.c")],
-    [Path("chapter_15\\invalid_parse\\parenthesized_array_of_functions.c")],
-    [Path("chapter_15\\invalid_parse\\return_array.c")],
-    [Path("chapter_15\\invalid_parse\\unclosed_initializer.c")],
-    [Path("chapter_15\\invalid_parse\\unclosed_nested_initializer.c")],
-    [Path("chapter_15\\invalid_parse\\unclosed_subscript.c")],
-    [Path("chapter_15\\invalid_types\\add_two_pointers.c")],
-    [Path("chapter_15\\invalid_types\\assign_incompatible_pointer_types.c")],
-    [Path("chapter_15\\invalid_types\\assign_to_array.c")],
-    [Path("chapter_15\\invalid_types\\assign_to_array_2.c")],
-    [Path("chapter_15\\invalid_types\\assign_to_array_3.c")],
-    [Path("chapter_15\\invalid_types\\bad_arg_type.c")],
-    [Path("chapter_15\\invalid_types\\cast_to_array_type.c")],
-    [Path("chapter_15\\invalid_types\\cast_to_array_type_2.c")],
-    [Path("chapter_15\\invalid_types\\cast_to_array_type_3.c")],
-    [Path("chapter_15\\invalid_types\\compare_different_pointer_types.c")],
-    [Path("chapter_15\\invalid_types\\compare_explicit_and_implict_addr.c")],
-    [Path("chapter_15\\invalid_types\\compare_pointer_to_int.c")],
-    [Path("chapter_15\\invalid_types\\compare_pointer_to_zero.c")],
-    [Path("chapter_15\\invalid_types\\compound_initializer_for_scalar.c")],
-    [Path("chapter_15\\invalid_types\\compound_initializer_for_static_scalar.c")],
-    [Path("chapter_15\\invalid_types\\compound_initializer_too_long_static.c")],
-    [Path("chapter_15\\invalid_types\\compound_inititializer_too_long.c")],
-    [Path("chapter_15\\invalid_types\\conflicting_array_declarations.c")],
-    [Path("chapter_15\\invalid_types\\conflicting_function_declarations.c")],
-    [Path("chapter_15\\invalid_types\\double_subscript.c")],
-    [Path("chapter_15\\invalid_types\\function_returns_array.c")],
-    [Path("chapter_15\\invalid_types\\incompatible_elem_type_compound_init.c")],
-    [Path("chapter_15\\invalid_types\\incompatible_elem_type_static_compound_init.c")],
-    [Path("chapter_15\\invalid_types\\null_ptr_array_initializer.c")],
-    [Path("chapter_15\\invalid_types\\null_ptr_static_array_initializer.c")],
-    [Path("chapter_15\\invalid_types\\scalar_initializer_for_array.c")],
-    [Path("chapter_15\\invalid_types\\scalar_initializer_for_static_array.c")],
-    [Path("chapter_15\\invalid_types\\static_non_const_array.c")],
-    [Path("chapter_15\\invalid_types\\subscript_both_pointers.c")],
-    [Path("chapter_15\\invalid_types\\subscript_non_ptr.c")],
-    [Path("chapter_15\\invalid_types\\sub_different_pointer_types.c")],
-    [Path("chapter_15\\invalid_types\\sub_double_from_ptr.c")],
-    [Path("chapter_15\\invalid_types\\sub_ptr_from_int.c")],
-    [Path("chapter_15\\invalid_types\\extra_credit\\compound_add_double_to_pointer.c")],
-    [Path("chapter_15\\invalid_types\\extra_credit\\compound_add_two_pointers.c")],
-    [Path("chapter_15\\invalid_types\\extra_credit\\compound_assign_to_array.c")],
-    [Path("chapter_15\\invalid_types\\extra_credit\\compound_assign_to_nested_array.c")],
-    [Path("chapter_15\\invalid_types\\extra_credit\\compound_sub_pointer_from_int.c")],
-    [Path("chapter_15\\invalid_types\\extra_credit\\postfix_incr_array.c")],
-    [Path("chapter_15\\invalid_types\\extra_credit\\postfix_incr_nested_array.c")],
-    [Path("chapter_15\\invalid_types\\extra_credit\\prefix_decr_array.c")],
-    [Path("chapter_15\\invalid_types\\extra_credit\\prefix_decr_nested_array.c")],
-    [Path("chapter_15\\invalid_types\\extra_credit\\switch_on_array.c")],
-    [Path("chapter_15\\valid\\allocation\\test_alignment.c")],
-    [Path("chapter_15\\valid\\casts\\cast_array_of_pointers.c")],
-    [Path("chapter_15\\valid\\casts\\implicit_and_explicit_conversions.c")],
-    [Path("chapter_15\\valid\\casts\\multi_dim_casts.c")],
-    [Path("chapter_15\\valid\\declarators\\array_as_argument.c")],
-    [Path("chapter_15\\valid\\declarators\\big_array.c")],
-    [Path("chapter_15\\valid\\declarators\\equivalent_declarators.c")],
-    [Path("chapter_15\\valid\\declarators\\for_loop_array.c")],
-    [Path("chapter_15\\valid\\declarators\\return_nested_array.c")],
-    [Path("chapter_15\\valid\\extra_credit\\bitwise_subscript.c")],
-    [Path("chapter_15\\valid\\extra_credit\\compound_assign_and_increment.c")],
-    [Path("chapter_15\\valid\\extra_credit\\compound_assign_array_of_pointers.c")],
-    [Path("chapter_15\\valid\\extra_credit\\compound_assign_to_nested_subscript.c")],
-    [Path("chapter_15\\valid\\extra_credit\\compound_assign_to_subscripted_val.c")],
-    [Path("chapter_15\\valid\\extra_credit\\compound_bitwise_subscript.c")],
-    [Path("chapter_15\\valid\\extra_credit\\compound_lval_evaluated_once.c")],
-    [Path("chapter_15\\valid\\extra_credit\\compound_nested_pointer_assignment.c")],
-    [Path("chapter_15\\valid\\extra_credit\\compound_pointer_assignment.c")],
-    [Path("chapter_15\\valid\\extra_credit\\incr_and_decr_nested_pointers.c")],
-    [Path("chapter_15\\valid\\extra_credit\\incr_and_decr_pointers.c")],
-    [Path("chapter_15\\valid\\extra_credit\\incr_decr_subscripted_vals.c")],
-    [Path("chapter_15\\valid\\extra_credit\\postfix_prefix_precedence.c")],
-    [Path("chapter_15\\valid\\initialization\\automatic.c")],
-    [Path("chapter_15\\valid\\initialization\\automatic_nested.c")],
-    [Path("chapter_15\\valid\\initialization\\static.c")],
-    [Path("chapter_15\\valid\\initialization\\static_nested.c")],
-    [Path("chapter_15\\valid\\initialization\\trailing_comma_initializer.c")],
-    [Path("chapter_15\\valid\\libraries\\global_array.c")],
-    [Path("chapter_15\\valid\\libraries\\global_array_client.c")],
-    [Path("chapter_15\\valid\\libraries\\return_pointer_to_array.c")],
-    [Path("chapter_15\\valid\\libraries\\return_pointer_to_array_client.c")],
-    [Path("chapter_15\\valid\\libraries\\set_array_val.c")],
-    [Path("chapter_15\\valid\\libraries\\set_array_val_client.c")],
-    [Path("chapter_15\\valid\\pointer_arithmetic\\add_dereference_and_assign.c")],
-    [Path("chapter_15\\valid\\pointer_arithmetic\\compare.c")],
-    [Path("chapter_15\\valid\\pointer_arithmetic\\pointer_add.c")],
-    [Path("chapter_15\\valid\\pointer_arithmetic\\pointer_diff.c")],
-    [Path("chapter_15\\valid\\subscripting\\addition_subscript_equivalence.c")],
-    [Path("chapter_15\\valid\\subscripting\\array_of_pointers_to_arrays.c")],
-    [Path("chapter_15\\valid\\subscripting\\complex_operands.c")],
-    [Path("chapter_15\\valid\\subscripting\\simple.c")],
-    [Path("chapter_15\\valid\\subscripting\\simple_subscripts.c")],
-    [Path("chapter_15\\valid\\subscripting\\subscript_nested.c")],
-    [Path("chapter_15\\valid\\subscripting\\subscript_pointer.c")],
-    [Path("chapter_15\\valid\\subscripting\\subscript_precedence.c")],
-    [Path("chapter_16\\invalid_labels\\extra_credit\\duplicate_case_char_const.c")],
-    [Path("chapter_16\\invalid_lex\\char_bad_escape_sequence.c")],
-    [Path("chapter_16\\invalid_lex\\newline.c")],
-    [Path("chapter_16\\invalid_lex\\string_bad_escape_sequence.c")],
-    [Path("chapter_16\\invalid_lex\\unescaped_backslash.c")],
-    [Path("chapter_16\\invalid_lex\\unescaped_double_quote.c")],
-    [Path("chapter_16\\invalid_lex\\unescaped_single_quote.c")],
-    [Path("chapter_16\\invalid_lex\\unterminated_char_constant.c")],
-    [Path("chapter_16\\invalid_lex\\unterminated_string.c")],
-    [Path("chapter_16\\invalid_parse\\invalid_type_specifier.c")],
-    [Path("chapter_16\\invalid_parse\\invalid_type_specifier_2.c")],
-    [Path("chapter_16\\invalid_parse\\misplaced_char_literal.c")],
-    [Path("chapter_16\\invalid_parse\\string_literal_varname.c")],
-    [Path("chapter_16\\invalid_parse\\extra_credit\\character_const_goto.c")],
-    [Path("chapter_16\\invalid_parse\\extra_credit\\character_const_label.c")],
-    [Path("chapter_16\\invalid_parse\\extra_credit\\string_literal_goto.c")],
-    [Path("chapter_16\\invalid_parse\\extra_credit\\string_literal_label.c")],
-    [Path("chapter_16\\invalid_types\\assign_to_string_literal.c")],
-    [Path("chapter_16\\invalid_types\\char_and_schar_conflict.c")],
-    [Path("chapter_16\\invalid_types\\char_and_uchar_conflict.c")],
-    [Path("chapter_16\\invalid_types\\compound_initializer_for_pointer.c")],
-    [Path("chapter_16\\invalid_types\\implicit_conversion_between_char_pointers.c")],
-    [Path("chapter_16\\invalid_types\\implicit_conversion_pointers_to_different_size_arrays.c")],
-    [Path("chapter_16\\invalid_types\\negate_char_pointer.c")],
-    [Path("chapter_16\\invalid_types\\string_initializer_for_multidim_array.c")],
-    [Path("chapter_16\\invalid_types\\string_initializer_too_long.c")],
-    [Path("chapter_16\\invalid_types\\string_initializer_too_long_nested.c")],
-    [Path("chapter_16\\invalid_types\\string_initializer_too_long_nested_static.c")],
-    [Path("chapter_16\\invalid_types\\string_initializer_too_long_static.c")],
-    [Path("chapter_16\\invalid_types\\string_initializer_wrong_type.c")],
-    [Path("chapter_16\\invalid_types\\string_initializer_wrong_type_nested.c")],
-    [Path("chapter_16\\invalid_types\\string_initializer_wrong_type_nested_static.c")],
-    [Path("chapter_16\\invalid_types\\string_literal_is_plain_char_pointer.c")],
-    [Path("chapter_16\\invalid_types\\string_literal_is_plain_char_pointer_static.c")],
-    [Path("chapter_16\\invalid_types\\extra_credit\\bitwise_operation_on_string.c")],
-    [Path("chapter_16\\invalid_types\\extra_credit\\bit_shift_string.c")],
-    [Path("chapter_16\\invalid_types\\extra_credit\\case_statement_string.c")],
-    [Path("chapter_16\\invalid_types\\extra_credit\\compound_assign_from_string.c")],
-    [Path("chapter_16\\invalid_types\\extra_credit\\compound_assign_to_string.c")],
-    [Path("chapter_16\\invalid_types\\extra_credit\\postfix_incr_string.c")],
-    [Path("chapter_16\\invalid_types\\extra_credit\\prefix_incr_string.c")],
-    [Path("chapter_16\\invalid_types\\extra_credit\\switch_on_string.c")],
-    [Path("chapter_16\\valid\\chars\\access_through_char_pointer.c")],
-    [Path("chapter_16\\valid\\chars\\chained_casts.c")],
-    [Path("chapter_16\\valid\\chars\\char_arguments.c")],
-    [Path("chapter_16\\valid\\chars\\char_expressions.c")],
-    [Path("chapter_16\\valid\\chars\\common_type.c")],
-    [Path("chapter_16\\valid\\chars\\convert_by_assignment.c")],
-    [Path("chapter_16\\valid\\chars\\explicit_casts.c")],
-    [Path("chapter_16\\valid\\chars\\integer_promotion.c")],
-    [Path("chapter_16\\valid\\chars\\partial_initialization.c")],
-    [Path("chapter_16\\valid\\chars\\push_arg_on_page_boundary.c")],
-    [Path("chapter_16\\valid\\chars\\return_char.c")],
-    [Path("chapter_16\\valid\\chars\\rewrite_movz_regression.c")],
-    [Path("chapter_16\\valid\\chars\\static_initializers.c")],
-    [Path("chapter_16\\valid\\chars\\type_specifiers.c")],
-    [Path("chapter_16\\valid\\char_constants\\char_constant_operations.c")],
-    [Path("chapter_16\\valid\\char_constants\\control_characters.c")],
-    [Path("chapter_16\\valid\\char_constants\\escape_sequences.c")],
-    [Path("chapter_16\\valid\\char_constants\\return_char_constant.c")],
-    [Path("chapter_16\\valid\\extra_credit\\bitshift_chars.c")],
-    [Path("chapter_16\\valid\\extra_credit\\bitwise_ops_character_constants.c")],
-    [Path("chapter_16\\valid\\extra_credit\\bitwise_ops_chars.c")],
-    [Path("chapter_16\\valid\\extra_credit\\char_consts_as_cases.c")],
-    [Path("chapter_16\\valid\\extra_credit\\compound_assign_chars.c")],
-    [Path("chapter_16\\valid\\extra_credit\\compound_bitwise_ops_chars.c")],
-    [Path("chapter_16\\valid\\extra_credit\\incr_decr_chars.c")],
-    [Path("chapter_16\\valid\\extra_credit\\incr_decr_unsigned_chars.c")],
-    [Path("chapter_16\\valid\\extra_credit\\promote_switch_cond.c")],
-    [Path("chapter_16\\valid\\extra_credit\\promote_switch_cond_2.c")],
-    [Path("chapter_16\\valid\\extra_credit\\switch_on_char_const.c")],
-    [Path("chapter_16\\valid\\libraries\\char_arguments.c")],
-    [Path("chapter_16\\valid\\libraries\\char_arguments_client.c")],
-    [Path("chapter_16\\valid\\libraries\\global_char.c")],
-    [Path("chapter_16\\valid\\libraries\\global_char_client.c")],
-    [Path("chapter_16\\valid\\libraries\\return_char.c")],
-    [Path("chapter_16\\valid\\libraries\\return_char_client.c")],
-    [Path("chapter_16\\valid\\strings_as_initializers\\adjacent_strings_in_initializer.c")],
-    [Path("chapter_16\\valid\\strings_as_initializers\\array_init_special_chars.c")],
-    [Path("chapter_16\\valid\\strings_as_initializers\\literals_and_compound_initializers.c")],
-    [Path("chapter_16\\valid\\strings_as_initializers\\partial_initialize_via_string.c")],
-    [Path("chapter_16\\valid\\strings_as_initializers\\simple.c")],
-    [Path("chapter_16\\valid\\strings_as_initializers\\terminating_null_bytes.c")],
-    [Path("chapter_16\\valid\\strings_as_initializers\\test_alignment.c")],
-    [Path("chapter_16\\valid\\strings_as_initializers\\transfer_by_eightbyte.c")],
-    [Path("chapter_16\\valid\\strings_as_initializers\\write_to_array.c")],
-    [Path("chapter_16\\valid\\strings_as_lvalues\\addr_of_string.c")],
-    [Path("chapter_16\\valid\\strings_as_lvalues\\adjacent_strings.c")],
-    [Path("chapter_16\\valid\\strings_as_lvalues\\array_of_strings.c")],
-    [Path("chapter_16\\valid\\strings_as_lvalues\\cast_string_pointer.c")],
-    [Path("chapter_16\\valid\\strings_as_lvalues\\empty_string.c")],
-    [Path("chapter_16\\valid\\strings_as_lvalues\\pointer_operations.c")],
-    [Path("chapter_16\\valid\\strings_as_lvalues\\simple.c")],
-    [Path("chapter_16\\valid\\strings_as_lvalues\\standard_library_calls.c")],
-    [Path("chapter_16\\valid\\strings_as_lvalues\\strings_in_function_calls.c")],
-    [Path("chapter_16\\valid\\strings_as_lvalues\\string_special_characters.c")],
-    [Path("chapter_17\\invalid_parse\\bad_specifier.c")],
-    [Path("chapter_17\\invalid_parse\\bad_specifier_2.c")],
-    [Path("chapter_17\\invalid_parse\\sizeof_cast.c")],
-    [Path("chapter_17\\invalid_parse\\sizeof_type_no_parens.c")],
-    [Path("chapter_17\\invalid_types\\extra_credit\\bitshift_void.c")],
-    [Path("chapter_17\\invalid_types\\extra_credit\\bitwise_void.c")],
-    [Path("chapter_17\\invalid_types\\extra_credit\\compound_add_void_pointer.c")],
-    [Path("chapter_17\\invalid_types\\extra_credit\\compound_sub_void_pointer.c")],
-    [Path("chapter_17\\invalid_types\\extra_credit\\compound_void_rval.c")],
-    [Path("chapter_17\\invalid_types\\extra_credit\\compound_void_rval_add.c")],
-    [Path("chapter_17\\invalid_types\\extra_credit\\compound_void_rval_bitshift.c")],
-    [Path("chapter_17\\invalid_types\\extra_credit\\postfix_decr_void.c")],
-    [Path("chapter_17\\invalid_types\\extra_credit\\postfix_decr_void_pointer.c")],
-    [Path("chapter_17\\invalid_types\\extra_credit\\postfix_incr_void_pointer.c")],
-    [Path("chapter_17\\invalid_types\\extra_credit\\prefix_decr_void_pointer.c")],
-    [Path("chapter_17\\invalid_types\\extra_credit\\prefix_incr_void.c")],
-    [Path("chapter_17\\invalid_types\\extra_credit\\prefix_incr_void_pointer.c")],
-    [Path("chapter_17\\invalid_types\\extra_credit\\switch_void.c")],
-    [Path("chapter_17\\invalid_types\\incomplete_types\\add_void_pointer.c")],
-    [Path("chapter_17\\invalid_types\\incomplete_types\\sizeof_function.c")],
-    [Path("chapter_17\\invalid_types\\incomplete_types\\sizeof_void.c")],
-    [Path("chapter_17\\invalid_types\\incomplete_types\\sizeof_void_array.c")],
-    [Path("chapter_17\\invalid_types\\incomplete_types\\sizeof_void_expression.c")],
-    [Path("chapter_17\\invalid_types\\incomplete_types\\subscript_void.c")],
-    [Path("chapter_17\\invalid_types\\incomplete_types\\subscript_void_pointer_conditional.c")],
-    [Path("chapter_17\\invalid_types\\incomplete_types\\sub_void_pointer.c")],
-    [Path("chapter_17\\invalid_types\\incomplete_types\\void_array.c")],
-    [Path("chapter_17\\invalid_types\\incomplete_types\\void_array_in_cast.c")],
-    [Path("chapter_17\\invalid_types\\incomplete_types\\void_array_in_param_type.c")],
-    [Path("chapter_17\\invalid_types\\incomplete_types\\void_array_nested_in_declaration.c")],
-    [Path("chapter_17\\invalid_types\\incomplete_types\\void_array_pointer_in_declaration.c")],
-    [Path("chapter_17\\invalid_types\\incomplete_types\\void_array_pointer_in_param_type.c")],
-    [Path("chapter_17\\invalid_types\\pointer_conversions\\compare_void_ptr_to_int.c")],
-    [Path("chapter_17\\invalid_types\\pointer_conversions\\compare_void_to_other_pointer.c")],
-    [Path("chapter_17\\invalid_types\\pointer_conversions\\convert_ulong_to_void_ptr.c")],
-    [Path("chapter_17\\invalid_types\\pointer_conversions\\convert_void_ptr_to_int.c")],
-    [Path("chapter_17\\invalid_types\\pointer_conversions\\usual_arithmetic_conversions_ptr.c")],
-    [Path("chapter_17\\invalid_types\\scalar_expressions\\and_void.c")],
-    [Path("chapter_17\\invalid_types\\scalar_expressions\\cast_void.c")],
-    [Path("chapter_17\\invalid_types\\scalar_expressions\\not_void.c")],
-    [Path("chapter_17\\invalid_types\\scalar_expressions\\or_void.c")],
-    [Path("chapter_17\\invalid_types\\scalar_expressions\\void_condition_do_loop.c")],
-    [Path("chapter_17\\invalid_types\\scalar_expressions\\void_condition_for_loop.c")],
-    [Path("chapter_17\\invalid_types\\scalar_expressions\\void_condition_while_loop.c")],
-    [Path("chapter_17\\invalid_types\\scalar_expressions\\void_if_condition.c")],
-    [Path("chapter_17\\invalid_types\\scalar_expressions\\void_ternary_condition.c")],
-    [Path("chapter_17\\invalid_types\\void\\assign_to_void_lvalue.c")],
-    [Path("chapter_17\\invalid_types\\void\\assign_to_void_var.c")],
-    [Path("chapter_17\\invalid_types\\void\\assign_void_rval.c")],
-    [Path("chapter_17\\invalid_types\\void\\define_void.c")],
-    [Path("chapter_17\\invalid_types\\void\\initialized_void.c")],
-    [Path("chapter_17\\invalid_types\\void\\mismatched_conditional.c")],
-    [Path("chapter_17\\invalid_types\\void\\negate_void.c")],
-    [Path("chapter_17\\invalid_types\\void\\non_void_return.c")],
-    [Path("chapter_17\\invalid_types\\void\\no_return_value.c")],
-    [Path("chapter_17\\invalid_types\\void\\return_void_as_pointer.c")],
-    [Path("chapter_17\\invalid_types\\void\\subscript_void.c")],
-    [Path("chapter_17\\invalid_types\\void\\void_compare.c")],
-    [Path("chapter_17\\invalid_types\\void\\void_equality.c")],
-    [Path("chapter_17\\invalid_types\\void\\void_fun_params.c")],
-    [Path("chapter_17\\valid\\extra_credit\\sizeof_bitwise.c")],
-    [Path("chapter_17\\valid\\extra_credit\\sizeof_compound.c")],
-    [Path("chapter_17\\valid\\extra_credit\\sizeof_compound_bitwise.c")],
-    [Path("chapter_17\\valid\\extra_credit\\sizeof_incr.c")],
-    [Path("chapter_17\\valid\\libraries\\pass_alloced_memory.c")],
-    [Path("chapter_17\\valid\\libraries\\pass_alloced_memory_client.c")],
-    [Path("chapter_17\\valid\\libraries\\sizeof_extern.c")],
-    [Path("chapter_17\\valid\\libraries\\sizeof_extern_client.c")],
-    [Path("chapter_17\\valid\\libraries\\test_for_memory_leaks.c")],
-    [Path("chapter_17\\valid\\libraries\\test_for_memory_leaks_client.c")],
-    [Path("chapter_17\\valid\\sizeof\\simple.c")],
-    [Path("chapter_17\\valid\\sizeof\\sizeof_array.c")],
-    [Path("chapter_17\\valid\\sizeof\\sizeof_basic_types.c")],
-    [Path("chapter_17\\valid\\sizeof\\sizeof_consts.c")],
-    [Path("chapter_17\\valid\\sizeof\\sizeof_derived_types.c")],
-    [Path("chapter_17\\valid\\sizeof\\sizeof_expressions.c")],
-    [Path("chapter_17\\valid\\sizeof\\sizeof_not_evaluated.c")],
-    [Path("chapter_17\\valid\\sizeof\\sizeof_result_is_ulong.c")],
-    [Path("chapter_17\\valid\\void\\cast_to_void.c")],
-    [Path("chapter_17\\valid\\void\\ternary.c")],
-    [Path("chapter_17\\valid\\void\\void_for_loop.c")],
-    [Path("chapter_17\\valid\\void\\void_function.c")],
-    [Path("chapter_17\\valid\\void_pointer\\array_of_pointers_to_void.c")],
-    [Path("chapter_17\\valid\\void_pointer\\common_pointer_type.c")],
-    [Path("chapter_17\\valid\\void_pointer\\conversion_by_assignment.c")],
-    [Path("chapter_17\\valid\\void_pointer\\explicit_cast.c")],
-    [Path("chapter_17\\valid\\void_pointer\\memory_management_functions.c")],
-    [Path("chapter_17\\valid\\void_pointer\\simple.c")],
-    [Path("chapter_18\\invalid_lex\\dot_bad_token.c")],
-    [Path("chapter_18\\invalid_lex\\dot_bad_token_2.c")],
-    [Path("chapter_18\\invalid_parse\\arrow_missing_member.c")],
-    [Path("chapter_18\\invalid_parse\\dot_invalid_member.c")],
-    [Path("chapter_18\\invalid_parse\\dot_no_left_expr.c")],
-    [Path("chapter_18\\invalid_parse\\dot_operator_in_declarator.c")],
-    [Path("chapter_18\\invalid_parse\\empty_initializer_list.c")],
-    [Path("chapter_18\\invalid_parse\\misplaced_storage_class.c")],
-    [Path("chapter_18\\invalid_parse\\struct_decl_double_semicolon.c")],
-    [Path("chapter_18\\invalid_parse\\struct_decl_empty_member_list.c")],
-    [Path("chapter_18\\invalid_parse\\struct_decl_extra_semicolon.c")],
-    [Path("chapter_18\\invalid_parse\\struct_decl_kw_wrong_order.c")],
-    [Path("chapter_18\\invalid_parse\\struct_decl_missing_end_semicolon.c")],
-    [Path("chapter_18\\invalid_parse\\struct_decl_tag_kw.c")],
-    [Path("chapter_18\\invalid_parse\\struct_decl_two_kws.c")],
-    [Path("chapter_18\\invalid_parse\\struct_member_initializer.c")],
-    [Path("chapter_18\\invalid_parse\\struct_member_is_function.c")],
-    [Path("chapter_18\\invalid_parse\\struct_member_name_kw.c")],
-    [Path("chapter_18\\invalid_parse\\struct_member_no_declarator.c")],
-    [Path("chapter_18\\invalid_parse\\struct_member_no_semicolon.c")],
-    [Path("chapter_18\\invalid_parse\\struct_member_no_type.c")],
-    [Path("chapter_18\\invalid_parse\\struct_member_storage_class.c")],
-    [Path("chapter_18\\invalid_parse\\var_decl_bad_tag_1.c")],
-    [Path("chapter_18\\invalid_parse\\var_decl_bad_tag_2.c")],
-    [Path("chapter_18\\invalid_parse\\var_decl_bad_type_specifier.c")],
-    [Path("chapter_18\\invalid_parse\\var_decl_missing_struct_kw.c")],
-    [Path("chapter_18\\invalid_parse\\var_decl_two_struct_kws.c")],
-    [Path("chapter_18\\invalid_parse\\var_decl_two_tags.c")],
-    [Path("chapter_18\\invalid_parse\\extra_credit\\case_struct_decl.c")],
-    [Path("chapter_18\\invalid_parse\\extra_credit\\default_kw_member_name.c")],
-    [Path("chapter_18\\invalid_parse\\extra_credit\\goto_kw_struct_tag.c")],
-    [Path("chapter_18\\invalid_parse\\extra_credit\\labeled_struct_decl.c")],
-    [Path("chapter_18\\invalid_parse\\extra_credit\\label_inside_struct_decl.c")],
-    [Path("chapter_18\\invalid_parse\\extra_credit\\struct_union.c")],
-    [Path("chapter_18\\invalid_parse\\extra_credit\\two_union_kws.c")],
-    [Path("chapter_18\\invalid_parse\\extra_credit\\union_bad_type_spec.c")],
-    [Path("chapter_18\\invalid_parse\\extra_credit\\union_decl_bad_type_specifier.c")],
-    [Path("chapter_18\\invalid_parse\\extra_credit\\union_decl_empty_member_list.c")],
-    [Path("chapter_18\\invalid_parse\\extra_credit\\union_decl_extra_semicolon.c")],
-    [Path("chapter_18\\invalid_parse\\extra_credit\\union_empty_initializer.c")],
-    [Path("chapter_18\\invalid_parse\\extra_credit\\union_member_initializer.c")],
-    [Path("chapter_18\\invalid_parse\\extra_credit\\union_member_is_function.c")],
-    [Path("chapter_18\\invalid_parse\\extra_credit\\union_member_name_kw.c")],
-    [Path("chapter_18\\invalid_parse\\extra_credit\\union_member_no_declarator.c")],
-    [Path("chapter_18\\invalid_parse\\extra_credit\\union_member_no_type.c")],
-    [Path("chapter_18\\invalid_parse\\extra_credit\\union_member_storage_class.c")],
-    [Path("chapter_18\\invalid_parse\\extra_credit\\union_struct_tag.c")],
-    [Path("chapter_18\\invalid_parse\\extra_credit\\union_two_tags.c")],
-    [Path("chapter_18\\invalid_parse\\extra_credit\\union_var_bad_tag.c")],
-    [Path("chapter_18\\invalid_parse\\extra_credit\\union_var_tag_paren.c")],
-    [Path("chapter_18\\invalid_struct_tags\\array_of_undeclared.c")],
-    [Path("chapter_18\\invalid_struct_tags\\cast_undeclared.c")],
-    [Path("chapter_18\\invalid_struct_tags\\deref_undeclared.c")],
-    [Path("chapter_18\\invalid_struct_tags\\file_scope_var_type_undeclared.c")],
-    [Path("chapter_18\\invalid_struct_tags\\for_loop_scope.c")],
-    [Path("chapter_18\\invalid_struct_tags\\for_loop_scope_2.c")],
-    [Path("chapter_18\\invalid_struct_tags\\member_type_undeclared.c")],
-    [Path("chapter_18\\invalid_struct_tags\\param_undeclared.c")],
-    [Path("chapter_18\\invalid_struct_tags\\return_type_undeclared.c")],
-    [Path("chapter_18\\invalid_struct_tags\\sizeof_undeclared.c")],
-    [Path("chapter_18\\invalid_struct_tags\\var_type_undeclared.c")],
-    [Path("chapter_18\\invalid_struct_tags\\extra_credit\\sizeof_undeclared_union.c")],
-    [Path("chapter_18\\invalid_struct_tags\\extra_credit\\var_undeclared_union_type.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\bad_union_member_access\\nested_non_member.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\bad_union_member_access\\union_bad_member.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\bad_union_member_access\\union_bad_pointer_member.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\incompatible_union_types\\assign_different_union_type.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\incompatible_union_types\\assign_scalar_to_union.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\incompatible_union_types\\return_type_mismatch.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\incompatible_union_types\\union_branch_mismatch.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\incompatible_union_types\\union_pointer_branch_mismatch.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\incomplete_unions\\define_incomplete_union.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\incomplete_unions\\sizeof_incomplete_union_type.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\invalid_union_lvalues\\address_of_non_lvalue_union_member.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\invalid_union_lvalues\\assign_non_lvalue_union_member.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\other_features\\bitwise_op_structure.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\other_features\\compound_assign_struct_rval.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\other_features\\compound_assign_to_nested_struct.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\other_features\\compound_assign_to_struct.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\other_features\\duplicate_struct_types_after_label.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\other_features\\postfix_decr_struct_arrow.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\other_features\\postfix_incr_struct.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\other_features\\prefix_decr_struct.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\other_features\\prefix_incr_nested_struct.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\other_features\\switch_on_struct.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\scalar_required\\cast_between_unions.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\scalar_required\\cast_union_to_int.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\scalar_required\\compare_unions.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\scalar_required\\switch_on_union.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\scalar_required\\union_as_controlling_expression.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\union_initializers\\initializer_too_long.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\union_initializers\\nested_init_wrong_type.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\union_initializers\\nested_union_init_too_long.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\union_initializers\\scalar_union_initializer.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\union_initializers\\static_aggregate_init_wrong_type.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\union_initializers\\static_nested_init_not_const.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\union_initializers\\static_nested_init_too_long.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\union_initializers\\static_scalar_union_initializer.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\union_initializers\\static_too_long.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\union_initializers\\static_union_init_not_constant.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\union_initializers\\static_union_init_wrong_type.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\union_initializers\\union_init_wrong_type.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\union_struct_conflicts\\conflicting_tag_declarations.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\union_struct_conflicts\\conflicting_tag_decl_and_use.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\union_struct_conflicts\\conflicting_tag_decl_and_use_self_reference.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\union_struct_conflicts\\struct_shadowed_by_union.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\union_struct_conflicts\\tag_decl_conflicts_with_def.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\union_struct_conflicts\\tag_def_conflicts_with_decl.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\union_struct_conflicts\\union_shadowed_by_incomplete_struct.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\union_tag_resolution\\address_of_wrong_union_type.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\union_tag_resolution\\compare_struct_and_union_ptrs.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\union_tag_resolution\\conflicting_param_union_types.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\union_tag_resolution\\distinct_union_types.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\union_tag_resolution\\union_type_shadows_struct.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\union_tag_resolution\\union_wrong_member.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\union_type_declarations\\array_of_incomplete_union_type.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\union_type_declarations\\duplicate_union_def.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\union_type_declarations\\incomplete_union_member.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\union_type_declarations\\member_name_conflicts.c")],
-    [Path("chapter_18\\invalid_types\\extra_credit\\union_type_declarations\\union_self_reference.c")],
-    [Path("chapter_18\\invalid_types\\incompatible_types\\assign_different_pointer_type.c")],
-    [Path("chapter_18\\invalid_types\\incompatible_types\\assign_different_struct_type.c")],
-    [Path("chapter_18\\invalid_types\\incompatible_types\\branch_mismatch.c")],
-    [Path("chapter_18\\invalid_types\\incompatible_types\\branch_mismatch_2.c")],
-    [Path("chapter_18\\invalid_types\\incompatible_types\\compare_different_struct_pointers.c")],
-    [Path("chapter_18\\invalid_types\\incompatible_types\\return_wrong_struct_type.c")],
-    [Path("chapter_18\\invalid_types\\incompatible_types\\struct_param_mismatch.c")],
-    [Path("chapter_18\\invalid_types\\incompatible_types\\struct_pointer_param_mismatch.c")],
-    [Path("chapter_18\\invalid_types\\initializers\\compound_initializer_too_long.c")],
-    [Path("chapter_18\\invalid_types\\initializers\\initialize_nested_static_struct_member_wrong_type.c")],
-    [Path("chapter_18\\invalid_types\\initializers\\initialize_static_struct_with_zero.c")],
-    [Path("chapter_18\\invalid_types\\initializers\\initialize_struct_member_wrong_type.c")],
-    [Path("chapter_18\\invalid_types\\initializers\\initialize_struct_with_scalar.c")],
-    [Path("chapter_18\\invalid_types\\initializers\\initialize_struct_wrong_type.c")],
-    [Path("chapter_18\\invalid_types\\initializers\\init_struct_with_string.c")],
-    [Path("chapter_18\\invalid_types\\initializers\\nested_compound_initializer_too_long.c")],
-    [Path("chapter_18\\invalid_types\\initializers\\nested_static_compound_initializer_too_long.c")],
-    [Path("chapter_18\\invalid_types\\initializers\\nested_struct_initializer_wrong_type.c")],
-    [Path("chapter_18\\invalid_types\\initializers\\non_constant_static_elem_init.c")],
-    [Path("chapter_18\\invalid_types\\initializers\\non_constant_static_init.c")],
-    [Path("chapter_18\\invalid_types\\initializers\\static_initializer_too_long.c")],
-    [Path("chapter_18\\invalid_types\\invalid_incomplete_structs\\assign_to_incomplete_var.c")],
-    [Path("chapter_18\\invalid_types\\invalid_incomplete_structs\\cast_incomplete_struct.c")],
-    [Path("chapter_18\\invalid_types\\invalid_incomplete_structs\\deref_incomplete_struct_pointer.c")],
-    [Path("chapter_18\\invalid_types\\invalid_incomplete_structs\\incomplete_arg_funcall.c")],
-    [Path("chapter_18\\invalid_types\\invalid_incomplete_structs\\incomplete_array_element.c")],
-    [Path("chapter_18\\invalid_types\\invalid_incomplete_structs\\incomplete_local_var.c")],
-    [Path("chapter_18\\invalid_types\\invalid_incomplete_structs\\incomplete_param.c")],
-    [Path("chapter_18\\invalid_types\\invalid_incomplete_structs\\incomplete_ptr_addition.c")],
-    [Path("chapter_18\\invalid_types\\invalid_incomplete_structs\\incomplete_ptr_subtraction.c")],
-    [Path("chapter_18\\invalid_types\\invalid_incomplete_structs\\incomplete_return_type_funcall.c")],
-    [Path("chapter_18\\invalid_types\\invalid_incomplete_structs\\incomplete_return_type_fun_def.c")],
-    [Path("chapter_18\\invalid_types\\invalid_incomplete_structs\\incomplete_struct_conditional.c")],
-    [Path("chapter_18\\invalid_types\\invalid_incomplete_structs\\incomplete_struct_full_expr.c")],
-    [Path("chapter_18\\invalid_types\\invalid_incomplete_structs\\incomplete_struct_member.c")],
-    [Path("chapter_18\\invalid_types\\invalid_incomplete_structs\\incomplete_subscript.c")],
-    [Path("chapter_18\\invalid_types\\invalid_incomplete_structs\\incomplete_tentative_def.c")],
-    [Path("chapter_18\\invalid_types\\invalid_incomplete_structs\\initialize_incomplete.c")],
-    [Path("chapter_18\\invalid_types\\invalid_incomplete_structs\\sizeof_incomplete.c")],
-    [Path("chapter_18\\invalid_types\\invalid_incomplete_structs\\sizeof_incomplete_expr.c")],
-    [Path("chapter_18\\invalid_types\\invalid_lvalues\\address_of_non_lvalue.c")],
-    [Path("chapter_18\\invalid_types\\invalid_lvalues\\assign_nested_non_lvalue.c")],
-    [Path("chapter_18\\invalid_types\\invalid_lvalues\\assign_to_array.c")],
-    [Path("chapter_18\\invalid_types\\invalid_lvalues\\assign_to_non_lvalue.c")],
-    [Path("chapter_18\\invalid_types\\invalid_member_operators\\arrow_pointer_to_non_struct.c")],
-    [Path("chapter_18\\invalid_types\\invalid_member_operators\\bad_member.c")],
-    [Path("chapter_18\\invalid_types\\invalid_member_operators\\bad_pointer_member.c")],
-    [Path("chapter_18\\invalid_types\\invalid_member_operators\\member_of_non_struct.c")],
-    [Path("chapter_18\\invalid_types\\invalid_member_operators\\member_pointer_non_struct_pointer.c")],
-    [Path("chapter_18\\invalid_types\\invalid_member_operators\\nested_arrow_pointer_to_non_struct.c")],
-    [Path("chapter_18\\invalid_types\\invalid_member_operators\\postfix_precedence.c")],
-    [Path("chapter_18\\invalid_types\\invalid_struct_declaration\\duplicate_member_name.c")],
-    [Path("chapter_18\\invalid_types\\invalid_struct_declaration\\duplicate_struct_declaration.c")],
-    [Path("chapter_18\\invalid_types\\invalid_struct_declaration\\incomplete_member.c")],
-    [Path("chapter_18\\invalid_types\\invalid_struct_declaration\\invalid_array_member.c")],
-    [Path("chapter_18\\invalid_types\\invalid_struct_declaration\\invalid_self_reference.c")],
-    [Path("chapter_18\\invalid_types\\invalid_struct_declaration\\void_member.c")],
-    [Path("chapter_18\\invalid_types\\scalar_required\\and_struct.c")],
-    [Path("chapter_18\\invalid_types\\scalar_required\\assign_null_ptr_to_struct.c")],
-    [Path("chapter_18\\invalid_types\\scalar_required\\assign_scalar_to_struct.c")],
-    [Path("chapter_18\\invalid_types\\scalar_required\\cast_struct_to_scalar.c")],
-    [Path("chapter_18\\invalid_types\\scalar_required\\cast_to_struct.c")],
-    [Path("chapter_18\\invalid_types\\scalar_required\\compare_structs.c")],
-    [Path("chapter_18\\invalid_types\\scalar_required\\not_struct.c")],
-    [Path("chapter_18\\invalid_types\\scalar_required\\pass_struct_as_scalar_param.c")],
-    [Path("chapter_18\\invalid_types\\scalar_required\\struct_as_int.c")],
-    [Path("chapter_18\\invalid_types\\scalar_required\\struct_controlling_expression.c")],
-    [Path("chapter_18\\invalid_types\\scalar_required\\subscript_struct.c")],
-    [Path("chapter_18\\invalid_types\\tag_resolution\\address_of_wrong_type.c")],
-    [Path("chapter_18\\invalid_types\\tag_resolution\\conflicting_fun_param_types.c")],
-    [Path("chapter_18\\invalid_types\\tag_resolution\\conflicting_fun_ret_types.c")],
-    [Path("chapter_18\\invalid_types\\tag_resolution\\distinct_struct_types.c")],
-    [Path("chapter_18\\invalid_types\\tag_resolution\\incomplete_shadows_complete.c")],
-    [Path("chapter_18\\invalid_types\\tag_resolution\\incomplete_shadows_complete_cast.c")],
-    [Path("chapter_18\\invalid_types\\tag_resolution\\invalid_shadow_self_reference.c")],
-    [Path("chapter_18\\invalid_types\\tag_resolution\\member_name_wrong_scope.c")],
-    [Path("chapter_18\\invalid_types\\tag_resolution\\member_name_wrong_scope_nested.c")],
-    [Path("chapter_18\\invalid_types\\tag_resolution\\mismatched_return_type.c")],
-    [Path("chapter_18\\invalid_types\\tag_resolution\\shadowed_tag_branch_mismatch.c")],
-    [Path("chapter_18\\invalid_types\\tag_resolution\\shadow_struct.c")],
-    [Path("chapter_18\\valid\\extra_credit\\libraries\\classify_unions.c")],
-    [Path("chapter_18\\valid\\extra_credit\\libraries\\classify_unions_client.c")],
-    [Path("chapter_18\\valid\\extra_credit\\libraries\\param_passing.c")],
-    [Path("chapter_18\\valid\\extra_credit\\libraries\\param_passing_client.c")],
-    [Path("chapter_18\\valid\\extra_credit\\libraries\\static_union_inits.c")],
-    [Path("chapter_18\\valid\\extra_credit\\libraries\\static_union_inits_client.c")],
-    [Path("chapter_18\\valid\\extra_credit\\libraries\\union_inits.c")],
-    [Path("chapter_18\\valid\\extra_credit\\libraries\\union_inits_client.c")],
-    [Path("chapter_18\\valid\\extra_credit\\libraries\\union_retvals.c")],
-    [Path("chapter_18\\valid\\extra_credit\\libraries\\union_retvals_client.c")],
-    [Path("chapter_18\\valid\\extra_credit\\member_access\\nested_union_access.c")],
-    [Path("chapter_18\\valid\\extra_credit\\member_access\\static_union_access.c")],
-    [Path("chapter_18\\valid\\extra_credit\\member_access\\union_init_and_member_access.c")],
-    [Path("chapter_18\\valid\\extra_credit\\member_access\\union_temp_lifetime.c")],
-    [Path("chapter_18\\valid\\extra_credit\\other_features\\bitwise_ops_struct_members.c")],
-    [Path("chapter_18\\valid\\extra_credit\\other_features\\compound_assign_struct_members.c")],
-    [Path("chapter_18\\valid\\extra_credit\\other_features\\decr_arrow_lexing.c")],
-    [Path("chapter_18\\valid\\extra_credit\\other_features\\incr_struct_members.c")],
-    [Path("chapter_18\\valid\\extra_credit\\other_features\\label_tag_member_namespace.c")],
-    [Path("chapter_18\\valid\\extra_credit\\other_features\\struct_decl_in_switch_statement.c")],
-    [Path("chapter_18\\valid\\extra_credit\\semantic_analysis\\cast_union_to_void.c")],
-    [Path("chapter_18\\valid\\extra_credit\\semantic_analysis\\decl_shadows_decl.c")],
-    [Path("chapter_18\\valid\\extra_credit\\semantic_analysis\\incomplete_union_types.c")],
-    [Path("chapter_18\\valid\\extra_credit\\semantic_analysis\\redeclare_union.c")],
-    [Path("chapter_18\\valid\\extra_credit\\semantic_analysis\\struct_shadows_union.c")],
-    [Path("chapter_18\\valid\\extra_credit\\semantic_analysis\\union_members_same_type.c")],
-    [Path("chapter_18\\valid\\extra_credit\\semantic_analysis\\union_namespace.c")],
-    [Path("chapter_18\\valid\\extra_credit\\semantic_analysis\\union_self_pointer.c")],
-    [Path("chapter_18\\valid\\extra_credit\\semantic_analysis\\union_shadows_struct.c")],
-    [Path("chapter_18\\valid\\extra_credit\\size_and_offset\\compare_union_pointers.c")],
-    [Path("chapter_18\\valid\\extra_credit\\size_and_offset\\union_sizes.c")],
-    [Path("chapter_18\\valid\\extra_credit\\union_copy\\assign_to_union.c")],
-    [Path("chapter_18\\valid\\extra_credit\\union_copy\\copy_non_scalar_members.c")],
-    [Path("chapter_18\\valid\\extra_credit\\union_copy\\copy_thru_pointer.c")],
-    [Path("chapter_18\\valid\\extra_credit\\union_copy\\unions_in_conditionals.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\libraries\\array_of_structs.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\libraries\\array_of_structs_client.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\libraries\\global_struct.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\libraries\\global_struct_client.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\libraries\\opaque_struct.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\libraries\\opaque_struct_client.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\libraries\\param_struct_pointer.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\libraries\\param_struct_pointer_client.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\libraries\\return_struct_pointer.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\libraries\\return_struct_pointer_client.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\libraries\\initializers\\auto_struct_initializers.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\libraries\\initializers\\auto_struct_initializers_client.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\libraries\\initializers\\nested_auto_struct_initializers.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\libraries\\initializers\\nested_auto_struct_initializers_client.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\libraries\\initializers\\nested_static_struct_initializers.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\libraries\\initializers\\nested_static_struct_initializers_client.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\libraries\\initializers\\static_struct_initializers.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\libraries\\initializers\\static_struct_initializers_client.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\parse_and_lex\\postfix_precedence.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\parse_and_lex\\space_around_struct_member.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\parse_and_lex\\struct_member_looks_like_const.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\parse_and_lex\\trailing_comma.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\scalar_member_access\\arrow.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\scalar_member_access\\dot.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\scalar_member_access\\linked_list.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\scalar_member_access\\nested_struct.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\scalar_member_access\\static_structs.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\semantic_analysis\\cast_struct_to_void.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\semantic_analysis\\incomplete_structs.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\semantic_analysis\\namespaces.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\semantic_analysis\\resolve_tags.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\size_and_offset_calculations\\member_comparisons.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\size_and_offset_calculations\\member_offsets.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\size_and_offset_calculations\\sizeof_exps.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\size_and_offset_calculations\\sizeof_type.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\smoke_tests\\simple.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\smoke_tests\\static_vs_auto.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\struct_copy\\copy_struct.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\struct_copy\\copy_struct_through_pointer.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\struct_copy\\copy_struct_with_arrow_operator.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\struct_copy\\copy_struct_with_dot_operator.c")],
-    [Path("chapter_18\\valid\\no_structure_parameters\\struct_copy\\stack_clobber.c")],
-    [Path("chapter_18\\valid\\parameters\\incomplete_param_type.c")],
-    [Path("chapter_18\\valid\\parameters\\pass_args_on_page_boundary.c")],
-    [Path("chapter_18\\valid\\parameters\\simple.c")],
-    [Path("chapter_18\\valid\\parameters\\stack_clobber.c")],
-    [Path("chapter_18\\valid\\parameters\\libraries\\classify_params.c")],
-    [Path("chapter_18\\valid\\parameters\\libraries\\classify_params_client.c")],
-    [Path("chapter_18\\valid\\parameters\\libraries\\modify_param.c")],
-    [Path("chapter_18\\valid\\parameters\\libraries\\modify_param_client.c")],
-    [Path("chapter_18\\valid\\parameters\\libraries\\param_calling_conventions.c")],
-    [Path("chapter_18\\valid\\parameters\\libraries\\param_calling_conventions_client.c")],
-    [Path("chapter_18\\valid\\parameters\\libraries\\pass_struct.c")],
-    [Path("chapter_18\\valid\\parameters\\libraries\\pass_struct_client.c")],
-    [Path("chapter_18\\valid\\parameters\\libraries\\struct_sizes.c")],
-    [Path("chapter_18\\valid\\parameters\\libraries\\struct_sizes_client.c")],
-    [Path("chapter_18\\valid\\params_and_returns\\ignore_retval.c")],
-    [Path("chapter_18\\valid\\params_and_returns\\return_big_struct_on_page_boundary.c")],
-    [Path("chapter_18\\valid\\params_and_returns\\return_incomplete_type.c")],
-    [Path("chapter_18\\valid\\params_and_returns\\return_pointer_in_rax.c")],
-    [Path("chapter_18\\valid\\params_and_returns\\return_space_overlap.c")],
-    [Path("chapter_18\\valid\\params_and_returns\\return_struct_on_page_boundary.c")],
-    [Path("chapter_18\\valid\\params_and_returns\\simple.c")],
-    [Path("chapter_18\\valid\\params_and_returns\\stack_clobber.c")],
-    [Path("chapter_18\\valid\\params_and_returns\\temporary_lifetime.c")],
-    [Path("chapter_18\\valid\\params_and_returns\\libraries\\access_retval_members.c")],
-    [Path("chapter_18\\valid\\params_and_returns\\libraries\\access_retval_members_client.c")],
-    [Path("chapter_18\\valid\\params_and_returns\\libraries\\missing_retval.c")],
-    [Path("chapter_18\\valid\\params_and_returns\\libraries\\missing_retval_client.c")],
-    [Path("chapter_18\\valid\\params_and_returns\\libraries\\return_calling_conventions.c")],
-    [Path("chapter_18\\valid\\params_and_returns\\libraries\\return_calling_conventions_client.c")],
-    [Path("chapter_18\\valid\\params_and_returns\\libraries\\retval_struct_sizes.c")],
-    [Path("chapter_18\\valid\\params_and_returns\\libraries\\retval_struct_sizes_client.c")],
-    [Path("chapter_19\\constant_folding\\all_types\\fold_cast_from_double.c")],
-    [Path("chapter_19\\constant_folding\\all_types\\fold_cast_to_double.c")],
-    [Path("chapter_19\\constant_folding\\all_types\\fold_conditional_jump.c")],
-    [Path("chapter_19\\constant_folding\\all_types\\fold_double.c")],
-    [Path("chapter_19\\constant_folding\\all_types\\fold_double_cast_exception.c")],
-    [Path("chapter_19\\constant_folding\\all_types\\fold_extensions_and_copies.c")],
-    [Path("chapter_19\\constant_folding\\all_types\\fold_long.c")],
-    [Path("chapter_19\\constant_folding\\all_types\\fold_truncate.c")],
-    [Path("chapter_19\\constant_folding\\all_types\\fold_uint.c")],
-    [Path("chapter_19\\constant_folding\\all_types\\fold_ulong.c")],
-    [Path("chapter_19\\constant_folding\\all_types\\negative_zero.c")],
-    [Path("chapter_19\\constant_folding\\all_types\\extra_credit\\cast_nan_not_executed.c")],
-    [Path("chapter_19\\constant_folding\\all_types\\extra_credit\\fold_bitwise_long.c")],
-    [Path("chapter_19\\constant_folding\\all_types\\extra_credit\\fold_bitwise_unsigned.c")],
-    [Path("chapter_19\\constant_folding\\all_types\\extra_credit\\fold_nan.c")],
-    [Path("chapter_19\\constant_folding\\all_types\\extra_credit\\return_nan.c")],
-    [Path("chapter_19\\constant_folding\\int_only\\fold_binary.c")],
-    [Path("chapter_19\\constant_folding\\int_only\\fold_conditional_jump.c")],
-    [Path("chapter_19\\constant_folding\\int_only\\fold_control_flow.c")],
-    [Path("chapter_19\\constant_folding\\int_only\\fold_exception.c")],
-    [Path("chapter_19\\constant_folding\\int_only\\fold_unary.c")],
-    [Path("chapter_19\\constant_folding\\int_only\\extra_credit\\fold_bitwise.c")],
-    [Path("chapter_19\\copy_propagation\\all_types\\alias_analysis.c")],
-    [Path("chapter_19\\copy_propagation\\all_types\\char_type_conversion.c")],
-    [Path("chapter_19\\copy_propagation\\all_types\\copy_struct.c")],
-    [Path("chapter_19\\copy_propagation\\all_types\\funcall_kills_aliased.c")],
-    [Path("chapter_19\\copy_propagation\\all_types\\pointer_arithmetic.c")],
-    [Path("chapter_19\\copy_propagation\\all_types\\propagate_all_types.c")],
-    [Path("chapter_19\\copy_propagation\\all_types\\propagate_into_type_conversions.c")],
-    [Path("chapter_19\\copy_propagation\\all_types\\propagate_null_pointer.c")],
-    [Path("chapter_19\\copy_propagation\\all_types\\redundant_double_copies.c")],
-    [Path("chapter_19\\copy_propagation\\all_types\\redundant_struct_copies.c")],
-    [Path("chapter_19\\copy_propagation\\all_types\\store_doesnt_kill.c")],
-    [Path("chapter_19\\copy_propagation\\all_types\\dont_propagate\\copy_to_offset.c")],
-    [Path("chapter_19\\copy_propagation\\all_types\\dont_propagate\\dont_propagate_addr_of.c")],
-    [Path("chapter_19\\copy_propagation\\all_types\\dont_propagate\\static_are_aliased.c")],
-    [Path("chapter_19\\copy_propagation\\all_types\\dont_propagate\\store_kills_aliased.c")],
-    [Path("chapter_19\\copy_propagation\\all_types\\dont_propagate\\type_conversion.c")],
-    [Path("chapter_19\\copy_propagation\\all_types\\dont_propagate\\zero_neg_zero_different.c")],
-    [Path("chapter_19\\copy_propagation\\all_types\\extra_credit\\copy_union.c")],
-    [Path("chapter_19\\copy_propagation\\all_types\\extra_credit\\pointer_compound_assignment.c")],
-    [Path("chapter_19\\copy_propagation\\all_types\\extra_credit\\pointer_incr.c")],
-    [Path("chapter_19\\copy_propagation\\all_types\\extra_credit\\redundant_nan_copy.c")],
-    [Path("chapter_19\\copy_propagation\\all_types\\extra_credit\\redundant_union_copy.c")],
-    [Path("chapter_19\\copy_propagation\\all_types\\extra_credit\\dont_propagate\\update_union_member.c")],
-    [Path("chapter_19\\copy_propagation\\all_types\\extra_credit\\dont_propagate\\update_union_member_2.c")],
-    [Path("chapter_19\\copy_propagation\\int_only\\constant_propagation.c")],
-    [Path("chapter_19\\copy_propagation\\int_only\\different_paths_same_copy.c")],
-    [Path("chapter_19\\copy_propagation\\int_only\\different_source_values_same_copy.c")],
-    [Path("chapter_19\\copy_propagation\\int_only\\fig_19_8.c")],
-    [Path("chapter_19\\copy_propagation\\int_only\\init_all_copies.c")],
-    [Path("chapter_19\\copy_propagation\\int_only\\killed_then_redefined.c")],
-    [Path("chapter_19\\copy_propagation\\int_only\\kill_and_add_copies.c")],
-    [Path("chapter_19\\copy_propagation\\int_only\\multi_path_no_kill.c")],
-    [Path("chapter_19\\copy_propagation\\int_only\\nested_loops.c")],
-    [Path("chapter_19\\copy_propagation\\int_only\\propagate_into_complex_expressions.c")],
-    [Path("chapter_19\\copy_propagation\\int_only\\propagate_params.c")],
-    [Path("chapter_19\\copy_propagation\\int_only\\propagate_static.c")],
-    [Path("chapter_19\\copy_propagation\\int_only\\propagate_static_var.c")],
-    [Path("chapter_19\\copy_propagation\\int_only\\propagate_var.c")],
-    [Path("chapter_19\\copy_propagation\\int_only\\redundant_copies.c")],
-    [Path("chapter_19\\copy_propagation\\int_only\\dont_propagate\\add_all_blocks_to_worklist.c")],
-    [Path("chapter_19\\copy_propagation\\int_only\\dont_propagate\\dest_killed.c")],
-    [Path("chapter_19\\copy_propagation\\int_only\\dont_propagate\\listing_19_14.c")],
-    [Path("chapter_19\\copy_propagation\\int_only\\dont_propagate\\multi_values.c")],
-    [Path("chapter_19\\copy_propagation\\int_only\\dont_propagate\\no_copies_reach_entry.c")],
-    [Path("chapter_19\\copy_propagation\\int_only\\dont_propagate\\one_reaching_copy.c")],
-    [Path("chapter_19\\copy_propagation\\int_only\\dont_propagate\\source_killed.c")],
-    [Path("chapter_19\\copy_propagation\\int_only\\dont_propagate\\source_killed_on_one_path.c")],
-    [Path("chapter_19\\copy_propagation\\int_only\\dont_propagate\\static_dst_killed.c")],
-    [Path("chapter_19\\copy_propagation\\int_only\\dont_propagate\\static_src_killed.c")],
-    [Path("chapter_19\\copy_propagation\\int_only\\extra_credit\\goto_define.c")],
-    [Path("chapter_19\\copy_propagation\\int_only\\extra_credit\\prefix_result.c")],
-    [Path("chapter_19\\copy_propagation\\int_only\\extra_credit\\propagate_from_default.c")],
-    [Path("chapter_19\\copy_propagation\\int_only\\extra_credit\\propagate_into_case.c")],
-    [Path("chapter_19\\copy_propagation\\int_only\\extra_credit\\dont_propagate\\decr_kills_dest.c")],
-    [Path("chapter_19\\copy_propagation\\int_only\\extra_credit\\dont_propagate\\switch_fallthrough.c")],
-    [Path("chapter_19\\dead_store_elimination\\all_types\\aliased_dead_at_exit.c")],
-    [Path("chapter_19\\dead_store_elimination\\all_types\\copy_to_dead_struct.c")],
-    [Path("chapter_19\\dead_store_elimination\\all_types\\delete_dead_pt_ii_instructions.c")],
-    [Path("chapter_19\\dead_store_elimination\\all_types\\getaddr_doesnt_gen.c")],
-    [Path("chapter_19\\dead_store_elimination\\all_types\\dont_elim\\copytooffset_doesnt_kill.c")],
-    [Path("chapter_19\\dead_store_elimination\\all_types\\dont_elim\\funcall_generates_aliased.c")],
-    [Path("chapter_19\\dead_store_elimination\\all_types\\dont_elim\\load_generates_aliased.c")],
-    [Path("chapter_19\\dead_store_elimination\\all_types\\dont_elim\\never_kill_store.c")],
-    [Path("chapter_19\\dead_store_elimination\\all_types\\dont_elim\\recognize_all_uses.c")],
-    [Path("chapter_19\\dead_store_elimination\\all_types\\dont_elim\\use_and_update.c")],
-    [Path("chapter_19\\dead_store_elimination\\all_types\\extra_credit\\compound_assign_to_dead_struct_member.c")],
-    [Path("chapter_19\\dead_store_elimination\\all_types\\extra_credit\\copy_to_dead_union.c")],
-    [Path("chapter_19\\dead_store_elimination\\all_types\\extra_credit\\decr_struct_member.c")],
-    [Path("chapter_19\\dead_store_elimination\\all_types\\extra_credit\\dont_elim\\copy_generates_union.c")],
-    [Path("chapter_19\\dead_store_elimination\\all_types\\extra_credit\\dont_elim\\incr_through_pointer.c")],
-    [Path("chapter_19\\dead_store_elimination\\all_types\\extra_credit\\dont_elim\\type_punning.c")],
-    [Path("chapter_19\\dead_store_elimination\\int_only\\dead_store_static_var.c")],
-    [Path("chapter_19\\dead_store_elimination\\int_only\\delete_arithmetic_ops.c")],
-    [Path("chapter_19\\dead_store_elimination\\int_only\\elim_second_copy.c")],
-    [Path("chapter_19\\dead_store_elimination\\int_only\\fig_19_11.c")],
-    [Path("chapter_19\\dead_store_elimination\\int_only\\initialize_blocks_with_empty_set.c")],
-    [Path("chapter_19\\dead_store_elimination\\int_only\\loop_dead_store.c")],
-    [Path("chapter_19\\dead_store_elimination\\int_only\\simple.c")],
-    [Path("chapter_19\\dead_store_elimination\\int_only\\static_not_always_live.c")],
-    [Path("chapter_19\\dead_store_elimination\\int_only\\dont_elim\\add_all_to_worklist.c")],
-    [Path("chapter_19\\dead_store_elimination\\int_only\\dont_elim\\dont_remove_funcall.c")],
-    [Path("chapter_19\\dead_store_elimination\\int_only\\dont_elim\\loop.c")],
-    [Path("chapter_19\\dead_store_elimination\\int_only\\dont_elim\\nested_loops.c")],
-    [Path("chapter_19\\dead_store_elimination\\int_only\\dont_elim\\recognize_all_uses.c")],
-    [Path("chapter_19\\dead_store_elimination\\int_only\\dont_elim\\self_copy.c")],
-    [Path("chapter_19\\dead_store_elimination\\int_only\\dont_elim\\static_vars_at_exit.c")],
-    [Path("chapter_19\\dead_store_elimination\\int_only\\dont_elim\\static_vars_fun.c")],
-    [Path("chapter_19\\dead_store_elimination\\int_only\\dont_elim\\used_one_path.c")],
-    [Path("chapter_19\\dead_store_elimination\\int_only\\extra_credit\\dead_compound_assignment.c")],
-    [Path("chapter_19\\dead_store_elimination\\int_only\\extra_credit\\dead_incr_decr.c")],
-    [Path("chapter_19\\dead_store_elimination\\int_only\\extra_credit\\dont_elim\\incr_and_dead_store.c")],
-    [Path("chapter_19\\helper_libs\\exit.c")],
-    [Path("chapter_19\\unreachable_code_elimination\\and_clause.c")],
-    [Path("chapter_19\\unreachable_code_elimination\\constant_if_else.c")],
-    [Path("chapter_19\\unreachable_code_elimination\\dead_after_if_else.c")],
-    [Path("chapter_19\\unreachable_code_elimination\\dead_after_return.c")],
-    [Path("chapter_19\\unreachable_code_elimination\\dead_blocks_with_predecessors.c")],
-    [Path("chapter_19\\unreachable_code_elimination\\dead_branch_inside_loop.c")],
-    [Path("chapter_19\\unreachable_code_elimination\\dead_for_loop.c")],
-    [Path("chapter_19\\unreachable_code_elimination\\empty.c")],
-    [Path("chapter_19\\unreachable_code_elimination\\empty_block.c")],
-    [Path("chapter_19\\unreachable_code_elimination\\infinite_loop.c")],
-    [Path("chapter_19\\unreachable_code_elimination\\keep_final_jump.c")],
-    [Path("chapter_19\\unreachable_code_elimination\\or_clause.c")],
-    [Path("chapter_19\\unreachable_code_elimination\\remove_conditional_jumps.c")],
-    [Path("chapter_19\\unreachable_code_elimination\\remove_jump_keep_label.c")],
-    [Path("chapter_19\\unreachable_code_elimination\\remove_useless_starting_label.c")],
-    [Path("chapter_19\\unreachable_code_elimination\\extra_credit\\dead_before_first_switch_case.c")],
-    [Path("chapter_19\\unreachable_code_elimination\\extra_credit\\dead_in_switch_body.c")],
-    [Path("chapter_19\\unreachable_code_elimination\\extra_credit\\goto_skips_over_code.c")],
-    [Path("chapter_19\\unreachable_code_elimination\\extra_credit\\remove_unused_label.c")],
-    [Path("chapter_19\\unreachable_code_elimination\\extra_credit\\unreachable_switch_body.c")],
-    [Path("chapter_19\\whole_pipeline\\all_types\\alias_analysis_change.c")],
-    [Path("chapter_19\\whole_pipeline\\all_types\\fold_cast_from_double.c")],
-    [Path("chapter_19\\whole_pipeline\\all_types\\fold_cast_to_double.c")],
-    [Path("chapter_19\\whole_pipeline\\all_types\\fold_char_condition.c")],
-    [Path("chapter_19\\whole_pipeline\\all_types\\fold_extension_and_truncation.c")],
-    [Path("chapter_19\\whole_pipeline\\all_types\\fold_infinity.c")],
-    [Path("chapter_19\\whole_pipeline\\all_types\\fold_negative_values.c")],
-    [Path("chapter_19\\whole_pipeline\\all_types\\fold_negative_zero.c")],
-    [Path("chapter_19\\whole_pipeline\\all_types\\integer_promotions.c")],
-    [Path("chapter_19\\whole_pipeline\\all_types\\listing_19_5_more_types.c")],
-    [Path("chapter_19\\whole_pipeline\\all_types\\propagate_into_copyfromoffset.c")],
-    [Path("chapter_19\\whole_pipeline\\all_types\\propagate_into_copytooffset.c")],
-    [Path("chapter_19\\whole_pipeline\\all_types\\propagate_into_load.c")],
-    [Path("chapter_19\\whole_pipeline\\all_types\\propagate_into_store.c")],
-    [Path("chapter_19\\whole_pipeline\\all_types\\signed_unsigned_conversion.c")],
-    [Path("chapter_19\\whole_pipeline\\all_types\\extra_credit\\eval_nan_condition.c")],
-    [Path("chapter_19\\whole_pipeline\\all_types\\extra_credit\\fold_compound_assign_all_types.c")],
-    [Path("chapter_19\\whole_pipeline\\all_types\\extra_credit\\fold_compound_bitwise_assign_all_types.c")],
-    [Path("chapter_19\\whole_pipeline\\all_types\\extra_credit\\fold_incr_decr_chars.c")],
-    [Path("chapter_19\\whole_pipeline\\all_types\\extra_credit\\fold_incr_decr_doubles.c")],
-    [Path("chapter_19\\whole_pipeline\\all_types\\extra_credit\\fold_incr_decr_unsigned.c")],
-    [Path("chapter_19\\whole_pipeline\\all_types\\extra_credit\\fold_negative_long_bitshift.c")],
-    [Path("chapter_19\\whole_pipeline\\all_types\\extra_credit\\nan.c")],
-    [Path("chapter_19\\whole_pipeline\\int_only\\dead_condition.c")],
-    [Path("chapter_19\\whole_pipeline\\int_only\\elim_and_copy_prop.c")],
-    [Path("chapter_19\\whole_pipeline\\int_only\\int_min.c")],
-    [Path("chapter_19\\whole_pipeline\\int_only\\listing_19_5.c")],
-    [Path("chapter_19\\whole_pipeline\\int_only\\remainder_test.c")],
-    [Path("chapter_19\\whole_pipeline\\int_only\\extra_credit\\compound_assign_exceptions.c")],
-    [Path("chapter_19\\whole_pipeline\\int_only\\extra_credit\\evaluate_switch.c")],
-    [Path("chapter_19\\whole_pipeline\\int_only\\extra_credit\\fold_bitwise_compound_assignment.c")],
-    [Path("chapter_19\\whole_pipeline\\int_only\\extra_credit\\fold_compound_assignment.c")],
-    [Path("chapter_19\\whole_pipeline\\int_only\\extra_credit\\fold_incr_and_decr.c")],
-    [Path("chapter_19\\whole_pipeline\\int_only\\extra_credit\\fold_negative_bitshift.c")],
-    [Path("chapter_20\\all_types\\no_coalescing\\aliasing_optimized_away.c")],
-    [Path("chapter_20\\all_types\\no_coalescing\\dbl_bin_uses_operands.c")],
-    [Path("chapter_20\\all_types\\no_coalescing\\dbl_funcall_generates_args.c")],
-    [Path("chapter_20\\all_types\\no_coalescing\\dbl_fun_call.c")],
-    [Path("chapter_20\\all_types\\no_coalescing\\dbl_trivially_colorable.c")],
-    [Path("chapter_20\\all_types\\no_coalescing\\div_interference.c")],
-    [Path("chapter_20\\all_types\\no_coalescing\\div_uses_ax.c")],
-    [Path("chapter_20\\all_types\\no_coalescing\\force_spill_doubles.c")],
-    [Path("chapter_20\\all_types\\no_coalescing\\force_spill_mixed_ints.c")],
-    [Path("chapter_20\\all_types\\no_coalescing\\fourteen_pseudos_interfere.c")],
-    [Path("chapter_20\\all_types\\no_coalescing\\gp_xmm_mixed.c")],
-    [Path("chapter_20\\all_types\\no_coalescing\\indexed_operand_reads_regs.c")],
-    [Path("chapter_20\\all_types\\no_coalescing\\mixed_type_arg_registers.c")],
-    [Path("chapter_20\\all_types\\no_coalescing\\mixed_type_funcall_generates_args.c")],
-    [Path("chapter_20\\all_types\\no_coalescing\\mixed_type_stack_alignment.c")],
-    [Path("chapter_20\\all_types\\no_coalescing\\one_aliased_var.c")],
-    [Path("chapter_20\\all_types\\no_coalescing\\ptr_rax_live_at_exit.c")],
-    [Path("chapter_20\\all_types\\no_coalescing\\return_all_int_struct.c")],
-    [Path("chapter_20\\all_types\\no_coalescing\\return_double.c")],
-    [Path("chapter_20\\all_types\\no_coalescing\\return_double_struct.c")],
-    [Path("chapter_20\\all_types\\no_coalescing\\store_pointer_in_register.c")],
-    [Path("chapter_20\\all_types\\no_coalescing\\track_dbl_arg_registers.c")],
-    [Path("chapter_20\\all_types\\no_coalescing\\type_conversion_interference.c")],
-    [Path("chapter_20\\all_types\\no_coalescing\\xmm0_live_at_exit.c")],
-    [Path("chapter_20\\all_types\\with_coalescing\\briggs_coalesce_long.c")],
-    [Path("chapter_20\\all_types\\with_coalescing\\briggs_coalesce_xmm.c")],
-    [Path("chapter_20\\all_types\\with_coalescing\\briggs_xmm_k_value.c")],
-    [Path("chapter_20\\all_types\\with_coalescing\\coalesce_char.c")],
-    [Path("chapter_20\\all_types\\with_coalescing\\dont_coalesce_movzx.c")],
-    [Path("chapter_20\\all_types\\with_coalescing\\george_coalesce_xmm.c")],
-    [Path("chapter_20\\all_types\\with_coalescing\\george_off_by_one_xmm.c")],
-    [Path("chapter_20\\all_types\\with_coalescing\\george_xmm_k_value.c")],
-    [Path("chapter_20\\helper_libs\\coalesce_prevents_spill_lib.c")],
-    [Path("chapter_20\\helper_libs\\funcall_generates_args_lib.c")],
-    [Path("chapter_20\\helper_libs\\mixed_type_arg_registers_lib.c")],
-    [Path("chapter_20\\helper_libs\\mixed_type_funcall_generates_args_lib.c")],
-    [Path("chapter_20\\helper_libs\\return_all_int_struct_lib.c")],
-    [Path("chapter_20\\helper_libs\\return_double_lib.c")],
-    [Path("chapter_20\\helper_libs\\return_double_struct_lib.c")],
-    [Path("chapter_20\\helper_libs\\target_shim.c")],
-    [Path("chapter_20\\helper_libs\\track_arg_registers_lib.c")],
-    [Path("chapter_20\\helper_libs\\track_dbl_arg_registers_lib.c")],
-    [Path("chapter_20\\helper_libs\\util.c")],
-    [Path("chapter_20\\int_only\\no_coalescing\\bin_uses_operands.c")],
-    [Path("chapter_20\\int_only\\no_coalescing\\callee_saved_stack_alignment.c")],
-    [Path("chapter_20\\int_only\\no_coalescing\\cdq_interference.c")],
-    [Path("chapter_20\\int_only\\no_coalescing\\cmp_generates_operands.c")],
-    [Path("chapter_20\\int_only\\no_coalescing\\cmp_no_updates.c")],
-    [Path("chapter_20\\int_only\\no_coalescing\\copy_no_interference.c")],
-    [Path("chapter_20\\int_only\\no_coalescing\\division_uses_ax.c")],
-    [Path("chapter_20\\int_only\\no_coalescing\\eax_live_at_exit.c")],
-    [Path("chapter_20\\int_only\\no_coalescing\\force_spill.c")],
-    [Path("chapter_20\\int_only\\no_coalescing\\funcall_generates_args.c")],
-    [Path("chapter_20\\int_only\\no_coalescing\\idiv_interference.c")],
-    [Path("chapter_20\\int_only\\no_coalescing\\loop.c")],
-    [Path("chapter_20\\int_only\\no_coalescing\\many_pseudos_fewer_conflicts.c")],
-    [Path("chapter_20\\int_only\\no_coalescing\\optimistic_coloring.c")],
-    [Path("chapter_20\\int_only\\no_coalescing\\preserve_across_fun_call.c")],
-    [Path("chapter_20\\int_only\\no_coalescing\\rewrite_regression_test.c")],
-    [Path("chapter_20\\int_only\\no_coalescing\\same_instr_interference.c")],
-    [Path("chapter_20\\int_only\\no_coalescing\\same_instr_no_interference.c")],
-    [Path("chapter_20\\int_only\\no_coalescing\\test_spill_metric.c")],
-    [Path("chapter_20\\int_only\\no_coalescing\\test_spill_metric_2.c")],
-    [Path("chapter_20\\int_only\\no_coalescing\\track_arg_registers.c")],
-    [Path("chapter_20\\int_only\\no_coalescing\\trivially_colorable.c")],
-    [Path("chapter_20\\int_only\\no_coalescing\\unary_interference.c")],
-    [Path("chapter_20\\int_only\\no_coalescing\\unary_uses_operand.c")],
-    [Path("chapter_20\\int_only\\no_coalescing\\use_all_hardregs.c")],
-    [Path("chapter_20\\int_only\\with_coalescing\\briggs_coalesce.c")],
-    [Path("chapter_20\\int_only\\with_coalescing\\briggs_coalesce_hardreg.c")],
-    [Path("chapter_20\\int_only\\with_coalescing\\briggs_dont_coalesce.c")],
-    [Path("chapter_20\\int_only\\with_coalescing\\coalesce_prevents_spill.c")],
-    [Path("chapter_20\\int_only\\with_coalescing\\george_coalesce.c")],
-    [Path("chapter_20\\int_only\\with_coalescing\\george_dont_coalesce.c")],
-    [Path("chapter_20\\int_only\\with_coalescing\\george_dont_coalesce_2.c")],
-    [Path("chapter_20\\int_only\\with_coalescing\\george_off_by_one.c")],
-    [Path("chapter_20\\int_only\\with_coalescing\\no_george_test_for_pseudos.c")],
-]
+import discovery
 
-def get_test_groups(path: Path) -> list[list[str]]:
-    return [group for group in test_groups if Path(group[0]).is_relative_to(path)]
+def get_test_groups(path: Path) -> list[list[Path]]:
+    return [group.build_paths() for group in discovery.get_index().groups_under(Path(path))]
 
+# Matches a directory in the test path that starts with the given type, e.g. "invalid" matches "chapter_1/invalid_lex/at_sign.c"
 def is_test_case_of_type(path: Path, ty: str) -> bool:
-    return f"\\{ty}" in str(path) 
+    return any(part.startswith(ty) for part in Path(path).parts[:-1])
+
+def is_invalid_test(path: Path) -> bool:
+    return is_test_case_of_type(path, "invalid")
+
+# Chapters 19 and 20 group their tests into optimization suites instead of valid and invalid directories, and every test
+# in them is a valid program
+def is_valid_test(path: Path) -> bool:
+    if is_test_case_of_type(path, "valid"):
+        return True
+    return Path(path).parts[0] in ("chapter_19", "chapter_20") and not is_invalid_test(path)
+
+if sys.platform == "win32":
+    EXECUTABLE_SUFFIX = ".exe"
+else:
+    EXECUTABLE_SUFFIX = ""
+
+def compiler_path() -> Path:
+    return Path("..", f"occm{EXECUTABLE_SUFFIX}").resolve()
+
+ASSEMBLY_FILE_MARKER = "# occm-file: "
+
+# Compiles the group to assembly without touching the disk, returning the assembly of each C file keyed by its path
+def compile_to_assembly_in_memory(paths: list[Path], compiler_flags: list[str] | None = None) -> dict[Path, str] | None:
+    if compiler_flags is None:
+        compiler_flags = []
+    compile_result = subprocess.run(
+            [compiler_path(), "-assembly", "-stdout"] + compiler_flags + paths,
+            capture_output=True
+        )
+    if compile_result.returncode != 0:
+        return None
+
+    assembly_lines = {}
+    current_lines = None
+    for line in compile_result.stdout.decode().splitlines(keepends=True):
+        if line.startswith(ASSEMBLY_FILE_MARKER):
+            current_lines = assembly_lines.setdefault(Path(line.removeprefix(ASSEMBLY_FILE_MARKER).rstrip()), [])
+        elif current_lines is not None:
+            current_lines.append(line)
+    return {path: "".join(lines) for path, lines in assembly_lines.items()}
+
+build_command = ["odin", "build", ".", f"-out:occm{EXECUTABLE_SUFFIX}"]
+build_stamp_path = Path("..", ".occm_build_stamp")
+build_log_path = Path("..", "build.log")
+
+# The fingerprint covers every compiler source file and the build command, so changing either forces a rebuild
+def compiler_fingerprint() -> str:
+    hasher = hashlib.sha256()
+    hasher.update(" ".join(build_command).encode())
+    for source_path in sorted(Path("..").glob("*.odin")):
+        hasher.update(source_path.name.encode())
+        hasher.update(b"\0")
+        hasher.update(source_path.read_bytes())
+    return hasher.hexdigest()
 
 def rebuild_compiler():
-    os.chdir("..")
+    fingerprint = compiler_fingerprint()
+    if compiler_path().exists() and build_stamp_path.exists() and build_stamp_path.read_text() == fingerprint:
+        print("Compiler is up to date, skipping build")
+        return
+
+    start = time.perf_counter()
     build_result = subprocess.run(
-            ["odin", "build", "."],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL
-        )               
+            build_command,
+            cwd="..",
+            capture_output=True
+        )
+    elapsed = time.perf_counter() - start
+    with open(build_log_path, "wb") as f:
+        f.write(build_result.stdout)
+        f.write(build_result.stderr)
+
     if build_result.returncode != 0:
-        print("ABORT: Compiler build failed")
+        print(f"ABORT: Compiler build failed (see {build_log_path.resolve()})")
         sys.exit(1)
-    os.chdir("test")
+    build_stamp_path.write_text(fingerprint)
+    print(f"Built compiler in {elapsed:.2f}s")
@@ -0,0 +1,199 @@
+from pathlib import Path
+import json
+import os
+import sys
+
+# Discovers test groups by scanning the test tree once and caching the result in a manifest.
+# All paths are relative to the test directory, so they can be used directly from the harness' working directory.
+
+TEST_DIR = Path(__file__).resolve().parent
+MANIFEST_PATH = TEST_DIR / ".test_index.json"
+MANIFEST_VERSION = 4
+
+if sys.platform == "darwin":
+    HOST_ASM_SUFFIX = "_osx"
+else:
+    HOST_ASM_SUFFIX = "_linux"
+
+class TestGroup:
+    def __init__(self, paths: list[Path], helper_libs: list[Path]):
+        self.paths = paths
+        self.helper_libs = helper_libs
+
+        parts = paths[0].parts
+        self.chapter = int(parts[0].removeprefix("chapter_"))
+        self.category = parts[1]
+        # Chapters 19 and 20 group their tests into optimization suites, e.g. constant_folding or with_coalescing
+        self.suite = None
+        if self.chapter == 19:
+            self.suite = parts[1]
+        elif self.chapter == 20 and len(parts) > 3:
+            self.suite = parts[2]
+
+    # Every file that has to be passed to the compiler to build this group
+    def build_paths(self) -> list[Path]:
+        return self.paths + self.helper_libs
+
+class TestIndex:
+    def __init__(self, groups: list[TestGroup]):
+        self.groups = groups
+        self.by_chapter: dict[int, list[TestGroup]] = {}
+        self.by_category: dict[tuple[int, str], list[TestGroup]] = {}
+        self.by_suite: dict[str, list[TestGroup]] = {}
+        for group in groups:
+            self.by_chapter.setdefault(group.chapter, []).append(group)
+            self.by_category.setdefault((group.chapter, group.category), []).append(group)
+            if group.suite is not None:
+                self.by_suite.setdefault(group.suite, []).append(group)
+
+    def chapter(self, chapter: int) -> list[TestGroup]:
+        return self.by_chapter.get(chapter, [])
+
+    def category(self, chapter: int, category: str) -> list[TestGroup]:
+        return self.by_category.get((chapter, category), [])
+
+    def suite(self, suite: str) -> list[TestGroup]:
+        return self.by_suite.get(suite, [])
+
+    def groups_under(self, path: Path) -> list[TestGroup]:
+        parts = path.parts
+        if len(parts) == 0 or not parts[0].startswith("chapter_"):
+            return [group for group in self.groups if group.paths[0].is_relative_to(path)]
+        chapter = int(parts[0].removeprefix("chapter_"))
+        if len(parts) == 1:
+            return self.chapter(chapter)
+        elif len(parts) == 2:
+            return self.category(chapter, parts[1])
+        return [group for group in self.chapter(chapter) if group.paths[0].is_relative_to(path)]
+
+# Tests whose helper library is not named after the test or lives in another chapter, keyed by the test's path without
+# its extension. HOST_ASM_SUFFIX is filled in for assembly helpers.
+SHARED_HELPER_LIBS = {
+    "chapter_19/constant_folding/all_types/extra_credit/fold_nan": "chapter_13/helper_libs/nan.c",
+    "chapter_19/constant_folding/all_types/extra_credit/return_nan": "chapter_13/helper_libs/nan.c",
+    "chapter_19/copy_propagation/all_types/extra_credit/redundant_nan_copy": "chapter_13/helper_libs/nan.c",
+    "chapter_19/dead_store_elimination/int_only/static_not_always_live": "chapter_19/helper_libs/exit.c",
+    "chapter_19/unreachable_code_elimination/infinite_loop": "chapter_19/helper_libs/exit.c",
+    "chapter_20/all_types/no_coalescing/dbl_funcall_generates_args": "chapter_20/helper_libs/funcall_generates_args_lib.c",
+    "chapter_20/all_types/no_coalescing/dbl_fun_call": "chapter_20/helper_libs/clobber_xmm_regs{}.s",
+}
+
+def find_helper_libs(source_path: Path, helper_libs_dir: Path) -> list[Path]:
+    libs = []
+    stem = source_path.stem
+    shared_lib = SHARED_HELPER_LIBS.get(source_path.with_suffix("").as_posix())
+    if shared_lib is not None:
+        libs.append(Path(shared_lib.format(HOST_ASM_SUFFIX)))
+    lib_names = [] if shared_lib is not None else [f"{stem}_lib.c", f"{stem}.c"]
+    for lib_name in lib_names:
+        if (TEST_DIR / helper_libs_dir / lib_name).exists():
+            libs.append(helper_libs_dir / lib_name)
+            break
+
+    # Chapter 20 tests declare their checking functions in util.h, which are defined in helper_libs/util.c
+    with open(TEST_DIR / source_path, "rb") as f:
+        source = f.read()
+    if b'#include "../util.h"' in source and (TEST_DIR / helper_libs_dir / "util.c").exists():
+        libs.append(helper_libs_dir / "util.c")
+
+    # Tests without a main are driven by an assembly wrapper that calls their target function, or their test functions
+    # while checking stack alignment. Targets returning a double go through a shim that converts the result to an int.
+    if b"int main(" not in source:
+        if b"check_alignment" in source:
+            wrapper_name = f"alignment_check_wrapper{HOST_ASM_SUFFIX}.s"
+        else:
+            wrapper_name = f"wrapper{HOST_ASM_SUFFIX}.s"
+            if b"dbl_target" in source:
+                libs.append(helper_libs_dir / "target_shim.c")
+        if (TEST_DIR / helper_libs_dir / wrapper_name).exists():
+            libs.append(helper_libs_dir / wrapper_name)
+    return libs
+
+def scan_directory(directory: Path, helper_libs_dir: Path, groups: list[TestGroup], dir_mtimes: dict[str, int]):
+    dir_mtimes[directory.as_posix()] = os.stat(TEST_DIR / directory).st_mtime_ns
+
+    entries = sorted(os.scandir(TEST_DIR / directory), key=lambda entry: entry.name)
+    file_names = {entry.name for entry in entries if entry.is_file()}
+    for entry in entries:
+        path = directory / entry.name
+        if entry.is_dir():
+            if entry.name != "helper_libs":
+                scan_directory(path, helper_libs_dir, groups, dir_mtimes)
+            continue
+        if not entry.name.endswith(".c") or entry.name.endswith("_client.c"):
+            continue
+
+        stem = path.stem
+        # Library tests are compiled together with their client
+        client_name = f"{stem}_client.c"
+        paths = [path, directory / client_name] if client_name in file_names else [path]
+
+        # Some tests are linked against a platform specific assembly checker, in which case the assembly file leads the group
+        check_name = f"{stem}_check{HOST_ASM_SUFFIX}.s"
+        if check_name in file_names:
+            paths = [directory / check_name] + paths
+
+        groups.append(TestGroup(paths, find_helper_libs(path, helper_libs_dir)))
+
+def scan_test_tree() -> tuple[list[TestGroup], dict[str, int]]:
+    groups = []
+    dir_mtimes = {}
+    chapter_dirs = [entry.name for entry in os.scandir(TEST_DIR) if entry.is_dir() and entry.name.startswith("chapter_")]
+    for chapter_dir in sorted(chapter_dirs, key=lambda name: int(name.removeprefix("chapter_"))):
+        scan_directory(Path(chapter_dir), Path(chapter_dir, "helper_libs"), groups, dir_mtimes)
+    return groups, dir_mtimes
+
+def load_manifest() -> list[TestGroup] | None:
+    try:
+        with open(MANIFEST_PATH, "r") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if manifest.get("version") != MANIFEST_VERSION:
+        return None
+    # Adding, removing or renaming a file changes the mtime of its directory, so these are enough to detect a stale index
+    for directory, mtime in manifest["dir_mtimes"].items():
+        try:
+            if os.stat(TEST_DIR / directory).st_mtime_ns != mtime:
+                return None
+        except OSError:
+            return None
+
+    return [
+        TestGroup([Path(p) for p in group["paths"]], [Path(p) for p in group["helper_libs"]])
+        for group in manifest["groups"]
+    ]
+
+def save_manifest(groups: list[TestGroup], dir_mtimes: dict[str, int]):
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "dir_mtimes": dir_mtimes,
+        "groups": [
+            {
+                "paths": [p.as_posix() for p in group.paths],
+                "helper_libs": [p.as_posix() for p in group.helper_libs],
+            }
+            for group in groups
+        ],
+    }
+    temp_path = MANIFEST_PATH.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        with open(temp_path, "w") as f:
+            json.dump(manifest, f)
+        os.replace(temp_path, MANIFEST_PATH)
+    except OSError:
+        # The manifest is only a cache, so failing to write it is not an error
+        pass
+
+_index = None
+
+def get_index() -> TestIndex:
+    global _index
+    if _index is None:
+        groups = load_manifest()
+        if groups is None:
+            groups, dir_mtimes = scan_test_tree()
+            save_manifest(groups, dir_mtimes)
+        _index = TestIndex(groups)
+    return _index
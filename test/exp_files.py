@@ -1,18 +1,72 @@
-import os
+from pathlib import Path
+import json
+import threading
+
+# Expected results are stored in one JSON lines manifest per chapter, with one record per test:
+#   {"test": "chapter_1/valid/return_2", "exit_code": 2, "stdout": "", "stderr": ""}
+# stdout and stderr are arbitrary bytes, stored latin-1 decoded so that every byte round trips through JSON.
+MANIFEST_NAME = "expected.jsonl"
+TEST_DIR = Path(__file__).resolve().parent
 
 class ExpFile:
-    def __init__(self, path):
-        with open(path, "r") as f:
-            lines = f.readlines()
-        for line in lines:
-            if line.startswith("exit_code: "):
-                self.exit_code = int(line.strip("exit_code: "))
-            elif line.startswith("stdout: "):
-                self.stdout = line.strip("stdout: ")
-            elif line.startswith("stderr: "):
-                self.stderr = line.strip("stderr: ")
-
-def exp_file_path_from_source_path(path: str) -> str:
-    noext = os.path.splitext(path)[0]
-    return f"{noext}.txt"
+    def __init__(self, exit_code: int, stdout: bytes, stderr: bytes):
+        self.exit_code = exit_code
+        self.stdout = stdout
+        self.stderr = stderr
+
+    def to_record(self, test: str) -> dict:
+        return {
+            "test": test,
+            "exit_code": self.exit_code,
+            "stdout": self.stdout.decode("latin-1"),
+            "stderr": self.stderr.decode("latin-1"),
+        }
+
+    @staticmethod
+    def from_record(record: dict) -> "ExpFile":
+        return ExpFile(record["exit_code"], record["stdout"].encode("latin-1"), record["stderr"].encode("latin-1"))
+
+# The name of a test's record, which is the path of its first source file without the extension
+def test_name_from_source_path(path: Path) -> str:
+    return Path(path).with_suffix("").as_posix()
+
+def manifest_path_from_source_path(path: Path) -> Path:
+    return TEST_DIR / Path(path).parts[0] / MANIFEST_NAME
+
+_manifests: dict[Path, dict[str, ExpFile]] = {}
+_dirty_manifests: set[Path] = set()
+_manifests_lock = threading.Lock()
+
+def load_manifest(manifest_path: Path) -> dict[str, ExpFile]:
+    with _manifests_lock:
+        if manifest_path not in _manifests:
+            exp_files = {}
+            if manifest_path.exists():
+                with open(manifest_path, "r") as f:
+                    for line in f:
+                        if line.strip() == "": continue
+                        record = json.loads(line)
+                        exp_files[record["test"]] = ExpFile.from_record(record)
+            _manifests[manifest_path] = exp_files
+        return _manifests[manifest_path]
+
+# Returns None if no expected result has been generated for the test yet
+def get_exp_file(source_path: Path) -> ExpFile | None:
+    exp_files = load_manifest(manifest_path_from_source_path(source_path))
+    return exp_files.get(test_name_from_source_path(source_path))
+
+def set_exp_file(source_path: Path, exp_file: ExpFile):
+    exp_files = load_manifest(manifest_path_from_source_path(source_path))
+    with _manifests_lock:
+        exp_files[test_name_from_source_path(source_path)] = exp_file
+        _dirty_manifests.add(manifest_path_from_source_path(source_path))
 
+def save_manifests():
+    with _manifests_lock:
+        for manifest_path in _dirty_manifests:
+            exp_files = _manifests[manifest_path]
+            with open(manifest_path, "w", newline="\n") as f:
+                for test in sorted(exp_files):
+                    f.write(json.dumps(exp_files[test].to_record(test)))
+                    f.write("\n")
+        _dirty_manifests.clear()
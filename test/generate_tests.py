@@ -1,4 +1,4 @@
-from pathlib import Path, PurePath
+from pathlib import Path
 import os
 import argparse
 import subprocess
@@ -6,35 +6,34 @@ import subprocess
 import exp_files
 import common
 
-def write_exp_file(exp_file_path: Path, process_result: subprocess.CompletedProcess):
-    print(f"Generating {exp_file_path}")
-    with open(exp_file_path, "w") as f:
-        f.write(f"exit_code: {process_result.returncode}\n")
-        f.write(f"stdout: {process_result.stdout}\n")
-        f.write(f"stderr: {process_result.stderr}\n")
+def write_exp_file(source_path: Path, process_result: subprocess.CompletedProcess):
+    print(f"Generating expected result for {source_path}")
+    exp_file = exp_files.ExpFile(process_result.returncode, process_result.stdout, process_result.stderr)
+    exp_files.set_exp_file(source_path, exp_file)
 
 def generate_exp_files_with_gcc(base_path: Path):
     groups = common.get_test_groups(base_path)
     for group in groups:
-        if common.is_test_case_of_type(group[0], "valid"):
+        if common.is_valid_test(group[0]):
             generate_valid_exp_file(group)
-        elif common.is_test_case_of_type(group[0], "invalid"):
+        elif common.is_invalid_test(group[0]):
             generate_invalid_exp_file(group)
+        else:
+            print(f"Skipping {group[0]}: not in a valid or invalid directory")
 
 def generate_valid_exp_file(paths: list[Path]):
-    compile_result = subprocess.run(["gcc", "-O0"] + paths)
+    exec_path = Path(f"a{common.EXECUTABLE_SUFFIX}").resolve()
+    compile_result = subprocess.run(["gcc", "-O0"] + paths + ["-o", exec_path])
     # @HACK: If we get here, we should always be able to compile. However, the current compilation strategy doesn't always succeed.
     if compile_result.returncode != 0:
         return
-    run_result = subprocess.run("a.exe", capture_output=True)
-    exp_file_path = exp_files.exp_file_path_from_source_path(paths[0])
-    write_exp_file(exp_file_path, run_result)
-    os.remove("a.exe")
+    run_result = subprocess.run([exec_path], capture_output=True)
+    write_exp_file(paths[0], run_result)
+    os.remove(exec_path)
 
 def generate_invalid_exp_file(paths: list[Path]):
-    compile_result = subprocess.run(["..\occm.exe"] + paths, capture_output=True)
-    exp_file_path = exp_files.exp_file_path_from_source_path(paths[0])
-    write_exp_file(exp_file_path, compile_result)
+    compile_result = subprocess.run([common.compiler_path()] + [path.as_posix() for path in paths], capture_output=True)
+    write_exp_file(paths[0], compile_result)
     assert(not Path(paths[0].with_suffix(".exe").name).exists())
 
 def main():
@@ -58,5 +57,7 @@ def main():
         for i in range(low, high + 1):
             generate_exp_files_with_gcc(Path(f"chapter_{i}"))
 
+    exp_files.save_manifests()
+
 if __name__ == "__main__":
     main()
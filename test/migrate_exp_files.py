@@ -0,0 +1,55 @@
+from pathlib import Path
+import ast
+import argparse
+import os
+
+import exp_files
+import common
+
+# Converts the old per-test .txt expectation files into the per-chapter manifests read by exp_files.
+# The old format stored stdout and stderr as Python bytes reprs, which are parsed with ast.literal_eval rather than eval.
+
+def parse_txt_exp_file(path: Path) -> exp_files.ExpFile:
+    exit_code = None
+    stdout = None
+    stderr = None
+    with open(path, "r") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if line.startswith("exit_code: "):
+                exit_code = int(line.removeprefix("exit_code: "))
+            elif line.startswith("stdout: "):
+                stdout = ast.literal_eval(line.removeprefix("stdout: "))
+            elif line.startswith("stderr: "):
+                stderr = ast.literal_eval(line.removeprefix("stderr: "))
+    # Some files were cut off after stdout. Valid tests never write to stderr, so nothing was lost for those.
+    if stderr is None and common.is_test_case_of_type(path, "valid"):
+        stderr = b""
+    if exit_code is None or not isinstance(stdout, bytes) or not isinstance(stderr, bytes):
+        raise ValueError(f"{path} is not a valid expectation file")
+    return exp_files.ExpFile(exit_code, stdout, stderr)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-remove", action="store_true", help="Delete the .txt files once they have been migrated")
+    args = parser.parse_args()
+
+    migrated = []
+    for txt_path in sorted(Path(".").glob("chapter_*/**/*.txt")):
+        try:
+            exp_file = parse_txt_exp_file(txt_path)
+        except (ValueError, SyntaxError) as e:
+            # Left in place so the test can be regenerated with generate_tests.py
+            print(f"Skipping {txt_path}: {e}")
+            continue
+        exp_files.set_exp_file(txt_path, exp_file)
+        migrated.append(txt_path)
+    exp_files.save_manifests()
+    print(f"Migrated {len(migrated)} expectation files")
+
+    if args.remove:
+        for txt_path in migrated:
+            os.remove(txt_path)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+from pathlib import Path
+import hashlib
+import json
+import os
+import time
+
+import exp_files
+
+# Test outcomes are stored one file per key, where the key hashes everything that can influence the outcome:
+# the compiler binary and the flags it is run with, the group's source files and its expected result.
+class ResultCache:
+    def __init__(self, cache_dir: Path, compiler_path: Path):
+        self.cache_dir = cache_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.compiler_hash = hash_file(compiler_path)
+
+    def key(self, paths: list[Path], exp_file: exp_files.ExpFile, compiler_flags: list[str]) -> str:
+        hasher = hashlib.sha256()
+        hasher.update(self.compiler_hash.encode())
+        hasher.update("\0".join(compiler_flags).encode())
+        hasher.update(b"\0")
+        for path in paths:
+            hasher.update(path.as_posix().encode())
+            hasher.update(b"\0")
+            hasher.update(path.read_bytes())
+            hasher.update(b"\0")
+        hasher.update(json.dumps(exp_file.to_record(""), sort_keys=True).encode())
+        return hasher.hexdigest()
+
+    def get(self, key: str) -> tuple[bool, str | None] | None:
+        entry_path = self.cache_dir / f"{key}.json"
+        try:
+            with open(entry_path, "r") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        # Touch the entry so that eviction by age keeps recently used results
+        os.utime(entry_path)
+        return entry["passed"], entry["message"]
+
+    def put(self, key: str, passed: bool, message: str | None):
+        entry_path = self.cache_dir / f"{key}.json"
+        temp_path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temp_path, "w") as f:
+            json.dump({"passed": passed, "message": message}, f)
+        os.replace(temp_path, entry_path)
+
+    def evict(self, max_age_days: float, max_size_mb: float):
+        entries = []
+        now = time.time()
+        for entry_path in self.cache_dir.glob("*.json"):
+            stat = entry_path.stat()
+            if now - stat.st_mtime > max_age_days * 24 * 60 * 60:
+                entry_path.unlink(missing_ok=True)
+            else:
+                entries.append((stat.st_mtime, stat.st_size, entry_path))
+
+        # Remove least recently used entries until the cache fits in the size budget
+        total_size = sum(size for _, size, _ in entries)
+        max_size = max_size_mb * 1024 * 1024
+        for _, size, entry_path in sorted(entries):
+            if total_size <= max_size:
+                break
+            entry_path.unlink(missing_ok=True)
+            total_size -= size
+
+def hash_file(path: Path) -> str:
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
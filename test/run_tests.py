@@ -1,78 +1,301 @@
 from pathlib import Path
 import os 
+import sys
 import subprocess
 import argparse
+import json
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import exp_files
 import common
+import result_cache
+import asm_checks
 
 class Stats:
-    passed_count = 0
-    failed_count = 0
+    def __init__(self):
+        self.passed_count = 0
+        self.failed_count = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # Per stage timings reported by occm for each test that was compiled, when running with -timings
+        self.timings: list[dict] = []
+        # Metrics on the generated assembly of each test checked with -check-asm, keyed by its source path
+        self.asm_metrics: dict[str, dict[str, int]] = {}
+        # Workers report concurrently when running with -jobs, so counters and output are guarded by this lock
+        self.lock = threading.Lock()
 
-    def failed(self, message: str):
-        print(f"FAIL! {message}")
-        self.failed_count += 1
+    def failed(self, test_path: Path, message: str):
+        with self.lock:
+            print(f"Running test {test_path}:  FAIL! {message}")
+            self.failed_count += 1
 
-    def passed(self):
-        print(f"PASS!")
-        self.passed_count += 1
+    def passed(self, test_path: Path):
+        with self.lock:
+            print(f"Running test {test_path}:  PASS!")
+            self.passed_count += 1
 
-def compare_to_exp_file(process_result: subprocess.CompletedProcess, exp_file: exp_files.ExpFile, stats: Stats) -> bool:
+    def record_timings(self, timings: dict):
+        with self.lock:
+            self.timings.append(timings)
+
+    def record_asm_metrics(self, source_path: Path, metrics: dict[str, int]):
+        with self.lock:
+            self.asm_metrics[source_path.as_posix()] = metrics
+
+    def cache_lookup(self, hit: bool):
+        with self.lock:
+            if hit: self.cache_hits += 1
+            else: self.cache_misses += 1
+
+# Expected output was recorded on Windows, where the C runtime writes newlines to stdout as \r\n
+def host_stdout(stdout: bytes) -> bytes:
+    if sys.platform == "win32":
+        return stdout
+    return stdout.replace(b"\r\n", b"\n")
+
+# Returns a failure message, or None if the process behaved as expected
+def compare_to_exp_file(process_result: subprocess.CompletedProcess, exp_file: exp_files.ExpFile) -> str | None:
     if exp_file.exit_code != process_result.returncode:
-        stats.failed(f"Return codes do not match. Expected {exp_file.exit_code}, got {process_result.returncode}")
-        return False
-    elif eval(exp_file.stdout) != process_result.stdout:
-        stats.failed("stdout does not match")
-        return False
-    elif eval(exp_file.stderr) != process_result.stderr:
-        stats.failed("stderr does not match")
-        return False
-    return True
-
-def do_valid_test(paths: list[Path], stats: Stats):
-    print(f"Running test {paths[0]}:  ", end = "")
+        return f"Return codes do not match. Expected {exp_file.exit_code}, got {process_result.returncode}"
+    elif host_stdout(exp_file.stdout) != process_result.stdout:
+        return "stdout does not match"
+    elif exp_file.stderr != process_result.stderr:
+        return "stderr does not match"
+    return None
+
+# Each test compiles in its own scratch directory, since occm writes <stem>.s and <stem>.exe to its working directory
+# and concurrent tests with the same stem would otherwise clobber each other.
+def run_executable(exec_path: Path, exp_file: exp_files.ExpFile, scratch_dir: Path) -> str | None:
+    run_result = subprocess.run([exec_path], capture_output=True, cwd=scratch_dir)
+    os.remove(exec_path)
+    return compare_to_exp_file(run_result, exp_file)
+
+def do_valid_test(paths: list[Path], exp_file: exp_files.ExpFile, scratch_dir: Path, compiler_flags: list[str]) -> str | None:
     compile_result = subprocess.run(
-            ["../occm.exe"] + paths,
+            [common.compiler_path()] + compiler_flags + [path.resolve() for path in paths],
             stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL
+            stderr=subprocess.DEVNULL,
+            cwd=scratch_dir
         )
     if compile_result.returncode != 0:
-        stats.failed("Compilation unsuccessful")
-        return
+        return "Compilation unsuccessful"
 
-    exec_path = Path(paths[0].with_suffix(".exe").name)
-    exp_file_path = exp_files.exp_file_path_from_source_path(paths[0])
-    exp_file = exp_files.ExpFile(exp_file_path)
-    run_result = subprocess.run([exec_path], capture_output=True)
-    if compare_to_exp_file(run_result, exp_file, stats):
-        stats.passed()
-    os.remove(exec_path)
+    return run_executable(scratch_dir / paths[0].with_suffix(".exe").name, exp_file, scratch_dir)
 
-def do_invalid_test(paths: list[Path], stats: Stats):
-    print(f"Running test {paths[0]}:  ", end = "")
-    compile_result = subprocess.run(["../occm.exe"] + paths, capture_output=True)
-    exp_file_path = exp_files.exp_file_path_from_source_path(paths[0])
-    exp_file = exp_files.ExpFile(exp_file_path)
-    if not compare_to_exp_file(compile_result, exp_file, stats):
-        return
-    stderr = eval(exp_file.stderr)
+def check_invalid_result(paths: list[Path], exp_file: exp_files.ExpFile, compile_result: subprocess.CompletedProcess) -> str | None:
+    # Diagnostics name the files as they were passed to occm, so map the absolute paths back to the test-relative ones.
+    # Expected results always use forward slashes, so the same expectations hold on every platform.
+    for path in paths:
+        compile_result.stdout = compile_result.stdout.replace(str(path.resolve()).encode(), path.as_posix().encode())
+        compile_result.stderr = compile_result.stderr.replace(str(path.resolve()).encode(), path.as_posix().encode())
+    message = compare_to_exp_file(compile_result, exp_file)
+    if message is not None:
+        return message
+    stderr = exp_file.stderr
     if common.is_test_case_of_type(paths[0], "invalid_lex") and b"Lex error" not in stderr:
-        stats.failed("Lexing succeeded, but should have failed")
+        return "Lexing succeeded, but should have failed"
     elif common.is_test_case_of_type(paths[0], "invalid_parse") and b"Parse error" not in stderr:
-        stats.failed("Parsing succeeded, but should have failed")
+        return "Parsing succeeded, but should have failed"
     elif common.is_test_case_of_type(paths[0], "invalid_semantics") and b"Semantic error" not in stderr:
-        stats.failed("Semantic checking succeeded, but should have failed")
+        return "Semantic checking succeeded, but should have failed"
+    return None
+
+def do_invalid_test(paths: list[Path], exp_file: exp_files.ExpFile, scratch_dir: Path, compiler_flags: list[str]) -> str | None:
+    compile_result = subprocess.run(
+            [common.compiler_path()] + compiler_flags + [path.resolve() for path in paths],
+            capture_output=True,
+            cwd=scratch_dir
+        )
+    return check_invalid_result(paths, exp_file, compile_result)
+
+def get_test_proc(group: list[Path]):
+    if common.is_valid_test(group[0]):
+        return do_valid_test
+    elif common.is_invalid_test(group[0]):
+        return do_invalid_test
+    return None
+
+UNCLASSIFIED_MESSAGE = "Not in a valid or invalid directory, so it is unclear how to run it"
+
+# Looks up the expected result and any cached result for a group. Returns the expected result and cache key if the test
+# still has to run, or None if it has already been reported.
+def prepare_test(group: list[Path], stats: Stats, cache: result_cache.ResultCache | None, compiler_flags: list[str]) -> tuple[exp_files.ExpFile, str | None] | None:
+    exp_file = exp_files.get_exp_file(group[0])
+    if exp_file is None:
+        stats.failed(group[0], "No expected result, run generate_tests.py first")
+        return None
+
+    key = None
+    if cache is not None:
+        key = cache.key(group, exp_file, compiler_flags)
+        cached = cache.get(key)
+        stats.cache_lookup(cached is not None)
+        if cached is not None:
+            passed, message = cached
+            if passed: stats.passed(group[0])
+            else: stats.failed(group[0], message)
+            return None
+    return exp_file, key
+
+def record_result(group: list[Path], message: str | None, stats: Stats, cache: result_cache.ResultCache | None, key: str | None):
+    if message is None: stats.passed(group[0])
+    else: stats.failed(group[0], message)
+    if cache is not None:
+        cache.put(key, message is None, message)
+
+def read_timings(timings_path: Path, stats: Stats):
+    # occm only writes its timings once it gets as far as exiting normally or reporting an error
+    try:
+        with open(timings_path, "r") as f:
+            stats.record_timings(json.load(f))
+    except (OSError, ValueError):
+        pass
+
+def percentile(sorted_values: list, fraction: float):
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+def print_timings(stats: Stats):
+    if len(stats.timings) == 0:
+        print("No timings were recorded")
+        return
+
+    print(f"Compiler stage timings over {len(stats.timings)} tests:")
+    print(f"  {'stage':<10}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}{'p50 KB':>10}{'max KB':>10}")
+    for stage in stats.timings[0]:
+        times = sorted(timings[stage]["nanoseconds"] / 1e6 for timings in stats.timings)
+        sizes = sorted(timings[stage]["bytes_allocated"] / 1024 for timings in stats.timings)
+        print(
+            f"  {stage:<10}"
+            f"{percentile(times, 0.5):>10.3f}{percentile(times, 0.9):>10.3f}{percentile(times, 0.99):>10.3f}{times[-1]:>10.3f}"
+            f"{percentile(sizes, 0.5):>10.1f}{sizes[-1]:>10.1f}"
+        )
+
+# Checks the assembly generated for an optimization test that has passed, see asm_checks.py
+def check_assembly(group: list[Path], stats: Stats, compiler_flags: list[str]) -> str | None:
+    assembly = common.compile_to_assembly_in_memory([path.resolve() for path in group], compiler_flags)
+    if assembly is None:
+        return "Compilation to assembly unsuccessful"
+    message, metrics = asm_checks.check_group(group, assembly)
+    stats.record_asm_metrics(asm_checks.source_path(group), metrics)
+    return message
+
+def print_asm_metrics(stats: Stats, metrics_path: str | None):
+    if len(stats.asm_metrics) == 0:
+        print("No assembly was checked")
+        return
+
+    suites: dict[str, list[dict[str, int]]] = {}
+    for source_path, metrics in stats.asm_metrics.items():
+        parts = Path(source_path).parts
+        suite = "/".join(parts[:3] if parts[0] == "chapter_20" else parts[:2])
+        suites.setdefault(suite, []).append(metrics)
+
+    print("Generated code in target functions:")
+    print(f"  {'suite':<45}{'tests':>8}{'instructions':>14}{'spill slots':>13}")
+    for suite, suite_metrics in sorted(suites.items()):
+        instructions = sum(metrics["instructions"] for metrics in suite_metrics)
+        spill_slots = sum(metrics["spill_slots"] for metrics in suite_metrics)
+        print(f"  {suite:<45}{len(suite_metrics):>8}{instructions:>14}{spill_slots:>13}")
+
+    if metrics_path is not None:
+        with open(metrics_path, "w", newline="\n") as f:
+            json.dump(stats.asm_metrics, f, indent=4, sort_keys=True)
+            f.write("\n")
+
+def do_test(group: list[Path], stats: Stats, cache: result_cache.ResultCache | None, compiler_flags: list[str], timings: bool = False, check_asm: bool = False):
+    test_proc = get_test_proc(group)
+    if test_proc is None:
+        stats.failed(group[0], UNCLASSIFIED_MESSAGE)
+        return
+    if check_asm:
+        compiler_flags = compiler_flags + asm_checks.suite_flags(group)
+
+    prepared = prepare_test(group, stats, cache, compiler_flags)
+    if prepared is None:
+        return
+    exp_file, key = prepared
+
+    with tempfile.TemporaryDirectory(prefix="occm_test_") as scratch_dir:
+        scratch_dir = Path(scratch_dir)
+        if timings:
+            timings_path = scratch_dir / "timings.json"
+            message = test_proc(group, exp_file, scratch_dir, compiler_flags + ["-timings", str(timings_path)])
+            read_timings(timings_path, stats)
+        else:
+            message = test_proc(group, exp_file, scratch_dir, compiler_flags)
+    if message is None and check_asm and test_proc is do_valid_test and asm_checks.is_checked(group):
+        message = check_assembly(group, stats, compiler_flags)
+    record_result(group, message, stats, cache, key)
+
+def do_tests(groups: list[list[Path]], stats: Stats, jobs: int, cache: result_cache.ResultCache | None, compiler_flags: list[str], timings: bool, check_asm: bool):
+    if jobs <= 1:
+        for group in groups:
+            do_test(group, stats, cache, compiler_flags, timings, check_asm)
     else:
-        stats.passed()
-                        
-def do_tests(base_path: Path, stats: Stats):
-    groups = common.get_test_groups(base_path)
+        # Threads are enough here: every worker spends its time blocked in subprocess.run, which releases the GIL
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            for _ in executor.map(lambda group: do_test(group, stats, cache, compiler_flags, timings, check_asm), groups):
+                pass
+
+# Compiles every group with a single `occm -batch` process instead of one occm process per test.
+# occm reports one JSON record per group, see batch.odin. Valid tests then run their executables as usual.
+def do_batch_tests(groups: list[list[Path]], stats: Stats, jobs: int, cache: result_cache.ResultCache | None, compiler_flags: list[str]):
+    pending = []
     for group in groups:
-        if common.is_test_case_of_type(group[0], "valid"):
-            do_valid_test(group, stats)
-        elif common.is_test_case_of_type(group[0], "invalid"):
-            do_invalid_test(group, stats)
+        test_proc = get_test_proc(group)
+        if test_proc is None:
+            stats.failed(group[0], UNCLASSIFIED_MESSAGE)
+            continue
+        prepared = prepare_test(group, stats, cache, compiler_flags)
+        if prepared is not None:
+            pending.append((group, test_proc) + prepared)
+    if len(pending) == 0:
+        return
+
+    with tempfile.TemporaryDirectory(prefix="occm_test_") as scratch_dir:
+        scratch_dir = Path(scratch_dir)
+        manifest_path = scratch_dir / "batch.txt"
+        with open(manifest_path, "w") as f:
+            for group, *_ in pending:
+                f.write("\t".join(str(path.resolve()) for path in group))
+                f.write("\n")
+
+        batch_result = subprocess.run(
+                [common.compiler_path(), "-batch", "-link-jobs", str(jobs)] + compiler_flags + [manifest_path],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                cwd=scratch_dir
+            )
+        records = {}
+        for line in batch_result.stdout.decode("utf-8", errors="surrogateescape").splitlines():
+            if line.strip() == "": continue
+            record = json.loads(line)
+            records[record["group"]] = record
+
+        def finish_test(index: int):
+            group, test_proc, exp_file, key = pending[index]
+            record = records.get(index)
+            if record is None:
+                message = f"occm -batch exited with code {batch_result.returncode} before reporting this test"
+            elif test_proc is do_invalid_test:
+                compile_result = subprocess.CompletedProcess(
+                        [],
+                        record["exit_code"],
+                        record["stdout"].encode("utf-8", errors="surrogateescape"),
+                        record["stderr"].encode("utf-8", errors="surrogateescape")
+                    )
+                message = check_invalid_result(group, exp_file, compile_result)
+            elif record["status"] != "ok":
+                message = "Compilation unsuccessful"
+            else:
+                message = run_executable(scratch_dir / record["executable"], exp_file, scratch_dir)
+            record_result(group, message, stats, cache, key)
+
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            for _ in executor.map(finish_test, range(len(pending))):
+                pass
 
 def main():
     parser = argparse.ArgumentParser()
@@ -80,24 +303,73 @@ def main():
     parser.add_argument("-high")
     parser.add_argument("-low")
     parser.add_argument("-norebuild")
+    parser.add_argument("-jobs", type=int, default=1, help="Number of tests to run concurrently (0 uses every CPU)")
+    parser.add_argument("-nocache", action="store_true", help="Run every test instead of reusing cached results")
+    parser.add_argument("-cache-dir", default=".test_cache", help="Directory holding cached test results")
+    parser.add_argument("-cache-max-age", type=float, default=30, help="Evict cached results unused for this many days")
+    parser.add_argument("-cache-max-size", type=float, default=64, help="Evict least recently used results above this many MB")
+    parser.add_argument("-pipe", action="store_true", help="Have occm pipe its assembly to gcc instead of writing .s files")
+    parser.add_argument("-tokenize", action="store_true", help="Have occm lex each file completely before parsing it")
+    parser.add_argument("-regalloc", action="store_true", help="Compile with occm's register allocating backend")
+    parser.add_argument("-peephole", action="store_true", help="Compile with occm's peephole optimizer")
+    parser.add_argument("-fold-constants", action="store_true", help="Compile with occm's constant folding pass")
+    parser.add_argument("-propagate-copies", action="store_true", help="Compile with occm's copy propagation pass")
+    parser.add_argument("-eliminate-unreachable-code", action="store_true", help="Compile with occm's unreachable code elimination pass")
+    parser.add_argument("-eliminate-dead-stores", action="store_true", help="Compile with occm's dead store elimination pass")
+    parser.add_argument("-optimize", action="store_true", help="Compile with every occm optimization pass")
+    parser.add_argument("-batch", action="store_true", help="Compile every test with a single occm -batch process")
+    parser.add_argument("-timings", action="store_true", help="Collect per stage compiler timings and print percentiles (implies -nocache, not with -batch)")
+    parser.add_argument("-check-asm", action="store_true", help="Compile chapters 19 and 20 with their optimizations and check the generated assembly (implies -nocache, not with -batch)")
+    parser.add_argument("-asm-metrics", help="With -check-asm, also write the metrics of each checked test to this JSON file")
     args = parser.parse_args()
+    if args.check_asm and args.batch:
+        parser.error("-check-asm cannot be used with -batch")
 
     stats = Stats()
+    jobs = args.jobs if args.jobs > 0 else os.cpu_count()
 
     if not args.norebuild:
         common.rebuild_compiler()
 
+    cache = None
+    # Cached tests are not compiled, so they would have no timings or assembly to report
+    if not args.nocache and not args.timings and not args.check_asm:
+        cache = result_cache.ResultCache(Path(args.cache_dir), common.compiler_path())
+
+    groups = []
     if args.path:
-        do_tests(Path(args.path), stats)
+        groups += common.get_test_groups(Path(args.path))
     else:
         low = 1
         if args.low: low = int(args.low)
         high = 20
         if args.high: high = int(args.high)
         for i in range(low, high + 1):
-            do_tests(Path(f"chapter_{i}"), stats)
+            groups += common.get_test_groups(Path(f"chapter_{i}"))
+
+    compiler_flags = []
+    if args.pipe: compiler_flags.append("-pipe")
+    if args.tokenize: compiler_flags.append("-tokenize")
+    if args.regalloc: compiler_flags.append("-regalloc")
+    if args.peephole: compiler_flags.append("-peephole")
+    for optimization in ["fold_constants", "propagate_copies", "eliminate_unreachable_code", "eliminate_dead_stores", "optimize"]:
+        if getattr(args, optimization): compiler_flags.append("-" + optimization.replace("_", "-"))
+
+    if args.batch:
+        do_batch_tests(groups, stats, jobs, cache, compiler_flags)
+    else:
+        do_tests(groups, stats, jobs, cache, compiler_flags, args.timings, args.check_asm)
 
     print(f"Passed: {stats.passed_count}, Failed: {stats.failed_count}")
+    if args.timings and not args.batch:
+        print_timings(stats)
+    if args.check_asm:
+        print_asm_metrics(stats, args.asm_metrics)
+    if cache is not None:
+        lookups = stats.cache_hits + stats.cache_misses
+        hit_rate = 100 * stats.cache_hits / lookups if lookups > 0 else 0
+        print(f"Cache hits: {stats.cache_hits}/{lookups} ({hit_rate:.1f}%)")
+        cache.evict(args.cache_max_age, args.cache_max_size)
 
 if __name__ == "__main__":
     main()
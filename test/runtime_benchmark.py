@@ -0,0 +1,235 @@
+from pathlib import Path
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import common
+
+# Generated code benchmarks. Each kernel is a small CPU bound C program, compiled once with occm and once with gcc -O0
+# like generate_tests.py does, and run several times after a warmup. The report gives the median run time of each,
+# their ratio, and the number of instructions in each compiler's assembly.
+#
+# Kernels return a checksum as their exit code, which has to match between the two builds. Results can be saved as a
+# baseline, and later runs flag any kernel whose occm/gcc ratio got worse than the baseline by more than the threshold.
+# Comparing ratios rather than times keeps the baseline meaningful on a different or busier machine.
+
+BASELINE_PATH = Path(".runtime_benchmark_baseline.json")
+
+KERNELS = {
+    # Nested counted loops with a modulo in the body
+    "loops": """
+int main(void) {
+    int sum = 0;
+    for (int i = 0; i < 6000; i = i + 1) {
+        for (int j = 0; j < 6000; j = j + 1) {
+            sum = (sum + i * j) % 1000003;
+        }
+    }
+    return sum % 256;
+}
+""",
+    # Call heavy: two recursive calls per invocation
+    "recursion": """
+int fib(int n) {
+    if (n < 2) return n;
+    return fib(n - 1) + fib(n - 2);
+}
+
+int main(void) {
+    return fib(34) % 256;
+}
+""",
+    # An interpreter loop dispatching on a small bytecode with a switch
+    "switch_dispatch": """
+int main(void) {
+    int acc = 1;
+    int pc = 0;
+    int steps = 0;
+    while (steps < 50000000) {
+        switch (pc) {
+            case 0: acc = acc + 7; pc = 1; break;
+            case 1: acc = (acc & 65535) * 3; pc = 2; break;
+            case 2: acc = acc ^ (acc >> 5); pc = 3; break;
+            case 3: acc = acc - steps; pc = 4; break;
+            case 4: acc = acc & 1048575; pc = 5; break;
+            case 5: acc = acc | 3; pc = 6; break;
+            case 6: acc = acc % 9973; pc = 7; break;
+            default: pc = 0;
+        }
+        steps = steps + 1;
+    }
+    return acc % 256;
+}
+""",
+    # Long dependent chains of arithmetic, like a hash mixing function. Values are masked before they are multiplied or
+    # shifted left, so nothing overflows and both builds have to agree on the checksum.
+    "arithmetic_chain": """
+int main(void) {
+    int x = 12345;
+    int y = 678;
+    for (int i = 0; i < 20000000; i = i + 1) {
+        x = (x & 65535) * 1103 + 12345;
+        y = (y ^ (x >> 3)) & 65535;
+        x = (x & 65535) + (y << 2) + i;
+        y = (y * 31 + x) % 65521;
+    }
+    return (x + y) % 256;
+}
+""",
+    # Data dependent branches: Collatz sequence lengths, stopping before 3 * value + 1 could overflow
+    "branches": """
+int main(void) {
+    int longest = 0;
+    for (int n = 1; n < 300000; n = n + 1) {
+        int steps = 0;
+        int value = n;
+        while (value != 1 && value < 700000000 && steps < 1000) {
+            if (value % 2 == 0) value = value / 2;
+            else value = 3 * value + 1;
+            steps = steps + 1;
+        }
+        if (steps > longest) longest = steps;
+    }
+    return longest % 256;
+}
+""",
+}
+
+# Counts the instructions in assembly, skipping labels, directives and comments
+def count_instructions(assembly: str) -> int:
+    count = 0
+    for line in assembly.splitlines():
+        line = line.split("#", 1)[0].strip()
+        if line == "" or line.endswith(":") or line.startswith("."):
+            continue
+        count += 1
+    return count
+
+def compile_with_occm(source_path: Path, exec_path: Path, occm_flags: list[str]) -> int | None:
+    compile_result = subprocess.run(
+            [common.compiler_path()] + occm_flags + [source_path.resolve()],
+            capture_output=True,
+            cwd=exec_path.parent
+        )
+    if compile_result.returncode != 0:
+        print(compile_result.stdout.decode(errors="replace") + compile_result.stderr.decode(errors="replace"), file=sys.stderr)
+        return None
+    # occm names the executable after the source file
+    Path(exec_path.parent, f"{source_path.stem}.exe").replace(exec_path)
+
+    assembly = common.compile_to_assembly_in_memory([source_path.resolve()], occm_flags)
+    if assembly is None:
+        print(f"Could not generate assembly for {source_path}", file=sys.stderr)
+        return None
+    return count_instructions("".join(assembly.values()))
+
+def compile_with_gcc(source_path: Path, exec_path: Path) -> int | None:
+    if subprocess.run(["gcc", "-O0", source_path, "-o", exec_path]).returncode != 0:
+        return None
+    assembly = subprocess.run(["gcc", "-O0", "-S", "-o", "-", source_path], capture_output=True)
+    return count_instructions(assembly.stdout.decode(errors="replace"))
+
+# Returns the median wall time over `runs` timed runs and the exit code, after `warmup` untimed runs
+def time_executable(exec_path: Path, warmup: int, runs: int) -> tuple[float, int]:
+    for _ in range(warmup):
+        subprocess.run([exec_path], stdout=subprocess.DEVNULL)
+    times = []
+    exit_code = 0
+    for _ in range(runs):
+        start = time.perf_counter()
+        exit_code = subprocess.run([exec_path], stdout=subprocess.DEVNULL).returncode
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), exit_code
+
+def load_baseline(baseline_path: Path) -> dict[str, dict]:
+    try:
+        with open(baseline_path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_baseline(baseline_path: Path, results: dict[str, dict]):
+    with open(baseline_path, "w", newline="\n") as f:
+        json.dump(results, f, indent=4, sort_keys=True)
+        f.write("\n")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-norebuild", action="store_true", help="Use the existing compiler instead of rebuilding it")
+    parser.add_argument("-only", action="append", choices=KERNELS.keys(), help="Only run the given kernel, may be repeated")
+    parser.add_argument("-warmup", type=int, default=1, help="Untimed runs before timing each executable")
+    parser.add_argument("-runs", type=int, default=5, help="Timed runs per executable, the median is kept")
+    parser.add_argument("-occm-flags", default="", help="Extra flags for occm, e.g. \"-optimize -regalloc\"")
+    parser.add_argument("-baseline", default=str(BASELINE_PATH), help="Baseline file to compare against or save to")
+    parser.add_argument("-save-baseline", action="store_true", help="Record these results as the new baseline")
+    parser.add_argument("-threshold", type=float, default=0.1, help="Flag kernels whose occm/gcc ratio worsened by this fraction")
+    args = parser.parse_args()
+
+    if not args.norebuild:
+        common.rebuild_compiler()
+
+    occm_flags = args.occm_flags.split()
+    baseline = load_baseline(Path(args.baseline))
+    results = {}
+    problems = []
+
+    print(f"  {'kernel':<20}{'occm ms':>10}{'gcc ms':>10}{'ratio':>8}{'occm insns':>12}{'gcc insns':>11}")
+    with tempfile.TemporaryDirectory(prefix="occm_runtime_") as scratch_dir:
+        for name in args.only or KERNELS.keys():
+            source_path = Path(scratch_dir, f"{name}.c")
+            with open(source_path, "w") as f:
+                f.write(KERNELS[name])
+            occm_exec = Path(scratch_dir, f"{name}_occm{common.EXECUTABLE_SUFFIX}")
+            gcc_exec = Path(scratch_dir, f"{name}_gcc{common.EXECUTABLE_SUFFIX}")
+
+            occm_instructions = compile_with_occm(source_path, occm_exec, occm_flags)
+            gcc_instructions = compile_with_gcc(source_path, gcc_exec)
+            if occm_instructions is None or gcc_instructions is None:
+                print(f"  {name:<20}FAILED to compile with {'occm' if occm_instructions is None else 'gcc'}")
+                problems.append(f"{name} failed to compile")
+                continue
+
+            occm_time, occm_exit_code = time_executable(occm_exec, args.warmup, args.runs)
+            gcc_time, gcc_exit_code = time_executable(gcc_exec, args.warmup, args.runs)
+            ratio = occm_time / gcc_time
+            line = (
+                f"  {name:<20}{occm_time * 1000:>10.1f}{gcc_time * 1000:>10.1f}{ratio:>8.2f}"
+                f"{occm_instructions:>12}{gcc_instructions:>11}"
+            )
+
+            if occm_exit_code != gcc_exit_code:
+                line += f"  WRONG RESULT {occm_exit_code}, expected {gcc_exit_code}"
+                problems.append(f"{name} returned {occm_exit_code} with occm and {gcc_exit_code} with gcc")
+
+            results[name] = {
+                "occm_seconds": occm_time,
+                "gcc_seconds": gcc_time,
+                "ratio": ratio,
+                "occm_instructions": occm_instructions,
+                "gcc_instructions": gcc_instructions,
+            }
+            if name in baseline:
+                change = ratio / baseline[name]["ratio"] - 1
+                line += f"  {change * 100:>+7.1f}% vs baseline"
+                if change > args.threshold:
+                    line += "  REGRESSION"
+                    problems.append(f"{name} ratio is {change * 100:.1f}% worse than the baseline")
+            print(line)
+
+    if args.save_baseline:
+        baseline.update(results)
+        save_baseline(Path(args.baseline), baseline)
+        print(f"Saved baseline to {args.baseline}")
+
+    if len(problems) > 0:
+        print(f"{len(problems)} problems found:")
+        for problem in problems:
+            print(f"  {problem}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
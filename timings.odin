@@ -0,0 +1,132 @@
+package occm
+
+// Per stage wall time and allocation totals, reported by -timings. Lexing is only a stage of its own with -tokenize,
+// which lexes the whole file in one step. Otherwise it happens on demand while parsing and is counted as parse time,
+// since timing every token would mostly measure the clock. Optimization is taken out of the emit time, which otherwise
+// covers lowering to the IR and emitting it.
+//
+// The report is a single JSON object with one entry per stage, accumulated over every file the process compiled:
+//   {"lex": {"nanoseconds": 1200, "bytes_allocated": 0, "allocation_count": 0}, "parse": {...}, ...}
+import "core:fmt"
+import "core:os"
+import "core:time"
+import "core:mem"
+import "core:encoding/json"
+
+Stage :: enum {
+    Lex,
+    Parse,
+    Validate,
+    Optimize,
+    Emit,
+    Write,
+    Gcc,
+}
+
+Stage_Timing :: struct {
+    nanoseconds: i64,
+    bytes_allocated: int,
+    allocation_count: int,
+}
+
+Stage_Mark :: struct {
+    tick: time.Tick,
+    bytes_allocated: int,
+    allocation_count: int,
+}
+
+Timings_Report :: struct {
+    lex: Stage_Timing,
+    parse: Stage_Timing,
+    validate: Stage_Timing,
+    optimize: Stage_Timing,
+    emit: Stage_Timing,
+    write: Stage_Timing,
+    gcc: Stage_Timing,
+}
+
+timings_enabled := false
+timings_file := "" // "-" reports to stderr
+stage_timings: [Stage]Stage_Timing
+
+// Allocations made through context.allocator, or through any allocator wrapped by counting_allocator, are counted
+// while timings are enabled
+total_bytes_allocated := 0
+total_allocation_count := 0
+counted_allocator: mem.Allocator
+
+counting_allocator_proc :: proc(allocator_data: rawptr, mode: mem.Allocator_Mode, size, alignment: int, old_memory: rawptr, old_size: int, location := #caller_location) -> ([]byte, mem.Allocator_Error) {
+    #partial switch mode {
+        case .Alloc, .Alloc_Non_Zeroed:
+            total_bytes_allocated += size
+            total_allocation_count += 1
+        case .Resize, .Resize_Non_Zeroed:
+            if size > old_size do total_bytes_allocated += size - old_size
+            total_allocation_count += 1
+    }
+    counted := (^mem.Allocator)(allocator_data)
+    return counted.procedure(counted.data, mode, size, alignment, old_memory, old_size, location)
+}
+
+enable_timings :: proc(file: string) -> mem.Allocator {
+    timings_enabled = true
+    timings_file = file
+    counted_allocator = context.allocator
+    return counting_allocator(&counted_allocator)
+}
+
+// Counts the allocations made through `allocator`, which must outlive the returned allocator. Allocators that are not
+// the context allocator, such as the syntax tree's arena, go through this so their stage is still charged for them.
+counting_allocator :: proc(allocator: ^mem.Allocator) -> mem.Allocator {
+    if !timings_enabled do return allocator^
+    return mem.Allocator{procedure = counting_allocator_proc, data = allocator}
+}
+
+begin_stage :: proc() -> Stage_Mark {
+    if !timings_enabled do return {}
+    return Stage_Mark{time.tick_now(), total_bytes_allocated, total_allocation_count}
+}
+
+end_stage :: proc(stage: Stage, mark: Stage_Mark) {
+    if !timings_enabled do return
+    timing := &stage_timings[stage]
+    timing.nanoseconds += i64(time.tick_since(mark.tick))
+    timing.bytes_allocated += total_bytes_allocated - mark.bytes_allocated
+    timing.allocation_count += total_allocation_count - mark.allocation_count
+}
+
+// Removes the time spent in `nested` since `before` from `stage`, for stages that run inside another
+exclude_nested_stage :: proc(stage: Stage, nested: Stage, before: Stage_Timing) {
+    if !timings_enabled do return
+    nested_timing := stage_timings[nested]
+    timing := &stage_timings[stage]
+    timing.nanoseconds -= nested_timing.nanoseconds - before.nanoseconds
+    timing.bytes_allocated -= nested_timing.bytes_allocated - before.bytes_allocated
+    timing.allocation_count -= nested_timing.allocation_count - before.allocation_count
+}
+
+report_timings :: proc() {
+    if !timings_enabled do return
+
+    report := Timings_Report{
+        lex = stage_timings[.Lex],
+        parse = stage_timings[.Parse],
+        validate = stage_timings[.Validate],
+        optimize = stage_timings[.Optimize],
+        emit = stage_timings[.Emit],
+        write = stage_timings[.Write],
+        gcc = stage_timings[.Gcc],
+    }
+    data, err := json.marshal(report, allocator = context.temp_allocator)
+    if err != nil {
+        fmt.eprintln("Could not encode timings")
+        return
+    }
+
+    if timings_file == "-" {
+        fmt.eprintln(string(data))
+    }
+    else if !os.write_entire_file(timings_file, data) {
+        fmt.eprintfln("Could not write to %v", timings_file)
+    }
+}